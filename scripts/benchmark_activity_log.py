@@ -0,0 +1,82 @@
+"""
+Activity log benchmark.
+
+har action pe seedha ek INSERT (pooled connection, commit) vs buffered
+ActivityLogWriter.log(): caller ko kitni der rukna padta hai, aur writer
+thread sab kuch kitni der me database tak pahucha deta hai. benchmark ke
+rows end me delete ho jate hai.
+
+usage:
+    python scripts/benchmark_activity_log.py --events 5000
+"""
+
+import argparse
+import datetime
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.activity_log import ActivityLogWriter
+from utils.db_pool import db_cursor
+
+ACTION = "benchmark"
+INSERT = """
+INSERT INTO activity_log (action_type, meeting_id, performed_by, details, created_at)
+VALUES (%s, %s, %s, %s, %s)
+"""
+
+
+def insert_per_action(i):
+    with db_cursor(commit=True) as cur:
+        cur.execute(INSERT, (ACTION, f"evt{i}", "bench@college.edu", '{"n": %d}' % i,
+                             datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)))
+
+
+def timed_calls(fn, events):
+    latencies = []
+    started = time.perf_counter()
+    for i in range(events):
+        call_started = time.perf_counter()
+        fn(i)
+        latencies.append((time.perf_counter() - call_started) * 1e6)
+    return time.perf_counter() - started, latencies
+
+
+def report(label, total, latencies):
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"{label:28s} total={total * 1000:9.1f} ms  mean={statistics.mean(latencies):8.1f} us  "
+          f"p99={p99:8.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    try:
+        total, latencies = timed_calls(insert_per_action, args.events)
+        report("INSERT per action", total, latencies)
+
+        writer = ActivityLogWriter(max_queue=args.events + 1, batch_size=args.batch_size)
+        writer.start()
+        total, latencies = timed_calls(
+            lambda i: writer.log(ACTION, f"evt{i}", "bench@college.edu", {"n": i}), args.events
+        )
+        report("ActivityLogWriter.log", total, latencies)
+        started = time.perf_counter()
+        writer.flush(timeout=60)
+        print(f"{'writer drained after':28s} {(time.perf_counter() - started) * 1000:9.1f} ms")
+        writer.close()
+        print(writer.stats())
+    finally:
+        with db_cursor(commit=True) as cur:
+            cur.execute("DELETE FROM activity_log WHERE action_type = %s", (ACTION,))
+
+
+if __name__ == "__main__":
+    main()
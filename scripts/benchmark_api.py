@@ -0,0 +1,309 @@
+"""
+HTTP API load test: bahut saare concurrent clients, local stand-ins ke against.
+
+api/routes.py ko uvicorn pe isi process me start karta hai aur --clients
+async clients (default 128) --duration seconds tak lagatar requests bhejte
+hai: list / show / resolve / create / reschedule / cancel ka mix.
+reschedule aur cancel notify=true ke saath, toh outbox me mail bhi banta hai.
+
+stand-ins:
+  - Google Calendar: FakeCalendar, memory me events, har HTTP call pe
+    --calendar-latency ka sleep (batch pe ek baar). reschedule / cancel
+    async REST client se jaate hai - woh bhi isi FakeCalendar pe, httpx
+    MockTransport ke through
+  - SMTP: benchmark_smtp_pool.py wala local sink, outbox workers isi ko bhejte hai
+  - Postgres: DATABASE_URL wala local / throwaway database
+    (scripts/init_meetings_tables.py chala hua). benchmark ki meetings
+    end me mirror se hata di jati hai; outbox / activity_log rows reh jati hai.
+
+usage:
+    python scripts/benchmark_api.py --clients 128 --duration 20 --calendar-latency 0.05
+"""
+
+import argparse
+import asyncio
+import collections
+import itertools
+import json
+import os
+import random
+import socket
+import statistics
+import sys
+import threading
+import time
+import uuid
+
+import httplib2
+import httpx
+import uvicorn
+from googleapiclient.errors import HttpError
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from benchmark_smtp_pool import SinkHandler, ThreadedSink
+from api import routes
+from services import meeting_modifier
+from services.notification_queue import NotificationWorkerPool, get_queue_stats
+from utils import busy_cache, meeting_store
+from utils.async_calendar import AsyncCalendarClient
+from utils.config_loader import Config
+
+ATTENDEES = [f"faculty{i}@bench.local" for i in range(4)]
+NAMES = ["Sharma", "ani", "Kishan", "mayank KD", "Bismun", "NonExistentPerson"]
+# (operation, weight)
+MIX = (("list", 30), ("show", 15), ("resolve", 20), ("create", 15), ("reschedule", 12), ("cancel", 8))
+
+
+class FakeRequest:
+    """Calendar HttpRequest stand-in: execute() waits one round trip, then answers."""
+
+    def __init__(self, calendar, answer):
+        self.calendar = calendar
+        self.answer = answer
+
+    def execute(self):
+        time.sleep(self.calendar.latency)
+        return self.answer()
+
+
+class FakeBatch:
+    def __init__(self, calendar, callback):
+        self.calendar = calendar
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        time.sleep(self.calendar.latency)
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, request.answer(), None)
+            except HttpError as error:
+                self.callback(request_id, None, error)
+
+
+class FakeCalendar:
+    """
+    Just enough of the Calendar v3 client for meeting_modifier and the busy
+    cache: events().list / insert / patch / delete and batch requests.
+    Shared by all threads (the real client is per thread).
+    """
+
+    def __init__(self, latency):
+        self.latency = latency
+        self._events = {}
+        self._lock = threading.Lock()
+        self._sync = itertools.count(1)
+        self.calls = 0
+
+    def events(self):
+        return self
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+    def _request(self, answer):
+        with self._lock:
+            self.calls += 1
+        return FakeRequest(self, answer)
+
+    @staticmethod
+    def _missing():
+        return HttpError(httplib2.Response({"status": 404}), b"Not Found")
+
+    def list(self, calendarId, pageToken=None, syncToken=None, **params):
+        def answer():
+            # our own writes reach the busy cache through apply_event already
+            with self._lock:
+                items = [] if syncToken else list(self._events.values())
+            return {"items": items, "timeZone": "UTC", "nextSyncToken": f"sync{next(self._sync)}"}
+        return self._request(answer)
+
+    def insert(self, calendarId, body):
+        def answer():
+            # like the real API, a client-chosen id is kept
+            event_id = body.get("id") or f"bench{uuid.uuid4().hex[:16]}"
+            event = dict(body, id=event_id, etag=f'"{event_id}-1"', status="confirmed",
+                         htmlLink=f"https://calendar.bench.local/{event_id}")
+            with self._lock:
+                self._events[event_id] = event
+            return event
+        return self._request(answer)
+
+    def patch(self, calendarId, eventId, body, **params):
+        def answer():
+            with self._lock:
+                if eventId not in self._events:
+                    raise self._missing()
+                event = self._events[eventId] = dict(self._events[eventId], **body)
+                return event
+        return self._request(answer)
+
+    def delete(self, calendarId, eventId, **params):
+        def answer():
+            with self._lock:
+                if self._events.pop(eventId, None) is None:
+                    raise self._missing()
+            return ""
+        return self._request(answer)
+
+    async def handle_rest(self, request):
+        """httpx MockTransport handler: the same events over the REST paths AsyncCalendarClient uses."""
+        await asyncio.sleep(self.latency)
+        event_id = request.url.path.rsplit("/events/", 1)[-1]
+        with self._lock:
+            self.calls += 1
+            if event_id not in self._events:
+                return httpx.Response(404, json={"error": {"code": 404, "message": "Not Found"}})
+            if request.method == "DELETE":
+                del self._events[event_id]
+                return httpx.Response(204)
+            if request.method == "PATCH":
+                self._events[event_id] = dict(self._events[event_id], **json.loads(request.content))
+            return httpx.Response(200, json=self._events[event_id])
+
+
+class FakeCredentials:
+    token = "bench"
+    valid = True
+    expiry = None
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def random_slot():
+    # 30-minute slots over the next ~3 years, so most creates do not clash
+    start = (int(time.time()) // 1800 + 48 + random.randrange(50000)) * 1800
+    return (time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(start)),
+            time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(start + 1800)))
+
+
+async def client(http, deadline, created, results):
+    operations, weights = zip(*MIX)
+    while time.monotonic() < deadline:
+        operation = random.choices(operations, weights)[0]
+        if operation in ("show", "reschedule", "cancel") and not created:
+            operation = "create"
+        started = time.perf_counter()
+        try:
+            if operation == "list":
+                response = await http.get("/meetings", params={"days": 30})
+            elif operation == "show":
+                response = await http.get(f"/meetings/{random.choice(created)}")
+            elif operation == "resolve":
+                response = await http.post("/resolve", json={"names": random.sample(NAMES, 3)})
+            elif operation == "create":
+                start, end = random_slot()
+                response = await http.post("/meetings", json={
+                    "title": "Bench sync", "start": start, "end": end, "participants": ATTENDEES})
+                if response.status_code == 201:
+                    created.append(response.json()["meeting_id"])
+            elif operation == "reschedule":
+                start, end = random_slot()
+                response = await http.patch(f"/meetings/{random.choice(created)}",
+                                            json={"start": start, "end": end, "notify": True})
+            else:
+                meeting_id = created.pop(random.randrange(len(created)))
+                response = await http.delete(f"/meetings/{meeting_id}", params={"notify": "true"})
+            status = response.status_code
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        results.append((operation, status, (time.perf_counter() - started) * 1000))
+
+
+async def load(base_url, clients, duration):
+    created, results = [], []
+    # one connection per client: a shared httpx pool checks every idle
+    # connection on each request, which makes the load generator itself
+    # the bottleneck at 100+ connections
+    sessions = [httpx.AsyncClient(base_url=base_url, timeout=60,
+                                  limits=httpx.Limits(max_connections=1))
+                for _ in range(clients)]
+    deadline = time.monotonic() + duration
+    started = time.perf_counter()
+    await asyncio.gather(*(client(http, deadline, created, results) for http in sessions))
+    elapsed = time.perf_counter() - started
+    health = (await sessions[0].get("/health")).json()
+    for http in sessions:
+        await http.aclose()
+    return results, elapsed, health, created
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def report(results, elapsed):
+    print(f"requests={len(results)} in {elapsed:.1f}s -> {len(results) / elapsed:.1f} req/s")
+    by_operation = collections.defaultdict(list)
+    for operation, status, ms in results:
+        by_operation[operation].append((status, ms))
+    for operation, _ in MIX:
+        rows = by_operation.get(operation)
+        if not rows:
+            continue
+        timings = [ms for _, ms in rows]
+        statuses = collections.Counter(status for status, _ in rows)
+        print(f"{operation:11s} n={len(rows):6d}  p50={statistics.median(timings):7.1f} ms  "
+              f"p95={percentile(timings, 0.95):7.1f} ms  p99={percentile(timings, 0.99):7.1f} ms  "
+              f"status={dict(statuses)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=128)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--calendar-latency", type=float, default=0.05,
+                        help="seconds per simulated Calendar HTTP call")
+    parser.add_argument("--workers", type=int, default=None, help="API_WORKERS for the run")
+    args = parser.parse_args()
+
+    sink = ThreadedSink(("127.0.0.1", 0), SinkHandler)
+    Config.SMTP_HOST, Config.SMTP_PORT = sink.server_address
+    threading.Thread(target=sink.serve_forever, daemon=True).start()
+
+    calendar = FakeCalendar(args.calendar_latency)
+    meeting_modifier.get_calendar_service = lambda: calendar
+    busy_cache.get_calendar_service = lambda: calendar
+    rest_client = AsyncCalendarClient(http=httpx.AsyncClient(transport=httpx.MockTransport(calendar.handle_rest)),
+                                      credentials_factory=FakeCredentials)
+    meeting_modifier.get_async_calendar = lambda: rest_client
+    if args.workers:
+        Config.API_WORKERS = args.workers
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(routes.app, host="127.0.0.1", port=port,
+                                           log_level="warning", backlog=4096))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    outbox = NotificationWorkerPool(workers=4, poll_interval=0.2, send_rate=1000)
+    outbox.start()
+    try:
+        results, elapsed, health, created = asyncio.run(
+            load(f"http://127.0.0.1:{port}", args.clients, args.duration))
+    finally:
+        outbox.stop()
+        server.should_exit = True
+        sink.shutdown()
+
+    print(f"clients={args.clients} duration={args.duration}s calendar_latency={args.calendar_latency}s "
+          f"api_workers={Config.API_WORKERS}")
+    report(results, elapsed)
+    print(f"executor: {health['executor']}")
+    print(f"calendar calls: {calendar.calls}  outbox: sent={outbox.stats['jobs_sent']} "
+          f"dead={outbox.stats['jobs_dead']} queue={get_queue_stats()}")
+    meeting_store.delete_meetings(created)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+sam daemon benchmark.
+
+ek hee CLI command (default `list --days 7`) teen tarike se chalata hai:
+har baar naya process bina daemon ke (SAM_NO_DAEMON=1), naya process jo
+command warm daemon ko bhejta hai, aur daemon ka socket round trip akele
+(interpreter startup ke bina). daemon ek temp socket pe khud start aur
+band hota hai.
+
+usage:
+    python scripts/benchmark_daemon.py --runs 20 -- list --days 7
+"""
+
+import argparse
+import io
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+MAIN = os.path.join(SRC_DIR, 'main.py')
+
+sys.path.append(SRC_DIR)
+
+from services.daemon import forward, ping
+
+
+class _Sink:
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def flush(self):
+        pass
+
+
+def time_process(argv, env, runs):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, MAIN, *argv], env=env, stdout=subprocess.DEVNULL, check=False)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(label, timings):
+    print(f"{label:32s} median={statistics.median(timings):8.1f} ms  min={min(timings):8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("command", nargs="*", default=["list", "--days", "7"])
+    args = parser.parse_args()
+
+    socket_path = os.path.join(tempfile.mkdtemp(), "sam-bench.sock")
+    env = dict(os.environ, SAM_SOCKET=socket_path)
+    daemon = subprocess.Popen([sys.executable, MAIN, "serve"], env=env, stdout=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 60
+        while ping(socket_path) is None:
+            if daemon.poll() is not None or time.monotonic() > deadline:
+                sys.exit("daemon did not start")
+            time.sleep(0.1)
+
+        report("new process, no daemon", time_process(args.command, dict(env, SAM_NO_DAEMON="1"), args.runs))
+        report("new process -> daemon", time_process(args.command, env, args.runs))
+
+        timings = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            forward(args.command, socket_path, stdout=_Sink(), stderr=_Sink())
+            timings.append((time.perf_counter() - started) * 1000)
+        report("daemon round trip only", timings)
+        print(ping(socket_path))
+    finally:
+        daemon.terminate()
+        daemon.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
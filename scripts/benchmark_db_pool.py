@@ -0,0 +1,87 @@
+"""
+Database pool benchmark.
+
+Faculty table pe email se lookup karta hai: purana tarika (har query pe
+psycopg2.connect + close) vs shared DatabasePool. Sequential aur threads
+dono se chalata hai aur end me pool ke saturation stats print karta hai.
+
+usage:
+    python scripts/benchmark_db_pool.py --queries 1000 --threads 8
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.config_loader import Config
+from utils.db_pool import DatabasePool
+
+QUERY = "SELECT * FROM faculty WHERE email = %s;"
+
+
+def lookup_connect_per_query(email):
+    conn = psycopg2.connect(Config.DATABASE_URL, cursor_factory=RealDictCursor)
+    try:
+        with conn.cursor() as cur:
+            cur.execute(QUERY, (email,))
+            return cur.fetchone()
+    finally:
+        conn.close()
+
+
+def lookup_pooled(pool, email):
+    with pool.cursor() as cur:
+        cur.execute(QUERY, (email,))
+        return cur.fetchone()
+
+
+def timed(fn, emails, threads):
+    started = time.perf_counter()
+    if threads <= 1:
+        for email in emails:
+            fn(email)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(fn, emails))
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--pool-size", type=int, default=Config.DB_POOL_MAX)
+    args = parser.parse_args()
+
+    with psycopg2.connect(Config.DATABASE_URL) as conn, conn.cursor() as cur:
+        cur.execute("SELECT email FROM faculty;")
+        emails = [row[0] for row in cur.fetchall()]
+    if not emails:
+        print("faculty table is empty, run scripts/seed_db.py first")
+        return
+    emails = [emails[i % len(emails)] for i in range(args.queries)]
+
+    pool = DatabasePool(Config.DATABASE_URL, minconn=1, maxconn=args.pool_size,
+                        statement_timeout_ms=Config.DB_STATEMENT_TIMEOUT_MS)
+    pooled = lambda email: lookup_pooled(pool, email)  # noqa: E731
+
+    print(f"queries={args.queries} threads={args.threads} pool_size={args.pool_size}")
+    for label, threads in (("sequential", 1), (f"{args.threads} threads", args.threads)):
+        old = timed(lookup_connect_per_query, emails, threads)
+        new = timed(pooled, emails, threads)
+        print(f"{label:<12} connect-per-query: {old / args.queries * 1000:7.3f} ms/query   "
+              f"pooled: {new / args.queries * 1000:7.3f} ms/query   ({old / new:.1f}x)")
+
+    print(f"pool stats: {pool.stats()}")
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Create-meeting pipeline: stages ek ke baad ek vs dependency graph pe saath.
+
+services/meeting_pipeline.py ka schedule_meeting do tarike se chalata hai:
+  1. max_workers=1: README ka flow, har stage pichhle ke baad
+  2. default: jo stages independent hai woh threads pe saath
+aur har stage ka average time / start offset dikhata hai.
+
+stand-ins (benchmark_api.py wale):
+  - Google Calendar: FakeCalendar (+ freebusy), har HTTP call pe
+    --calendar-latency ka sleep
+  - SMTP: local sink, login pe --smtp-delay
+  - Postgres: DATABASE_URL (faculty roster + meetings mirror). benchmark ki
+    meetings end me mirror se hata di jati hai.
+
+usage:
+    python scripts/benchmark_pipeline.py --runs 20 --calendar-latency 0.15
+"""
+
+import argparse
+import collections
+import os
+import statistics
+import sys
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from benchmark_api import FakeCalendar, FakeRequest, random_slot
+from benchmark_smtp_pool import SinkHandler, ThreadedSink
+from services import meeting_modifier
+from services.meeting_pipeline import schedule_meeting
+from utils import conflict_detector, meeting_store
+from utils.busy_cache import to_timestamp
+from utils.config_loader import Config
+
+PARTICIPANTS = ["Kishan", "Bismun", "ani", "Ayush", "guest1@bench.local", "guest2@bench.local"]
+
+
+class FreeBusyCalendar(FakeCalendar):
+    """
+    FakeCalendar that also answers a time-window events().list (the
+    scheduler check) and freebusy().query, where everyone is free.
+    """
+
+    def list(self, calendarId, timeMin=None, timeMax=None, **params):
+        if timeMin is None:
+            return super().list(calendarId, **params)
+
+        def answer():
+            begin, finish = to_timestamp(timeMin), to_timestamp(timeMax)
+            with self._lock:
+                events = list(self._events.values())
+            return {"items": [event for event in events
+                              if to_timestamp(event["start"]["dateTime"]) < finish
+                              and to_timestamp(event["end"]["dateTime"]) > begin]}
+        return self._request(answer)
+
+    def freebusy(self):
+        return self
+
+    def query(self, body):
+        with self._lock:
+            self.calls += 1
+        return FakeRequest(self, lambda: {"calendars": {item["id"]: {"busy": []} for item in body["items"]}})
+
+
+def run_mode(runs, max_workers, created):
+    elapsed = []
+    stages = collections.defaultdict(list)
+    for _ in range(runs):
+        start, end = random_slot()
+        result = schedule_meeting("Bench review", start, end, PARTICIPANTS, Config.SENDER_EMAIL,
+                                  description="pipeline benchmark", max_workers=max_workers)
+        if not result["success"]:
+            raise SystemExit(f"pipeline failed in {result['failed_stage']}: {result['error']}")
+        created.append(result["meeting_id"])
+        elapsed.append(result["elapsed_ms"])
+        for stage, timing in result["timings"].items():
+            stages[stage].append((timing["start_ms"], timing["duration_ms"]))
+    return elapsed, stages
+
+
+def report(label, elapsed, stages):
+    print(f"{label}: median={statistics.median(elapsed):7.1f} ms  "
+          f"p95={sorted(elapsed)[int(len(elapsed) * 0.95) - 1]:7.1f} ms  max={max(elapsed):7.1f} ms")
+    ordered = sorted(stages.items(), key=lambda item: statistics.mean(start for start, _ in item[1]))
+    for stage, timings in ordered:
+        print(f"    {stage:22s} starts +{statistics.mean(s for s, _ in timings):7.1f} ms  "
+              f"takes {statistics.mean(d for _, d in timings):7.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--calendar-latency", type=float, default=0.15,
+                        help="seconds per simulated Calendar HTTP call")
+    parser.add_argument("--smtp-delay", type=float, default=0.05, help="seconds per SMTP login")
+    args = parser.parse_args()
+
+    SinkHandler.connect_delay = args.smtp_delay
+    sink = ThreadedSink(("127.0.0.1", 0), SinkHandler)
+    Config.SMTP_HOST, Config.SMTP_PORT = sink.server_address
+    threading.Thread(target=sink.serve_forever, daemon=True).start()
+
+    calendar = FreeBusyCalendar(args.calendar_latency)
+    meeting_modifier.get_calendar_service = lambda: calendar
+    conflict_detector.get_calendar_service = lambda: calendar
+
+    created = []
+    try:
+        # warm-up: roster, resolver index, templates, SMTP session, DB pool
+        run_mode(1, None, created)
+        sequential = run_mode(args.runs, 1, created)
+        concurrent = run_mode(args.runs, None, created)
+    finally:
+        sink.shutdown()
+        meeting_store.delete_meetings(created)
+
+    print(f"runs={args.runs} participants={len(PARTICIPANTS)} calendar_latency={args.calendar_latency}s "
+          f"smtp_delay={args.smtp_delay}s")
+    report("sequential", *sequential)
+    report("concurrent", *concurrent)
+    print(f"speedup: {statistics.median(sequential[0]) / statistics.median(concurrent[0]):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
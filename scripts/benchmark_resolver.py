@@ -0,0 +1,127 @@
+"""
+Resolver index benchmark.
+
+Synthetic roster (default 50k naam) banata hai aur typo wale queries ke liye
+purana thefuzz.process.extractOne full scan vs ResolverIndex compare karta hai.
+Saath me check karta hai ki dono ka top match same hai.
+
+usage:
+    python scripts/benchmark_resolver.py --roster 50000 --queries 200
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+from thefuzz import process
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.resolver_index import ResolverIndex
+
+FIRST = ["Aniket", "Ayush", "Kishan", "Krishna", "Bismun", "Mayank", "Priya", "Rahul", "Sneha",
+         "Vikram", "Anjali", "Rohit", "Pooja", "Arjun", "Neha", "Sanjay", "Kavya", "Deepak",
+         "Isha", "Manish", "Ritu", "Amit", "Divya", "Karan", "Meera", "Nikhil", "Shreya"]
+LAST = ["Sharma", "Kumar", "Singh", "Barun", "Bhardwaj", "Zalavadiya", "Makkarh", "Gupta",
+        "Verma", "Iyer", "Reddy", "Nair", "Patel", "Joshi", "Mehta", "Chopra", "Rao", "Das",
+        "Mishra", "Pandey", "Agarwal", "Banerjee", "Kapoor", "Saxena", "Malhotra", "Bose"]
+TITLES = ["", "", "", "Dr. ", "Prof. "]
+
+
+def synthetic_roster(size, rng):
+    roster = []
+    for i in range(size):
+        middle = rng.choice(["", "", f"{rng.choice('ABCDEFGHKMNPRS')} "])
+        name = f"{rng.choice(TITLES)}{rng.choice(FIRST)} {middle}{rng.choice(LAST)}{i % 97 or ''}"
+        roster.append({"id": i, "name": name, "email": f"user{i}@college.edu"})
+    return roster
+
+
+def typo(name, rng):
+    chars = list(name)
+    for _ in range(rng.randint(0, 2)):
+        pos = rng.randrange(len(chars))
+        op = rng.choice(["drop", "swap", "replace"])
+        if op == "drop" and len(chars) > 3:
+            chars.pop(pos)
+        elif op == "swap" and pos < len(chars) - 1:
+            chars[pos], chars[pos + 1] = chars[pos + 1], chars[pos]
+        else:
+            chars[pos] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    words = "".join(chars).split()
+    return " ".join(rng.sample(words, k=rng.randint(1, len(words))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--roster", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--threshold", type=int, default=75)
+    parser.add_argument("--batch", type=int, default=20,
+                        help="participants per batch for resolve_participants-style calls")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    roster = synthetic_roster(args.roster, rng)
+    queries = [typo(rng.choice(roster)["name"], rng) for _ in range(args.queries)]
+
+    started = time.perf_counter()
+    index = ResolverIndex(roster)
+    build = time.perf_counter() - started
+
+    names = list({person["name"]: person for person in roster})
+
+    started = time.perf_counter()
+    baseline = [process.extractOne(q, names) for q in queries]
+    old = time.perf_counter() - started
+
+    started = time.perf_counter()
+    indexed = [index.best_match(q, args.threshold) for q in queries]
+    new = time.perf_counter() - started
+
+    started = time.perf_counter()
+    blocked = [index.best_match(q, args.threshold, exact=False) for q in queries]
+    fast = time.perf_counter() - started
+
+    mismatches = sum(
+        1 for (name, score), (_, best, best_score) in zip(baseline, indexed)
+        if score >= args.threshold and (name, score) != (best, best_score)
+        or score < args.threshold and best_score >= args.threshold
+    )
+    blocked_misses = sum(
+        1 for (name, _), (_, best, _) in zip(baseline, blocked) if name != best
+    )
+
+    batches = [queries[i:i + args.batch] for i in range(0, len(queries), args.batch)]
+    started = time.perf_counter()
+    batched = [m for batch in batches for m in index.best_matches(batch, args.threshold, exact=False)]
+    matrix = time.perf_counter() - started
+
+    started = time.perf_counter()
+    exact_batched = [m for batch in batches for m in index.best_matches(batch, args.threshold)]
+    exact_matrix = time.perf_counter() - started
+    exact_batch_misses = sum(1 for (_, name, score), m in zip(indexed, exact_batched)
+                             if score >= args.threshold and (name, score) != (m["name"], m["score"]))
+    # Synthetic rosters have many equal-score names; count real score drops separately
+    batch_score_misses = sum(1 for (_, score), m in zip(baseline, batched) if score != m["score"])
+    batch_ties = sum(
+        1 for (name, score), m in zip(baseline, batched) if score == m["score"] and name != m["name"]
+    )
+
+    print(f"roster={args.roster} unique_names={len(names)} queries={args.queries}")
+    print(f"index build            : {build:.2f}s (once per roster version)")
+    print(f"thefuzz full scan      : {old / args.queries * 1000:8.2f} ms/query")
+    print(f"index (exact)          : {new / args.queries * 1000:8.2f} ms/query  mismatches={mismatches}")
+    print(f"index (blocking only)  : {fast / args.queries * 1000:8.2f} ms/query  top-1 differs={blocked_misses}")
+    print(f"batch matrix (exact)   : {exact_matrix / len(batches) * 1000:8.2f} ms/batch of {args.batch}  "
+          f"(loop of exact best_match: {new / len(batches) * 1000:.2f} ms)  "
+          f"differs from best_match={exact_batch_misses}")
+    print(f"batch matrix (blocked) : {matrix / len(batches) * 1000:8.2f} ms/batch of {args.batch}  "
+          f"lower score={batch_score_misses} equal-score tie={batch_ties}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Free slot finder benchmark.
+
+Synthetic calendars banata hai (har participant ke roz kuch meetings,
+working hours ke andar) aur find_free_slots ko ek naive search se compare
+karta hai jo har 15 minute ke candidate pe har participant ka har
+interval check karta hai. dono ke slots same hone chahiye.
+
+usage:
+    python scripts/benchmark_slot_finder.py --participants 30 --days 30 --duration 60
+"""
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.slot_finder import find_free_slots
+
+UTC = datetime.timezone.utc
+
+
+def synthetic_calendars(participants, days, meetings_per_day, start, rng):
+    calendars = {}
+    for p in range(participants):
+        busy = []
+        for d in range(days):
+            day = start + datetime.timedelta(days=d)
+            for _ in range(rng.randint(0, meetings_per_day)):
+                begin = day.replace(hour=rng.randint(8, 17), minute=rng.choice([0, 15, 30, 45]))
+                busy.append((begin, begin + datetime.timedelta(minutes=rng.choice([15, 30, 60, 90]))))
+        rng.shuffle(busy)
+        calendars[f"user{p}@college.edu"] = busy
+    return calendars
+
+
+def naive_free_slots(calendars, start, end, duration, top_k):
+    """Every 15 minute start in working hours, checked against every interval."""
+    slots = []
+    candidate = start
+    length = datetime.timedelta(minutes=duration)
+    while candidate + length <= end and len(slots) < top_k:
+        day_open = candidate.replace(hour=9, minute=0)
+        day_close = candidate.replace(hour=17, minute=0)
+        if candidate.weekday() < 5 and day_open <= candidate and candidate + length <= day_close:
+            clash = any(s < candidate + length and e > candidate
+                        for busy in calendars.values() for s, e in busy)
+            if not clash:
+                slots.append((candidate, candidate + length))
+                candidate += length
+                continue
+        candidate += datetime.timedelta(minutes=15)
+    return slots
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--participants", type=int, default=30)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--meetings-per-day", type=int, default=2)
+    parser.add_argument("--duration", type=int, default=60)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start = datetime.datetime(2025, 1, 27, tzinfo=UTC)
+    end = start + datetime.timedelta(days=args.days)
+    calendars = synthetic_calendars(args.participants, args.days, args.meetings_per_day, start, rng)
+    total = sum(len(busy) for busy in calendars.values())
+
+    def fast():
+        return find_free_slots(calendars, start, end, args.duration, top_k=args.top_k,
+                               timezone="UTC", day_start="09:00", day_end="17:00")
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        slots = fast()
+    new = (time.perf_counter() - started) / args.repeat
+
+    started = time.perf_counter()
+    expected = naive_free_slots(calendars, start, end, args.duration, args.top_k)
+    old = time.perf_counter() - started
+
+    same = [(s.astimezone(UTC), e.astimezone(UTC)) for s, e in slots] == expected
+    print(f"participants={args.participants} days={args.days} busy intervals={total} "
+          f"duration={args.duration}min top_k={args.top_k}")
+    print(f"naive 15-minute scan : {old * 1000:9.2f} ms")
+    print(f"find_free_slots      : {new * 1000:9.2f} ms   same slots={same}")
+    for s, e in slots:
+        print(f"  {s:%a %d %b %H:%M} - {e:%H:%M}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Pooled vs connect-per-message SMTP benchmark.
+
+Ek local SMTP sink start karta hai (real Gmail pe spam nahi karna hai)
+aur same N messages do tarike se bhejta hai:
+  1. purana tarika: har message ke liye naya connection + login
+  2. SMTPConnectionPool ke through
+
+--connect-delay se TLS handshake/login ki latency simulate kar sakte ho.
+
+usage:
+    python scripts/benchmark_smtp_pool.py --messages 200 --sessions 4 --connect-delay 0.05
+"""
+
+import argparse
+import os
+import smtplib
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.smtp_pool import SMTPConnectionPool
+
+
+class SinkHandler(socketserver.StreamRequestHandler):
+    """Just enough of RFC 5321 for smtplib: accepts and discards everything."""
+
+    connect_delay = 0.0
+
+    def reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        time.sleep(self.connect_delay)
+        self.reply("220 sink ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors="replace").strip().upper()
+
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250-sink")
+                self.reply("250 AUTH PLAIN")
+            elif command.startswith("AUTH"):
+                time.sleep(self.connect_delay)
+                self.reply("235 ok")
+            elif command == "DATA":
+                self.reply("354 go ahead")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                self.reply("250 queued")
+            elif command == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("250 ok")
+
+
+class ThreadedSink(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def build_messages(count):
+    messages = []
+    for i in range(count):
+        msg = EmailMessage()
+        msg["From"] = "sam@bench.local"
+        msg["To"] = f"faculty{i}@bench.local"
+        msg["Subject"] = "Meeting Invitation: Benchmark"
+        msg.set_content("x" * 2048)
+        messages.append(msg)
+    return messages
+
+
+def run_unpooled(host, port, messages, workers):
+    def send(msg):
+        with smtplib.SMTP(host, port) as server:
+            server.login("sam", "bench")
+            server.send_message(msg)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(send, messages))
+
+
+def run_pooled(host, port, messages, workers):
+    pool = SMTPConnectionPool(host, port, "sam", "bench", use_ssl=False,
+                              max_connections=workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(pool.send_message, messages))
+    pool.close()
+    return pool.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--connect-delay", type=float, default=0.05,
+                        help="seconds of simulated handshake + login latency")
+    args = parser.parse_args()
+
+    SinkHandler.connect_delay = args.connect_delay
+    sink = ThreadedSink(("127.0.0.1", 0), SinkHandler)
+    host, port = sink.server_address
+    threading.Thread(target=sink.serve_forever, daemon=True).start()
+
+    messages = build_messages(args.messages)
+
+    started = time.perf_counter()
+    run_unpooled(host, port, messages, args.sessions)
+    unpooled = time.perf_counter() - started
+
+    started = time.perf_counter()
+    stats = run_pooled(host, port, messages, args.sessions)
+    pooled = time.perf_counter() - started
+
+    sink.shutdown()
+
+    print(f"messages={args.messages} sessions={args.sessions} connect_delay={args.connect_delay}s")
+    print(f"connect-per-message : {unpooled:.3f}s ({args.messages / unpooled:.1f} msg/s)")
+    print(f"pooled              : {pooled:.3f}s ({args.messages / pooled:.1f} msg/s)  "
+          f"connects={stats['connects']} reuses={stats['reuses']}")
+    print(f"speedup             : {unpooled / pooled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Template rendering micro-benchmark.
+
+purana tarika (har message pe file padhna + jinja2.Template compile karna)
+vs template_registry (compiled template reuse) ka per-message latency compare karta hai.
+
+usage:
+    python scripts/benchmark_template_render.py --messages 500
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from jinja2 import Template
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.template_registry import TEMPLATES_DIR, get_registry
+
+CONTEXT = {
+    "title": "Department Sync",
+    "time_str": "2025-01-27T15:00:00 to 2025-01-27T16:00:00",
+    "location": "https://meet.google.com/abc-defg-hij",
+    "agenda": "Semester planning",
+}
+
+
+def render_uncached(path):
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    with open(path, "r", encoding="utf-8") as f:
+        template = Template(f.read())
+    return template.render(**CONTEXT)
+
+
+def render_cached():
+    return get_registry().render("invite", **CONTEXT)
+
+
+def time_per_message(fn, count):
+    started = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return (time.perf_counter() - started) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=500)
+    args = parser.parse_args()
+
+    path = str(TEMPLATES_DIR / "email_invite.html")
+    assert render_uncached(path) == render_cached(), "outputs differ"
+
+    before = time_per_message(lambda: render_uncached(path), args.messages)
+    after = time_per_message(render_cached, args.messages)
+
+    print(f"messages={args.messages}")
+    print(f"read + compile per message : {before * 1e6:8.1f} us/msg")
+    print(f"template_registry          : {after * 1e6:8.1f} us/msg")
+    print(f"speedup                    : {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
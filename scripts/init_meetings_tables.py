@@ -1,6 +1,12 @@
-import psycopg2
+import os
+import sys
+
 from psycopg2 import OperationalError, DatabaseError
-from utils.config_loader import Config
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.activity_log import create_activity_log_table
+from utils.db_pool import get_pool
 
 
 
@@ -10,11 +16,11 @@ class DatabaseInitializationError(Exception):
 
 def get_db_connection():
     """
-    Create and return a PostgreSQL database connection
-    using centralized configuration.
+    Check out a PostgreSQL connection from the shared pool
+    (utils/db_pool.py). Give it back with get_pool().putconn(conn).
     """
     try:
-        return psycopg2.connect(Config.DATABASE_URL)
+        return get_pool().getconn()
     except OperationalError as err:
         raise DatabaseInitializationError(
             f"Unable to connect to database. Check DATABASE_URL. Details: {err}"
@@ -49,17 +55,62 @@ def create_tables(cursor):
             );
         """)
 
+        # Added later, so older databases get them through ALTER TABLE.
+        # sequence is the iCalendar SEQUENCE (bumped when the time or title
+        # changes); updated_at feeds the ETag of the .ics feeds.
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS activity_log (
-                id SERIAL PRIMARY KEY,
-                action_type VARCHAR(50) NOT NULL,
-                meeting_id INTEGER,
-                performed_by VARCHAR(255),
-                details TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ALTER TABLE meetings
+                ADD COLUMN IF NOT EXISTS sequence INTEGER NOT NULL DEFAULT 0,
+                ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP NOT NULL
+                    DEFAULT (now() AT TIME ZONE 'utc');
+        """)
+
+        # Read path of utils/meeting_store.py: listing by organizer + time
+        # range, meetings someone is invited to, and the participants join.
+        # meetings.meeting_id is already indexed by its UNIQUE constraint.
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_meetings_organizer_start
+            ON meetings (organizer_email, start_time);
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_meeting_participants_email
+            ON meeting_participants (participant_email);
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_meeting_participants_meeting
+            ON meeting_participants (meeting_id);
+        """)
+
+        # Partitioned by month with a BRIN index; converts an older
+        # unpartitioned table (see utils/activity_log.py)
+        create_activity_log_table(cursor)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS notification_outbox (
+                id BIGSERIAL PRIMARY KEY,
+                kind VARCHAR(20) NOT NULL,
+                sender_email VARCHAR(255) NOT NULL,
+                payload JSONB NOT NULL,
+                status VARCHAR(20) NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL DEFAULT 5,
+                next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                locked_at TIMESTAMP,
+                locked_by VARCHAR(100),
+                last_error TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                sent_at TIMESTAMP
             );
         """)
 
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_notification_outbox_due
+            ON notification_outbox (next_attempt_at)
+            WHERE status IN ('pending', 'sending');
+        """)
+
     except DatabaseError as err:
         raise DatabaseInitializationError(
             f"Failed while executing table creation SQL. Details: {err}"
@@ -96,7 +147,7 @@ def initialize_database():
 
     finally:
         if conn:
-            conn.close()
+            get_pool().putconn(conn)
 
 
 def main():
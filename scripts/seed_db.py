@@ -1,32 +1,50 @@
-import csv
+import argparse
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
-from utils.db_handler import init_db, add_faculty_member
+from utils.db_handler import init_db
+from utils.faculty_import import import_faculty_csv, sync_faculty_csv
 
-def seed_data():
+def seed_data(csv_path='data/faculty.csv', sync=False, dry_run=False):
+    """
+    Default: upsert every CSV row. With sync=True only the difference is
+    written and faculty missing from the CSV are marked inactive.
+    """
     init_db()
-    
-    csv_path = 'data/faculty.csv'
+
     try:
-        with open(csv_path, mode='r') as file:
-            reader = csv.DictReader(file, skipinitialspace=True)
-            for row in reader:
-                print(f"Importing {row['name']}...")
-                add_faculty_member(
-                    row['name'], 
-                    row['email'], 
-                    row['phone'], 
-                    row['department'], 
-                    row['role']
-                )
-        print("Migration complete!")
+        if sync:
+            report = sync_faculty_csv(csv_path, dry_run=dry_run)
+        else:
+            report = import_faculty_csv(csv_path)
     except FileNotFoundError:
         print("CSV file not found.")
-    except KeyError as e:
-        print(f"CSV Header Error: Missing column {e}.")
+        return
+
+    if not report["success"]:
+        print(f"Import failed: {report['error']}")
+        return
+
+    deactivated = f"Deactivated: {report['deactivated']}  " if sync else ""
+    print(f"Inserted: {report['inserted']}  Updated: {report['updated']}  {deactivated}"
+          f"Unchanged: {report['unchanged']}  Duplicates: {report['duplicates']}  "
+          f"Rejected: {report['rejected']}")
+    for rejected in report["rejected_rows"]:
+        print(f"  line {rejected['line']}: {rejected['reason']}")
+    if dry_run:
+        print("Dry run: nothing was written.")
+    else:
+        print("Migration complete!")
 
 if __name__ == "__main__":
-    seed_data()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Import faculty from a CSV file.")
+    parser.add_argument("--csv", default='data/faculty.csv',
+                        help="CSV with name,email,phone,department,role columns")
+    parser.add_argument("--sync", action="store_true",
+                        help="write only the difference and deactivate faculty missing from the CSV")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="with --sync: report the difference without writing it")
+    args = parser.parse_args()
+    seed_data(args.csv, sync=args.sync, dry_run=args.dry_run)
@@ -0,0 +1,292 @@
+"""
+S.A.M ka HTTP API (FastAPI, asyncio pe).
+
+create / list / show / reschedule / cancel / resolve sab yaha endpoint hai.
+list / show / reschedule / cancel service functions ke *_async variants
+seedha event loop pe chalate hai (asyncpg, httpx se Calendar REST), toh
+unke liye koi thread nahi lagta. create (Calendar batch) aur resolve (fuzzy
+match, CPU) blocking hai - woh ek fixed size ke thread pool (API_WORKERS)
+pe chalte hai, aur loop baaki requests leta rehta hai.
+
+har request ka apna deadline hai (API_REQUEST_TIMEOUT, client
+X-Request-Timeout header se kam kar sakta hai) - time nikal gaya toh 504.
+client beech me connection tod de toh uska kaam bhi cancel: async call
+wahin ruk jati hai (query / HTTP call cancel), pool ki queue me ho toh
+chalega hee nahi, thread pe chal raha ho toh result phenk diya jata hai.
+API_MAX_PENDING se zyada kaam in flight ho toh naya request turant 503
+pata hai, queue lambi nahi hoti.
+
+emails yaha se nahi jate: notify=True pe mail outbox me queue hota hai
+(services/notification_queue.py) aur `sam outbox work` bhejta hai.
+
+    python src/main.py api --port 8000
+"""
+
+import asyncio
+import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+from fastapi import FastAPI, HTTPException, Request
+from pydantic import BaseModel, Field
+
+from services import meeting_modifier
+from utils import meeting_store, user_resolver
+from utils.async_db import close_async_pool
+from utils.config_loader import Config
+from utils.date_parser import parse_iso_datetime
+
+# Client-side deadline header, in seconds (capped at API_REQUEST_TIMEOUT)
+TIMEOUT_HEADER = "X-Request-Timeout"
+# Status nginx uses for "client closed request"; the client never sees it
+CLIENT_CLOSED_STATUS = 499
+
+
+class MeetingIn(BaseModel):
+    title: str
+    start: str = Field(description="ISO 8601, UTC if no offset")
+    end: str
+    participants: List[str] = Field(default_factory=list, description="Attendee emails")
+    description: str = ""
+    check_conflicts: bool = True
+
+
+class RescheduleIn(BaseModel):
+    start: str
+    end: str
+    notify: bool = False
+
+
+class ResolveIn(BaseModel):
+    names: List[str]
+    threshold: int = 75
+
+
+class RequestExecutor:
+    """
+    Runs each request's service call under its deadline and disconnect
+    watch: coroutines on the loop (run_async), blocking calls on a bounded
+    thread pool (run). Admission control: at most `max_pending` calls in
+    flight, the rest are refused (503) instead of queueing behind them.
+    Only used from the event loop thread, so the counters need no lock.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sam-api")
+        self._stats = {
+            "pending": 0,
+            "max_pending_seen": 0,
+            "completed": 0,
+            "rejected": 0,
+            "timeouts": 0,
+            "disconnects": 0,
+        }
+
+    async def run(self, request: Request, fn, *args, **kwargs):
+        """Blocking fn(*args, **kwargs) on the thread pool; see _guarded."""
+        loop = asyncio.get_running_loop()
+        return await self._guarded(
+            request, lambda: loop.run_in_executor(self._pool, functools.partial(fn, *args, **kwargs)))
+
+    async def run_async(self, request: Request, coroutine_fn, *args, **kwargs):
+        """await coroutine_fn(*args, **kwargs) on the loop; see _guarded."""
+        return await self._guarded(request, lambda: asyncio.ensure_future(coroutine_fn(*args, **kwargs)))
+
+    async def _guarded(self, request: Request, start):
+        """
+        Starts the work (`start()` returns its future) and returns its
+        result, or raises HTTPException: 503 when full, 504 past the
+        request's deadline, 499 when the client went away first.
+        """
+        timeout = _deadline(request)
+        if self._stats["pending"] >= self.max_pending:
+            self._stats["rejected"] += 1
+            raise HTTPException(503, "Server busy, try again", headers={"Retry-After": "1"})
+
+        work = start()
+        gone = asyncio.ensure_future(_client_gone(request))
+        self._stats["pending"] += 1
+        self._stats["max_pending_seen"] = max(self._stats["max_pending_seen"], self._stats["pending"])
+        try:
+            done, _ = await asyncio.wait({work, gone}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self._stats["pending"] -= 1
+            gone.cancel()
+            # a no-op once it finished; a coroutine is cancelled where it
+            # waits (query, HTTP call), a queued blocking call never starts
+            # and a running one completes on its thread, result dropped
+            if work.cancel():
+                # let the cancellation land before answering, so the query
+                # is really gone by the time the client sees the 504
+                await asyncio.wait({work})
+
+        if work in done:
+            self._stats["completed"] += 1
+            return work.result()
+        if gone in done:
+            self._stats["disconnects"] += 1
+            raise HTTPException(CLIENT_CLOSED_STATUS, "Client closed request")
+        self._stats["timeouts"] += 1
+        raise HTTPException(504, "Request timed out")
+
+    def stats(self):
+        return dict(self._stats, workers=self.workers, max_pending=self.max_pending)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _client_gone(request: Request):
+    """Returns once the client disconnects (never, if the response goes out first)."""
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+def _deadline(request: Request) -> float:
+    timeout = Config.API_REQUEST_TIMEOUT
+    header = request.headers.get(TIMEOUT_HEADER)
+    if header:
+        try:
+            timeout = min(timeout, float(header))
+        except ValueError:
+            raise HTTPException(400, f"{TIMEOUT_HEADER} must be a number of seconds")
+    if timeout <= 0:
+        raise HTTPException(400, f"{TIMEOUT_HEADER} must be positive")
+    return timeout
+
+
+def _checked(result: dict) -> dict:
+    """
+    Passes a service {"success": ...} result through, or raises it as an
+    HTTP error (404 not found, 409 conflict, 502 Google API error, else 400).
+    """
+    if result.get("success"):
+        return result
+    error = result.get("error") or "Request failed"
+    lowered = error.lower()
+    if "not found" in lowered:
+        status = 404
+    elif "conflict" in lowered or "changed since" in lowered:
+        status = 409
+    elif lowered.startswith("google api error"):
+        status = 502
+    else:
+        status = 400
+    raise HTTPException(status, error)
+
+
+def _iso(value: str, field: str) -> str:
+    try:
+        return parse_iso_datetime(value)
+    except (ValueError, TypeError):
+        raise HTTPException(422, f"{field} must be an ISO 8601 datetime")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.executor = RequestExecutor(Config.API_WORKERS, Config.API_MAX_PENDING)
+    try:
+        yield
+    finally:
+        app.state.executor.shutdown()
+        await close_async_pool()
+
+
+app = FastAPI(title="S.A.M", lifespan=lifespan)
+
+
+def _run(request: Request, fn, *args, **kwargs):
+    return request.app.state.executor.run(request, fn, *args, **kwargs)
+
+
+def _run_async(request: Request, coroutine_fn, *args, **kwargs):
+    return request.app.state.executor.run_async(request, coroutine_fn, *args, **kwargs)
+
+
+@app.get("/health")
+async def health(request: Request):
+    return {"success": True, "executor": request.app.state.executor.stats()}
+
+
+@app.post("/meetings", status_code=201)
+async def create_meeting(meeting: MeetingIn, request: Request):
+    event = {
+        "summary": meeting.title,
+        "description": meeting.description,
+        "start": {"dateTime": _iso(meeting.start, "start"), "timeZone": "UTC"},
+        "end": {"dateTime": _iso(meeting.end, "end"), "timeZone": "UTC"},
+        "attendees": [{"email": email} for email in meeting.participants],
+    }
+    result = await _run(request, meeting_modifier.create_meetings, [event],
+                        Config.SENDER_EMAIL, check_conflicts=meeting.check_conflicts)
+    if "results" not in result:
+        return _checked(result)
+    return _checked(result["results"][0])
+
+
+@app.get("/meetings")
+async def list_meetings(request: Request, days: int = 7, email: Optional[str] = None,
+                        invited: bool = False):
+    email = email or Config.SENDER_EMAIL
+    now = datetime.datetime.now(datetime.timezone.utc)
+    fetch = meeting_store.list_invited_meetings_async if invited else meeting_store.list_meetings_async
+    meetings = await _run_async(request, fetch, email, now, now + datetime.timedelta(days=days))
+    return {"success": True, "email": email, "meetings": meetings}
+
+
+@app.get("/meetings/{meeting_id}")
+async def show_meeting(meeting_id: str, request: Request):
+    meeting = await _run_async(request, meeting_store.get_meeting_async, meeting_id)
+    if meeting is None:
+        raise HTTPException(404, f"Meeting {meeting_id} not found")
+    return {"success": True, "meeting": meeting}
+
+
+@app.patch("/meetings/{meeting_id}")
+async def reschedule_meeting(meeting_id: str, change: RescheduleIn, request: Request):
+    result = await _run_async(request, meeting_modifier.reschedule_meeting_async, meeting_id,
+                              _iso(change.start, "start"), _iso(change.end, "end"),
+                              Config.SENDER_EMAIL, notify=change.notify)
+    return _checked(result)
+
+
+@app.delete("/meetings/{meeting_id}")
+async def cancel_meeting(meeting_id: str, request: Request, notify: bool = False):
+    result = await _run_async(request, meeting_modifier.cancel_meeting_async, meeting_id,
+                              Config.SENDER_EMAIL, notify=notify)
+    return _checked(result)
+
+
+@app.post("/resolve")
+async def resolve(body: ResolveIn, request: Request):
+    results = await _run(request, user_resolver.resolve_participants_batch,
+                         body.names, threshold=body.threshold, exact=True)
+    return {"success": True, "results": results}
+
+
+'''
+how to use this?
+
+python src/main.py api --port 8000          # ya: uvicorn api.routes:app (src/ se)
+
+curl -X POST localhost:8000/meetings -H 'Content-Type: application/json' \
+     -d '{"title": "Review", "start": "2025-01-28T10:00:00", "end": "2025-01-28T11:00:00",
+          "participants": ["sharma@college.edu"]}'
+# 201 {"index": 0, "success": true, "meeting_id": "...", "html_link": "..."}
+
+curl 'localhost:8000/meetings?days=7'
+curl -X PATCH localhost:8000/meetings/evt1 -H 'X-Request-Timeout: 5' \
+     -d '{"start": "2025-01-29T10:00:00", "end": "2025-01-29T11:00:00", "notify": true}'
+curl -X DELETE 'localhost:8000/meetings/evt1?notify=true'
+curl -X POST localhost:8000/resolve -d '{"names": ["Sharma", "ani"]}'
+curl localhost:8000/health                   # pool: pending / timeouts / rejected
+
+# errors: 404 not found, 409 conflict, 502 Google, 503 busy, 504 timeout
+# load test: scripts/benchmark_api.py
+'''
@@ -0,0 +1,244 @@
+"""
+S.A.M command line entry point.
+
+    python src/main.py outbox work --workers 4
+    python src/main.py outbox status
+    python src/main.py list --days 7
+    python src/main.py show <meeting_id>
+    python src/main.py create "Budget review" --start 2025-01-28T10:00 --end 2025-01-28T11:00 --with Sharma
+    python src/main.py feed --department "Computer Science" -o cs.ics
+    python src/main.py serve
+    python src/main.py api --port 8000
+
+With `serve` running, every other command is sent to the warm daemon over
+its Unix socket (services/daemon.py); without it they run in this process.
+"""
+
+import datetime
+import os
+import sys
+import time
+
+import click
+
+
+@click.group()
+def cli():
+    """S.A.M - Smart Administrative Messenger."""
+
+
+def _print_meeting(meeting, verbose=False):
+    click.echo(f"{meeting['start_time']:%a %d %b %H:%M}-{meeting['end_time']:%H:%M} UTC  "
+               f"{meeting['title']}  [{meeting['meeting_id']}]")
+    if verbose:
+        click.echo(f"  organizer: {meeting['organizer_email']}")
+        if meeting["meet_link"]:
+            click.echo(f"  meet: {meeting['meet_link']}")
+        for person in meeting["participants"]:
+            click.echo(f"  - {person['name'] or ''} <{person['email']}>")
+
+
+@cli.command("list")
+@click.option("--days", type=int, default=7, show_default=True, help="How many days ahead.")
+@click.option("--organizer", default=None, help="Organizer email (default: SENDER_EMAIL).")
+@click.option("--invited", is_flag=True, help="Meetings the email is invited to instead.")
+def list_command(days, organizer, invited):
+    """List upcoming meetings (from the local mirror)."""
+    from utils.config_loader import Config
+    from utils.meeting_store import list_invited_meetings, list_meetings
+
+    email = organizer or Config.SENDER_EMAIL
+    now = datetime.datetime.now(datetime.timezone.utc)
+    fetch = list_invited_meetings if invited else list_meetings
+    meetings = fetch(email, now, now + datetime.timedelta(days=days))
+    if not meetings:
+        click.echo(f"No meetings for {email} in the next {days} days.")
+    for meeting in meetings:
+        _print_meeting(meeting)
+
+
+@cli.command("show")
+@click.argument("meeting_id")
+def show_command(meeting_id):
+    """Show one meeting with its participants."""
+    from utils.meeting_store import get_meeting
+
+    meeting = get_meeting(meeting_id)
+    if meeting is None:
+        raise click.ClickException(f"Meeting {meeting_id} not found")
+    _print_meeting(meeting, verbose=True)
+
+
+@cli.command("create")
+@click.argument("title")
+@click.option("--start", required=True, help="ISO 8601, UTC if no offset.")
+@click.option("--end", required=True, help="ISO 8601, UTC if no offset.")
+@click.option("--with", "participants", multiple=True, help="Participant name or email (repeatable).")
+@click.option("--description", default="", help="Agenda.")
+@click.option("--force", is_flag=True, help="Skip the conflict checks.")
+@click.option("--no-notify", is_flag=True, help="Do not email the invite.")
+@click.option("--timings", is_flag=True, help="Show how long each stage took.")
+def create_command(title, start, end, participants, description, force, no_notify, timings):
+    """Create a meeting and email the invite (services/meeting_pipeline.py)."""
+    from services.meeting_pipeline import schedule_meeting
+    from utils.config_loader import Config
+
+    result = schedule_meeting(title, start, end, list(participants), Config.SENDER_EMAIL,
+                              description=description, check_conflicts=not force, notify=not no_notify)
+    if timings:
+        for stage, timing in sorted(result["timings"].items(), key=lambda item: item[1]["start_ms"]):
+            click.echo(f"  {stage:22s} +{timing['start_ms']:7.1f} ms  {timing['duration_ms']:7.1f} ms")
+        click.echo(f"  {'total':22s} {result['elapsed_ms']:17.1f} ms")
+    if not result["success"]:
+        rolled_back = f", rolled back: {', '.join(result['rolled_back'])}" if result["rolled_back"] else ""
+        raise click.ClickException(f"{result['error']} (stage {result['failed_stage']}{rolled_back})")
+    click.echo(f"Created {result['meeting_id']}  {result['html_link'] or ''}".rstrip())
+    notification = result["notification"]
+    if notification is not None:
+        click.echo(f"Invites: sent={notification['sent']} failed={notification['failed']}")
+
+
+@cli.command("feed")
+@click.option("--faculty", default=None, help="Faculty email: meetings they organize or are invited to.")
+@click.option("--department", default=None, help="Department name: meetings of its faculty.")
+@click.option("-o", "--output", type=click.Path(dir_okay=False), default="-", help="Output file (default: stdout).")
+@click.pass_context
+def feed_command(ctx, faculty, department, output):
+    """Export an iCalendar feed (.ics) from the local mirror."""
+    from utils.ics_feed import get_feed
+
+    if bool(faculty) == bool(department):
+        raise click.UsageError("Give exactly one of --faculty or --department")
+    feed = get_feed("faculty", faculty) if faculty else get_feed("department", department)
+    if not feed["success"]:
+        raise click.ClickException(feed["error"])
+    if output == "-":
+        sys.stdout.flush()
+        for chunk in feed["body"]:
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+        return
+    # relative to the caller's directory, also when run by the daemon
+    path = os.path.join((ctx.obj or {}).get("cwd") or os.getcwd(), output)
+    with open(path, "wb") as f:
+        for chunk in feed["body"]:
+            f.write(chunk)
+
+
+@cli.group()
+def outbox():
+    """Background email delivery (notification_outbox)."""
+
+
+def _print_queue_stats(stats):
+    if not stats:
+        click.echo("Outbox stats unavailable (is the database reachable?)")
+        return
+    oldest = stats.get("oldest_pending_seconds")
+    click.echo(
+        f"pending={stats['pending']} sending={stats['sending']} "
+        f"sent={stats['sent']} dead={stats['dead']} "
+        f"oldest_pending={f'{oldest:.0f}s' if oldest is not None else '-'} "
+        f"sent/min={stats['sent_last_minute']} sent/hour={stats['sent_last_hour']}"
+    )
+
+
+@outbox.command("status")
+def outbox_status():
+    """Show queue depth and delivery throughput."""
+    from services.notification_queue import get_queue_stats
+
+    _print_queue_stats(get_queue_stats())
+
+
+@outbox.command("work")
+@click.option("--workers", type=int, default=None, help="Worker threads (default: OUTBOX_WORKERS).")
+@click.option("--batch-size", type=int, default=1, show_default=True, help="Jobs claimed per poll.")
+@click.option("--poll-interval", type=float, default=1.0, show_default=True, help="Seconds between polls when idle.")
+@click.option("--report-every", type=float, default=30.0, show_default=True, help="Seconds between status lines.")
+def outbox_work(workers, batch_size, poll_interval, report_every):
+    """Run outbox workers until Ctrl+C."""
+    from services.notification_queue import NotificationWorkerPool, get_queue_stats
+
+    pool = NotificationWorkerPool(workers=workers, batch_size=batch_size,
+                                  poll_interval=poll_interval)
+    pool.start()
+    click.echo(f"Started {pool.workers} outbox workers. Ctrl+C to stop.")
+
+    try:
+        while True:
+            time.sleep(report_every)
+            click.echo(
+                f"[workers] jobs_sent={pool.stats['jobs_sent']} retried={pool.stats['jobs_retried']} "
+                f"dead={pool.stats['jobs_dead']} throughput={pool.throughput():.2f} msg/s"
+            )
+            _print_queue_stats(get_queue_stats())
+    except KeyboardInterrupt:
+        click.echo("Stopping workers, finishing in-flight jobs...")
+        pool.stop()
+
+
+@cli.command("serve")
+@click.option("--socket", "socket_path", default=None, help="Unix socket (default: SAM_SOCKET or sam-<uid>.sock in the temp dir).")
+@click.option("--workers", type=int, default=None, help="Threads serving commands (default: SAM_DAEMON_WORKERS).")
+@click.option("--status", is_flag=True, help="Show whether a daemon is running, then exit.")
+def serve_command(socket_path, workers, status):
+    """Keep a warm process running that the other commands are sent to."""
+    from services.daemon import SamDaemon, ping
+
+    if status:
+        stats = ping(socket_path)
+        if stats is None:
+            raise click.ClickException("No sam daemon is running")
+        click.echo(" ".join(f"{key}={value}" for key, value in stats.items()))
+        return
+
+    daemon = SamDaemon(socket_path=socket_path, workers=workers, app=cli)
+    try:
+        daemon.start()
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+    for step, result in daemon.warm_up().items():
+        click.echo(f"[warm] {step}: {result}")
+    click.echo(f"Listening on {daemon.socket_path} with {daemon.workers} workers. Ctrl+C to stop.")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        click.echo("Stopping daemon...")
+
+
+@cli.command("api")
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--port", type=int, default=8000, show_default=True)
+@click.option("--workers", type=int, default=None, help="Threads for blocking calls (default: API_WORKERS).")
+def api_command(host, port, workers):
+    """Run the HTTP API (api/routes.py) until Ctrl+C."""
+    import uvicorn
+
+    from utils.config_loader import Config
+
+    if workers:
+        Config.API_WORKERS = workers
+    uvicorn.run("api.routes:app", host=host, port=port, log_level="warning")
+
+
+def main():
+    """
+    Sends the command to the `sam serve` daemon when one is running,
+    otherwise runs it here. A subsystem used without its .env keys exits
+    with a message.
+    """
+    from services.daemon import forward
+    from utils.config_loader import ConfigError
+
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+    try:
+        cli()
+    except ConfigError as e:
+        raise SystemExit(f"Configuration error: {e}")
+
+
+if __name__ == "__main__":
+    main()
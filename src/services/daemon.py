@@ -0,0 +1,427 @@
+"""
+`sam serve` daemon aur CLI ka thin client.
+
+har `python src/main.py list` ek naya process hai: imports, DB connection,
+OAuth token + Calendar client, roster + resolver index, compiled templates,
+sab har baar dobara. daemon yea sab ek baar garam (warm) karke Unix socket
+pe baitha rehta hai. CLI pehele socket pe command bhejta hai aur sirf output
+print karta hai; daemon na chal raha ho toh pehele jaisa process me hee
+command chala leta hai.
+
+daemon wahi click commands (main.cli) chalata hai, fixed worker threads pe
+(har thread ka Calendar client google_auth me thread-local hai, isliye
+threads bane rehne chahiye). har request ka stdout / stderr (click.echo aur
+print dono) alag capture hota hai. capture ek ContextVar me hai, toh command
+ke andar utils/pipeline.py ke stage threads (jo caller ka context copy karke
+chalte hai) ka print bhi usi request me jata hai; koi aur thread jo context
+copy nahi karta, uska output daemon ke console pe jata hai.
+
+protocol: client ek JSON line bhejta hai {"v", "op", "argv", "cwd"}; daemon
+ek JSON line {"exit_code", "stdout", "stderr"} (byte counts) aur uske baad
+stdout aur stderr ke raw bytes bhejta hai.
+"""
+
+import contextvars
+import io
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+from utils.config_loader import Config
+
+PROTOCOL_VERSION = 1
+
+# Longest request line the daemon reads (argv + cwd)
+MAX_REQUEST_BYTES = 1024 * 1024
+
+# Commands that never go to the daemon: the daemon itself, and long-running
+# foreground commands that have to stop with this terminal's Ctrl+C
+LOCAL_COMMANDS = (("serve",), ("api",), ("outbox", "work"))
+
+
+def default_socket_path() -> str:
+    """Config.SAM_SOCKET, or sam-<uid>.sock in the temp directory."""
+    if Config.SAM_SOCKET:
+        return Config.SAM_SOCKET
+    return os.path.join(tempfile.gettempdir(), f"sam-{os.getuid()}.sock")
+
+
+def is_local_command(argv) -> bool:
+    return any(tuple(argv[:len(command)]) == command for command in LOCAL_COMMANDS)
+
+
+# -------------------------------
+# Client
+# -------------------------------
+
+def _read_exact(reader, size):
+    data = reader.read(size)
+    if len(data) != size:
+        raise ConnectionError("sam daemon closed the connection mid-response")
+    return data
+
+
+def _request(message: dict, socket_path: str = None):
+    """
+    Sends one request. Returns (header, stdout bytes, stderr bytes), or
+    None if no daemon is listening. Errors after connecting are raised:
+    the command may already have run, so it must not be run again.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path or default_socket_path())
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+
+    with sock, sock.makefile("rb") as reader:
+        sock.sendall(json.dumps(dict(message, v=PROTOCOL_VERSION)).encode("utf-8") + b"\n")
+        line = reader.readline()
+        if not line:
+            raise ConnectionError("sam daemon closed the connection")
+        header = json.loads(line)
+        if header.get("error") == "protocol":
+            # a daemon from another version: run in process instead
+            return None
+        stdout = _read_exact(reader, header.get("stdout", 0))
+        stderr = _read_exact(reader, header.get("stderr", 0))
+        return header, stdout, stderr
+
+
+def forward(argv, socket_path: str = None, stdout=None, stderr=None):
+    """
+    Runs a CLI command in the daemon and copies its output to this
+    process's stdout / stderr.
+
+    Returns:
+        int: The command's exit code, or None if it was not forwarded
+        (no daemon, SAM_NO_DAEMON set, or a local-only command).
+    """
+    if os.getenv("SAM_NO_DAEMON") or is_local_command(argv):
+        return None
+    response = _request({"op": "run", "argv": list(argv), "cwd": os.getcwd()}, socket_path)
+    if response is None:
+        return None
+
+    header, out, err = response
+    for stream, data in ((stdout or sys.stdout, out), (stderr or sys.stderr, err)):
+        if data:
+            stream.flush()
+            stream.buffer.write(data)
+            stream.buffer.flush()
+    return header["exit_code"]
+
+
+def ping(socket_path: str = None):
+    """The daemon's stats, or None if it is not running."""
+    response = _request({"op": "ping"}, socket_path)
+    return response[0]["stats"] if response else None
+
+
+# -------------------------------
+# Daemon
+# -------------------------------
+
+class _RequestOutput:
+    """
+    Stands in for sys.stdout / sys.stderr in the daemon. Writes from code
+    serving a request (its thread, or threads running in a copy of its
+    context) go to that request's buffer; anything else (background
+    threads, the daemon's own log) to the real stream.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._stream = contextvars.ContextVar(f"sam_output_{id(self)}", default=None)
+
+    def _target(self):
+        return self._stream.get() or self._fallback
+
+    def capture(self):
+        self._stream.set(io.TextIOWrapper(io.BytesIO(), encoding="utf-8", write_through=True))
+
+    def release(self) -> bytes:
+        stream = self._stream.get()
+        # worker threads are reused: the next request starts uncaptured
+        self._stream.set(None)
+        stream.flush()
+        return stream.buffer.getvalue()
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+
+class SamDaemon:
+    """
+    Serves CLI commands over a Unix socket from one warm process.
+
+    Args:
+        socket_path (str): Default: default_socket_path().
+        workers (int): Threads running commands (default Config.SAM_DAEMON_WORKERS).
+        app: click command to run (default main.cli).
+    """
+
+    def __init__(self, socket_path: str = None, workers: int = None, app=None):
+        self.socket_path = socket_path or default_socket_path()
+        self.workers = workers or Config.SAM_DAEMON_WORKERS
+        self.app = app
+        self._server = None
+        self._executor = None
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "failed": 0, "busy": 0}
+        self._started_at = None
+        self._streams = None
+
+    # ----- warm state -----
+
+    def warm_up(self) -> dict:
+        """
+        Loads everything a command would otherwise set up on its own:
+        DB pool, compiled templates, roster + resolver index, and a Calendar
+        client on every worker thread (only if token.json exists, so the
+        daemon never opens a browser login). Failures are reported, not raised.
+
+        Returns:
+            dict: {step: "<ms> ms" or the error}.
+        """
+        steps = (
+            ("database", self._warm_database),
+            ("templates", self._warm_templates),
+            ("roster", self._warm_roster),
+            ("calendar", self._warm_calendar),
+            ("modules", self._warm_modules),
+        )
+        report = {}
+        for name, step in steps:
+            started = time.perf_counter()
+            try:
+                note = step()
+                report[name] = note or f"{(time.perf_counter() - started) * 1000:.0f} ms"
+            except Exception as e:
+                report[name] = f"failed: {e}"
+        return report
+
+    def _warm_database(self):
+        from utils.db_pool import db_cursor
+
+        with db_cursor() as cur:
+            cur.execute("SELECT 1")
+
+    def _warm_templates(self):
+        from utils.template_registry import get_registry
+
+        get_registry()
+
+    def _warm_roster(self):
+        from utils.user_resolver import get_faculty_index
+
+        get_faculty_index()
+
+    def _warm_calendar(self):
+        from utils import google_auth
+
+        if not os.path.exists(google_auth.TOKEN_FILE):
+            return "skipped (no token.json)"
+        # one task per worker; the barrier keeps a thread from taking two
+        barrier = threading.Barrier(self.workers)
+
+        def build():
+            try:
+                google_auth.get_calendar_service()
+            except Exception:
+                barrier.abort()
+                raise
+            barrier.wait(timeout=30)
+
+        for future in [self._executor.submit(build) for _ in range(self.workers)]:
+            future.result()
+
+    def _warm_modules(self):
+        import icalendar  # noqa: F401  (ics_generator imports it on first render)
+        import services.meeting_modifier  # noqa: F401
+        import utils.ics_feed  # noqa: F401
+
+    # ----- serving -----
+
+    def start(self):
+        """Binds the socket and starts the worker threads (serve_forever() runs the loop)."""
+        import socketserver
+        from concurrent.futures import ThreadPoolExecutor
+
+        if self.app is None:
+            from main import cli
+
+            self.app = cli
+
+        if os.path.exists(self.socket_path):
+            if _request({"op": "ping"}, self.socket_path) is not None:
+                raise RuntimeError(f"A sam daemon is already listening on {self.socket_path}")
+            os.unlink(self.socket_path)  # left behind by a daemon that died
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                daemon._handle(self.rfile, self.wfile)
+
+        class Server(socketserver.UnixStreamServer):
+            def process_request(self, request, client_address):
+                daemon._executor.submit(self._process, request, client_address)
+
+            def _process(self, request, client_address):
+                try:
+                    self.finish_request(request, client_address)
+                except Exception:
+                    self.handle_error(request, client_address)
+                finally:
+                    self.shutdown_request(request)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sam-daemon")
+        old_umask = os.umask(0o177)  # socket is rw for this user only
+        try:
+            self._server = Server(self.socket_path, Handler)
+        finally:
+            os.umask(old_umask)
+
+        self._streams = (sys.stdout, sys.stderr)
+        sys.stdout = _RequestOutput(sys.stdout)
+        sys.stderr = _RequestOutput(sys.stderr)
+        self._started_at = time.time()
+
+    def serve_forever(self):
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            self.close()
+
+    def serve_in_background(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, name="sam-daemon", daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self):
+        """Stops serve_forever() (from another thread)."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def close(self):
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._streams is not None:
+            sys.stdout, sys.stderr = self._streams
+            self._streams = None
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["uptime_s"] = round(time.time() - self._started_at, 1) if self._started_at else 0
+        stats["workers"] = self.workers
+        stats["pid"] = os.getpid()
+        return stats
+
+    def _handle(self, rfile, wfile):
+        line = rfile.readline(MAX_REQUEST_BYTES)
+        try:
+            message = json.loads(line)
+        except ValueError:
+            wfile.write(b'{"error": "bad request"}\n')
+            return
+        if message.get("v") != PROTOCOL_VERSION:
+            wfile.write(b'{"error": "protocol"}\n')
+            return
+        if message.get("op") == "ping":
+            wfile.write(json.dumps({"stats": self.stats()}).encode("utf-8") + b"\n")
+            return
+
+        with self._lock:
+            self._stats["busy"] += 1
+        try:
+            exit_code, out, err = self._run(message.get("argv") or [], message.get("cwd"))
+        finally:
+            with self._lock:
+                self._stats["busy"] -= 1
+                self._stats["requests"] += 1
+        if exit_code:
+            with self._lock:
+                self._stats["failed"] += 1
+
+        header = {"exit_code": exit_code, "stdout": len(out), "stderr": len(err)}
+        try:
+            wfile.write(json.dumps(header).encode("utf-8") + b"\n" + out + err)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client gave up (e.g. Ctrl+C); the command has run anyway
+
+    def _run(self, argv, cwd):
+        """Runs one command with its output captured. Returns (exit_code, stdout, stderr)."""
+        sys.stdout.capture()
+        sys.stderr.capture()
+        try:
+            exit_code = self._invoke(argv, cwd)
+        finally:
+            out = sys.stdout.release()
+            err = sys.stderr.release()
+        return exit_code, out, err
+
+    def _invoke(self, argv, cwd):
+        import click
+        from utils.config_loader import ConfigError
+
+        if is_local_command(argv):
+            print(f"'{' '.join(argv)}' cannot run inside the daemon", file=sys.stderr)
+            return 2
+        try:
+            # cwd lets commands resolve the caller's relative paths
+            result = self.app.main(args=argv, prog_name="sam", standalone_mode=False,
+                                   obj={"cwd": cwd})
+            return result if isinstance(result, int) else 0
+        except click.exceptions.Exit as e:
+            return e.exit_code
+        except click.ClickException as e:
+            e.show()
+            return e.exit_code
+        except click.Abort:
+            click.echo("Aborted!", err=True)
+            return 1
+        except ConfigError as e:
+            print(f"Configuration error: {e}", file=sys.stderr)
+            return 1
+        except SystemExit as e:
+            if isinstance(e.code, str):
+                print(e.code, file=sys.stderr)
+                return 1
+            return e.code or 0
+        except Exception:
+            traceback.print_exc()
+            return 1
+
+
+'''
+how to use this?
+
+python src/main.py serve                 # ek terminal me (ya systemd / tmux)
+python src/main.py list --days 7         # ab socket se, warm daemon me chalta hai
+python src/main.py serve --status        # uptime, requests, workers
+
+SAM_NO_DAEMON=1 python src/main.py list  # daemon ko skip, process me hee chalao
+
+from services.daemon import SamDaemon    # tests / embedding
+daemon = SamDaemon(socket_path="/tmp/sam-test.sock", workers=2)
+daemon.start()
+print(daemon.warm_up())
+daemon.serve_forever()
+'''
@@ -4,10 +4,10 @@ people using the send_email(self, target_name, subject, message_body)
 '''
 
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from utils.config_loader import Config
+from utils.mime_builder import PersonalizedMessageBuilder
 from utils.user_resolver import resolve_faculty_member
+from services.notification_queue import enqueue_direct_email
 
 class DirectEmailService:
     def __init__(self):
@@ -38,19 +38,14 @@ class DirectEmailService:
 
         try:
             # Construct the email
-            msg = MIMEMultipart()
-            msg['From'] = self.sender_email
-            msg['To'] = recipient_email
-            msg['Subject'] = subject
-
-            # Attach body (Plain text or HTML)
-            msg.attach(MIMEText(message_body, 'plain'))
+            builder = PersonalizedMessageBuilder(self.sender_email, subject, message_body)
+            msg = builder.build(recipient_email, recipient_name)
 
             # Send via SMTP
             with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
                 server.starttls()
                 server.login(self.sender_email, self.sender_password)
-                server.sendmail(self.sender_email, recipient_email, msg.as_string())
+                server.send_message(msg)
 
             print(f"🚀 Email successfully sent to {recipient_name}!")
             return True
@@ -58,6 +53,93 @@ class DirectEmailService:
         except Exception as e:
             print(f"❌ Failed to send email: {e}")
             return False
+
+    async def send_email_async(self, target_name, subject, message_body):
+        """
+        send_email on the event loop (aiosmtplib), so many direct emails can
+        be in flight on one thread. Same result: True / False.
+        """
+        import aiosmtplib
+
+        recipient = resolve_faculty_member(target_name)
+        if not recipient:
+            print(f"❌ Error: Could not find anyone named '{target_name}' in the database.")
+            return False
+
+        try:
+            builder = PersonalizedMessageBuilder(self.sender_email, subject, message_body)
+            msg = builder.build(recipient['email'], recipient['name'])
+
+            await aiosmtplib.send(msg, hostname=self.smtp_server, port=self.smtp_port,
+                                  start_tls=True, username=self.sender_email,
+                                  password=self.sender_password)
+
+            print(f"🚀 Email successfully sent to {recipient['name']}!")
+            return True
+
+        except Exception as e:
+            print(f"❌ Failed to send email: {e}")
+            return False
+
+    def queue_email(self, target_name, subject, message_body):
+        """
+        Like send_email, but only resolves the name and drops the email into
+        the notification outbox. Returns the outbox job id right away (None on
+        failure); outbox workers do the actual SMTP send.
+        """
+        recipient = resolve_faculty_member(target_name)
+        if not recipient:
+            print(f"❌ Error: Could not find anyone named '{target_name}' in the database.")
+            return None
+
+        job_id = enqueue_direct_email(recipient['email'], recipient['name'], subject, message_body)
+        if job_id:
+            print(f"📬 Email to {recipient['name']} queued (job {job_id}).")
+        return job_id
+
+    def send_email_to_many(self, target_names, subject, message_body):
+        """
+        Same as send_email for a list of names, but the message is built once
+        and everyone is mailed over a single SMTP session.
+
+        Returns:
+            dict: {target_name: True/False}
+        """
+        results = {}
+        recipients = []
+        for target_name in target_names:
+            recipient = resolve_faculty_member(target_name)
+            if not recipient:
+                print(f"❌ Error: Could not find anyone named '{target_name}' in the database.")
+                results[target_name] = False
+            else:
+                recipients.append((target_name, recipient))
+
+        if not recipients:
+            return results
+
+        builder = PersonalizedMessageBuilder(self.sender_email, subject, message_body)
+
+        try:
+            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
+                server.starttls()
+                server.login(self.sender_email, self.sender_password)
+
+                for target_name, recipient in recipients:
+                    try:
+                        server.send_message(builder.build(recipient['email'], recipient['name']))
+                        results[target_name] = True
+                    except smtplib.SMTPRecipientsRefused as e:
+                        print(f"❌ Failed to send email to {recipient['name']}: {e}")
+                        results[target_name] = False
+
+        except Exception as e:
+            print(f"❌ Failed to send email: {e}")
+            for target_name, _ in recipients:
+                results.setdefault(target_name, False)
+
+        print(f"🚀 Sent {sum(results.values())}/{len(results)} emails.")
+        return results
         
 '''
 how to use this service?
@@ -76,6 +158,8 @@ body = "Bhai kal meeting hai, time pe aana."
 
 success = email_service.send_email(target_name, subject, body)
 
+# async code me: success = await email_service.send_email_async(target_name, subject, body)
+
 if success:
     print("Email chala gaya!")
 else:
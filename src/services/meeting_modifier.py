@@ -1,33 +1,236 @@
+"""
+Meetings ko reschedule / cancel / create karna.
+
+ek meeting ke liye create_meeting / reschedule_meeting / cancel_meeting hai.
+bahut saari meetings ek saath (jaise department holiday pe poore din ka
+schedule cancel) ke liye cancel_meetings / reschedule_meetings /
+create_meetings hai: yea Google ke batch endpoint pe ek HTTP request me 50
+operations tak bhejte hai, aur har meeting ka result alag se wapas aata hai.
+
+create_meeting ko event id pehele se di ja sakti hai, toh invite ka .ics
+insert ke saath hee ban jata hai (services/meeting_pipeline.py).
+
+delete / patch se pehele wala events().get hata diya hai: meeting na ho toh
+delete / patch khud 404 deta hai, aur patch ko sirf start / end chahiye,
+poora event nahi. conflict check busy cache (utils/busy_cache.py) se hota hai.
+
+har successful write Postgres ke meetings mirror (utils/meeting_store.py) me
+bhi jata hai, taaki list / show Google ko call kiye bina chal sake, aur
+activity_log me audit entry buffer ho jati hai (utils/activity_log.py).
+
+notify=True pe reschedule_meeting / cancel_meeting participants ko chhota
+"update" / "cancel" mail queue karte hai jiska .ics meeting ke UID aur
+mirror ke SEQUENCE wala METHOD:REQUEST / CANCEL hai: attendee ke calendar
+me purana event hee badal / hat jata hai, poora invite dobara nahi jata.
+
+reschedule_meeting_async / cancel_meeting_async wahi kaam event loop pe
+karte hai (Calendar REST httpx se, mirror / outbox asyncpg se) - HTTP API
+inhi ko use karta hai, ek loop pe bahut saari calls ek saath.
+"""
+
+import asyncio
+import time
+
 from googleapiclient.errors import HttpError
+from services.notification_queue import enqueue_meeting_notification, enqueue_meeting_notification_async
+from utils import meeting_store
+from utils.activity_log import log_activity
+from utils.async_calendar import CalendarAPIError, get_async_calendar
+from utils.busy_cache import get_busy_store, get_synced_store, to_timestamp
 from utils.google_auth import get_calendar_service
+from utils.ics_generator import render_meeting_ics
 from utils.conflict_detector import check_scheduler_conflict
 from utils.date_parser import parse_iso_datetime
 
+# Calendar API limit on calls inside one batch request
+BATCH_MAX_REQUESTS = 50
+# Items that failed with these are sent again in the next batch
+RETRYABLE_STATUSES = (429, 500, 502, 503)
+RETRYABLE_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+BATCH_RETRIES = 2
+BATCH_RETRY_DELAY = 1.0
+
+
+def _new_time_conflicts(meeting_id, scheduler_email, new_start, new_end):
+    """
+    Checks the new slot against the cached busy intervals, ignoring the
+    meeting itself (moving a meeting by 30 minutes overlaps its old slot).
+    Falls back to the live check if the cache cannot be synced.
+    """
+    try:
+        store = get_busy_store('primary')
+        return bool(store.busy_intervals(new_start, new_end, exclude={meeting_id}))
+    except Exception as e:
+        print(f"Busy cache unavailable, checking Google Calendar directly: {e}")
+        return check_scheduler_conflict(scheduler_email, new_start, new_end)
+
+
+def _mirror(write, *args):
+    """
+    Applies a write to the local meetings mirror. Google Calendar is the
+    source of truth, so a failed mirror write is logged, not raised.
+    """
+    try:
+        write(*args)
+    except Exception as e:
+        print(f"Meeting mirror not updated: {e}")
+
+
+def _mirrored_meeting(meeting_id):
+    """The meeting from the mirror (participants, SEQUENCE), or None."""
+    try:
+        meeting = meeting_store.get_meeting(meeting_id)
+    except Exception as e:
+        print(f"Meeting mirror not readable: {e}")
+        return None
+    if meeting is None:
+        print(f"Meeting {meeting_id} is not in the mirror, attendees not notified")
+    return meeting
+
+
+def _notification(meeting, notification_type, method):
+    """enqueue_meeting_notification arguments for the meeting's participants."""
+    details = {
+        "title": meeting["title"],
+        "start": meeting["start_time"].isoformat(),
+        "end": meeting["end_time"].isoformat(),
+        "link": meeting["meet_link"],
+        "organizer": meeting["organizer_email"],
+    }
+    return (
+        [{"email": person["email"], "name": person["name"]} for person in meeting["participants"]],
+        notification_type,
+        details,
+        render_meeting_ics(meeting, method),
+    )
+
+
+def _notify_attendees(meeting, notification_type, method):
+    """
+    Queues an update / cancellation email to the meeting's participants.
+    The .ics carries the meeting's UID and SEQUENCE, so their calendar
+    changes the event it already has. Returns the outbox job id, or None.
+    """
+    if not meeting or not meeting["participants"]:
+        return None
+    try:
+        return enqueue_meeting_notification(*_notification(meeting, notification_type, method))
+    except Exception as e:
+        print(f"Attendees not notified: {e}")
+        return None
+
+
+def _slots_conflicts(slots, scheduler_email):
+    """
+    Conflict flag for every (meeting_id, start, end) in `slots`: against
+    the calendar (ignoring the meeting itself) and against the slots
+    before it in the same list, which are not on the calendar yet.
+    """
+    flags = []
+    accepted = []
+    for meeting_id, start, end in slots:
+        begin, finish = to_timestamp(start), to_timestamp(end)
+        clash = any(begin < e and finish > s for s, e in accepted)
+        if not clash:
+            clash = _new_time_conflicts(meeting_id, scheduler_email, start, end)
+        if not clash:
+            accepted.append((begin, finish))
+        flags.append(clash)
+    return flags
+
+
+def _is_retryable(error):
+    if not isinstance(error, HttpError):
+        return False
+    if error.resp.status in RETRYABLE_STATUSES:
+        return True
+    return error.resp.status == 403 and any(reason in str(error) for reason in RETRYABLE_REASONS)
+
+
+def _execute_batch(service, requests: dict) -> dict:
+    """
+    Sends {key: HttpRequest} through the batch endpoint, at most
+    BATCH_MAX_REQUESTS per HTTP request. Rate-limited and 5xx items are
+    retried (BATCH_RETRIES times, with backoff).
+
+    Returns:
+        dict: {key: (response, error)}, error being None on success.
+    """
+    results = {}
+    pending = dict(requests)
+    for attempt in range(BATCH_RETRIES + 1):
+        if attempt:
+            time.sleep(BATCH_RETRY_DELAY * 2 ** (attempt - 1))
+        keys = list(pending)
+        for chunk_start in range(0, len(keys), BATCH_MAX_REQUESTS):
+            chunk = keys[chunk_start:chunk_start + BATCH_MAX_REQUESTS]
+
+            def callback(request_id, response, exception):
+                results[chunk[int(request_id)]] = (response, exception)
+
+            batch = service.new_batch_http_request(callback=callback)
+            for position, key in enumerate(chunk):
+                batch.add(pending[key], request_id=str(position))
+            try:
+                batch.execute()
+            except Exception as e:
+                # The whole HTTP request failed: every item in it gets the error
+                for key in chunk:
+                    results.setdefault(key, (None, e))
+
+        pending = {key: pending[key] for key in keys
+                   if results[key][1] is not None and _is_retryable(results[key][1])}
+        if not pending or attempt == BATCH_RETRIES:
+            break
+        for key in pending:
+            del results[key]
+    return results
+
+
+def _item_error(error, not_found):
+    if isinstance(error, HttpError):
+        if error.resp.status in (404, 410):
+            return not_found
+        if error.resp.status == 412:
+            return "Meeting was changed since it was last synced"
+        return f"Google API error: {error}"
+    return str(error)
+
+
+def _summary(results, done_key):
+    failed = sum(1 for item in results if not item["success"])
+    return {
+        "success": failed == 0,
+        done_key: len(results) - failed,
+        "failed": failed,
+        "results": results,
+    }
+
 
 def reschedule_meeting(meeting_id: str,
                        new_start_datetime: str,
                        new_end_datetime: str,
-                       scheduler_email: str) -> dict:
+                       scheduler_email: str,
+                       notify: bool = False) -> dict:
     """
     Reschedules an existing meeting to a new time.
+
+    With notify=True the participants get an "update" email whose .ics
+    (METHOD:REQUEST, next SEQUENCE) moves the event in their calendar;
+    the result then has "notification_job" (outbox id, None if not queued).
     """
 
     try:
-        
+
         new_start = parse_iso_datetime(new_start_datetime)
         new_end = parse_iso_datetime(new_end_datetime)
 
-        
+
         service = get_calendar_service()
 
-       
-        event = service.events().get(
-            calendarId='primary',
-            eventId=meeting_id
-        ).execute()
 
-       
-        conflict = check_scheduler_conflict(
+        conflict = _new_time_conflicts(
+            meeting_id,
             scheduler_email,
             new_start,
             new_end
@@ -39,30 +242,38 @@ def reschedule_meeting(meeting_id: str,
                 "error": "New time conflicts with an existing meeting"
             }
 
-       
-        event['start'] = {
-            'dateTime': new_start,
-            'timeZone': 'UTC'
-        }
-        event['end'] = {
-            'dateTime': new_end,
-            'timeZone': 'UTC'
-        }
 
-        
+        # patch only needs the fields that change; a missing meeting is a 404 here
         updated_event = service.events().patch(
             calendarId='primary',
             eventId=meeting_id,
-            body=event
+            body={
+                'start': {'dateTime': new_start, 'timeZone': 'UTC'},
+                'end': {'dateTime': new_end, 'timeZone': 'UTC'},
+            }
         ).execute()
 
-        return {
+        # Our own write is visible to conflict checks before the next sync
+        store = get_synced_store('primary')
+        if store is not None:
+            store.apply_event(updated_event)
+        _mirror(meeting_store.reschedule_meetings,
+                [(meeting_id, updated_event["start"]["dateTime"], updated_event["end"]["dateTime"])])
+        log_activity("meeting_rescheduled", meeting_id, scheduler_email,
+                     {"start": new_start, "end": new_end})
+
+        result = {
             "success": True,
             "meeting_id": updated_event["id"],
             "updated_start": updated_event["start"]["dateTime"],
             "updated_end": updated_event["end"]["dateTime"],
             "message": "Meeting rescheduled successfully"
         }
+        if notify:
+            # read after the mirror write, so it has the new times and SEQUENCE
+            result["notification_job"] = _notify_attendees(
+                _mirrored_meeting(meeting_id), "update", "REQUEST")
+        return result
 
     except HttpError as error:
         if error.resp.status == 404:
@@ -73,37 +284,417 @@ def reschedule_meeting(meeting_id: str,
         return {"success": False, "error": str(e)}
 
 
-def cancel_meeting(meeting_id: str, scheduler_email: str) -> dict:
+def cancel_meeting(meeting_id: str, scheduler_email: str, notify: bool = False) -> dict:
     """
-    
+    Deletes a meeting from the scheduler's calendar.
+
+    With notify=True the participants get a "cancel" email whose .ics
+    (METHOD:CANCEL) removes the event from their calendar; the result then
+    has "notification_job".
     """
 
     try:
-        
+
         service = get_calendar_service()
 
-       
-        service.events().get(
-            calendarId='primary',
-            eventId=meeting_id
-        ).execute()
+        # the mirror row goes with the delete, so read it first
+        meeting = _mirrored_meeting(meeting_id) if notify else None
+
 
-        
         service.events().delete(
             calendarId='primary',
             eventId=meeting_id
         ).execute()
 
-        return {
+        store = get_synced_store('primary')
+        if store is not None:
+            store.remove_event(meeting_id)
+        _mirror(meeting_store.delete_meetings, [meeting_id])
+        log_activity("meeting_cancelled", meeting_id, scheduler_email)
+
+        result = {
             "success": True,
             "meeting_id": meeting_id,
             "message": "Meeting cancelled successfully"
         }
+        if notify:
+            if meeting is not None:
+                meeting = dict(meeting, sequence=meeting["sequence"] + 1)
+            result["notification_job"] = _notify_attendees(meeting, "cancel", "CANCEL")
+        return result
 
     except HttpError as error:
-        if error.resp.status == 404:
+        if error.resp.status in (404, 410):
+            _mirror(meeting_store.delete_meetings, [meeting_id])
+            return {"success": False, "error": "Meeting not found or already deleted"}
+        return {"success": False, "error": f"Google API error: {error}"}
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def create_meeting(event: dict, scheduler_email: str, check_conflicts: bool = True) -> dict:
+    """
+    Creates one meeting on the scheduler's calendar.
+
+    `event` is a Calendar event body. It may carry its own "id" (5-1024
+    characters of a-v and 0-9), so the caller knows the meeting id, and
+    its .ics UID, before the insert returns; inserting that id twice gives
+    "Meeting already exists".
+    """
+    try:
+        if check_conflicts and _new_time_conflicts(None, scheduler_email, event["start"]["dateTime"],
+                                                   event["end"]["dateTime"]):
+            return {"success": False, "error": "Time conflicts with an existing meeting"}
+
+        created = get_calendar_service().events().insert(calendarId='primary', body=event).execute()
+
+        store = get_synced_store('primary')
+        if store is not None:
+            store.apply_event(created)
+        _mirror(meeting_store.save_meetings, [created], scheduler_email)
+        log_activity("meeting_created", created["id"], scheduler_email, {"summary": created.get("summary")})
+
+        return {
+            "success": True,
+            "meeting_id": created["id"],
+            "html_link": created.get("htmlLink"),
+            "message": "Meeting created successfully"
+        }
+
+    except HttpError as error:
+        if error.resp.status == 409:
+            return {"success": False, "error": "Meeting already exists"}
+        return {"success": False, "error": f"Google API error: {error}"}
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def cancel_meetings(meeting_ids: list, scheduler_email: str) -> dict:
+    """
+    Cancels many meetings with batched deletes.
+
+    Args:
+        meeting_ids (list): Google Calendar event ids.
+        scheduler_email (str): Whose calendar they are on.
+
+    Returns:
+        dict: {success, cancelled, failed, results}, results holding one
+        {meeting_id, success, message | error} per id, in input order.
+    """
+    try:
+        service = get_calendar_service()
+        ids = list(dict.fromkeys(meeting_ids))
+        responses = _execute_batch(service, {
+            meeting_id: service.events().delete(calendarId='primary', eventId=meeting_id)
+            for meeting_id in ids
+        })
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+    store = get_synced_store('primary')
+    results = []
+    gone = []
+    for meeting_id in ids:
+        _, error = responses[meeting_id]
+        if error is None or (isinstance(error, HttpError) and error.resp.status in (404, 410)):
+            gone.append(meeting_id)
+        if error is None:
+            if store is not None:
+                store.remove_event(meeting_id)
+            log_activity("meeting_cancelled", meeting_id, scheduler_email, {"bulk": True})
+            results.append({"meeting_id": meeting_id, "success": True,
+                            "message": "Meeting cancelled successfully"})
+        else:
+            results.append({"meeting_id": meeting_id, "success": False,
+                            "error": _item_error(error, "Meeting not found or already deleted")})
+    _mirror(meeting_store.delete_meetings, gone)
+    return _summary(results, "cancelled")
+
+
+def reschedule_meetings(changes: list, scheduler_email: str, if_unchanged: bool = False) -> dict:
+    """
+    Reschedules many meetings with batched patches.
+
+    Args:
+        changes (list): [{"meeting_id", "new_start", "new_end"}, ...] with
+            ISO 8601 times.
+        scheduler_email (str): Whose calendar they are on.
+        if_unchanged (bool): Send the ETag from the busy cache as If-Match,
+            so a meeting someone edited since the last sync is left alone.
+
+    Returns:
+        dict: {success, rescheduled, failed, results} with one result per
+        change, in input order. A new time is refused if it clashes with the
+        calendar or with an earlier change in the same list.
+    """
+    results = [None] * len(changes)
+    slots = []
+    for index, change in enumerate(changes):
+        try:
+            slots.append((index, change["meeting_id"],
+                          parse_iso_datetime(change["new_start"]),
+                          parse_iso_datetime(change["new_end"])))
+        except Exception as e:
+            results[index] = {"meeting_id": change.get("meeting_id"), "success": False, "error": str(e)}
+
+    try:
+        service = get_calendar_service()
+        conflicts = _slots_conflicts([slot[1:] for slot in slots], scheduler_email)
+        store = get_synced_store('primary')
+
+        requests = {}
+        for (index, meeting_id, new_start, new_end), conflict in zip(slots, conflicts):
+            if conflict:
+                results[index] = {"meeting_id": meeting_id, "success": False,
+                                  "error": "New time conflicts with an existing meeting"}
+                continue
+            request = service.events().patch(
+                calendarId='primary',
+                eventId=meeting_id,
+                body={
+                    'start': {'dateTime': new_start, 'timeZone': 'UTC'},
+                    'end': {'dateTime': new_end, 'timeZone': 'UTC'},
+                }
+            )
+            etag = store.etag(meeting_id) if (if_unchanged and store is not None) else None
+            if etag:
+                request.headers['If-Match'] = etag
+            requests[index] = request
+
+        responses = _execute_batch(service, requests)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+    moved = []
+    for index, meeting_id, _, _ in slots:
+        if index not in responses:
+            continue
+        event, error = responses[index]
+        if error is None:
+            if store is not None:
+                store.apply_event(event)
+            moved.append((event["id"], event["start"]["dateTime"], event["end"]["dateTime"]))
+            log_activity("meeting_rescheduled", event["id"], scheduler_email,
+                         {"start": event["start"]["dateTime"], "end": event["end"]["dateTime"], "bulk": True})
+            results[index] = {"meeting_id": event["id"], "success": True,
+                              "updated_start": event["start"]["dateTime"],
+                              "updated_end": event["end"]["dateTime"],
+                              "message": "Meeting rescheduled successfully"}
+        else:
+            results[index] = {"meeting_id": meeting_id, "success": False,
+                              "error": _item_error(error, "Meeting not found")}
+    _mirror(meeting_store.reschedule_meetings, moved)
+    return _summary(results, "rescheduled")
+
+
+def create_meetings(events: list, scheduler_email: str, check_conflicts: bool = True) -> dict:
+    """
+    Creates many meetings with batched inserts.
+
+    Args:
+        events (list): Calendar event bodies (summary, start, end,
+            attendees, ...), start / end with "dateTime".
+        scheduler_email (str): Whose calendar they go on.
+        check_conflicts (bool): Refuse events that clash with the calendar
+            or with an earlier event in the same list.
+
+    Returns:
+        dict: {success, created, failed, results} with one
+        {index, success, meeting_id | error} per event, in input order.
+    """
+    results = [None] * len(events)
+    try:
+        service = get_calendar_service()
+        flags = [False] * len(events)
+        if check_conflicts:
+            flags = _slots_conflicts(
+                [(None, event["start"]["dateTime"], event["end"]["dateTime"]) for event in events],
+                scheduler_email
+            )
+
+        requests = {}
+        for index, (event, conflict) in enumerate(zip(events, flags)):
+            if conflict:
+                results[index] = {"index": index, "success": False,
+                                  "error": "Time conflicts with an existing meeting"}
+            else:
+                requests[index] = service.events().insert(calendarId='primary', body=event)
+
+        responses = _execute_batch(service, requests)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+    store = get_synced_store('primary')
+    saved = []
+    for index, (created, error) in responses.items():
+        if error is None:
+            if store is not None:
+                store.apply_event(created)
+            saved.append(created)
+            log_activity("meeting_created", created["id"], scheduler_email,
+                         {"summary": created.get("summary"), "bulk": True})
+            results[index] = {"index": index, "success": True, "meeting_id": created["id"],
+                              "html_link": created.get("htmlLink")}
+        else:
+            results[index] = {"index": index, "success": False, "error": _item_error(error, "Calendar not found")}
+    _mirror(meeting_store.save_meetings, saved, scheduler_email)
+    return _summary(results, "created")
+
+
+
+# asyncio variants of reschedule_meeting / cancel_meeting: Calendar over the
+# REST client (utils/async_calendar.py), mirror and outbox over asyncpg
+# (utils/async_db.py). Same arguments and result dicts.
+
+async def _mirror_async(write, *args):
+    try:
+        await write(*args)
+    except Exception as e:
+        print(f"Meeting mirror not updated: {e}")
+
+
+async def _mirrored_meeting_async(meeting_id):
+    try:
+        meeting = await meeting_store.get_meeting_async(meeting_id)
+    except Exception as e:
+        print(f"Meeting mirror not readable: {e}")
+        return None
+    if meeting is None:
+        print(f"Meeting {meeting_id} is not in the mirror, attendees not notified")
+    return meeting
+
+
+async def _notify_attendees_async(meeting, notification_type, method):
+    if not meeting or not meeting["participants"]:
+        return None
+    try:
+        return await enqueue_meeting_notification_async(*_notification(meeting, notification_type, method))
+    except Exception as e:
+        print(f"Attendees not notified: {e}")
+        return None
+
+
+async def _new_time_conflicts_async(meeting_id, scheduler_email, new_start, new_end):
+    """
+    _new_time_conflicts without blocking the loop: a fresh busy cache is
+    answered in memory; a cache that has to (re)sync first, which is a
+    blocking Calendar list, does that on a worker thread.
+    """
+    store = get_synced_store('primary')
+    if store is not None and not store.stale:
+        return bool(store.busy_intervals(new_start, new_end, exclude={meeting_id}))
+    return await asyncio.to_thread(_new_time_conflicts, meeting_id, scheduler_email, new_start, new_end)
+
+
+async def reschedule_meeting_async(meeting_id: str,
+                                   new_start_datetime: str,
+                                   new_end_datetime: str,
+                                   scheduler_email: str,
+                                   notify: bool = False) -> dict:
+    """reschedule_meeting on the event loop."""
+    try:
+        new_start = parse_iso_datetime(new_start_datetime)
+        new_end = parse_iso_datetime(new_end_datetime)
+
+        if await _new_time_conflicts_async(meeting_id, scheduler_email, new_start, new_end):
+            return {
+                "success": False,
+                "error": "New time conflicts with an existing meeting"
+            }
+
+        updated_event = await get_async_calendar().patch_event('primary', meeting_id, {
+            'start': {'dateTime': new_start, 'timeZone': 'UTC'},
+            'end': {'dateTime': new_end, 'timeZone': 'UTC'},
+        })
+
+        store = get_synced_store('primary')
+        if store is not None:
+            store.apply_event(updated_event)
+        await _mirror_async(meeting_store.reschedule_meetings_async,
+                            [(meeting_id, updated_event["start"]["dateTime"], updated_event["end"]["dateTime"])])
+        log_activity("meeting_rescheduled", meeting_id, scheduler_email,
+                     {"start": new_start, "end": new_end})
+
+        result = {
+            "success": True,
+            "meeting_id": updated_event["id"],
+            "updated_start": updated_event["start"]["dateTime"],
+            "updated_end": updated_event["end"]["dateTime"],
+            "message": "Meeting rescheduled successfully"
+        }
+        if notify:
+            result["notification_job"] = await _notify_attendees_async(
+                await _mirrored_meeting_async(meeting_id), "update", "REQUEST")
+        return result
+
+    except CalendarAPIError as error:
+        if error.status == 404:
+            return {"success": False, "error": "Meeting not found"}
+        return {"success": False, "error": f"Google API error: {error}"}
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+async def cancel_meeting_async(meeting_id: str, scheduler_email: str, notify: bool = False) -> dict:
+    """cancel_meeting on the event loop."""
+    try:
+        meeting = await _mirrored_meeting_async(meeting_id) if notify else None
+
+        await get_async_calendar().delete_event('primary', meeting_id)
+
+        store = get_synced_store('primary')
+        if store is not None:
+            store.remove_event(meeting_id)
+        await _mirror_async(meeting_store.delete_meetings_async, [meeting_id])
+        log_activity("meeting_cancelled", meeting_id, scheduler_email)
+
+        result = {
+            "success": True,
+            "meeting_id": meeting_id,
+            "message": "Meeting cancelled successfully"
+        }
+        if notify:
+            if meeting is not None:
+                meeting = dict(meeting, sequence=meeting["sequence"] + 1)
+            result["notification_job"] = await _notify_attendees_async(meeting, "cancel", "CANCEL")
+        return result
+
+    except CalendarAPIError as error:
+        if error.status in (404, 410):
+            await _mirror_async(meeting_store.delete_meetings_async, [meeting_id])
             return {"success": False, "error": "Meeting not found or already deleted"}
         return {"success": False, "error": f"Google API error: {error}"}
 
     except Exception as e:
         return {"success": False, "error": str(e)}
+
+'''
+how to use this?
+
+from services.meeting_modifier import cancel_meetings, reschedule_meetings
+
+# department holiday: poore din ki meetings, 50-50 karke batch me
+result = cancel_meetings(["evt1", "evt2", "evt3"], "hod@college.edu")
+# {"success": False, "cancelled": 2, "failed": 1, "results": [
+#     {"meeting_id": "evt1", "success": True, ...},
+#     {"meeting_id": "evt2", "success": False, "error": "Meeting not found or already deleted"}, ...]}
+
+reschedule_meetings([
+    {"meeting_id": "evt4", "new_start": "2025-01-28T10:00:00", "new_end": "2025-01-28T11:00:00"},
+    {"meeting_id": "evt5", "new_start": "2025-01-28T11:00:00", "new_end": "2025-01-28T12:00:00"},
+], "hod@college.edu", if_unchanged=True)
+
+# ek meeting: attendees ko sirf update / cancel jata hai, same UID + agla SEQUENCE
+reschedule_meeting("evt6", "2025-01-29T10:00:00", "2025-01-29T11:00:00", "hod@college.edu", notify=True)
+cancel_meeting("evt7", "hod@college.edu", notify=True)
+create_meeting({"id": "a1b2c3d4e5", "summary": "Review",
+                "start": {"dateTime": "2025-01-30T10:00:00", "timeZone": "UTC"},
+                "end": {"dateTime": "2025-01-30T11:00:00", "timeZone": "UTC"}}, "hod@college.edu")
+
+# event loop pe (HTTP API): thread block nahi hota
+await reschedule_meeting_async("evt6", "2025-01-29T10:00:00", "2025-01-29T11:00:00", "hod@college.edu", notify=True)
+await cancel_meeting_async("evt7", "hod@college.edu", notify=True)
+'''
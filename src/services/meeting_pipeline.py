@@ -0,0 +1,276 @@
+"""
+Nayi meeting ka poora flow (README wala: parse -> participants resolve ->
+conflicts check -> event create -> .ics -> email -> log) ek dependency
+graph ki tarah (utils/pipeline.py).
+
+pehele sab ek ke baad ek hota tha. ab har stage tabhi chalta hai jab uski
+zaroorat wale stages ho jaye, baaki saath me:
+
+    stage                  kisko chahiye
+    parse                  -
+    resolve                -
+    scheduler_busy         parse
+    participant_conflicts  parse, resolve
+    create_event           scheduler_busy, participant_conflicts
+    ics                    parse, resolve
+    emails                 ics
+    send                   create_event, emails
+
+- participants resolve hote hai jab tak scheduler ka calendar check ho raha hai
+- meeting id (Calendar event id) hum khud pehele chun lete hai, toh .ics ka
+  UID aur har attendee ka mail Calendar insert ke saath hee ban jata hai;
+  insert hote hee bas bhejna baaki rehta hai
+
+koi stage fail ho (conflict, SMTP down ...) toh bana hua Calendar event
+wapas delete ho jata hai (mirror / busy cache se bhi) - aadhi meeting nahi
+bachti. kuch attendees ko mail na jaye toh meeting rehti hai, result me
+failed count aata hai; kisi ko bhi na jaye tabhi rollback.
+
+har stage ka timing result me aata hai aur activity_log ki
+"meeting_scheduled" entry me bhi.
+"""
+
+import uuid
+
+import pytz
+from dateutil import parser
+
+from services import meeting_modifier, notification_dispatcher
+from utils import user_resolver
+from utils.activity_log import log_activity
+from utils.conflict_detector import check_participants_conflicts, check_scheduler_conflict
+from utils.date_parser import parse_iso_datetime
+from utils.ics_generator import render_ics
+from utils.pipeline import Pipeline, Stage
+
+
+def new_meeting_id() -> str:
+    """
+    A Calendar event id chosen before the insert: event ids may use a-v
+    and 0-9, which a hex UUID does.
+    """
+    return uuid.uuid4().hex
+
+
+def _aware(value: str):
+    moment = parser.isoparse(value)
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=pytz.UTC)
+
+
+def _parse(request):
+    start = parse_iso_datetime(request["start"])
+    end = parse_iso_datetime(request["end"])
+    if _aware(end) <= _aware(start):
+        raise ValueError("Meeting must end after it starts")
+    return {"title": request["title"], "start": start, "end": end,
+            "description": request.get("description") or ""}
+
+
+def _resolve(request):
+    """
+    Emails are taken as given; names go through the fuzzy resolver.
+    Unknown or ambiguous names fail the pipeline instead of inviting the
+    wrong person.
+    """
+    people = {}
+    names = []
+    for participant in request["participants"]:
+        if "@" in participant:
+            people.setdefault(participant.lower(), {"name": None, "email": participant.lower()})
+        else:
+            names.append(participant)
+
+    unresolved, ambiguous = [], []
+    for result in (user_resolver.resolve_participants_batch(names, exact=True) if names else []):
+        if result["match"] is None:
+            unresolved.append(result["query"])
+        elif result["ambiguous"]:
+            ambiguous.append(f"{result['query']} ({result['name']} / {result['runner_up']})")
+        else:
+            email = result["match"]["email"].lower()
+            people.setdefault(email, {"name": result["match"]["name"], "email": email})
+    if unresolved:
+        raise ValueError(f"Participants not found: {', '.join(unresolved)}")
+    if ambiguous:
+        raise ValueError(f"Participants are ambiguous: {', '.join(ambiguous)}")
+    return list(people.values())
+
+
+def _scheduler_busy(request, parse):
+    if request["check_conflicts"] and check_scheduler_conflict(
+            request["scheduler_email"], parse["start"], parse["end"]):
+        raise ValueError("Time conflicts with an existing meeting")
+
+
+def _participant_conflicts(request, parse, resolve):
+    if not request["check_conflicts"] or not resolve:
+        return None
+    result = check_participants_conflicts([person["email"] for person in resolve],
+                                          parse["start"], parse["end"])
+    if result["has_conflict"]:
+        raise ValueError(f"Participants have a conflict: {', '.join(result['conflicts'])}")
+    return result
+
+
+def _create_event(request, parse, resolve, scheduler_busy, participant_conflicts):
+    event = {
+        "id": request["meeting_id"],
+        "summary": parse["title"],
+        "description": parse["description"],
+        "start": {"dateTime": parse["start"], "timeZone": "UTC"},
+        "end": {"dateTime": parse["end"], "timeZone": "UTC"},
+        "attendees": [{"email": person["email"], "displayName": person["name"]} if person["name"]
+                      else {"email": person["email"]} for person in resolve],
+    }
+    # the conflict stages already checked this slot
+    result = meeting_modifier.create_meeting(event, request["scheduler_email"], check_conflicts=False)
+    if not result["success"]:
+        raise RuntimeError(result["error"])
+    return result
+
+
+def _ics(request, parse, resolve):
+    scheduler = request["scheduler_email"]
+    return render_ics(
+        parse["title"], _aware(parse["start"]), _aware(parse["end"]),
+        {"name": scheduler, "email": scheduler},
+        [{"name": person["name"] or person["email"], "email": person["email"]} for person in resolve],
+        meeting_id=request["meeting_id"],
+    )
+
+
+def _emails(request, parse, resolve, ics):
+    details = {
+        "title": parse["title"],
+        "start": parse["start"],
+        "end": parse["end"],
+        "organizer": request["scheduler_email"],
+        "agenda": parse["description"] or "N/A",
+    }
+    prepared = notification_dispatcher.build_notification_messages(resolve, "invite", details, ics)
+    if isinstance(prepared, dict):
+        raise ValueError(prepared["error"])
+    return prepared
+
+
+def _send(create_event, emails):
+    result = notification_dispatcher.deliver_notification_messages(emails, "invite")
+    if result["results"] and not result["sent"]:
+        raise RuntimeError(f"No invitation could be sent: {result['results'][0]['error']}")
+    return result
+
+
+def _undo_create(request):
+    def undo(created):
+        result = meeting_modifier.cancel_meeting(created["meeting_id"], request["scheduler_email"])
+        if not result["success"]:
+            raise RuntimeError(result["error"])
+    return undo
+
+
+def build_pipeline(request: dict, notify: bool = True, max_workers: int = None) -> Pipeline:
+    """
+    The create-meeting stage graph for `request` (see schedule_meeting).
+    Without notify the .ics / email stages are left out.
+    """
+    stages = [
+        Stage("parse", _parse, requires=["request"]),
+        Stage("resolve", _resolve, requires=["request"]),
+        Stage("scheduler_busy", _scheduler_busy, requires=["request", "parse"]),
+        Stage("participant_conflicts", _participant_conflicts, requires=["request", "parse", "resolve"]),
+        Stage("create_event", _create_event, undo=_undo_create(request),
+              requires=["request", "parse", "resolve", "scheduler_busy", "participant_conflicts"]),
+    ]
+    if notify:
+        stages += [
+            Stage("ics", _ics, requires=["request", "parse", "resolve"]),
+            Stage("emails", _emails, requires=["request", "parse", "resolve", "ics"]),
+            Stage("send", _send, requires=["create_event", "emails"]),
+        ]
+    return Pipeline(stages, max_workers=max_workers)
+
+
+def schedule_meeting(title: str,
+                     start: str,
+                     end: str,
+                     participants: list,
+                     scheduler_email: str,
+                     description: str = "",
+                     check_conflicts: bool = True,
+                     notify: bool = True,
+                     max_workers: int = None) -> dict:
+    """
+    Creates a meeting and emails the invite, running independent steps
+    concurrently.
+
+    Args:
+        title (str): Meeting title.
+        start, end (str): ISO 8601 (UTC if no offset).
+        participants (list): Emails, or names to resolve against the roster.
+        scheduler_email (str): Whose calendar it goes on; the organizer.
+        description (str): Agenda.
+        check_conflicts (bool): Refuse a slot that clashes with the
+            scheduler's or a participant's calendar.
+        notify (bool): Email the invite (.ics with the meeting's UID).
+        max_workers (int): Threads for the stages; 1 runs them in sequence.
+
+    Returns:
+        dict: {"success": True, "meeting_id", "html_link", "participants",
+               "notification" (bulk send result, or None), "timings", "elapsed_ms"}
+        or {"success": False, "error", "failed_stage", "rolled_back",
+            "timings", "elapsed_ms"}; a failed run leaves no event behind.
+    """
+    request = {
+        "meeting_id": new_meeting_id(),
+        "title": title,
+        "start": start,
+        "end": end,
+        "participants": participants,
+        "description": description,
+        "scheduler_email": scheduler_email,
+        "check_conflicts": check_conflicts,
+    }
+    run = build_pipeline(request, notify, max_workers).run(request=request)
+
+    if not run["success"]:
+        return {
+            "success": False,
+            "error": run["error"],
+            "failed_stage": run["failed_stage"],
+            "rolled_back": run["rolled_back"],
+            "timings": run["timings"],
+            "elapsed_ms": run["elapsed_ms"],
+        }
+
+    created = run["results"]["create_event"]
+    log_activity("meeting_scheduled", created["meeting_id"], scheduler_email,
+                 {"stages": run["timings"], "elapsed_ms": run["elapsed_ms"]})
+    return {
+        "success": True,
+        "meeting_id": created["meeting_id"],
+        "html_link": created["html_link"],
+        "participants": run["results"]["resolve"],
+        "notification": run["results"].get("send"),
+        "timings": run["timings"],
+        "elapsed_ms": run["elapsed_ms"],
+    }
+
+
+'''
+how to use this?
+
+from services.meeting_pipeline import schedule_meeting
+
+result = schedule_meeting("Budget review", "2025-01-28T10:00:00", "2025-01-28T11:00:00",
+                          ["Sharma", "ani", "guest@college.edu"], "hod@college.edu",
+                          description="Q1 numbers")
+# {"success": True, "meeting_id": "3f2c...", "html_link": "...", "participants": [...],
+#  "notification": {"sent": 3, "failed": 0, ...},
+#  "timings": {"parse": {"start_ms": 0.2, "duration_ms": 0.1}, "resolve": {...}, ...}, "elapsed_ms": 612.4}
+
+# conflict / SMTP down / koi naam nahi mila:
+# {"success": False, "error": "Participants have a conflict: sharma@college.edu",
+#  "failed_stage": "participant_conflicts", "rolled_back": [], ...}
+
+# CLI: python src/main.py create "Budget review" --start ... --end ... --with Sharma --with ani --timings
+'''
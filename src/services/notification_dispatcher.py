@@ -1,16 +1,119 @@
 from utils.config_loader import Config
-from jinja2 import Template
+from utils.smtp_pool import get_smtp_pool
+from utils.mime_builder import PersonalizedMessageBuilder, personalization_markers
+import asyncio
 import smtplib
+from concurrent.futures import ThreadPoolExecutor
 from email.message import EmailMessage
 from datetime import datetime
 import os
+import re
+
+# METHOD line of an .ics (REQUEST / CANCEL / PUBLISH)
+ICS_METHOD = re.compile(rb"^METHOD:([A-Z-]+)\r?$", re.MULTILINE)
+
+
+def _make_builder(sender_email: str,
+                  notification_type: str,
+                  meeting_details: dict,
+                  ics_attachment=None,
+                  ics_filename: str = "invite.ics") -> PersonalizedMessageBuilder:
+    """
+    Renders the template for `notification_type` once and returns a builder
+    that stamps each recipient into a copy of the shared message.
+    Raises ValueError with a user-facing message on bad input.
+    """
+    # 1) Pick the compiled template based on notification_type
+    if notification_type == "invite":
+        subject = f"Meeting Invitation: {meeting_details.get('title', 'Meeting')}"
+    elif notification_type == "update":
+        subject = f"Meeting Updated: {meeting_details.get('title', 'Meeting')}"
+    elif notification_type == "cancel":
+        subject = f"Meeting Cancelled: {meeting_details.get('title', 'Meeting')}"
+    else:
+        raise ValueError("Invalid notification_type (must be invite/update/cancel)")
+
+    # 2) Render with meeting_details (template is parsed/compiled once per process;
+    #    jinja2 is loaded with the first notification, not at import)
+    from jinja2 import TemplateNotFound
+    from utils.template_registry import NOTIFICATION_TEMPLATES, get_template
+
+    try:
+        template = get_template(notification_type)
+    except TemplateNotFound:
+        raise ValueError(f"Template file not found: {NOTIFICATION_TEMPLATES[notification_type]}")
+
+    # IMPORTANT:
+    # Your invite template uses variables like {{ title }}, {{ time_str }}, {{ location }}, {{ agenda }}
+    # But meeting_details in contract contains title/start/end/link/organizer
+    #
+    # So we build a render dict that supports both.
+    render_data = meeting_details.copy()
+
+    # Provide extra computed fields for existing template compatibility
+    if "time_str" not in render_data:
+        start = meeting_details.get("start", "")
+        end = meeting_details.get("end", "")
+        render_data["time_str"] = f"{start} to {end}"
+
+    if "location" not in render_data:
+        render_data["location"] = meeting_details.get("link", "N/A")
+
+    if "agenda" not in render_data:
+        render_data["agenda"] = "N/A"
+
+    # Per-recipient fields are rendered as markers and stamped in by the builder
+    for key, marker in personalization_markers().items():
+        render_data.setdefault(key, marker)
+
+    html_skeleton = template.render(**render_data)
+
+    # 3) The .ics comes as bytes from utils.ics_generator.render_ics (no
+    #    disk involved), or as a file path, which is read once for all recipients
+    ics_data = None
+    if isinstance(ics_attachment, (bytes, bytearray, memoryview)):
+        ics_data = ics_attachment
+    elif ics_attachment:
+        if not os.path.exists(ics_attachment):
+            raise ValueError(f"ICS file not found: {ics_attachment}")
+
+        with open(ics_attachment, "rb") as f:
+            ics_data = f.read()
+        ics_filename = os.path.basename(ics_attachment)
+
+    # METHOD:REQUEST / CANCEL from the .ics also goes on the MIME part
+    ics_method = None
+    if ics_data is not None:
+        match = ICS_METHOD.search(bytes(ics_data))
+        ics_method = match.group(1).decode() if match else None
+
+    return PersonalizedMessageBuilder(
+        sender_email,
+        subject,
+        "Meeting notification (HTML supported email recommended).",
+        html_skeleton=html_skeleton,
+        ics_data=ics_data,
+        ics_filename=ics_filename,
+        ics_method=ics_method
+    )
+
+
+def _recipient_fields(recipient) -> tuple:
+    """
+    Recipients can be plain emails or {"email", "name", "rsvp_token"} dicts.
+    """
+    if isinstance(recipient, str):
+        return recipient, None, None
+    return recipient["email"], recipient.get("name"), recipient.get("rsvp_token")
 
 
 def send_meeting_notification(
     recipient_email: str,
     notification_type: str,
     meeting_details: dict,
-    ics_attachment: str = None
+    ics_attachment=None,
+    recipient_name: str = None,
+    rsvp_token: str = None
 ) -> dict:
     """
     Sends email notifications for meeting events.
@@ -32,8 +135,12 @@ def send_meeting_notification(
             "organizer": "Aniket Barun"
         }
 
-    ics_attachment : str (optional)
-        Path to .ics file generated by utils/ics_generator.py
+    ics_attachment : bytes or str (optional)
+        The invite from utils.ics_generator.render_ics (bytes / memoryview),
+        or the path of an .ics file
+
+    recipient_name, rsvp_token : str (optional)
+        Used for the greeting and the RSVP link (needs "rsvp_url" in meeting_details)
 
     Returns:
     --------
@@ -53,100 +160,249 @@ def send_meeting_notification(
         }
     """
 
+    sender_email = Config.SENDER_EMAIL
+    if not sender_email or not Config.SENDER_PASSWORD:
+        return {
+            "success": False,
+            "error": "Missing SENDER_EMAIL or SENDER_PASSWORD"
+        }
+
     try:
-        # 1) Load config (sender credentials)
-        config = Config()
-        sender_email = config.get("SENDER_EMAIL")
-        sender_password = config.get("SENDER_PASSWORD")
+        builder = _make_builder(sender_email, notification_type, meeting_details, ics_attachment)
+        msg = builder.build(recipient_email, recipient_name, rsvp_token)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
 
-        if not sender_email or not sender_password:
-            return {
+    # Send over a pooled (already logged-in) Gmail SMTP session
+    return _deliver(get_smtp_pool(), msg, recipient_email, notification_type)
+
+
+def send_meeting_notifications_bulk(
+    recipients: list,
+    notification_type: str,
+    meeting_details: dict,
+    ics_attachment=None,
+    max_sessions: int = None
+) -> dict:
+    """
+    Sends the same meeting notification to many recipients.
+
+    Messages are fanned out over at most `max_sessions` pooled SMTP sessions
+    (defaults to the pool size), so a 40-person invite costs a handful of
+    TLS handshakes/logins instead of 40.
+
+    Parameters:
+    -----------
+    recipients : list
+        Recipient emails, or {"email", "name", "rsvp_token"} dicts for a
+        personalized greeting / RSVP link
+
+    notification_type, meeting_details, ics_attachment :
+        Same as send_meeting_notification
+
+    max_sessions : int (optional)
+        Upper bound on concurrent SMTP sessions
+
+    Returns:
+    --------
+    dict:
+        {
+            "success": True,            # False if any recipient failed
+            "notification_type": "invite",
+            "sent": 39,
+            "failed": 1,
+            "results": [ ...one send_meeting_notification-style dict per recipient, in order... ]
+        }
+    """
+
+    prepared = build_notification_messages(recipients, notification_type, meeting_details, ics_attachment)
+    if isinstance(prepared, dict):
+        return prepared
+    return deliver_notification_messages(prepared, notification_type, max_sessions)
+
+
+def deliver_notification_messages(prepared: tuple, notification_type: str, max_sessions: int = None) -> dict:
+    """
+    Sends messages made by build_notification_messages, so they can be
+    built ahead (e.g. while the calendar event is being created) and sent
+    later. Same result dict as send_meeting_notifications_bulk.
+    """
+    results, jobs = prepared
+    results = list(results)
+
+    if jobs:
+        pool = get_smtp_pool()
+        sessions = min(max_sessions or pool.max_connections, pool.max_connections, len(jobs))
+
+        def run(job):
+            index, recipient_email, msg = job
+            results[index] = _deliver(pool, msg, recipient_email, notification_type)
+
+        with ThreadPoolExecutor(max_workers=sessions) as executor:
+            list(executor.map(run, jobs))
+
+    return _bulk_summary(results, notification_type)
+
+
+async def send_meeting_notifications_bulk_async(
+    recipients: list,
+    notification_type: str,
+    meeting_details: dict,
+    ics_attachment=None
+) -> dict:
+    """
+    send_meeting_notifications_bulk on the event loop: every message is
+    sent concurrently over the loop's aiosmtplib pool (utils/async_smtp.py),
+    which opens at most SMTP_POOL_SIZE sessions. Same arguments (except
+    max_sessions) and same result dict.
+    """
+    prepared = build_notification_messages(recipients, notification_type, meeting_details, ics_attachment)
+    if isinstance(prepared, dict):
+        return prepared
+    results, jobs = prepared
+
+    if jobs:
+        from utils.async_smtp import get_async_smtp_pool
+
+        pool = get_async_smtp_pool()
+        delivered = await asyncio.gather(*(
+            _deliver_async(pool, msg, recipient_email, notification_type)
+            for _, recipient_email, msg in jobs
+        ))
+        for (index, _, _), result in zip(jobs, delivered):
+            results[index] = result
+
+    return _bulk_summary(results, notification_type)
+
+
+def build_notification_messages(recipients: list, notification_type: str, meeting_details: dict, ics_attachment):
+    """
+    Renders once and builds every recipient's message.
+
+    Returns:
+        (results, jobs): results has a failure dict for every recipient
+        whose message could not be built (None for the rest); jobs is
+        [(index, recipient_email, msg)]. Or an error dict if nothing
+        can be sent at all.
+    """
+    sender_email = Config.SENDER_EMAIL
+    if not sender_email or not Config.SENDER_PASSWORD:
+        return {
+            "success": False,
+            "error": "Missing SENDER_EMAIL or SENDER_PASSWORD"
+        }
+
+    try:
+        # Template, HTML and .ics encoding happen once for the whole batch
+        builder = _make_builder(sender_email, notification_type, meeting_details, ics_attachment)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+    results = [None] * len(recipients)
+    jobs = []
+    for index, recipient in enumerate(recipients):
+        recipient_email, recipient_name, rsvp_token = _recipient_fields(recipient)
+        try:
+            msg = builder.build(recipient_email, recipient_name, rsvp_token)
+            jobs.append((index, recipient_email, msg))
+        except Exception as e:
+            results[index] = {
                 "success": False,
-                "error": "Missing SENDER_EMAIL or SENDER_PASSWORD"
+                "recipient": recipient_email,
+                "error": str(e)
             }
+    return results, jobs
+
 
-        # 2) Load template based on notification_type
-        if notification_type == "invite":
-            template_path = "templates/email_invite.html"
-            subject = f"Meeting Invitation: {meeting_details.get('title', 'Meeting')}"
-        elif notification_type == "update":
-            template_path = "templates/email_update.html"
-            subject = f"Meeting Updated: {meeting_details.get('title', 'Meeting')}"
-        elif notification_type == "cancel":
-            template_path = "templates/email_cancel.html"
-            subject = f"Meeting Cancelled: {meeting_details.get('title', 'Meeting')}"
-        else:
+def _bulk_summary(results: list, notification_type: str) -> dict:
+    sent = sum(1 for r in results if r["success"])
+    return {
+        "success": sent == len(results),
+        "notification_type": notification_type,
+        "sent": sent,
+        "failed": len(results) - sent,
+        "results": results
+    }
+
+
+def _refused_error(refused, recipient_email: str):
+    """
+    The server can accept a message but refuse some of its recipients
+    (smtplib: {addr: (code, text)}, aiosmtplib: {addr: SMTPResponse}).
+    Returns the error for `recipient_email` if it was refused, else None.
+    """
+    for address, response in (refused or {}).items():
+        if address.lower() == recipient_email.lower():
+            code, text = (response.code, response.message) if hasattr(response, "code") else response
+            if isinstance(text, bytes):
+                text = text.decode(errors="replace")
+            return f"Recipient refused: {code} {text}"
+    return None
+
+
+def _deliver(pool, msg: EmailMessage, recipient_email: str, notification_type: str) -> dict:
+    """
+    Sends one built message over the pool and maps errors to the result dict.
+    """
+    try:
+        refused = pool.send_message(msg)
+        error = _refused_error(refused, recipient_email)
+        if error:
             return {
                 "success": False,
-                "error": "Invalid notification_type (must be invite/update/cancel)"
+                "recipient": recipient_email,
+                "error": error
             }
 
-        if not os.path.exists(template_path):
+        return {
+            "success": True,
+            "recipient": recipient_email,
+            "notification_type": notification_type,
+            "sent_at": datetime.utcnow().isoformat()
+        }
+
+    except smtplib.SMTPAuthenticationError:
+        return {
+            "success": False,
+            "recipient": recipient_email,
+            "error": "SMTP authentication failed"
+        }
+
+    except smtplib.SMTPException as e:
+        return {
+            "success": False,
+            "recipient": recipient_email,
+            "error": f"SMTP error: {str(e)}"
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "recipient": recipient_email,
+            "error": str(e)
+        }
+
+
+async def _deliver_async(pool, msg: EmailMessage, recipient_email: str, notification_type: str) -> dict:
+    """_deliver for the aiosmtplib pool."""
+    import aiosmtplib
+
+    try:
+        refused = await pool.send_message(msg)
+        error = _refused_error(refused, recipient_email)
+        if error:
             return {
                 "success": False,
-                "error": f"Template file not found: {template_path}"
+                "recipient": recipient_email,
+                "error": error
             }
 
-        # 3) Render template with meeting_details using Jinja2
-        with open(template_path, "r", encoding="utf-8") as f:
-            html_template = f.read()
-
-        template = Template(html_template)
-
-        # IMPORTANT:
-        # Your invite template uses variables like {{ title }}, {{ time_str }}, {{ location }}, {{ agenda }}
-        # But meeting_details in contract contains title/start/end/link/organizer
-        #
-        # So we build a render dict that supports both.
-        render_data = meeting_details.copy()
-
-        # Provide extra computed fields for existing template compatibility
-        if "time_str" not in render_data:
-            start = meeting_details.get("start", "")
-            end = meeting_details.get("end", "")
-            render_data["time_str"] = f"{start} to {end}"
-
-        if "location" not in render_data:
-            render_data["location"] = meeting_details.get("link", "N/A")
-
-        if "agenda" not in render_data:
-            render_data["agenda"] = "N/A"
-
-        html_body = template.render(**render_data)
-
-        # 4) Create EmailMessage object
-        msg = EmailMessage()
-        msg["From"] = sender_email
-        msg["To"] = recipient_email
-        msg["Subject"] = subject
-
-        msg.set_content("Meeting notification (HTML supported email recommended).")
-        msg.add_alternative(html_body, subtype="html")
-
-        # 5) Attach .ics file if provided
-        if ics_attachment:
-            if not os.path.exists(ics_attachment):
-                return {
-                    "success": False,
-                    "error": f"ICS file not found: {ics_attachment}"
-                }
-
-            with open(ics_attachment, "rb") as f:
-                ics_data = f.read()
-
-            msg.add_attachment(
-                ics_data,
-                maintype="text",
-                subtype="calendar",
-                filename=os.path.basename(ics_attachment)
-            )
-
-        # 6) Send email via Gmail SMTP
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(sender_email, sender_password)
-            server.send_message(msg)
-
-        # 7) Return success dict
         return {
             "success": True,
             "recipient": recipient_email,
@@ -154,20 +410,23 @@ def send_meeting_notification(
             "sent_at": datetime.utcnow().isoformat()
         }
 
-    except smtplib.SMTPAuthenticationError:
+    except aiosmtplib.SMTPAuthenticationError:
         return {
             "success": False,
+            "recipient": recipient_email,
             "error": "SMTP authentication failed"
         }
 
-    except smtplib.SMTPException as e:
+    except aiosmtplib.SMTPException as e:
         return {
             "success": False,
+            "recipient": recipient_email,
             "error": f"SMTP error: {str(e)}"
         }
 
     except Exception as e:
         return {
             "success": False,
+            "recipient": recipient_email,
             "error": str(e)
         }
@@ -0,0 +1,414 @@
+"""
+Notification outbox.
+SMTP se mail bhejna slow hai (Gmail hop kabhi kabhi seconds le leta hai), toh
+scheduling request ke andar mail nahi bhejte. notification_outbox table me
+job daal ke turant job id return kar dete hai, aur background workers
+(`python src/main.py outbox work`) retry/backoff ke saath usse drain karte hai.
+"""
+
+import logging
+import os
+import random
+import socket
+import threading
+import time
+
+from utils.config_loader import Config
+from utils.db_pool import db_cursor
+from utils.mime_builder import PersonalizedMessageBuilder
+from utils.smtp_pool import get_smtp_pool
+from services.notification_dispatcher import send_meeting_notifications_bulk
+
+logger = logging.getLogger(__name__)
+
+BASE_BACKOFF_SECONDS = 30
+MAX_BACKOFF_SECONDS = 3600
+# A job stuck in 'sending' this long belongs to a worker that died
+STALE_LOCK_SECONDS = 600
+
+
+def _enqueue(kind: str, payload: dict, max_attempts: int = None):
+    from psycopg2.extras import Json
+
+    query = """
+    INSERT INTO notification_outbox (kind, sender_email, payload, max_attempts)
+    VALUES (%s, %s, %s, %s)
+    RETURNING id;
+    """
+    try:
+        with db_cursor(commit=True) as cur:
+            cur.execute(query, (kind, Config.SENDER_EMAIL, Json(payload),
+                                max_attempts or Config.OUTBOX_MAX_ATTEMPTS))
+            return cur.fetchone()['id']
+    except Exception as e:
+        print(f"Error queueing notification: {e}")
+        return None
+
+
+async def _enqueue_async(kind: str, payload: dict, max_attempts: int = None):
+    """_enqueue on the event loop (utils/async_db.py)."""
+    from utils import async_db
+
+    query = """
+    INSERT INTO notification_outbox (kind, sender_email, payload, max_attempts)
+    VALUES ($1, $2, $3, $4)
+    RETURNING id;
+    """
+    try:
+        row = await async_db.fetchrow(query, kind, Config.SENDER_EMAIL, payload,
+                                      max_attempts or Config.OUTBOX_MAX_ATTEMPTS)
+        return row["id"]
+    except Exception as e:
+        print(f"Error queueing notification: {e}")
+        return None
+
+
+def _meeting_payload(recipients, notification_type, meeting_details, ics_attachment):
+    payload = {
+        "recipients": recipients,
+        "notification_type": notification_type,
+        "meeting_details": meeting_details,
+        "ics_attachment": ics_attachment,
+    }
+    if isinstance(ics_attachment, (bytes, bytearray, memoryview)):
+        # .ics is UTF-8 text, so it fits in the JSONB payload as is
+        payload["ics_attachment"] = None
+        payload["ics_data"] = bytes(ics_attachment).decode("utf-8")
+    return payload
+
+
+def enqueue_meeting_notification(recipients: list,
+                                 notification_type: str,
+                                 meeting_details: dict,
+                                 ics_attachment=None,
+                                 max_attempts: int = None):
+    """
+    Queues a meeting notification for background delivery.
+
+    Takes the same arguments as send_meeting_notifications_bulk. An
+    in-memory invite (bytes) is stored in the job itself, so the worker
+    needs no file.
+
+    Returns:
+        int: Outbox job id, or None if the job could not be stored.
+    """
+    payload = _meeting_payload(recipients, notification_type, meeting_details, ics_attachment)
+    return _enqueue("meeting", payload, max_attempts)
+
+
+async def enqueue_meeting_notification_async(recipients: list,
+                                             notification_type: str,
+                                             meeting_details: dict,
+                                             ics_attachment=None,
+                                             max_attempts: int = None):
+    """enqueue_meeting_notification on the event loop."""
+    payload = _meeting_payload(recipients, notification_type, meeting_details, ics_attachment)
+    return await _enqueue_async("meeting", payload, max_attempts)
+
+
+def enqueue_direct_email(recipient_email: str,
+                         recipient_name: str,
+                         subject: str,
+                         message_body: str,
+                         max_attempts: int = None):
+    """
+    Queues a plain-text email (see DirectEmailService.queue_email).
+
+    Returns:
+        int: Outbox job id, or None if the job could not be stored.
+    """
+    return _enqueue("direct", {
+        "recipient_email": recipient_email,
+        "recipient_name": recipient_name,
+        "subject": subject,
+        "message_body": message_body,
+    }, max_attempts)
+
+
+def claim_jobs(worker_id: str, limit: int = 1) -> list:
+    """
+    Atomically takes up to `limit` due jobs. SKIP LOCKED lets several
+    workers poll the table without handing out the same row twice.
+    """
+    query = """
+    UPDATE notification_outbox
+    SET status = 'sending', attempts = attempts + 1,
+        locked_at = NOW(), locked_by = %s
+    WHERE id IN (
+        SELECT id FROM notification_outbox
+        WHERE (status = 'pending' AND next_attempt_at <= NOW())
+           OR (status = 'sending' AND locked_at < NOW() - make_interval(secs => %s))
+        ORDER BY next_attempt_at
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING *;
+    """
+    try:
+        with db_cursor(commit=True) as cur:
+            cur.execute(query, (worker_id, STALE_LOCK_SECONDS, limit))
+            return [dict(row) for row in cur.fetchall()]
+    except Exception as e:
+        logger.error("Error claiming outbox jobs: %s", e)
+        return []
+
+
+def mark_sent(job_id: int):
+    _update_job("""
+    UPDATE notification_outbox
+    SET status = 'sent', sent_at = NOW(), locked_at = NULL, locked_by = NULL, last_error = NULL
+    WHERE id = %s;
+    """, (job_id,))
+
+
+def mark_failed(job: dict, error: str, payload: dict = None, permanent: bool = False):
+    """
+    Schedules a retry with exponential backoff, or dead-letters the job
+    once it is out of attempts (or the error will never go away).
+
+    Returns:
+        str: The job's new status, 'pending' or 'dead'.
+    """
+    from psycopg2.extras import Json
+
+    dead = permanent or job["attempts"] >= job["max_attempts"]
+    status = "dead" if dead else "pending"
+    _update_job("""
+    UPDATE notification_outbox
+    SET status = %s, last_error = %s, payload = %s,
+        next_attempt_at = NOW() + make_interval(secs => %s),
+        locked_at = NULL, locked_by = NULL
+    WHERE id = %s;
+    """, (status, error, Json(payload or job["payload"]),
+          0 if dead else backoff_seconds(job["attempts"]), job["id"]))
+    return status
+
+
+def _update_job(query: str, params: tuple):
+    try:
+        with db_cursor(commit=True) as cur:
+            cur.execute(query, params)
+    except Exception as e:
+        logger.error("Error updating outbox job: %s", e)
+
+
+def backoff_seconds(attempts: int) -> float:
+    """
+    Exponential backoff with jitter: ~30s, 60s, 120s, ... capped at an hour.
+    """
+    delay = min(BASE_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0), MAX_BACKOFF_SECONDS)
+    return delay * random.uniform(0.5, 1.0)
+
+
+def get_queue_stats() -> dict:
+    """
+    Queue depth by status plus delivery throughput from sent_at.
+
+    Returns:
+        dict: {"pending": 3, "sending": 1, "sent": 120, "dead": 0,
+               "oldest_pending_seconds": 4.2, "sent_last_minute": 12, "sent_last_hour": 120}
+    """
+    query = """
+    SELECT
+        COUNT(*) FILTER (WHERE status = 'pending') AS pending,
+        COUNT(*) FILTER (WHERE status = 'sending') AS sending,
+        COUNT(*) FILTER (WHERE status = 'sent') AS sent,
+        COUNT(*) FILTER (WHERE status = 'dead') AS dead,
+        EXTRACT(EPOCH FROM NOW() - MIN(created_at) FILTER (WHERE status = 'pending'))
+            AS oldest_pending_seconds,
+        COUNT(*) FILTER (WHERE sent_at > NOW() - INTERVAL '1 minute') AS sent_last_minute,
+        COUNT(*) FILTER (WHERE sent_at > NOW() - INTERVAL '1 hour') AS sent_last_hour
+    FROM notification_outbox;
+    """
+    try:
+        with db_cursor() as cur:
+            cur.execute(query)
+            return dict(cur.fetchone())
+    except Exception as e:
+        print(f"Error reading outbox stats: {e}")
+        return {}
+
+
+class SenderRateLimiter:
+    """
+    Token bucket per sender account, shared by all worker threads.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int = None):
+        self.rate = rate_per_second
+        self.burst = burst or max(int(rate_per_second), 1)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, sender: str, tokens: int = 1):
+        """
+        Blocks until `tokens` messages may be sent for `sender`.
+        Requests larger than the burst size are paid off in burst-sized chunks.
+        """
+        if self.rate <= 0:
+            return
+        while tokens > 0:
+            chunk = min(tokens, self.burst)
+            self._take(sender, chunk)
+            tokens -= chunk
+
+    def _take(self, sender: str, tokens: int):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                available, updated = self._buckets.get(sender, (self.burst, now))
+                available = min(self.burst, available + (now - updated) * self.rate)
+                if available >= tokens:
+                    self._buckets[sender] = (available - tokens, now)
+                    return
+                self._buckets[sender] = (available, now)
+                wait = (tokens - available) / self.rate
+            time.sleep(wait)
+
+
+def deliver_job(job: dict) -> dict:
+    """
+    Sends one outbox job.
+
+    Returns:
+        dict: {"success": bool, "error": str, "retry_payload": dict or None,
+               "permanent": bool, "sent": int}
+    """
+    payload = job["payload"]
+
+    if job["kind"] == "meeting":
+        result = send_meeting_notifications_bulk(
+            payload["recipients"],
+            payload["notification_type"],
+            payload["meeting_details"],
+            payload["ics_data"].encode("utf-8") if payload.get("ics_data") else payload.get("ics_attachment"),
+        )
+        if "results" not in result:
+            # Bad template/type/attachment: retrying will not help
+            return {"success": False, "error": result["error"], "permanent": True,
+                    "retry_payload": None, "sent": 0}
+
+        failed = [recipient for recipient, r in zip(payload["recipients"], result["results"])
+                  if not r["success"]]
+        if not failed:
+            return {"success": True, "sent": result["sent"]}
+
+        errors = sorted({r["error"] for r in result["results"] if not r["success"]})
+        return {"success": False, "error": "; ".join(errors), "permanent": False,
+                "retry_payload": {**payload, "recipients": failed}, "sent": result["sent"]}
+
+    if job["kind"] == "direct":
+        builder = PersonalizedMessageBuilder(job["sender_email"], payload["subject"],
+                                             payload["message_body"])
+        try:
+            get_smtp_pool().send_message(
+                builder.build(payload["recipient_email"], payload.get("recipient_name"))
+            )
+            return {"success": True, "sent": 1}
+        except Exception as e:
+            return {"success": False, "error": str(e), "permanent": False,
+                    "retry_payload": None, "sent": 0}
+
+    return {"success": False, "error": f"Unknown job kind: {job['kind']}", "permanent": True,
+            "retry_payload": None, "sent": 0}
+
+
+def _job_size(job: dict) -> int:
+    if job["kind"] == "meeting":
+        return len(job["payload"]["recipients"])
+    return 1
+
+
+class NotificationWorkerPool:
+    """
+    Thread pool that drains notification_outbox.
+
+    Every thread claims jobs on its own (SKIP LOCKED), waits on the per-sender
+    rate limiter and records the outcome back in the table.
+    """
+
+    def __init__(self, workers: int = None, batch_size: int = 1,
+                 poll_interval: float = 1.0, send_rate: float = None):
+        self.workers = workers or Config.OUTBOX_WORKERS
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.rate_limiter = SenderRateLimiter(
+            Config.OUTBOX_SEND_RATE if send_rate is None else send_rate
+        )
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._stop = threading.Event()
+        self._threads = []
+        self._lock = threading.Lock()
+        self.started_at = None
+        self.stats = {"jobs_sent": 0, "jobs_retried": 0, "jobs_dead": 0, "messages_sent": 0}
+
+    def _bump(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def process_job(self, job: dict):
+        self.rate_limiter.acquire(job["sender_email"], _job_size(job))
+        outcome = deliver_job(job)
+        self._bump("messages_sent", outcome.get("sent", 0))
+
+        if outcome["success"]:
+            mark_sent(job["id"])
+            self._bump("jobs_sent")
+            return
+
+        status = mark_failed(job, outcome["error"], outcome.get("retry_payload"),
+                             permanent=outcome.get("permanent", False))
+        if status == "dead":
+            logger.warning("Outbox job %s dead-lettered: %s", job["id"], outcome["error"])
+            self._bump("jobs_dead")
+        else:
+            self._bump("jobs_retried")
+
+    def _run(self, worker_id: str):
+        while not self._stop.is_set():
+            jobs = claim_jobs(worker_id, self.batch_size)
+            if not jobs:
+                self._stop.wait(self.poll_interval)
+                continue
+            for job in jobs:
+                try:
+                    self.process_job(job)
+                except Exception as e:
+                    logger.exception("Outbox job %s crashed the worker loop", job["id"])
+                    mark_failed(job, str(e))
+
+    def start(self):
+        self.started_at = time.monotonic()
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, args=(f"{self.worker_prefix}:{i}",),
+                                      name=f"outbox-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 30):
+        """Stops polling and waits for in-flight jobs to finish."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def throughput(self) -> float:
+        """Messages sent per second since start()."""
+        if not self.started_at:
+            return 0.0
+        elapsed = time.monotonic() - self.started_at
+        return self.stats["messages_sent"] / elapsed if elapsed > 0 else 0.0
+
+
+'''
+how to use this?
+
+from services.notification_queue import enqueue_meeting_notification
+
+job_id = enqueue_meeting_notification(["a@college.edu", "b@college.edu"], "invite", meeting_details)
+# turant return ho jata hai, mail workers bhejenge:
+#   python src/main.py outbox work --workers 4
+#   python src/main.py outbox status
+'''
@@ -0,0 +1,390 @@
+"""
+Activity log (audit trail).
+har action pe seedha INSERT karna request ko slow kar deta, toh log_activity
+sirf ek in-memory queue me event daalta hai (microseconds). ek background
+thread batch bana ke COPY se activity_log me likhta hai. queue bounded hai:
+bhar jaye toh event drop hota hai (ya thodi der wait, block_timeout se) aur
+stats() me dikh jata hai. process band hote waqt bacha hua buffer flush ho
+jata hai (atexit).
+
+activity_log mahine ke hisaab se partitioned hai (activity_log_2025_01, ...)
+aur created_at pe BRIN index hai, toh saalon ka data ho tab bhi date range
+wali report sirf zaroori partitions / blocks padhti hai.
+"""
+
+import atexit
+import csv
+import datetime
+import io
+import json
+import logging
+import queue
+import threading
+import time
+
+from utils.config_loader import Config
+from utils.db_pool import db_cursor
+
+logger = logging.getLogger(__name__)
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS activity_log (
+    id BIGSERIAL,
+    action_type VARCHAR(50) NOT NULL,
+    meeting_id VARCHAR(255),
+    performed_by VARCHAR(255),
+    details TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+"""
+
+# Declared on the parent, so every monthly partition gets its own copy.
+# Log rows arrive in time order, which is what BRIN needs to stay tiny.
+CREATE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_activity_log_created_at
+ON activity_log USING brin (created_at);
+"""
+
+COPY_SQL = ("COPY activity_log (action_type, meeting_id, performed_by, details, created_at) "
+            "FROM STDIN WITH (FORMAT csv)")
+
+# Partitions created ahead of time, so the writer rarely needs DDL
+PARTITIONS_AHEAD = 2
+
+# Put on the queue by flush() / close() to wake a writer blocked in get()
+_WAKE = object()
+
+
+def _month_start(moment) -> datetime.date:
+    return datetime.date(moment.year, moment.month, 1)
+
+
+def _next_month(month: datetime.date) -> datetime.date:
+    return datetime.date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _utc_now():
+    # stored as naive UTC, like the meetings mirror
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _scalars(cursor):
+    # works with plain and RealDictCursor cursors (the init script uses plain ones)
+    return [next(iter(row.values())) if isinstance(row, dict) else row[0] for row in cursor.fetchall()]
+
+
+def partition_name(month: datetime.date) -> str:
+    return f"activity_log_{month.year}_{month.month:02d}"
+
+
+def ensure_partitions(cursor, months):
+    """Creates the monthly partitions for `months` (dates in the month) if missing."""
+    for month in sorted({_month_start(m) for m in months}):
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF activity_log "
+            "FOR VALUES FROM (%s) TO (%s)",
+            (month, _next_month(month)),
+        )
+
+
+def create_activity_log_table(cursor, now=None):
+    """
+    Creates the partitioned activity_log (used by
+    scripts/init_meetings_tables.py) with partitions for this month and the
+    next PARTITIONS_AHEAD. An older unpartitioned activity_log is converted,
+    keeping its rows.
+    """
+    cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass('activity_log')")
+    kind = next(iter(_scalars(cursor)), None)
+    legacy = kind == "r"
+    if legacy:
+        cursor.execute("ALTER TABLE activity_log RENAME TO activity_log_unpartitioned")
+        cursor.execute("ALTER TABLE activity_log_unpartitioned "
+                       "RENAME CONSTRAINT activity_log_pkey TO activity_log_unpartitioned_pkey")
+        cursor.execute("ALTER SEQUENCE IF EXISTS activity_log_id_seq "
+                       "RENAME TO activity_log_unpartitioned_id_seq")
+    if kind != "p":
+        cursor.execute(CREATE_TABLE_SQL)
+    cursor.execute(CREATE_INDEX_SQL)
+
+    month = _month_start(now or _utc_now())
+    months = [month]
+    for _ in range(PARTITIONS_AHEAD):
+        months.append(_next_month(months[-1]))
+    ensure_partitions(cursor, months)
+
+    if legacy:
+        cursor.execute("SELECT DISTINCT date_trunc('month', created_at) AS month "
+                       "FROM activity_log_unpartitioned WHERE created_at IS NOT NULL")
+        ensure_partitions(cursor, _scalars(cursor))
+        cursor.execute("""
+            INSERT INTO activity_log (action_type, meeting_id, performed_by, details, created_at)
+            SELECT action_type, meeting_id::text, performed_by, details,
+                   COALESCE(created_at, CURRENT_TIMESTAMP)
+            FROM activity_log_unpartitioned ORDER BY id
+        """)
+        cursor.execute("DROP TABLE activity_log_unpartitioned")
+
+
+class ActivityLogWriter:
+    """
+    Buffers activity events in a bounded queue and writes them in batches
+    from one background thread.
+
+    A batch is written when it reaches `batch_size` events or when the
+    oldest buffered event is `flush_interval` seconds old. If the database
+    is down, a batch is retried on the next flush; after `max_retries`
+    failures it is dropped (and counted) so the queue cannot wedge.
+    """
+
+    def __init__(self, max_queue: int = None, batch_size: int = None,
+                 flush_interval: float = None, block_timeout: float = 0.0, max_retries: int = 3):
+        self.batch_size = batch_size or Config.ACTIVITY_LOG_BATCH_SIZE
+        self.flush_interval = Config.ACTIVITY_LOG_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.block_timeout = block_timeout
+        self.max_retries = max_retries
+
+        self._queue = queue.Queue(maxsize=max_queue or Config.ACTIVITY_LOG_QUEUE_SIZE)
+        self._stop = threading.Event()
+        self._flush_now = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._known_months = set()
+        self._lock = threading.Lock()
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "blocked": 0,
+            "blocked_ms_total": 0.0,
+            "flushes": 0,
+            "flush_errors": 0,
+            "max_queue_depth": 0,
+            "last_flush_ms": None,
+        }
+
+    def _bump(self, key, amount=1):
+        with self._lock:
+            self._stats[key] += amount
+
+    def start(self):
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="activity-log-writer", daemon=True)
+                self._thread.start()
+
+    def log(self, action_type: str, meeting_id: str = None, performed_by: str = None,
+            details=None) -> bool:
+        """
+        Buffers one event; returns False if it was dropped because the
+        queue is full. `details` may be a string or anything JSON-serializable.
+        """
+        if self._thread is None:
+            self.start()
+        if details is not None and not isinstance(details, str):
+            details = json.dumps(details, default=str)
+        event = (action_type, meeting_id, performed_by, details, _utc_now())
+
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            if not self.block_timeout:
+                self._bump("dropped")
+                return False
+            started = time.perf_counter()
+            try:
+                self._queue.put(event, timeout=self.block_timeout)
+            except queue.Full:
+                self._bump("dropped")
+                return False
+            finally:
+                self._bump("blocked")
+                self._bump("blocked_ms_total", (time.perf_counter() - started) * 1000)
+
+        with self._lock:
+            self._stats["enqueued"] += 1
+            depth = self._queue.qsize()
+            if depth > self._stats["max_queue_depth"]:
+                self._stats["max_queue_depth"] = depth
+        if self._queue.qsize() >= self.batch_size:
+            self._flush_now.set()
+        return True
+
+    def _write(self, batch):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(batch)
+        buffer.seek(0)
+        months = {_month_start(event[4]) for event in batch}
+        with db_cursor(commit=True) as cur:
+            missing = months - self._known_months
+            if missing:
+                ensure_partitions(cur, missing)
+            cur.copy_expert(COPY_SQL, buffer)
+        self._known_months |= months
+
+    def _urgent(self):
+        return self._flush_now.is_set() or self._stop.is_set()
+
+    def _take_batch(self, batch):
+        """
+        Fills `batch` until it holds batch_size events or flush_interval
+        has passed; after flush() / close() it only takes what is queued.
+        """
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                if self._urgent():
+                    event = self._queue.get_nowait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    event = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if event is _WAKE:
+                self._queue.task_done()
+            else:
+                batch.append(event)
+        return batch
+
+    def _run(self):
+        batch, failures = [], 0
+        while True:
+            batch = self._take_batch(batch)
+            if not batch:
+                if self._stop.is_set():
+                    return
+                self._flush_now.clear()
+                continue
+
+            started = time.perf_counter()
+            try:
+                self._write(batch)
+            except Exception as e:
+                failures += 1
+                self._bump("flush_errors")
+                if failures <= self.max_retries and not self._stop.is_set():
+                    logger.warning("Activity log flush failed (%s), will retry %d events", e, len(batch))
+                    self._stop.wait(min(self.flush_interval * failures, 5))
+                    continue
+                logger.error("Dropping %d activity log events after %d failed flushes: %s",
+                             len(batch), failures, e)
+                self._bump("dropped", len(batch))
+            else:
+                self._bump("written", len(batch))
+                self._bump("flushes")
+                with self._lock:
+                    self._stats["last_flush_ms"] = (time.perf_counter() - started) * 1000
+            for _ in batch:
+                self._queue.task_done()
+            batch, failures = [], 0
+
+    def _wake(self):
+        self._flush_now.set()
+        try:
+            self._queue.put_nowait(_WAKE)
+        except queue.Full:
+            pass  # a full queue never leaves the writer waiting in get()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Writes everything buffered so far. Returns False if that did not
+        finish within `timeout` seconds.
+        """
+        if self._thread is None:
+            return True
+        self._wake()
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 5.0):
+        """Flushes what is buffered and stops the writer thread."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def stats(self):
+        """
+        Returns:
+            dict: enqueued / written / dropped counts, producer blocking
+            (blocked, blocked_ms_total), flushes and flush_errors, the
+            current and highest queue depth and the last flush time.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        stats["queue_capacity"] = self._queue.maxsize
+        return stats
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_activity_writer() -> ActivityLogWriter:
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = ActivityLogWriter()
+                atexit.register(_writer.close)
+    return _writer
+
+
+def log_activity(action_type: str, meeting_id: str = None, performed_by: str = None, details=None) -> bool:
+    """Buffers an audit event for the shared writer. Never raises, never waits on the database."""
+    try:
+        return get_activity_writer().log(action_type, meeting_id, performed_by, details)
+    except Exception as e:
+        print(f"Error buffering activity: {e}")
+        return False
+
+
+def fetch_activity(start, end, action_type: str = None, meeting_id: str = None, limit: int = 1000) -> list:
+    """
+    Log rows with created_at in [start, end), newest first. The range
+    prunes to the matching monthly partitions and BRIN skips the rest.
+    """
+    conditions = ["created_at >= %s", "created_at < %s"]
+    params = [start, end]
+    if action_type:
+        conditions.append("action_type = %s")
+        params.append(action_type)
+    if meeting_id:
+        conditions.append("meeting_id = %s")
+        params.append(meeting_id)
+    params.append(limit)
+    with db_cursor() as cur:
+        cur.execute(
+            "SELECT id, action_type, meeting_id, performed_by, details, created_at FROM activity_log "
+            f"WHERE {' AND '.join(conditions)} ORDER BY created_at DESC LIMIT %s",
+            params,
+        )
+        return [dict(row) for row in cur.fetchall()]
+
+
+'''
+how to use this?
+
+from utils.activity_log import log_activity, get_activity_writer
+
+log_activity("meeting_cancelled", meeting_id="evt123", performed_by="hod@college.edu",
+             details={"reason": "department holiday"})
+
+get_activity_writer().stats()
+# {"enqueued": 1, "written": 1, "dropped": 0, "queue_depth": 0, ...}
+
+# partitioned table + BRIN index: python scripts/init_meetings_tables.py
+'''
@@ -0,0 +1,164 @@
+"""
+Google Calendar REST API ka asyncio client (httpx).
+
+googleapiclient blocking hai aur thread-safe bhi nahi, isliye sync code me
+har thread ka apna service banta hai (utils/google_auth.py). event loop pe
+yea client seedha REST endpoints ko httpx.AsyncClient se call karta hai: ek
+client, keep-alive connections, aur jitni chahe calls ek saath in flight.
+
+credentials wahi hai jo google_auth deta hai (token.json, expiry se pehele
+refresh). refresh blocking hai, isliye woh thread pe hota hai - har 55
+minute me ek baar, har call pe nahi.
+
+429 / 5xx pe thoda ruk ke dobara try karta hai (meeting_modifier ke batch
+retry jaisa); baaki errors CalendarAPIError ban ke aate hai, jisme HTTP
+status hai (404, 410, 412 ...).
+"""
+
+import asyncio
+import urllib.parse
+import weakref
+
+from . import google_auth
+
+API_ROOT = "https://www.googleapis.com/calendar/v3"
+RETRYABLE_STATUSES = (429, 500, 502, 503)
+RETRIES = 2
+RETRY_DELAY = 1.0
+# Keep-alive connections per client (one client per event loop)
+MAX_CONNECTIONS = 100
+
+_clients = weakref.WeakKeyDictionary()
+
+
+class CalendarAPIError(Exception):
+    """A Calendar API call failed; `status` is the HTTP status."""
+
+    def __init__(self, status: int, message: str, reason: str = None):
+        super().__init__(f"<HttpError {status}: {message}>")
+        self.status = status
+        self.reason = reason
+
+
+class AsyncCalendarClient:
+    """
+    Calendar v3 calls on an httpx.AsyncClient: events get / insert /
+    patch / delete / list and freebusy. Responses are the same JSON
+    resources googleapiclient returns.
+    """
+
+    def __init__(self, http=None, credentials_factory=None, timeout=google_auth.HTTP_TIMEOUT):
+        import httpx
+
+        self._http = http or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS,
+                                max_keepalive_connections=MAX_CONNECTIONS),
+        )
+        self._credentials_factory = credentials_factory or google_auth.get_credentials
+        self._creds = None
+        self.stats = {"calls": 0, "retries": 0, "errors": 0}
+
+    async def _token(self):
+        creds = self._creds
+        if creds is None or google_auth._expires_soon(creds):
+            # loads token.json / refreshes over the network: not on the loop
+            creds = self._creds = await asyncio.to_thread(self._credentials_factory)
+        return creds.token
+
+    async def request(self, method: str, path: str, params=None, body=None):
+        """
+        One API call; `path` is relative to API_ROOT. Returns the decoded
+        JSON (None for an empty response). Raises CalendarAPIError.
+        """
+        url = f"{API_ROOT}{path}"
+        for attempt in range(RETRIES + 1):
+            if attempt:
+                self.stats["retries"] += 1
+                await asyncio.sleep(RETRY_DELAY * 2 ** (attempt - 1))
+            headers = {"Authorization": f"Bearer {await self._token()}"}
+            self.stats["calls"] += 1
+            response = await self._http.request(method, url, params=params, json=body, headers=headers)
+            if response.status_code < 400:
+                return response.json() if response.content else None
+            if response.status_code == 401 and attempt < RETRIES:
+                # token revoked or expired early: load it again
+                self._creds = None
+                google_auth.reset_calendar_service()
+                continue
+            if response.status_code not in RETRYABLE_STATUSES or attempt == RETRIES:
+                break
+        self.stats["errors"] += 1
+        raise _error(response)
+
+    @staticmethod
+    def _event_path(calendar_id, event_id=None):
+        path = f"/calendars/{urllib.parse.quote(calendar_id, safe='')}/events"
+        if event_id is not None:
+            path += f"/{urllib.parse.quote(event_id, safe='')}"
+        return path
+
+    async def get_event(self, calendar_id: str, event_id: str) -> dict:
+        return await self.request("GET", self._event_path(calendar_id, event_id))
+
+    async def insert_event(self, calendar_id: str, body: dict, **params) -> dict:
+        return await self.request("POST", self._event_path(calendar_id), params or None, body)
+
+    async def patch_event(self, calendar_id: str, event_id: str, body: dict, **params) -> dict:
+        return await self.request("PATCH", self._event_path(calendar_id, event_id), params or None, body)
+
+    async def delete_event(self, calendar_id: str, event_id: str, **params):
+        await self.request("DELETE", self._event_path(calendar_id, event_id), params or None)
+
+    async def list_events(self, calendar_id: str, **params) -> dict:
+        return await self.request("GET", self._event_path(calendar_id), params)
+
+    async def freebusy(self, body: dict) -> dict:
+        return await self.request("POST", "/freeBusy", body=body)
+
+    async def aclose(self):
+        await self._http.aclose()
+
+
+def _error(response) -> CalendarAPIError:
+    message, reason = response.reason_phrase, None
+    try:
+        error = response.json()["error"]
+        message = error.get("message", message)
+        reason = (error.get("errors") or [{}])[0].get("reason")
+    except (ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return CalendarAPIError(response.status_code, message, reason)
+
+
+def get_async_calendar() -> AsyncCalendarClient:
+    """
+    Returns the running event loop's client (httpx connections belong to
+    the loop that opened them).
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = _clients[loop] = AsyncCalendarClient()
+    return client
+
+
+'''
+how to use this?
+
+from utils.async_calendar import CalendarAPIError, get_async_calendar
+
+async def move(meeting_id):
+    calendar = get_async_calendar()
+    try:
+        event = await calendar.patch_event("primary", meeting_id, {
+            "start": {"dateTime": "2025-01-28T10:00:00", "timeZone": "UTC"},
+            "end": {"dateTime": "2025-01-28T11:00:00", "timeZone": "UTC"},
+        })
+    except CalendarAPIError as e:
+        if e.status == 404:
+            ...
+
+# 100 freebusy requests ek saath, ek thread pe
+results = await asyncio.gather(*(calendar.freebusy(body) for body in bodies))
+'''
@@ -0,0 +1,131 @@
+"""
+Postgres ka asyncio pool (asyncpg).
+
+utils/db_pool.py wala ThreadedConnectionPool har query pe ek thread block
+karta hai; yea pool event loop pe chalta hai, toh ek loop hazaaron queries
+ek saath wait kar sakta hai bina threads ke. settings same hai: DB_POOL_MIN /
+DB_POOL_MAX connections, har connection pe statement_timeout, aur pool bhar
+jaye toh caller checkout timeout tak wait karta hai.
+
+asyncpg ka pool ek event loop se bandha hota hai, isliye har loop ka apna
+pool banta hai (get_async_pool). json / jsonb columns Python objects ban
+ke aate hai, jaise psycopg2 me.
+
+queries me placeholders $1, $2 ... hai (psycopg2 ke %s nahi).
+"""
+
+import asyncio
+import json
+import weakref
+from contextlib import asynccontextmanager
+
+from utils.config_loader import Config
+
+# Seconds a caller waits for a free connection, like DatabasePool.checkout_timeout
+CHECKOUT_TIMEOUT = 10
+
+_pools = weakref.WeakKeyDictionary()
+
+
+async def _init_connection(conn):
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(type_name, encoder=json.dumps, decoder=json.loads,
+                                  schema="pg_catalog")
+
+
+async def create_async_pool(dsn=None, minconn=None, maxconn=None, statement_timeout_ms=None):
+    """
+    Opens an asyncpg pool with the same settings as utils.db_pool (from
+    Config unless given).
+    """
+    import asyncpg
+
+    if dsn is None:
+        Config.require("database")
+    timeout_ms = Config.DB_STATEMENT_TIMEOUT_MS if statement_timeout_ms is None else statement_timeout_ms
+    return await asyncpg.create_pool(
+        dsn or Config.DATABASE_URL,
+        min_size=Config.DB_POOL_MIN if minconn is None else minconn,
+        max_size=Config.DB_POOL_MAX if maxconn is None else maxconn,
+        server_settings={"statement_timeout": str(timeout_ms)},
+        init=_init_connection,
+    )
+
+
+async def get_async_pool():
+    """
+    Returns the running event loop's pool, opening it on first use.
+    Concurrent first callers wait on the same open instead of racing.
+    """
+    loop = asyncio.get_running_loop()
+    opening = _pools.get(loop)
+    if opening is None:
+        opening = _pools[loop] = loop.create_task(create_async_pool())
+    try:
+        return await asyncio.shield(opening)
+    except Exception:
+        if _pools.get(loop) is opening:
+            del _pools[loop]
+        raise
+
+
+@asynccontextmanager
+async def async_db_connection():
+    """
+    `async with async_db_connection() as conn:` - borrows a connection from
+    the loop's pool. Use `async with conn.transaction():` for writes that
+    must commit together; a single statement commits on its own.
+    """
+    pool = await get_async_pool()
+    async with pool.acquire(timeout=CHECKOUT_TIMEOUT) as conn:
+        yield conn
+
+
+async def fetch(query: str, *args) -> list:
+    """Rows of `query` as dicts."""
+    async with async_db_connection() as conn:
+        return [dict(row) for row in await conn.fetch(query, *args)]
+
+
+async def fetchrow(query: str, *args):
+    """First row of `query` as a dict, or None."""
+    async with async_db_connection() as conn:
+        row = await conn.fetchrow(query, *args)
+    return dict(row) if row is not None else None
+
+
+async def execute(query: str, *args) -> int:
+    """Runs a write and returns the number of rows it touched."""
+    async with async_db_connection() as conn:
+        status = await conn.execute(query, *args)
+    # "UPDATE 3", "DELETE 0", "INSERT 0 1"
+    count = status.rsplit(" ", 1)[-1]
+    return int(count) if count.isdigit() else 0
+
+
+async def close_async_pool():
+    """Closes the running loop's pool (e.g. on application shutdown)."""
+    opening = _pools.pop(asyncio.get_running_loop(), None)
+    if opening is not None:
+        await (await opening).close()
+
+
+'''
+how to use this?
+
+from utils.async_db import fetch, fetchrow, execute
+
+async def handler():
+    rows = await fetch("SELECT * FROM faculty WHERE department = $1", "CSE")
+    one = await fetchrow("SELECT * FROM meetings WHERE meeting_id = $1", "evt1")
+    await execute("DELETE FROM meetings WHERE meeting_id = ANY($1)", ["evt1", "evt2"])
+
+# transaction chahiye toh:
+from utils.async_db import async_db_connection
+
+async with async_db_connection() as conn:
+    async with conn.transaction():
+        ...
+
+# app band ho rahi ho toh: await close_async_pool()
+'''
@@ -0,0 +1,181 @@
+"""
+SMTP connection pool, asyncio version (aiosmtplib).
+
+utils/smtp_pool.py jaisa hee hai - kuch logged-in sessions zinda rakhta hai,
+idle session ko NOOP se check karta hai, drop hua toh naya bana leta hai -
+bas har send pe ek thread block nahi hota. ek event loop pe hazaaron mails
+in flight ho sakte hai, sessions max_connections tak hee khulte hai.
+"""
+
+import asyncio
+import time
+import weakref
+
+from utils.config_loader import Config
+from utils.smtp_pool import SMTPPoolError
+
+_pools = weakref.WeakKeyDictionary()
+
+
+class AsyncSMTPConnectionPool:
+    """
+    Pool of logged-in aiosmtplib sessions for one event loop.
+
+    Same knobs as SMTPConnectionPool: at most `max_connections` sessions,
+    NOOP probe after `keepalive_interval` idle seconds, thrown away after
+    `max_idle`.
+    """
+
+    def __init__(self, host, port, username=None, password=None,
+                 use_ssl=True, starttls=False, max_connections=4,
+                 keepalive_interval=30, max_idle=240, timeout=30):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_ssl = use_ssl
+        self.starttls = starttls
+        self.max_connections = max_connections
+        self.keepalive_interval = keepalive_interval
+        self.max_idle = max_idle
+        self.timeout = timeout
+
+        self._idle = []
+        self._slots = asyncio.Semaphore(max_connections)
+        self._closed = False
+        self.stats = {"connects": 0, "reuses": 0, "dropped": 0, "sent": 0}
+
+    async def _connect(self):
+        import aiosmtplib
+
+        server = aiosmtplib.SMTP(hostname=self.host, port=self.port, timeout=self.timeout,
+                                 use_tls=self.use_ssl, start_tls=self.starttls)
+        await server.connect()
+        try:
+            if self.username and self.password:
+                await server.login(self.username, self.password)
+        except Exception:
+            await self._discard(server)
+            raise
+        self.stats["connects"] += 1
+        return server
+
+    @staticmethod
+    async def _is_alive(server):
+        import aiosmtplib
+
+        try:
+            return (await server.noop()).code == 250
+        except (aiosmtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    async def _discard(server):
+        import aiosmtplib
+
+        try:
+            await server.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            server.close()
+
+    async def _acquire(self):
+        if self._closed:
+            raise SMTPPoolError("SMTP pool is closed")
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                server, last_used = self._idle.pop()
+                idle_for = time.monotonic() - last_used
+                stale = idle_for > self.max_idle or not server.is_connected
+                if not stale and idle_for > self.keepalive_interval:
+                    stale = not await self._is_alive(server)
+                if stale:
+                    self.stats["dropped"] += 1
+                    await self._discard(server)
+                    continue
+                self.stats["reuses"] += 1
+                return server
+            return await self._connect()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def _release(self, server, healthy=True):
+        try:
+            if healthy and not self._closed:
+                self._idle.append((server, time.monotonic()))
+            else:
+                self.stats["dropped"] += 1
+                await self._discard(server)
+        finally:
+            self._slots.release()
+
+    async def send_message(self, msg, retries=1):
+        """
+        Sends an EmailMessage over a pooled session, replacing a session the
+        server dropped and retrying `retries` times.
+
+        Returns:
+            dict: Refused recipients (empty on success).
+        """
+        import aiosmtplib
+
+        attempt = 0
+        while True:
+            server = await self._acquire()
+            healthy = True
+            try:
+                refused, _ = await server.send_message(msg)
+                self.stats["sent"] += 1
+                return refused
+            except (aiosmtplib.SMTPServerDisconnected, OSError):
+                healthy = False
+                if attempt >= retries:
+                    raise
+                attempt += 1
+            except asyncio.CancelledError:
+                # the session may be mid-DATA: do not hand it to someone else
+                healthy = False
+                raise
+            finally:
+                await self._release(server, healthy)
+
+    async def close(self):
+        """Closes every idle session."""
+        self._closed = True
+        while self._idle:
+            server, _ = self._idle.pop()
+            await self._discard(server)
+
+
+def get_async_smtp_pool() -> AsyncSMTPConnectionPool:
+    """
+    Returns the running event loop's pool for the configured sender
+    account (same settings as utils.smtp_pool.get_smtp_pool).
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        Config.require("email")
+        pool = _pools[loop] = AsyncSMTPConnectionPool(
+            Config.SMTP_HOST,
+            Config.SMTP_PORT,
+            username=Config.SENDER_EMAIL,
+            password=Config.SENDER_PASSWORD,
+            use_ssl=Config.SMTP_PORT == 465,
+            starttls=Config.SMTP_PORT == 587,
+            max_connections=Config.SMTP_POOL_SIZE,
+        )
+    return pool
+
+
+'''
+how to use this?
+
+from utils.async_smtp import get_async_smtp_pool
+
+async def notify(messages):
+    pool = get_async_smtp_pool()
+    await asyncio.gather(*(pool.send_message(msg) for msg in messages))
+    # sessions SMTP_POOL_SIZE tak hee khulenge, baaki mails unka wait karte hai
+'''
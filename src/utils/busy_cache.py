@@ -0,0 +1,329 @@
+"""
+Calendar busy intervals ka local cache.
+pehele har conflict check aur har reschedule seedha Google Calendar pe jata
+tha, chahe wahi calendar abhi abhi check hua ho. ab har calendar ka ek
+BusyStore hai: pehli baar events().list se poora bharta hai, uske baad
+nextSyncToken se sirf badle hue events aate hai. overlap wale sawal ek
+interval tree se microseconds me answer hote hai, network ke bina.
+"""
+
+import datetime
+import threading
+import time
+from zoneinfo import ZoneInfo
+
+from dateutil import parser
+from googleapiclient.errors import HttpError
+
+from .config_loader import Config
+from .google_auth import get_calendar_service
+
+# Calendar API maximum page size for events().list
+EVENTS_PAGE_SIZE = 2500
+
+
+def to_timestamp(value) -> float:
+    """
+    ISO 8601 string, datetime or date -> POSIX seconds.
+    Naive values are treated as UTC, like conflict_detector does.
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = parser.isoparse(value)
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime.combine(value, datetime.time.min)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.timestamp()
+
+
+def from_timestamp(value: float) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
+
+
+class IntervalTree:
+    """
+    Static augmented interval tree over (start, end, payload) tuples with
+    half-open [start, end) intervals.
+
+    The intervals are kept sorted by start and the tree is implicit in the
+    array (the middle element is the root); every node stores the largest
+    end in its subtree, so queries skip whole subtrees that end too early.
+    Rebuilding is O(n log n); queries are O(log n + matches).
+    """
+
+    def __init__(self, intervals=()):
+        self._items = sorted(intervals, key=lambda item: (item[0], item[1]))
+        self._starts = [item[0] for item in self._items]
+        self._max_end = [0.0] * len(self._items)
+        self._build(0, len(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def _build(self, lo, hi):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        max_end = self._items[mid][1]
+        for child in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child is not None and child > max_end:
+                max_end = child
+        self._max_end[mid] = max_end
+        return max_end
+
+    def _search(self, start, end, first_only):
+        found = []
+        stack = [(0, len(self._items))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_end[mid] <= start:
+                # everything in this subtree ends before the query starts
+                continue
+            stack.append((lo, mid))
+            item = self._items[mid]
+            if item[0] < end:
+                if item[1] > start:
+                    found.append(item)
+                    if first_only:
+                        return found
+                # the right subtree starts later, so only look if mid started in time
+                stack.append((mid + 1, hi))
+        return found
+
+    def overlapping(self, start: float, end: float) -> list:
+        """All intervals overlapping [start, end), sorted by start."""
+        return sorted(self._search(start, end, first_only=False))
+
+    def overlaps(self, start: float, end: float) -> bool:
+        return bool(self._search(start, end, first_only=True))
+
+
+class BusyStore:
+    """
+    Busy intervals of one calendar, kept current with incremental sync.
+
+    Only events that block time are stored: cancelled events, events
+    marked "free" (transparent) and events the calendar owner declined
+    are left out, the same things the freebusy API leaves out.
+    """
+
+    def __init__(self, calendar_id: str, max_staleness: float = None, service_factory=None):
+        self.calendar_id = calendar_id
+        self.max_staleness = Config.BUSY_CACHE_MAX_STALENESS if max_staleness is None else max_staleness
+        self._service_factory = service_factory or get_calendar_service
+
+        self._lock = threading.RLock()
+        self._events = {}
+        self._etags = {}
+        self._tree = None
+        self._sync_token = None
+        self._synced_at = None
+        self.timezone = datetime.timezone.utc
+        self._stats = {
+            "queries": 0,
+            "full_syncs": 0,
+            "incremental_syncs": 0,
+            "events_synced": 0,
+            "last_sync_ms": None,
+        }
+
+    @property
+    def synced(self):
+        return self._synced_at is not None
+
+    def _event_interval(self, event):
+        """(start, end) in POSIX seconds, or None if the event does not block time."""
+        if event.get("status") == "cancelled" or event.get("transparency") == "transparent":
+            return None
+        for attendee in event.get("attendees", []):
+            if attendee.get("self") and attendee.get("responseStatus") == "declined":
+                return None
+
+        start, end = event.get("start", {}), event.get("end", {})
+        if "dateTime" in start and "dateTime" in end:
+            return to_timestamp(start["dateTime"]), to_timestamp(end["dateTime"])
+        if "date" in start and "date" in end:
+            # All-day events block whole days in the calendar's own timezone
+            return tuple(
+                datetime.datetime.combine(datetime.date.fromisoformat(day), datetime.time.min,
+                                          tzinfo=self.timezone).timestamp()
+                for day in (start["date"], end["date"])
+            )
+        return None
+
+    def apply_event(self, event: dict):
+        """
+        Applies one event resource (new, changed or cancelled). Also used
+        after our own writes, so they show up before the next sync.
+        """
+        with self._lock:
+            if event.get("etag") and event.get("status") != "cancelled":
+                self._etags[event["id"]] = event["etag"]
+            else:
+                self._etags.pop(event["id"], None)
+            interval = self._event_interval(event)
+            if interval is None:
+                removed = self._events.pop(event["id"], None) is not None
+                if removed:
+                    self._tree = None
+                return
+            if self._events.get(event["id"]) != interval:
+                self._events[event["id"]] = interval
+                self._tree = None
+
+    def remove_event(self, event_id: str):
+        with self._lock:
+            self._etags.pop(event_id, None)
+            if self._events.pop(event_id, None) is not None:
+                self._tree = None
+
+    def etag(self, event_id: str):
+        """ETag of the event as last synced, or None if it is not known."""
+        return self._etags.get(event_id)
+
+    def _list_pages(self, service, **params):
+        page_token = None
+        while True:
+            result = service.events().list(
+                calendarId=self.calendar_id, pageToken=page_token, **params
+            ).execute()
+            yield result
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                return
+
+    def sync(self, full: bool = False):
+        """
+        Pulls changes since the last sync (everything on the first call or
+        with full=True). An expired sync token (HTTP 410) triggers a full
+        resync, as the Calendar API documentation asks.
+        """
+        with self._lock:
+            started = time.perf_counter()
+            service = self._service_factory()
+            incremental = self._sync_token is not None and not full
+            params = {"singleEvents": True, "maxResults": EVENTS_PAGE_SIZE}
+            if incremental:
+                params["syncToken"] = self._sync_token
+
+            try:
+                pages = list(self._list_pages(service, **params))
+            except HttpError as error:
+                if incremental and error.resp.status == 410:
+                    self._sync_token = None
+                    return self.sync(full=True)
+                raise
+
+            if not incremental:
+                timezone = pages[0].get("timeZone") if pages else None
+                self.timezone = ZoneInfo(timezone) if timezone else datetime.timezone.utc
+                self._events = {}
+                self._etags = {}
+                self._tree = None
+
+            count = 0
+            for page in pages:
+                for event in page.get("items", []):
+                    self.apply_event(event)
+                    count += 1
+
+            self._sync_token = pages[-1].get("nextSyncToken")
+            self._synced_at = time.monotonic()
+            self._stats["incremental_syncs" if incremental else "full_syncs"] += 1
+            self._stats["events_synced"] += count
+            self._stats["last_sync_ms"] = (time.perf_counter() - started) * 1000
+
+    @property
+    def stale(self):
+        """True if the next query would sync first (never synced, or older than max_staleness)."""
+        return self._synced_at is None or time.monotonic() - self._synced_at > self.max_staleness
+
+    def ensure_fresh(self):
+        """Syncs if the data is older than max_staleness seconds."""
+        if self.stale:
+            self.sync()
+
+    def _current_tree(self):
+        with self._lock:
+            self._stats["queries"] += 1
+            if self._tree is None:
+                self._tree = IntervalTree(
+                    (start, end, event_id) for event_id, (start, end) in self._events.items()
+                )
+            return self._tree
+
+    def busy_intervals(self, start, end, exclude=()) -> list:
+        """
+        Busy (start, end, event_id) tuples overlapping [start, end) as UTC
+        datetimes, skipping the event ids in `exclude` (e.g. the meeting
+        being rescheduled).
+        """
+        self.ensure_fresh()
+        hits = self._current_tree().overlapping(to_timestamp(start), to_timestamp(end))
+        return [(from_timestamp(s), from_timestamp(e), event_id)
+                for s, e, event_id in hits if event_id not in exclude]
+
+    def is_busy(self, start, end, exclude=()) -> bool:
+        self.ensure_fresh()
+        start, end = to_timestamp(start), to_timestamp(end)
+        tree = self._current_tree()
+        if not exclude:
+            return tree.overlaps(start, end)
+        return any(event_id not in exclude for _, _, event_id in tree.overlapping(start, end))
+
+    def stats(self):
+        """
+        Returns:
+            dict: query/sync counters, events held and seconds since the last sync.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["events"] = len(self._events)
+        stats["age_seconds"] = (time.monotonic() - self._synced_at) if self._synced_at else None
+        return stats
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_busy_store(calendar_id: str = "primary") -> BusyStore:
+    """
+    Returns the store for `calendar_id`, doing the initial full sync the
+    first time. Raises if the calendar cannot be read.
+    """
+    with _stores_lock:
+        store = _stores.get(calendar_id)
+        if store is None:
+            store = _stores[calendar_id] = BusyStore(calendar_id)
+    store.ensure_fresh()
+    return store
+
+
+def get_synced_store(calendar_id: str):
+    """
+    Returns the store for `calendar_id` only if it has already been synced
+    (nothing is fetched for calendars nobody asked to cache), else None.
+    """
+    store = _stores.get(calendar_id)
+    return store if store is not None and store.synced else None
+
+
+'''
+how to use this?
+
+from utils.busy_cache import get_busy_store
+
+store = get_busy_store("primary")            # pehli baar poora sync
+store.is_busy("2025-01-27T15:00:00", "2025-01-27T16:00:00")
+store.busy_intervals(start, end, exclude={meeting_id})   # reschedule me khud ko ignore karo
+print(store.stats())
+
+# max_staleness (BUSY_CACHE_MAX_STALENESS) se purana ho toh agli query se
+# pehele ek incremental sync hota hai (usually ek chhota request)
+'''
@@ -3,6 +3,11 @@ agar kissi koo janna hai ki kya karta hai yea file.
 toh yea basically ek loader and validator dono sath me hai.
 bar bar iss code ko manually har ek service me load krne kee jagah 
 directly iss module koo import kr lenge
+
+import karne pe ab koi validation nahi hoti (pehele sys.exit ho jata tha
+agar ek bhi key missing ho, chahe command ko woh chahiye ya nahi). har
+subsystem (database / email / google) pehli baar use hone pe
+Config.require(...) se sirf apni keys check karta hai.
 '''
 
 import os
@@ -12,16 +17,19 @@ from dotenv import load_dotenv
 #turrant load kr liyae environment vars .env se
 load_dotenv()
 
-#define kr diyae kaunsa keys koo use krna hai
-REQUIRED_KEYS = [
-    "GOOGLE_CLIENT_ID",
-    "GOOGLE_CLIENT_SECRET",
-    "GOOGLE_PROJECT_ID",
-    "GOOGLE_API_SCOPES",
-    "SENDER_EMAIL",
-    "SENDER_PASSWORD",
-    "DATABASE_URL"
-]
+#define kr diyae kaunsa keys koo use krna hai, subsystem ke hisaab se
+SUBSYSTEM_KEYS = {
+    "google": ["GOOGLE_CLIENT_ID", "GOOGLE_CLIENT_SECRET", "GOOGLE_PROJECT_ID", "GOOGLE_API_SCOPES"],
+    "email": ["SENDER_EMAIL", "SENDER_PASSWORD"],
+    "database": ["DATABASE_URL"],
+}
+
+REQUIRED_KEYS = [key for keys in SUBSYSTEM_KEYS.values() for key in keys]
+
+
+class ConfigError(Exception):
+    """Raised when a subsystem is used without its configuration keys."""
+
 
 class Config:
     """
@@ -42,8 +50,85 @@ class Config:
     SENDER_EMAIL = os.getenv("SENDER_EMAIL")
     SENDER_PASSWORD = os.getenv("SENDER_PASSWORD")
 
+    # SMTP transport (defaults are Gmail over implicit TLS)
+    SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
+    SMTP_PORT = int(os.getenv("SMTP_PORT", "465"))
+    SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "4"))
+
+    # Notification outbox workers
+    OUTBOX_WORKERS = int(os.getenv("OUTBOX_WORKERS", "4"))
+    OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5"))
+    # Max messages per second per sender account (Gmail throttles bursts)
+    OUTBOX_SEND_RATE = float(os.getenv("OUTBOX_SEND_RATE", "5"))
+
+    # Jinja2 bytecode cache directory (None = system temp dir)
+    TEMPLATE_CACHE_DIR = os.getenv("TEMPLATE_CACHE_DIR") or None
+
     # Database POSTGRES
     DATABASE_URL = os.getenv("DATABASE_URL")
+    DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
+    DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+    DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "5000"))
+
+    # Seconds before the cached faculty roster is refreshed in the background
+    ROSTER_CACHE_TTL = int(os.getenv("ROSTER_CACHE_TTL", "300"))
+
+    # Seconds a cached calendar may go without an incremental sync before
+    # a conflict check syncs it first
+    BUSY_CACHE_MAX_STALENESS = int(os.getenv("BUSY_CACHE_MAX_STALENESS", "60"))
+
+    # Buffered activity_log writer: queue bound (events), rows per COPY and
+    # the longest an event waits in memory before it is written (seconds)
+    ACTIVITY_LOG_QUEUE_SIZE = int(os.getenv("ACTIVITY_LOG_QUEUE_SIZE", "10000"))
+    ACTIVITY_LOG_BATCH_SIZE = int(os.getenv("ACTIVITY_LOG_BATCH_SIZE", "500"))
+    ACTIVITY_LOG_FLUSH_INTERVAL = float(os.getenv("ACTIVITY_LOG_FLUSH_INTERVAL", "1.0"))
+
+    # Content-addressed .ics files (only when a path is needed; emails
+    # attach the bytes directly). Limits in bytes and seconds.
+    ICS_CACHE_DIR = os.getenv("ICS_CACHE_DIR", "data/ics")
+    ICS_CACHE_MAX_BYTES = int(os.getenv("ICS_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+    ICS_CACHE_MAX_AGE = int(os.getenv("ICS_CACHE_MAX_AGE", str(7 * 24 * 3600)))
+
+    # Subscription feeds (utils/ics_feed.py): meetings from PAST_DAYS ago to
+    # FUTURE_DAYS ahead; bodies up to CACHE_MAX_BODY bytes stay in memory
+    ICS_FEED_PAST_DAYS = int(os.getenv("ICS_FEED_PAST_DAYS", "30"))
+    ICS_FEED_FUTURE_DAYS = int(os.getenv("ICS_FEED_FUTURE_DAYS", "180"))
+    ICS_FEED_CACHE_ENTRIES = int(os.getenv("ICS_FEED_CACHE_ENTRIES", "256"))
+    ICS_FEED_CACHE_MAX_BODY = int(os.getenv("ICS_FEED_CACHE_MAX_BODY", str(4 * 1024 * 1024)))
+
+    # `sam serve` daemon: Unix socket the CLI forwards commands to (default
+    # sam-<uid>.sock in the temp dir) and threads serving them
+    SAM_SOCKET = os.getenv("SAM_SOCKET") or None
+    SAM_DAEMON_WORKERS = int(os.getenv("SAM_DAEMON_WORKERS", "4"))
+
+    # HTTP API (api/routes.py): threads for the blocking service calls,
+    # requests allowed to wait on them before new ones get 503, and the
+    # longest a request may take (seconds) before it gets 504
+    API_WORKERS = int(os.getenv("API_WORKERS", "32"))
+    API_MAX_PENDING = int(os.getenv("API_MAX_PENDING", "256"))
+    API_REQUEST_TIMEOUT = float(os.getenv("API_REQUEST_TIMEOUT", "30"))
+
+    # Working hours used when suggesting alternative meeting times
+    SCHEDULING_TIMEZONE = os.getenv("SCHEDULING_TIMEZONE", "UTC")
+    WORKDAY_START = os.getenv("WORKDAY_START", "09:00")
+    WORKDAY_END = os.getenv("WORKDAY_END", "17:00")
+
+    _checked = set()
+
+    @classmethod
+    def require(cls, subsystem):
+        """
+        Checks the keys `subsystem` ("google", "email", "database") needs,
+        once per process. Called by each subsystem on first use.
+        Raises ConfigError if any are missing.
+        """
+        if subsystem in cls._checked:
+            return
+        missing_keys = [key for key in SUBSYSTEM_KEYS[subsystem] if not os.getenv(key)]
+        if missing_keys:
+            raise ConfigError(f"Missing configuration keys in .env for {subsystem}: "
+                              f"{', '.join(missing_keys)}")
+        cls._checked.add(subsystem)
 
     @classmethod
     def validate(cls):
@@ -61,9 +146,6 @@ class Config:
             print("Please update your .env file with the correct credentials.")
             sys.exit(1)
 
-#validation is necessary agar hamlog koo creds verify karna hai toh
-Config.validate()
-
 
 '''
 kaise iss config koo use krna hai is below
@@ -71,7 +153,10 @@ kaise iss config koo use krna hai is below
 from utils.config_loader import Config #pehele import kiya module koo
 
 def send_meeting_email(to_email, details):
+    Config.require("email") #pehli baar pe check, keys missing ho toh ConfigError
     sender = Config.SENDER_EMAIL #and simply config kee thru use kr liya
     password = Config.SENDER_PASSWORD
     # ... rest of code
+
+Config.validate() # sab keys ek saath check karni ho (jaise deploy ke time)
 '''
\ No newline at end of file
@@ -2,10 +2,38 @@
 This file basically check krega ki user kee google calender
 me ek defined time slot me koi dusra event clash toh nahi
 kar rha hai na
+
+bahut saare participants ke liye check_participants_conflicts hai: har
+insaan ke liye alag events().list nahi, balki freebusy().query ek request
+me 50 calendars tak check kar leta hai, baaki chunks threads me parallel
+jaate hai aur har participant ke busy intervals merge hoke milte hai.
+
+jo calendars utils/busy_cache.py me already synced hai unka answer local
+interval tree se aata hai, Google tak request nahi jati.
+
+conflict ho toh suggest_alternative_slots agle kuch dino me sabke liye
+khaali time dhoondh ke deta hai (utils/slot_finder.py).
 """
 
+import asyncio
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from dateutil import parser
+
+from .busy_cache import get_synced_store
 from .google_auth import get_calendar_service
+from .slot_finder import find_free_slots
+
+# Calendar API limit on calendars per freebusy request
+FREEBUSY_MAX_CALENDARS = 50
+# Concurrent freebusy requests when there are more participants than that
+FREEBUSY_MAX_WORKERS = 4
+
+
+def _as_rfc3339(value: str) -> str:
+    # Naive timestamps are treated as UTC, like check_scheduler_conflict does
+    return value if 'Z' in value or '+' in value else f"{value}Z"
 
 def check_scheduler_conflict(scheduler_email: str, start_datetime: str, end_datetime: str) -> bool:
     """
@@ -20,10 +48,17 @@ def check_scheduler_conflict(scheduler_email: str, start_datetime: str, end_date
         bool: True if a conflict exists (BUSY), False if the slot is free.
     """
     try:
-        service = get_calendar_service()
+        time_min = _as_rfc3339(start_datetime)
+        time_max = _as_rfc3339(end_datetime)
+
+        store = get_synced_store('primary')
+        if store is not None:
+            busy = store.busy_intervals(time_min, time_max)
+            if busy:
+                print(f"Conflict detected: busy {busy[0][0].isoformat()} - {busy[0][1].isoformat()}")
+            return bool(busy)
 
-        time_min = start_datetime if 'Z' in start_datetime or '+' in start_datetime else f"{start_datetime}Z"
-        time_max = end_datetime if 'Z' in end_datetime or '+' in end_datetime else f"{end_datetime}Z"
+        service = get_calendar_service()
 
         events_result = service.events().list(
             calendarId='primary', 
@@ -50,7 +85,214 @@ def check_scheduler_conflict(scheduler_email: str, start_datetime: str, end_date
     except Exception as e:
         print(f"Error checking conflicts for {scheduler_email}: {str(e)}")
         return True
-    
+
+
+def merge_intervals(intervals: list) -> list:
+    """
+    Merges overlapping or touching (start, end) datetime pairs.
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _query_freebusy(emails: list, time_min: str, time_max: str) -> dict:
+    """
+    One freebusy request for up to FREEBUSY_MAX_CALENDARS calendars.
+    Builds its own service: a googleapiclient service must not be shared
+    between threads.
+    """
+    service = get_calendar_service()
+    body = {
+        "timeMin": time_min,
+        "timeMax": time_max,
+        "items": [{"id": email} for email in emails],
+    }
+    return service.freebusy().query(body=body).execute().get("calendars", {})
+
+
+def check_participants_conflicts(participant_emails: list, start_datetime: str,
+                                 end_datetime: str, max_workers: int = FREEBUSY_MAX_WORKERS) -> dict:
+    """
+    Checks everyone's Google Calendar for the requested slot with the
+    freebusy API: 50 calendars per request, extra requests in parallel.
+    Calendars already synced into utils.busy_cache are answered locally.
+
+    Args:
+        participant_emails (list): Calendar ids (emails) to check.
+        start_datetime (str): ISO 8601 start time (naive means UTC).
+        end_datetime (str): ISO 8601 end time.
+        max_workers (int): Concurrent freebusy requests.
+
+    Returns:
+        dict: {"success": bool, "has_conflict": bool, "conflicts": [emails],
+               "participants": {email: {"busy": bool, "intervals": [(start, end)],
+                                        "error": str or None}}}
+        Like check_scheduler_conflict, a calendar that could not be read
+        counts as busy (error is set). success is False only if no
+        freebusy request went through at all.
+    """
+    time_min = _as_rfc3339(start_datetime)
+    time_max = _as_rfc3339(end_datetime)
+    emails = list(dict.fromkeys(participant_emails))
+    participants = _cached_participants(emails, time_min, time_max)
+    chunks = _remote_chunks(emails, participants)
+
+    def run(chunk):
+        try:
+            return chunk, _query_freebusy(chunk, time_min, time_max), None
+        except Exception as e:
+            return chunk, {}, str(e)
+
+    if len(chunks) > 1:
+        # The first chunk runs on the caller's thread while the rest fan out
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks) - 1)) as executor:
+            rest = executor.map(run, chunks[1:])
+            results = [run(chunks[0])] + list(rest)
+    else:
+        results = [run(chunk) for chunk in chunks]
+
+    return _conflicts_result(emails, participants, chunks, results, time_min, time_max)
+
+
+async def check_participants_conflicts_async(participant_emails: list, start_datetime: str,
+                                             end_datetime: str,
+                                             max_concurrency: int = FREEBUSY_MAX_WORKERS) -> dict:
+    """
+    check_participants_conflicts on the event loop: the freebusy requests
+    go out together over the REST client (utils/async_calendar.py), at most
+    `max_concurrency` at a time. Busy caches that would have to sync first
+    are skipped (the sync is blocking) and asked through freebusy instead.
+    Same result dict.
+    """
+    from .async_calendar import get_async_calendar
+
+    time_min = _as_rfc3339(start_datetime)
+    time_max = _as_rfc3339(end_datetime)
+    emails = list(dict.fromkeys(participant_emails))
+    participants = _cached_participants(emails, time_min, time_max, allow_sync=False)
+    chunks = _remote_chunks(emails, participants)
+
+    calendar = get_async_calendar()
+    slots = asyncio.Semaphore(max_concurrency)
+
+    async def run(chunk):
+        body = {"timeMin": time_min, "timeMax": time_max, "items": [{"id": email} for email in chunk]}
+        try:
+            async with slots:
+                response = await calendar.freebusy(body)
+            return chunk, response.get("calendars", {}), None
+        except Exception as e:
+            return chunk, {}, str(e)
+
+    results = await asyncio.gather(*(run(chunk) for chunk in chunks))
+    return _conflicts_result(emails, participants, chunks, results, time_min, time_max)
+
+
+def _cached_participants(emails: list, time_min: str, time_max: str, allow_sync: bool = True) -> dict:
+    """
+    Answers for the calendars already synced into utils.busy_cache. With
+    allow_sync=False a cache that is due for a sync is left out.
+    """
+    participants = {}
+    for email in emails:
+        store = get_synced_store(email)
+        if store is None or (not allow_sync and store.stale):
+            continue
+        try:
+            busy = [(start, end) for start, end, _ in store.busy_intervals(time_min, time_max)]
+        except Exception as e:
+            print(f"Busy cache for {email} failed, asking freebusy: {e}")
+            continue
+        participants[email] = {"busy": bool(busy), "intervals": merge_intervals(busy), "error": None}
+    return participants
+
+
+def _remote_chunks(emails: list, participants: dict) -> list:
+    remote = [email for email in emails if email not in participants]
+    return [remote[i:i + FREEBUSY_MAX_CALENDARS]
+            for i in range(0, len(remote), FREEBUSY_MAX_CALENDARS)]
+
+
+def _conflicts_result(emails, participants, chunks, results, time_min, time_max) -> dict:
+    """Folds the (chunk, calendars, error) freebusy results into the result dict."""
+    window_start, window_end = parser.isoparse(time_min), parser.isoparse(time_max)
+    failed_requests = 0
+    for chunk, calendars, request_error in results:
+        if request_error:
+            failed_requests += 1
+            print(f"Error querying free/busy for {len(chunk)} participants: {request_error}")
+        for email in chunk:
+            calendar = calendars.get(email, {})
+            error = request_error
+            if not error and calendar.get("errors"):
+                error = ", ".join(e.get("reason", "unknown") for e in calendar["errors"])
+            elif not error and email not in calendars:
+                error = "missing from freebusy response"
+
+            intervals = merge_intervals(
+                (parser.isoparse(slot["start"]), parser.isoparse(slot["end"]))
+                for slot in calendar.get("busy", [])
+            )
+            overlapping = [(start, end) for start, end in intervals
+                           if start < window_end and end > window_start]
+            participants[email] = {
+                "busy": bool(overlapping) or error is not None,
+                "intervals": overlapping,
+                "error": error,
+            }
+
+    conflicts = [email for email in emails if participants[email]["busy"]]
+    return {
+        "success": not chunks or failed_requests < len(chunks),
+        "has_conflict": bool(conflicts),
+        "conflicts": conflicts,
+        "participants": participants,
+    }
+
+
+def suggest_alternative_slots(participant_emails: list, start_datetime: str, end_datetime: str,
+                              search_days: int = 7, top_k: int = 3, **constraints) -> dict:
+    """
+    Suggests the earliest times after the requested slot when every
+    participant is free, for a meeting of the same length.
+
+    Args:
+        participant_emails (list): Calendar ids (emails) to check.
+        start_datetime (str), end_datetime (str): The requested slot.
+        search_days (int): How far ahead to look.
+        top_k (int): Number of suggestions.
+        **constraints: Passed to slot_finder.find_free_slots (timezone,
+            day_start, day_end, working_days, holidays, align_minutes).
+
+    Returns:
+        dict: {"success": bool, "slots": [(start, end) datetimes],
+               "unchecked": [emails whose calendar could not be read]}
+        Unreadable calendars are left out of the search, not treated as
+        busy the whole time, so check "unchecked" before trusting a slot.
+    """
+    time_min = _as_rfc3339(start_datetime)
+    requested_start = parser.isoparse(time_min)
+    duration = parser.isoparse(_as_rfc3339(end_datetime)) - requested_start
+    horizon_end = requested_start + datetime.timedelta(days=search_days)
+
+    result = check_participants_conflicts(participant_emails, time_min, horizon_end.isoformat())
+    if not result["success"]:
+        return {"success": False, "error": "Could not read any calendar", "slots": [],
+                "unchecked": list(result["participants"])}
+
+    busy = {email: info["intervals"] for email, info in result["participants"].items()
+            if info["error"] is None}
+    unchecked = [email for email, info in result["participants"].items() if info["error"]]
+    slots = find_free_slots(busy, requested_start, horizon_end,
+                            int(duration.total_seconds() // 60), top_k=top_k, **constraints)
+    return {"success": True, "slots": slots, "unchecked": unchecked}
+
+
 """
 isko use kaise karna hai?
 
@@ -58,4 +300,19 @@ from utils.conflict_detector import check_scheduler_conflict
 
 if check_scheduler_conflict(scheduler_email, start_time, end_time):
     return {"success": False, "error": "Conflict detected"}
+
+# poori meeting ke participants ek saath:
+from utils.conflict_detector import check_participants_conflicts
+
+result = check_participants_conflicts([p["email"] for p in participants], start_time, end_time)
+# event loop pe: result = await check_participants_conflicts_async(emails, start_time, end_time)
+if result["has_conflict"]:
+    for email in result["conflicts"]:
+        print(email, result["participants"][email]["intervals"], result["participants"][email]["error"])
+
+    # alternative time chahiye toh:
+    from utils.conflict_detector import suggest_alternative_slots
+    options = suggest_alternative_slots(emails, start_time, end_time, search_days=7, top_k=3)
+    for start, end in options["slots"]:
+        print(start, end)
 """
\ No newline at end of file
@@ -24,6 +24,16 @@ def parse_iso_from_llm(time_string):
         print(f"Error: Gemini returned an invalid date format: '{time_string}'")
         return None
 
+def parse_iso_datetime(time_string):
+    """
+    Strict parser for values that should already be ISO 8601 (reschedule
+    requests, API input), unlike parse_iso_from_llm which accepts anything.
+
+    Returns the normalized string, e.g. '2025-01-25T15:00:00'.
+    Raises ValueError if the string is not ISO 8601.
+    """
+    return parser.isoparse(time_string).isoformat()
+
 def calculate_end_time(start_dt, duration_minutes=60):
     """
     Calculates the meeting end time.
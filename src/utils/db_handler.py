@@ -3,13 +3,29 @@ noyb
 stay away from this file
 chuna bhi nahi
 """
-import psycopg2
-from psycopg2.extras import RealDictCursor
-from utils.config_loader import Config
+from utils.db_pool import db_cursor
 
-def get_db_connection():
-    conn = psycopg2.connect(Config.DATABASE_URL, cursor_factory=RealDictCursor)
-    return conn
+_faculty_listeners = []
+
+def on_faculty_change(callback):
+    """
+    Registers callback(changes) to run after any write to the faculty table
+    (used by utils.roster_cache to refresh the cached roster). changes is
+    None, except after a roster sync, which passes its change set.
+    """
+    _faculty_listeners.append(callback)
+
+def _notify_faculty_change(changes=None):
+    for callback in _faculty_listeners:
+        try:
+            callback(changes)
+        except Exception as e:
+            print(f"Error in faculty change listener: {e}")
+
+# md5 of the synced columns; utils.faculty_import.row_hash computes the same
+# value for a CSV row, so a sync only touches rows whose hash changed
+ROW_HASH_SQL = """md5(name || E'\\x1f' || email || E'\\x1f' || COALESCE(phone, '')
+        || E'\\x1f' || COALESCE(department, '') || E'\\x1f' || COALESCE(role, ''))"""
 
 def init_db():
     """
@@ -27,26 +43,32 @@ def init_db():
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     );
     """
+    # Added later, so older databases get it through ALTER TABLE
+    row_hash_query = f"""
+    ALTER TABLE faculty ADD COLUMN IF NOT EXISTS row_hash CHAR(32)
+        GENERATED ALWAYS AS ({ROW_HASH_SQL}) STORED;
+    """
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute(create_table_query)
-        conn.commit()
+        with db_cursor(commit=True) as cur:
+            cur.execute(create_table_query)
+            cur.execute(row_hash_query)
         print("Database initialized: Faculty table ready.")
-        cur.close()
-        conn.close()
     except Exception as e:
         print(f"Error initializing DB: {e}")
 
-def get_all_faculty():
-    try:
-        conn = get_db_connection()
-        cur = conn.cursor()
+def fetch_all_faculty():
+    """
+    Same as get_all_faculty but lets database errors propagate, so callers
+    (like the roster cache) can tell "empty table" from "query failed".
+    """
+    with db_cursor() as cur:
         cur.execute("SELECT * FROM faculty WHERE is_active = TRUE;")
         faculty_list = cur.fetchall()
-        cur.close()
-        conn.close()
-        return [dict(row) for row in faculty_list]
+    return [dict(row) for row in faculty_list]
+
+def get_all_faculty():
+    try:
+        return fetch_all_faculty()
     except Exception as e:
         print(f"Error fetching faculty: {e}")
         return []
@@ -61,14 +83,11 @@ def add_faculty_member(name, email, phone, dept, role):
     RETURNING id;
     """
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute(insert_query, (name, email, phone, dept, role))
-        new_id = cur.fetchone()['id']
-        conn.commit()
+        with db_cursor(commit=True) as cur:
+            cur.execute(insert_query, (name, email, phone, dept, role))
+            new_id = cur.fetchone()['id']
         print(f"Added faculty member ID: {new_id}")
-        cur.close()
-        conn.close()
+        _notify_faculty_change()
         return new_id
     except Exception as e:
         print(f"Error adding faculty: {e}")
@@ -89,13 +108,11 @@ def update_faculty_member(faculty_id, **kwargs):
     query = f"UPDATE faculty SET {set_clause} WHERE id = %s;"
 
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute(query, tuple(values))
-        conn.commit()
-        success = True if cur.rowcount > 0 else False
-        cur.close()
-        conn.close()
+        with db_cursor(commit=True) as cur:
+            cur.execute(query, tuple(values))
+            success = True if cur.rowcount > 0 else False
+        if success:
+            _notify_faculty_change()
         return success
     except Exception as e:
         print(f"Error updating faculty: {e}")
@@ -104,12 +121,9 @@ def update_faculty_member(faculty_id, **kwargs):
 def clear_faculty_table():
     sql_query = "TRUNCATE TABLE faculty RESTART IDENTITY CASCADE;"
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute(sql_query)
-        conn.commit()
+        with db_cursor(commit=True) as cur:
+            cur.execute(sql_query)
         print("Success: Faculty table cleared and IDs reset.")
-        cur.close()
-        conn.close()
+        _notify_faculty_change()
     except Exception as e:
         print(f"Error clearing table: {e}")
\ No newline at end of file
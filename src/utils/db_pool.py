@@ -0,0 +1,254 @@
+"""
+Postgres connection pool.
+pehele har ek query ke liye psycopg2.connect hota tha (TCP + auth + naya
+backend process), phir close. ab poore process me ek ThreadedConnectionPool
+hai aur `with db_cursor() as cur:` se cursor milta hai. pool bhar jaye toh
+caller thoda wait karta hai (error nahi), idle connections ko reuse se pehele
+ping kar lete hai, aur har connection pe statement_timeout set hota hai.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from utils.config_loader import Config
+
+
+class PoolTimeoutError(Exception):
+    """
+    Raised when no connection frees up within the checkout timeout.
+    (Not a psycopg2 PoolError: psycopg2 is only imported with the first
+    connection, so `sam --help` / `sam list` start without it.)
+    """
+
+
+class DatabasePool:
+    """
+    Blocking, health-checked wrapper around psycopg2's ThreadedConnectionPool.
+
+    psycopg2's pool raises as soon as it is exhausted; here callers wait up
+    to `checkout_timeout` seconds instead, and the wait is recorded in the
+    saturation metrics returned by stats().
+    """
+
+    def __init__(self, dsn, minconn=1, maxconn=10, statement_timeout_ms=5000,
+                 checkout_timeout=10, ping_after=30):
+        self.dsn = dsn
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.statement_timeout_ms = statement_timeout_ms
+        self.checkout_timeout = checkout_timeout
+        self.ping_after = ping_after
+
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._lock = threading.Lock()
+        self._last_used = {}
+        self._stats = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_ms_total": 0.0,
+            "timeouts": 0,
+            "discarded": 0,
+            "in_use": 0,
+            "max_in_use": 0,
+        }
+
+    def _get_pool(self):
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    from psycopg2.extras import RealDictCursor
+                    from psycopg2.pool import ThreadedConnectionPool
+
+                    options = f"-c statement_timeout={self.statement_timeout_ms}"
+                    self._pool = ThreadedConnectionPool(
+                        self.minconn, self.maxconn, self.dsn,
+                        cursor_factory=RealDictCursor, options=options
+                    )
+        return self._pool
+
+    @staticmethod
+    def _ping(conn):
+        import psycopg2
+
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1;")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _healthy(self, conn):
+        if conn.closed:
+            return False
+        last_used = self._last_used.get(id(conn))
+        if last_used is not None and time.monotonic() - last_used > self.ping_after:
+            return self._ping(conn)
+        return True
+
+    def getconn(self, timeout=None):
+        """
+        Checks out a healthy connection. Prefer connection()/db_cursor(),
+        which always give it back.
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        if not self._slots.acquire(blocking=False):
+            started = time.perf_counter()
+            acquired = self._slots.acquire(timeout=timeout)
+            waited_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self._stats["waits"] += 1
+                self._stats["wait_ms_total"] += waited_ms
+                if not acquired:
+                    self._stats["timeouts"] += 1
+            if not acquired:
+                raise PoolTimeoutError(
+                    f"No database connection free after {timeout}s (pool size {self.maxconn})"
+                )
+
+        try:
+            pool = self._get_pool()
+            conn = pool.getconn()
+            if not self._healthy(conn):
+                pool.putconn(conn, close=True)
+                with self._lock:
+                    self._stats["discarded"] += 1
+                conn = pool.getconn()
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._stats["checkouts"] += 1
+            self._stats["in_use"] += 1
+            self._stats["max_in_use"] = max(self._stats["max_in_use"], self._stats["in_use"])
+        return conn
+
+    def putconn(self, conn, close=False):
+        """
+        Returns a connection. psycopg2 rolls back any open transaction;
+        closed or broken connections are dropped from the pool.
+        """
+        close = close or bool(conn.closed)
+        try:
+            self._get_pool().putconn(conn, close=close)
+        finally:
+            with self._lock:
+                self._stats["in_use"] -= 1
+                if close:
+                    self._stats["discarded"] += 1
+                    self._last_used.pop(id(conn), None)
+                else:
+                    self._last_used[id(conn)] = time.monotonic()
+            self._slots.release()
+
+    @contextmanager
+    def connection(self, timeout=None):
+        import psycopg2
+
+        conn = self.getconn(timeout)
+        broken = False
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            raise
+        finally:
+            self.putconn(conn, close=broken)
+
+    @contextmanager
+    def cursor(self, commit=False, timeout=None):
+        """
+        Yields a RealDictCursor. With commit=True the transaction is
+        committed when the block succeeds; it is rolled back on any error.
+        """
+        with self.connection(timeout) as conn:
+            cur = conn.cursor()
+            try:
+                yield cur
+                if commit:
+                    conn.commit()
+            except Exception:
+                if not conn.closed:
+                    conn.rollback()
+                raise
+            finally:
+                cur.close()
+
+    def health_check(self):
+        """
+        Returns:
+            bool: True if a pooled connection can run SELECT 1.
+        """
+        try:
+            with self.cursor() as cur:
+                cur.execute("SELECT 1 AS ok;")
+                return cur.fetchone()["ok"] == 1
+        except Exception as e:
+            print(f"Database health check failed: {e}")
+            return False
+
+    def stats(self):
+        """
+        Returns:
+            dict: checkouts, waits (checkouts that found the pool full),
+            wait_ms_total, timeouts, discarded, in_use, max_in_use, size.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["size"] = self.maxconn
+        return stats
+
+    def close(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """
+    Returns the process-wide pool for Config.DATABASE_URL.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            Config.require("database")
+            _default_pool = DatabasePool(
+                Config.DATABASE_URL,
+                minconn=Config.DB_POOL_MIN,
+                maxconn=Config.DB_POOL_MAX,
+                statement_timeout_ms=Config.DB_STATEMENT_TIMEOUT_MS,
+            )
+        return _default_pool
+
+
+def db_cursor(commit=False):
+    """Shortcut for get_pool().cursor(commit)."""
+    return get_pool().cursor(commit=commit)
+
+
+def db_connection():
+    """Shortcut for get_pool().connection()."""
+    return get_pool().connection()
+
+
+'''
+how to use this?
+
+from utils.db_pool import db_cursor
+
+with db_cursor() as cur:                 # sirf read
+    cur.execute("SELECT * FROM faculty WHERE email = %s;", (email,))
+    row = cur.fetchone()
+
+with db_cursor(commit=True) as cur:      # write, error pe rollback
+    cur.execute("UPDATE faculty SET role = %s WHERE id = %s;", (role, faculty_id))
+'''
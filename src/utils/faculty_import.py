@@ -0,0 +1,332 @@
+"""
+Faculty roster ka bulk import.
+pehele seed_db har CSV row ke liye add_faculty_member call karta tha (alag
+INSERT + commit), 30k rows me minutes lag jate the. ab CSV ko stream karke
+COPY FROM STDIN se ek temp staging table me daalte hai aur phir ek hee
+INSERT ... ON CONFLICT (email) se faculty me upsert hota hai, sab ek
+transaction me. poori file kabhi memory me nahi aati.
+
+nightly sync ke liye sync_faculty_csv hai: har row ka hash faculty.row_hash
+se compare hota hai, aur sirf naye / badle / CSV se gayab (is_active = FALSE)
+rows likhe jate hai. jo badla uska change set roster cache aur resolver
+index ko patch karne ke liye bheja jata hai, poora reload nahi hota.
+"""
+
+import csv
+import hashlib
+import io
+
+from utils.db_handler import _notify_faculty_change
+from utils.db_pool import db_cursor
+
+COLUMNS = ("name", "email", "phone", "department", "role")
+# Same limits as the faculty table, so bad rows are rejected before COPY
+MAX_LENGTHS = {"name": 100, "email": 100, "phone": 20, "department": 50, "role": 50}
+# How many rejected rows are kept in the report (the count is always exact)
+MAX_REPORTED_REJECTS = 50
+# A sync refuses to deactivate more than this share of the active roster
+# (a truncated export should not wipe everyone)
+MAX_DEACTIVATE_SHARE = 0.5
+
+STAGING_TABLE = """
+CREATE TEMP TABLE faculty_staging (
+    line INTEGER,
+    name TEXT,
+    email TEXT,
+    phone TEXT,
+    department TEXT,
+    role TEXT,
+    row_hash TEXT
+) ON COMMIT DROP;
+"""
+
+COPY_STAGING = (
+    "COPY faculty_staging (line, name, email, phone, department, role, row_hash) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+
+# Latest line per email
+INCOMING = """
+CREATE TEMP TABLE faculty_incoming ON COMMIT DROP AS
+SELECT DISTINCT ON (email) name, email, phone, department, role, row_hash
+FROM faculty_staging
+ORDER BY email, line DESC;
+"""
+
+SYNC_UPDATE = """
+UPDATE faculty f
+SET name = i.name, phone = i.phone, department = i.department, role = i.role,
+    is_active = TRUE
+FROM faculty_incoming i
+WHERE f.email = i.email
+  AND (f.row_hash IS DISTINCT FROM i.row_hash OR NOT f.is_active)
+RETURNING f.*;
+"""
+
+SYNC_INSERT = """
+INSERT INTO faculty (name, email, phone, department, role)
+SELECT i.name, i.email, i.phone, i.department, i.role
+FROM faculty_incoming i
+WHERE NOT EXISTS (SELECT 1 FROM faculty f WHERE f.email = i.email)
+RETURNING *;
+"""
+
+MISSING_FROM_EXPORT = """
+f.is_active AND NOT EXISTS (SELECT 1 FROM faculty_incoming i WHERE i.email = f.email)
+"""
+
+SYNC_COUNT_MISSING = """
+SELECT COUNT(*) FILTER (WHERE i.email IS NULL) AS missing, COUNT(*) AS active
+FROM faculty f
+LEFT JOIN faculty_incoming i ON i.email = f.email
+WHERE f.is_active;
+"""
+
+SYNC_DEACTIVATE = f"""
+UPDATE faculty f SET is_active = FALSE
+WHERE {MISSING_FROM_EXPORT}
+RETURNING f.*;
+"""
+
+# The last line wins when the file has the same email twice.
+# xmax = 0 only for rows this statement inserted.
+UPSERT = """
+INSERT INTO faculty (name, email, phone, department, role)
+SELECT DISTINCT ON (email) name, email, phone, department, role
+FROM faculty_staging
+ORDER BY email, line DESC
+ON CONFLICT (email) DO UPDATE
+SET name = EXCLUDED.name,
+    phone = EXCLUDED.phone,
+    department = EXCLUDED.department,
+    role = EXCLUDED.role
+WHERE (faculty.name, faculty.phone, faculty.department, faculty.role)
+      IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.phone, EXCLUDED.department, EXCLUDED.role)
+RETURNING (xmax = 0) AS inserted;
+"""
+
+
+def clean_row(row: dict):
+    """
+    Validates one CSV row.
+
+    Returns:
+        tuple: (values tuple or None, rejection reason or None)
+    """
+    try:
+        values = {col: (row[col] or "").strip() for col in COLUMNS}
+    except KeyError as e:
+        return None, f"missing column {e}"
+
+    if not values["name"]:
+        return None, "empty name"
+    if "@" not in values["email"]:
+        return None, "invalid email"
+    for col, limit in MAX_LENGTHS.items():
+        if len(values[col]) > limit:
+            return None, f"{col} longer than {limit} characters"
+    return tuple(values[col] or None for col in COLUMNS), None
+
+
+def row_hash(values: tuple) -> str:
+    """
+    Hash of a cleaned row; equal to faculty.row_hash (db_handler.ROW_HASH_SQL)
+    for a stored row with the same values.
+    """
+    joined = "\x1f".join(value or "" for value in values)
+    return hashlib.md5(joined.encode("utf-8")).hexdigest()
+
+
+class _CopyStream(io.TextIOBase):
+    """
+    File-like object that copy_expert reads from; it encodes the valid rows
+    as CSV lazily, so only one chunk is ever in memory.
+    """
+
+    def __init__(self, rows, report):
+        self._rows = rows
+        self._report = report
+        self._buffer = ""
+        self._writer_buffer = io.StringIO()
+        self._writer = csv.writer(self._writer_buffer, lineterminator="\n")
+
+    def readable(self):
+        return True
+
+    def _next_chunk(self, size):
+        out = self._writer_buffer
+        out.seek(0)
+        out.truncate()
+        for line, row in self._rows:
+            values, reason = clean_row(row)
+            if values is None:
+                self._report["rejected"] += 1
+                if len(self._report["rejected_rows"]) < MAX_REPORTED_REJECTS:
+                    self._report["rejected_rows"].append({"line": line, "reason": reason})
+                continue
+            self._report["staged"] += 1
+            self._writer.writerow((line,) + values + (row_hash(values),))
+            if out.tell() >= size:
+                break
+        return out.getvalue()
+
+    def read(self, size=-1):
+        size = size if size and size > 0 else 65536
+        while len(self._buffer) < size:
+            chunk = self._next_chunk(size)
+            if not chunk:
+                break
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def bulk_upsert_faculty(rows):
+    """
+    Loads an iterable of (line number, row dict) into faculty in one
+    transaction, upserting on email.
+
+    Returns:
+        dict: {"success": bool, "inserted": int, "updated": int,
+               "unchanged": int, "duplicates": int, "rejected": int,
+               "rejected_rows": [{"line", "reason"}, ...], "error": str}
+        "duplicates" counts rows whose email appears again later in the
+        file (the later row is the one imported).
+    """
+    report = {"success": False, "inserted": 0, "updated": 0, "unchanged": 0,
+              "duplicates": 0, "rejected": 0, "rejected_rows": [], "staged": 0}
+    try:
+        with db_cursor(commit=True) as cur:
+            # One big statement on purpose; the pool default is meant for OLTP queries
+            cur.execute("SET LOCAL statement_timeout = 0;")
+            cur.execute(STAGING_TABLE)
+            cur.copy_expert(COPY_STAGING, _CopyStream(iter(rows), report))
+            cur.execute("SELECT COUNT(DISTINCT email) AS emails FROM faculty_staging;")
+            unique = cur.fetchone()["emails"]
+            cur.execute(UPSERT)
+            written = cur.fetchall()
+    except Exception as e:
+        print(f"Error importing faculty: {e}")
+        report["error"] = str(e)
+        report.pop("staged")
+        return report
+
+    report["inserted"] = sum(1 for row in written if row["inserted"])
+    report["updated"] = len(written) - report["inserted"]
+    report["unchanged"] = unique - len(written)
+    report["duplicates"] = report.pop("staged") - unique
+    report["success"] = True
+    if written:
+        _notify_faculty_change()
+    return report
+
+
+def sync_faculty(rows, deactivate_missing=True, dry_run=False,
+                 max_deactivate_share=MAX_DEACTIVATE_SHARE):
+    """
+    Makes faculty match a full roster export, writing only the difference:
+    new emails are inserted, rows whose hash changed (or that were
+    inactive) are updated, and active rows missing from the export are
+    soft-deleted with is_active = FALSE. Ids are never reused or reset.
+
+    Returns:
+        dict: Same counters as bulk_upsert_faculty plus "deactivated", and
+        "changes": {"inserted": [...], "updated": [...], "deactivated": [...]}
+        with the full faculty rows that were written. With dry_run=True the
+        transaction is rolled back and nothing is broadcast.
+    """
+    report = {"success": False, "inserted": 0, "updated": 0, "deactivated": 0,
+              "unchanged": 0, "duplicates": 0, "rejected": 0, "rejected_rows": [],
+              "staged": 0}
+    changes = {"inserted": [], "updated": [], "deactivated": []}
+    try:
+        with db_cursor(commit=not dry_run) as cur:
+            cur.execute("SET LOCAL statement_timeout = 0;")
+            cur.execute(STAGING_TABLE)
+            cur.copy_expert(COPY_STAGING, _CopyStream(iter(rows), report))
+            cur.execute(INCOMING)
+            unique = cur.rowcount
+            # Temp tables have no statistics; without them the joins below
+            # get planned as if the export had a handful of rows
+            cur.execute("ANALYZE faculty_incoming;")
+
+            if deactivate_missing:
+                cur.execute(SYNC_COUNT_MISSING)
+                counts = cur.fetchone()
+                missing, active = counts["missing"], counts["active"]
+                if missing and missing > active * max_deactivate_share:
+                    raise ValueError(
+                        f"refusing to deactivate {missing} of {active} active faculty; "
+                        "is the export complete?"
+                    )
+
+            cur.execute(SYNC_UPDATE)
+            changes["updated"] = [dict(row) for row in cur.fetchall()]
+            cur.execute(SYNC_INSERT)
+            changes["inserted"] = [dict(row) for row in cur.fetchall()]
+            if deactivate_missing:
+                cur.execute(SYNC_DEACTIVATE)
+                changes["deactivated"] = [dict(row) for row in cur.fetchall()]
+
+            if dry_run:
+                cur.connection.rollback()
+    except Exception as e:
+        print(f"Error syncing faculty: {e}")
+        report["error"] = str(e)
+        report.pop("staged")
+        return report
+
+    for key, rows_written in changes.items():
+        report[key] = len(rows_written)
+    report["unchanged"] = unique - report["inserted"] - report["updated"]
+    report["duplicates"] = report.pop("staged") - unique
+    report["changes"] = changes
+    report["success"] = True
+    if not dry_run and any(changes.values()):
+        _notify_faculty_change(changes)
+    return report
+
+
+def _read_faculty_csv(csv_path: str, load):
+    with open(csv_path, mode="r", newline="") as file:
+        reader = csv.DictReader(file, skipinitialspace=True)
+        missing = [col for col in COLUMNS if col not in (reader.fieldnames or [])]
+        if missing:
+            return {"success": False, "error": f"CSV header is missing columns: {', '.join(missing)}"}
+        # DictReader's line_num is the physical line (header is line 1)
+        rows = ((reader.line_num, row) for row in reader)
+        return load(rows)
+
+
+def import_faculty_csv(csv_path: str):
+    """
+    Streams a faculty CSV (name,email,phone,department,role) into the
+    database. See bulk_upsert_faculty for the report format.
+    """
+    return _read_faculty_csv(csv_path, bulk_upsert_faculty)
+
+
+def sync_faculty_csv(csv_path: str, deactivate_missing=True, dry_run=False):
+    """
+    Syncs faculty to a full CSV export. See sync_faculty for the report.
+    """
+    return _read_faculty_csv(
+        csv_path,
+        lambda rows: sync_faculty(rows, deactivate_missing=deactivate_missing, dry_run=dry_run),
+    )
+
+
+'''
+how to use this?
+
+from utils.faculty_import import import_faculty_csv
+
+report = import_faculty_csv("data/faculty.csv")
+print(report["inserted"], report["updated"], report["rejected"])
+# ya command line se:  python scripts/seed_db.py --csv data/faculty.csv
+
+# nightly sync (sirf diff likhta hai, CSV me jo nahi hai woh is_active = FALSE):
+report = sync_faculty_csv("data/faculty.csv")
+print(report["inserted"], report["updated"], report["deactivated"], report["unchanged"])
+#   python scripts/seed_db.py --sync --csv data/faculty.csv [--dry-run]
+'''
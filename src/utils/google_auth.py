@@ -1,31 +1,146 @@
 """
-noyb 
+noyb
 stay away from this file
 chuna bhi nahi
+
+(ok thoda chhua: pehele har call pe token.json padhna, build() aur naya
+TLS connection hota tha. ab credentials process me ek baar load hote hai,
+expiry se pehele hee refresh ho jate hai, discovery document ek baar parse
+hota hai, aur har thread ko apna service + httplib2 transport milta hai
+kyunki googleapiclient thread-safe nahi hai.
+
+google ki libraries ~400ms me import hoti hai, isliye woh pehli Calendar
+call pe import hoti hai, module import pe nahi.)
 """
 
+import datetime
+import importlib
+import json
 import os.path
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+import threading
+
+from .config_loader import Config
+
+# Names this module used to import at the top, resolved on first access
+# (utils.google_auth.Credentials still works for callers and tests)
+_LAZY_NAMES = {
+    "Credentials": "google.oauth2.credentials",
+    "Request": "google.auth.transport.requests",
+    "InstalledAppFlow": "google_auth_oauthlib.flow",
+}
 
-SCOPES = ['https://www.googleapis.com/auth/calendar.events', 
+SCOPES = ['https://www.googleapis.com/auth/calendar.events',
           'https://www.googleapis.com/auth/calendar.readonly']
 
-def get_calendar_service():
+TOKEN_FILE = 'token.json'
+# Refresh this long before the access token expires, so a request never
+# starts with a token that dies mid-flight
+REFRESH_MARGIN = datetime.timedelta(minutes=5)
+# Per-request socket timeout for the Calendar transport (seconds)
+HTTP_TIMEOUT = 30
+
+_creds = None
+_creds_lock = threading.Lock()
+_discovery_doc = None
+_local = threading.local()
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        return getattr(importlib.import_module(_LAZY_NAMES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _load_credentials():
+    from google.oauth2.credentials import Credentials
+
     creds = None
-    if os.path.exists('token.json'):
-        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-        
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file('credentials.json', SCOPES)
-            creds = flow.run_local_server(port=0) # Opens browser for login
-            
-        with open('token.json', 'w') as token:
-            token.write(creds.to_json())
-
-    return build('calendar', 'v3', credentials=creds)
\ No newline at end of file
+    if os.path.exists(TOKEN_FILE):
+        creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+
+    if not creds or not (creds.valid or creds.refresh_token):
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
+        flow = InstalledAppFlow.from_client_secrets_file('credentials.json', SCOPES)
+        creds = flow.run_local_server(port=0) # Opens browser for login
+        _save_credentials(creds)
+    return creds
+
+
+def _save_credentials(creds):
+    with open(TOKEN_FILE, 'w') as token:
+        token.write(creds.to_json())
+
+
+def _expires_soon(creds):
+    if not creds.valid:
+        return True
+    if creds.expiry is None:
+        return False
+    # google-auth keeps expiry as naive UTC
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    return creds.expiry - now < REFRESH_MARGIN
+
+
+def get_credentials():
+    """
+    Returns the process-wide credentials, refreshing them (and token.json)
+    when they are within REFRESH_MARGIN of expiring.
+    """
+    global _creds
+    creds = _creds
+    if creds is not None and not _expires_soon(creds):
+        return creds
+
+    with _creds_lock:
+        if _creds is None:
+            Config.require("google")
+            _creds = _load_credentials()
+        if _expires_soon(_creds) and _creds.refresh_token:
+            from google.auth.transport.requests import Request
+
+            _creds.refresh(Request())
+            _save_credentials(_creds)
+        return _creds
+
+
+def _get_discovery_doc():
+    global _discovery_doc
+    if _discovery_doc is None:
+        from googleapiclient.discovery_cache import get_static_doc
+
+        # Ships with google-api-python-client; no network and parsed only once
+        _discovery_doc = json.loads(get_static_doc('calendar', 'v3'))
+    return _discovery_doc
+
+
+def get_calendar_service():
+    """
+    Returns this thread's Calendar client. The client and its HTTP
+    connection are reused for every call on the same thread; credentials
+    are shared by all threads.
+    """
+    creds = get_credentials()
+    service = getattr(_local, 'service', None)
+    if service is None or _local.creds is not creds:
+        import google_auth_httplib2
+        import httplib2
+        from googleapiclient.discovery import build_from_document
+
+        http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+        service = build_from_document(_get_discovery_doc(), http=http)
+        _local.service = service
+        _local.creds = creds
+    return service
+
+
+def reset_calendar_service():
+    """
+    Drops the cached credentials and this thread's client, e.g. after the
+    token was revoked or token.json was replaced.
+    """
+    global _creds
+    with _creds_lock:
+        _creds = None
+    _local.service = None
+    _local.creds = None
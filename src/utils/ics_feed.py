@@ -0,0 +1,381 @@
+"""
+Per-faculty aur per-department iCalendar feeds (.ics subscription).
+
+generate_ics ek meeting ke liye poora icalendar.Calendar object banata hai,
+sainkdo meetings ke feed ke liye yea mehenga hai. yaha meetings mirror
+(utils/meeting_store.py) se server-side cursor pe rows aati hai aur har row
+seedha VEVENT text ban ke stream hoti hai, poora calendar memory me kabhi
+nahi banta.
+
+UID meeting ka Google event id hai (`<id>@sam`, invites jaisa hee), isliye
+subscribe kiye hue calendar me wahi event update hota hai, duplicate nahi
+banta. SEQUENCE meetings.sequence se aata hai (time / title badalne pe
+badhta hai).
+
+har feed ka ETag ek sasti query (count + max(updated_at)) se banta hai. ETag
+same hai toh If-None-Match / If-Modified-Since pe 304, warna FeedCache me
+rakha hua body, aur woh bhi na ho tab hi database se dobara stream hota hai.
+"""
+
+import datetime
+import email.utils
+import hashlib
+import threading
+from collections import OrderedDict
+
+from utils.config_loader import Config
+from utils.db_pool import db_connection, db_cursor
+from utils.ics_generator import meeting_uid
+from utils.meeting_store import MEETING_SELECT
+
+# Bump when the VEVENT layout changes, so cached feeds and client ETags expire
+FEED_FORMAT_VERSION = 1
+
+# Rows fetched per round trip from the server-side cursor
+FETCH_SIZE = 200
+
+# VEVENTs joined into one yielded chunk
+CHUNK_EVENTS = 100
+
+PRODID = "-//S.A.M//Meeting Scheduler//EN"
+
+FEED_KINDS = ("faculty", "department")
+
+FEED_FILTERS = {
+    "faculty": """
+        (m.organizer_email = %(key)s
+         OR m.id IN (SELECT meeting_id FROM meeting_participants
+                     WHERE participant_email = %(key)s))
+    """,
+    "department": """
+        (m.organizer_email IN (SELECT lower(email) FROM faculty WHERE department = %(key)s)
+         OR m.id IN (SELECT p.meeting_id FROM meeting_participants p
+                     JOIN faculty f ON lower(f.email) = p.participant_email
+                     WHERE f.department = %(key)s))
+    """,
+}
+
+WINDOW_FILTER = " AND m.start_time >= %(start)s AND m.start_time < %(end)s"
+
+
+# -------------------------------
+# iCalendar text (RFC 5545)
+# -------------------------------
+
+def escape_text(value) -> str:
+    """TEXT value escaping: backslash, ';', ',' and newlines."""
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+        .replace("\r", "\\n")
+    )
+
+
+def _param(value) -> str:
+    """Parameter value (e.g. CN): no DQUOTE or control characters, quoted when needed."""
+    value = "".join(ch for ch in str(value) if ch >= " " and ch != '"')
+    if any(ch in value for ch in ":;,"):
+        return f'"{value}"'
+    return value
+
+
+def fold_line(line: str) -> bytes:
+    """
+    Encodes one content line as UTF-8 with CRLF, folded so no physical
+    line is longer than 75 octets. Multi-byte characters are never split.
+    """
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return data + b"\r\n"
+
+    parts = []
+    limit = 75
+    while len(data) > limit:
+        cut = limit
+        while cut > 0 and (data[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(data[:cut])
+        data = data[cut:]
+        limit = 74  # continuation lines start with a space
+    parts.append(data)
+    return b"\r\n ".join(parts) + b"\r\n"
+
+
+def _utc_stamp(moment) -> str:
+    """Naive UTC (as stored in meetings) or aware datetime as 20250127T100000Z."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(datetime.timezone.utc)
+    return f"{moment:%Y%m%dT%H%M%SZ}"
+
+
+def vevent_lines(row: dict) -> list:
+    """VEVENT content lines for a MEETING_SELECT row."""
+    changed = _utc_stamp(row.get("updated_at") or row["start_time"])
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{meeting_uid(row['meeting_id'])}",
+        f"SEQUENCE:{row.get('sequence') or 0}",
+        f"DTSTAMP:{changed}",
+        f"LAST-MODIFIED:{changed}",
+        f"DTSTART:{_utc_stamp(row['start_time'])}",
+        f"DTEND:{_utc_stamp(row['end_time'])}",
+        f"SUMMARY:{escape_text(row['title'])}",
+        f"ORGANIZER:mailto:{row['organizer_email']}",
+    ]
+    for person in row.get("participants") or []:
+        cn = f"CN={_param(person['name'])};" if person.get("name") else ""
+        lines.append(f"ATTENDEE;{cn}ROLE=REQ-PARTICIPANT:mailto:{person['email']}")
+    if row.get("meet_link"):
+        lines.append(f"URL:{row['meet_link']}")
+        lines.append(f"LOCATION:{escape_text(row['meet_link'])}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def iter_ics_feed(rows, calendar_name: str):
+    """
+    Streams a VCALENDAR for `rows` (MEETING_SELECT dicts, any iterable).
+
+    Yields:
+        bytes: Chunks of the .ics body, each holding up to CHUNK_EVENTS
+        events. Only one chunk is in memory at a time.
+    """
+    header = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(calendar_name)}",
+    ]
+    chunk = [fold_line(line) for line in header]
+    events = 0
+    for row in rows:
+        chunk.extend(fold_line(line) for line in vevent_lines(row))
+        events += 1
+        if events % CHUNK_EVENTS == 0:
+            yield b"".join(chunk)
+            chunk = []
+    chunk.append(fold_line("END:VCALENDAR"))
+    yield b"".join(chunk)
+
+
+# -------------------------------
+# Meetings query
+# -------------------------------
+
+def _feed_params(kind: str, key: str, today: datetime.date = None) -> dict:
+    if kind not in FEED_KINDS:
+        raise ValueError(f"Unknown feed kind {kind!r} (expected one of {FEED_KINDS})")
+    # Whole days, so the window (and the ETag) only moves once a day
+    today = today or datetime.datetime.now(datetime.timezone.utc).date()
+    start = today - datetime.timedelta(days=Config.ICS_FEED_PAST_DAYS)
+    end = today + datetime.timedelta(days=Config.ICS_FEED_FUTURE_DAYS + 1)
+    return {
+        "key": key.lower() if kind == "faculty" else key,
+        "start": datetime.datetime.combine(start, datetime.time.min),
+        "end": datetime.datetime.combine(end, datetime.time.min),
+    }
+
+
+def stream_meetings(kind: str, params: dict):
+    """
+    Yields the feed's meetings (earliest first) from a server-side cursor,
+    FETCH_SIZE rows per round trip. The pooled connection is held until the
+    generator is exhausted or closed.
+    """
+    sql = f"{MEETING_SELECT} WHERE {FEED_FILTERS[kind]}{WINDOW_FILTER} ORDER BY m.start_time"
+    with db_connection() as conn:
+        with conn.cursor(name="ics_feed") as cur:
+            cur.itersize = FETCH_SIZE
+            cur.execute(sql, params)
+            yield from cur
+
+
+def feed_etag(kind: str, params: dict) -> str:
+    """
+    Strong ETag for a feed: changes when a meeting in it is added, removed
+    or updated (updated_at), or when the day's window moves.
+    """
+    with db_cursor() as cur:
+        cur.execute(
+            f"SELECT count(*) AS meetings, max(m.updated_at) AS changed FROM meetings m"
+            f" WHERE {FEED_FILTERS[kind]}{WINDOW_FILTER}",
+            params,
+        )
+        row = cur.fetchone()
+    changed = row["changed"].isoformat() if row["changed"] else "-"
+    validator = (f"{FEED_FORMAT_VERSION}|{kind}|{params['key']}|{params['start']:%Y-%m-%d}|"
+                 f"{row['meetings']}|{changed}")
+    return f'"{hashlib.sha1(validator.encode("utf-8")).hexdigest()}"'
+
+
+# -------------------------------
+# Cache
+# -------------------------------
+
+class FeedCache:
+    """
+    LRU of the last generated version of each feed: its ETag, when that
+    ETag was first seen (Last-Modified) and the body, unless it was over
+    `max_body_bytes` (then only the validators are kept and the body is
+    streamed again on a full request).
+    """
+
+    def __init__(self, max_entries: int = None, max_body_bytes: int = None):
+        self.max_entries = Config.ICS_FEED_CACHE_ENTRIES if max_entries is None else max_entries
+        self.max_body_bytes = (Config.ICS_FEED_CACHE_MAX_BODY
+                               if max_body_bytes is None else max_body_bytes)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"not_modified": 0, "hits": 0, "generated": 0}
+
+    def validate(self, feed_key, etag: str) -> dict:
+        """
+        Returns the entry for `feed_key`, starting a new one (Last-Modified
+        now, no body) when the ETag changed.
+        """
+        with self._lock:
+            entry = self._entries.get(feed_key)
+            if entry is None or entry["etag"] != etag:
+                entry = {
+                    "etag": etag,
+                    "last_modified": datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0),
+                    "body": None,
+                }
+                self._entries[feed_key] = entry
+            self._entries.move_to_end(feed_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return dict(entry)
+
+    def store_body(self, feed_key, etag: str, body: bytes):
+        with self._lock:
+            entry = self._entries.get(feed_key)
+            # a newer version may have replaced the entry while this one streamed
+            if entry is not None and entry["etag"] == etag and len(body) <= self.max_body_bytes:
+                entry["body"] = body
+
+    def count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries))
+
+
+def _not_modified(entry: dict, if_none_match, if_modified_since) -> bool:
+    # If-None-Match wins over If-Modified-Since when both are sent (RFC 9110)
+    if if_none_match:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or any(tag.removeprefix("W/") == entry["etag"] for tag in tags)
+    if if_modified_since:
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=datetime.timezone.utc)
+        return entry["last_modified"] <= since
+    return False
+
+
+def _capture(chunks, cache: FeedCache, feed_key, etag: str):
+    """Passes chunks through, handing the whole body to the cache once it completes."""
+    kept = []
+    size = 0
+    for chunk in chunks:
+        if kept is not None:
+            size += len(chunk)
+            if size <= cache.max_body_bytes:
+                kept.append(chunk)
+            else:
+                kept = None
+        yield chunk
+    if kept is not None:
+        cache.store_body(feed_key, etag, b"".join(kept))
+
+
+_cache = None
+
+
+def get_feed_cache() -> FeedCache:
+    """The process-wide FeedCache."""
+    global _cache
+    if _cache is None:
+        _cache = FeedCache()
+    return _cache
+
+
+def get_feed(kind: str, key: str, if_none_match: str = None, if_modified_since: str = None,
+             cache: FeedCache = None) -> dict:
+    """
+    A per-faculty or per-department feed, HTTP-style.
+
+    Args:
+        kind (str): "faculty" (key = email; meetings they organize or are
+            invited to) or "department" (key = faculty.department).
+        if_none_match (str): Client's If-None-Match header, if any.
+        if_modified_since (str): Client's If-Modified-Since header, if any.
+        cache (FeedCache): Default: get_feed_cache().
+
+    Returns:
+        dict: {"success": True, "status": 200 | 304, "etag": str,
+               "last_modified": HTTP-date, "body": iterable of bytes (None on 304)}
+        or {"success": False, "error": str}.
+    """
+    cache = cache or get_feed_cache()
+    try:
+        params = _feed_params(kind, key)
+        etag = feed_etag(kind, params)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    except Exception as e:
+        print(f"Error checking {kind} feed {key}: {e}")
+        return {"success": False, "error": str(e)}
+
+    feed_key = (kind, params["key"])
+    entry = cache.validate(feed_key, etag)
+    result = {
+        "success": True,
+        "status": 200,
+        "etag": etag,
+        "last_modified": email.utils.format_datetime(entry["last_modified"], usegmt=True),
+        "body": None,
+    }
+
+    if _not_modified(entry, if_none_match, if_modified_since):
+        cache.count("not_modified")
+        result["status"] = 304
+    elif entry["body"] is not None:
+        cache.count("hits")
+        result["body"] = [entry["body"]]
+    else:
+        cache.count("generated")
+        name = f"S.A.M - {params['key']}"
+        result["body"] = _capture(iter_ics_feed(stream_meetings(kind, params), name),
+                                  cache, feed_key, etag)
+    return result
+
+
+'''
+how to use this?
+
+from utils.ics_feed import get_feed
+
+feed = get_feed("department", "Computer Science",
+                if_none_match=request.headers.get("If-None-Match"))
+if feed["status"] == 304:
+    ...   # 304 Not Modified, koi body nahi
+else:
+    for chunk in feed["body"]:     # bytes, thoda thoda karke
+        response.write(chunk)
+# headers: ETag = feed["etag"], Last-Modified = feed["last_modified"]
+
+get_feed("faculty", "sharma@college.edu")   # organizer ya invited, dono
+'''
@@ -1,37 +1,69 @@
+"""
+.ics invite banane wala module.
+
+pehele har invite data/ics me ek naya UUID.ics file likhta tha, dispatcher
+usse wapas padhta tha, aur koi file kabhi delete nahi hoti thi. ab
+render_ics seedha bytes deta hai jo MIME builder ko pass ho jate hai, disk
+ko haath lagaye bina.
+
+UID meeting ke Google event id se banta hai (meeting_uid) aur SEQUENCE
+meetings mirror se aata hai, isliye reschedule / cancel ka .ics attendee ke
+calendar me wahi event update / hata deta hai (METHOD:REQUEST / CANCEL),
+naya event nahi banata aur poora invite dobara nahi bhejna padta.
+render_meeting_ics yea mirror ki row se seedha banata hai.
+
+jab sach me file chahiye (kisi aur tool ko path dena ho) tab generate_ics
+ya IcsFileCache: file ka naam content ka sha256 hai (DTSTAMP chhod ke, woh
+sirf render ka time hai) - same meeting_id / SEQUENCE / METHOD wala invite =
+same file, dobara nahi likhi jati. meeting_id ke bina har invite naya UID
+hai, toh nayi file. cache size / age limit cross hone pe purani files khud
+hata deta hai.
+"""
+
+import hashlib
 import logging
+import os
+import tempfile
+import threading
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
 
 import pytz
-from icalendar import Calendar, Event
+
+from .config_loader import Config
 
 
 logger = logging.getLogger(__name__)
 
+# Seconds between eviction scans while the cache is under its size limit
+EVICT_INTERVAL = 60
 
-def generate_ics(
+# iTIP methods (RFC 5546) an invite can carry
+METHODS = ("REQUEST", "CANCEL", "PUBLISH")
+
+
+def meeting_uid(meeting_id: str) -> str:
+    """Stable iCalendar UID of a meeting (its Google Calendar event id)."""
+    return f"{meeting_id}@sam"
+
+
+def build_calendar(
     title: str,
     start_dt: datetime,
     end_dt: datetime,
     organizer: dict,
     attendees: list,
-    output_dir: str = "data/ics",
-) -> str:
+    meeting_id: str = None,
+    sequence: int = 0,
+    method: str = "REQUEST",
+) -> "icalendar.Calendar":
     """
-    Generate an ICS file for a meeting.
-
-    Args:
-        title (str): Meeting title/subject.
-        start_dt (datetime): Timezone-aware start datetime.
-        end_dt (datetime): Timezone-aware end datetime.
-        organizer (dict): {"name": str, "email": str}
-        attendees (list): List of {"name": str, "email": str}
-        output_dir (str): Directory to store ICS files.
-
-    Returns:
-        str: Path to the generated .ics file.
+    Builds the VCALENDAR for a meeting (see render_ics for the arguments).
     """
+    # icalendar is only imported by code that renders an invite
+    from icalendar import Calendar, Event
 
     # -------------------------------
     # Validation
@@ -42,19 +74,27 @@ def generate_ics(
     if start_dt >= end_dt:
         raise ValueError("start_dt must be before end_dt")
 
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}")
+
     # -------------------------------
     # Calendar container
     # -------------------------------
     cal = Calendar()
     cal.add("prodid", "-//S.A.M//Meeting Scheduler//EN")
     cal.add("version", "2.0")
+    cal.add("method", method)
 
     # -------------------------------
     # Event
     # -------------------------------
     event = Event()
-    event.add("uid", f"{uuid.uuid4()}@sam")
+    # Without a meeting_id every call is a new event for the attendee
+    event.add("uid", meeting_uid(meeting_id) if meeting_id else f"{uuid.uuid4()}@sam")
+    event.add("sequence", sequence)
     event.add("summary", title)
+    if method == "CANCEL":
+        event.add("status", "CANCELLED")
 
     event.add("dtstart", start_dt)
     event.add("dtend", end_dt)
@@ -83,18 +123,217 @@ def generate_ics(
         )
 
     cal.add_component(event)
+    return cal
 
-    # -------------------------------
-    # Save to disk
-    # -------------------------------
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
 
-    file_path = output_path / f"{uuid.uuid4()}.ics"
+def render_ics(
+    title: str,
+    start_dt: datetime,
+    end_dt: datetime,
+    organizer: dict,
+    attendees: list,
+    meeting_id: str = None,
+    sequence: int = 0,
+    method: str = "REQUEST",
+) -> bytes:
+    """
+    Generate a meeting invite in memory.
+
+    Args:
+        title (str): Meeting title/subject.
+        start_dt (datetime): Timezone-aware start datetime.
+        end_dt (datetime): Timezone-aware end datetime.
+        organizer (dict): {"name": str, "email": str}
+        attendees (list): List of {"name": str, "email": str}
+        meeting_id (str): Google Calendar event id. Gives the invite a
+            stable UID, so later updates replace it in the attendee's calendar.
+        sequence (int): iCalendar SEQUENCE; must go up with every update.
+        method (str): "REQUEST" (invite / update) or "CANCEL".
+
+    Returns:
+        bytes: The .ics content, ready for the MIME builder
+        (send_meeting_notification(..., ics_attachment=<bytes>)).
+    """
+    return build_calendar(title, start_dt, end_dt, organizer, attendees,
+                          meeting_id, sequence, method).to_ical()
 
-    with open(file_path, "wb") as f:
-        f.write(cal.to_ical())
+
+def render_meeting_ics(meeting: dict, method: str = "REQUEST") -> bytes:
+    """
+    Update / cancellation for a meeting from the mirror
+    (utils.meeting_store.get_meeting), with its stored SEQUENCE.
+    """
+    return render_ics(
+        meeting["title"],
+        meeting["start_time"].replace(tzinfo=pytz.UTC),
+        meeting["end_time"].replace(tzinfo=pytz.UTC),
+        {"name": meeting["organizer_email"], "email": meeting["organizer_email"]},
+        [{"name": person["name"] or person["email"], "email": person["email"]}
+         for person in meeting["participants"]],
+        meeting_id=meeting["meeting_id"],
+        sequence=meeting["sequence"],
+        method=method,
+    )
+
+
+class IcsFileCache:
+    """
+    Content-addressed directory of .ics files.
+
+    put() names each file after the sha256 of its bytes minus the DTSTAMP
+    line (the time it was rendered), so storing the same invite twice
+    reuses the file even when it was rendered again. Files are written to a temp name and
+    renamed, so readers never see half a file. put() also evicts: files
+    older than `max_age` seconds go first, then the least recently stored
+    ones until the directory is under `max_bytes` (the directory is listed
+    at most every EVICT_INTERVAL seconds unless the size limit is crossed).
+
+    Anything with the same put(data) -> path method can stand in for this
+    class (e.g. an object-store backed cache) wherever a cache is accepted.
+    """
+
+    def __init__(self, directory: str = None, max_bytes: int = None, max_age: float = None):
+        self.directory = Path(directory or Config.ICS_CACHE_DIR)
+        self.max_bytes = Config.ICS_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.max_age = Config.ICS_CACHE_MAX_AGE if max_age is None else max_age
+        self._lock = threading.Lock()
+        self._stats = {"puts": 0, "hits": 0, "evicted": 0}
+        # Size estimate since the last scan, so put() does not list the
+        # directory every time
+        self._approx_bytes = None
+        self._last_evict = 0.0
+
+    def path_for(self, data) -> Path:
+        content = b"".join(line for line in bytes(data).splitlines(keepends=True)
+                           if not line.startswith(b"DTSTAMP"))
+        return self.directory / f"{hashlib.sha256(content).hexdigest()}.ics"
+
+    def put(self, data) -> str:
+        """Stores `data` (bytes / memoryview) and returns the file path."""
+        path = self.path_for(data)
+        with self._lock:
+            self._stats["puts"] += 1
+            if path.exists():
+                self._stats["hits"] += 1
+                os.utime(path)  # still in use: keep it away from eviction
+                return str(path)
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+
+            if self._approx_bytes is not None:
+                self._approx_bytes += len(data)
+            if (self._approx_bytes is None or self._approx_bytes > self.max_bytes
+                    or time.monotonic() - self._last_evict > EVICT_INTERVAL):
+                self._evict(keep=path)
+        return str(path)
+
+    def get(self, digest: str):
+        """Bytes of the file for a digest (its file name, see path_for), or None."""
+        try:
+            return (self.directory / f"{digest}.ics").read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _evict(self, keep=None):
+        now = time.time()
+        files = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".ics") or not entry.is_file():
+                continue
+            stat = entry.stat()
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        for mtime, size, path in files:
+            if now - mtime <= self.max_age and total <= self.max_bytes:
+                break
+            if keep is not None and path == str(keep):
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            self._stats["evicted"] += 1
+        self._approx_bytes = total
+        self._last_evict = time.monotonic()
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+
+_cache = None
+
+
+def get_ics_cache() -> IcsFileCache:
+    """The shared cache under Config.ICS_CACHE_DIR."""
+    global _cache
+    if _cache is None:
+        _cache = IcsFileCache()
+    return _cache
+
+
+def generate_ics(
+    title: str,
+    start_dt: datetime,
+    end_dt: datetime,
+    organizer: dict,
+    attendees: list,
+    output_dir: str = None,
+    cache=None,
+    meeting_id: str = None,
+    sequence: int = 0,
+    method: str = "REQUEST",
+) -> str:
+    """
+    Generate an ICS file for a meeting, for callers that need a path.
+    Prefer render_ics when the bytes are only going into an email.
+
+    Args:
+        title, start_dt, end_dt, organizer, attendees: See render_ics.
+        output_dir (str): Cache directory (default Config.ICS_CACHE_DIR).
+        cache: Object with put(data) -> path (default: the shared IcsFileCache).
+        meeting_id, sequence, method: See render_ics. Without a meeting_id
+            the invite gets a new UID, so every call writes a new file.
+
+    Returns:
+        str: Path to the generated .ics file.
+    """
+    data = render_ics(title, start_dt, end_dt, organizer, attendees,
+                      meeting_id, sequence, method)
+    if cache is None:
+        cache = IcsFileCache(output_dir) if output_dir else get_ics_cache()
+    file_path = cache.put(data)
 
     logger.info("ICS file generated at %s", file_path)
 
-    return str(file_path)
+    return file_path
+
+
+'''
+how to use this?
+
+from utils.ics_generator import render_ics, generate_ics
+
+ics = render_ics("Budget review", start, end,
+                 {"name": "HOD", "email": "hod@college.edu"},
+                 [{"name": "Dr. Sharma", "email": "sharma@college.edu"}])
+send_meeting_notifications_bulk(recipients, "invite", details, ics_attachment=ics)   # no file
+
+# reschedule ke baad: same UID, agla SEQUENCE -> attendee ke paas update, naya event nahi
+update = render_meeting_ics(get_meeting("evt123"))
+cancel = render_meeting_ics(dict(meeting, sequence=meeting["sequence"] + 1), method="CANCEL")
+
+path = generate_ics(..., meeting_id="evt123")   # data/ics/<sha256>.ics, dobara call = wahi file
+# purani files cache khud hatata hai
+'''
@@ -0,0 +1,271 @@
+"""
+meetings / meeting_participants tables ka read-write layer.
+
+Google Calendar asli source hai, yea uska local mirror hai: meeting_modifier
+jab bhi create / reschedule / cancel karta hai, Google ka response yaha bhi
+likh deta hai (write-through). `sam list` aur `sam show` phir Google ko call
+kiye bina ek indexed query se yahi se padh lete hai.
+
+tables aur indexes scripts/init_meetings_tables.py banata hai.
+"""
+
+import datetime
+
+from dateutil import parser
+
+from utils import async_db
+from utils.db_pool import db_cursor
+
+UPSERT_MEETINGS_SQL = """
+INSERT INTO meetings (meeting_id, title, start_time, end_time, organizer_email, meet_link)
+VALUES %s
+ON CONFLICT (meeting_id) DO UPDATE SET
+    title = EXCLUDED.title,
+    start_time = EXCLUDED.start_time,
+    end_time = EXCLUDED.end_time,
+    organizer_email = EXCLUDED.organizer_email,
+    meet_link = EXCLUDED.meet_link,
+    sequence = meetings.sequence + CASE
+        WHEN (meetings.title, meetings.start_time, meetings.end_time)
+             IS DISTINCT FROM (EXCLUDED.title, EXCLUDED.start_time, EXCLUDED.end_time)
+        THEN 1 ELSE 0 END,
+    updated_at = (now() AT TIME ZONE 'utc')
+RETURNING id, meeting_id
+"""
+
+RESCHEDULE_SQL = """
+UPDATE meetings AS m
+SET start_time = v.start_time,
+    end_time = v.end_time,
+    sequence = m.sequence + CASE
+        WHEN (m.start_time, m.end_time) IS DISTINCT FROM (v.start_time, v.end_time)
+        THEN 1 ELSE 0 END,
+    updated_at = (now() AT TIME ZONE 'utc')
+FROM (VALUES %s) AS v (meeting_id, start_time, end_time)
+WHERE m.meeting_id = v.meeting_id
+"""
+
+# One row per meeting with its participants folded in, so a listing is a
+# single query: meetings come from the (organizer_email, start_time) index,
+# each one's participants from the meeting_id index
+MEETING_SELECT = """
+SELECT
+    m.meeting_id, m.title, m.start_time, m.end_time, m.organizer_email, m.meet_link,
+    m.sequence, m.updated_at,
+    COALESCE((
+        SELECT json_agg(json_build_object('name', p.participant_name, 'email', p.participant_email)
+                        ORDER BY p.id)
+        FROM meeting_participants p
+        WHERE p.meeting_id = m.id
+    ), '[]') AS participants
+FROM meetings m
+"""
+
+
+def _naive_utc(moment):
+    """ISO string or datetime as naive UTC, like the table stores it (naive input is UTC)."""
+    if isinstance(moment, str):
+        moment = parser.isoparse(moment)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def _utc(value):
+    """Event start/end: "dateTime", or "date" for all-day events."""
+    if "dateTime" in value:
+        return _naive_utc(value["dateTime"])
+    return datetime.datetime.combine(datetime.date.fromisoformat(value["date"]), datetime.time.min)
+
+
+def event_rows(event: dict, organizer_email: str):
+    """
+    Splits a Calendar event resource into a meetings row and its
+    meeting_participants (name, email) rows. Rooms and other resources
+    are not participants.
+    """
+    meeting = (
+        event["id"],
+        (event.get("summary") or "Untitled meeting")[:255],
+        _utc(event["start"]),
+        _utc(event["end"]),
+        organizer_email.lower(),
+        event.get("hangoutLink"),
+    )
+    participants = [
+        (attendee.get("displayName"), attendee["email"].lower())
+        for attendee in event.get("attendees", [])
+        if attendee.get("email") and not attendee.get("resource")
+    ]
+    return meeting, participants
+
+
+def save_meetings(events: list, organizer_email: str) -> int:
+    """
+    Inserts or updates meetings from Calendar event resources, replacing
+    their participant lists. All rows go in one transaction.
+
+    Returns:
+        int: Number of meetings written.
+    """
+    rows = {}
+    for event in events:
+        # the same event twice would make ON CONFLICT touch a row twice
+        rows[event["id"]] = event_rows(event, organizer_email)
+    if not rows:
+        return 0
+
+    from psycopg2.extras import execute_values
+
+    with db_cursor(commit=True) as cur:
+        saved = execute_values(cur, UPSERT_MEETINGS_SQL,
+                               [meeting for meeting, _ in rows.values()], fetch=True)
+        ids = {row["meeting_id"]: row["id"] for row in saved}
+        cur.execute("DELETE FROM meeting_participants WHERE meeting_id = ANY(%s)",
+                    (list(ids.values()),))
+        participants = [
+            (ids[meeting_id], name, email)
+            for meeting_id, (_, people) in rows.items()
+            for name, email in people
+        ]
+        if participants:
+            execute_values(cur, "INSERT INTO meeting_participants "
+                                "(meeting_id, participant_name, participant_email) VALUES %s",
+                           participants)
+    return len(rows)
+
+
+def reschedule_meetings(changes: list) -> int:
+    """
+    Moves meetings to new times.
+
+    Args:
+        changes (list): [(meeting_id, start, end), ...], times as ISO
+            strings or datetimes (naive means UTC).
+
+    Returns:
+        int: Number of meetings updated (ones not mirrored are skipped).
+    """
+    if not changes:
+        return 0
+    from psycopg2.extras import execute_values
+
+    rows = [(meeting_id, _naive_utc(start), _naive_utc(end)) for meeting_id, start, end in changes]
+    with db_cursor(commit=True) as cur:
+        execute_values(cur, RESCHEDULE_SQL, rows, template="(%s, %s::timestamp, %s::timestamp)")
+        return cur.rowcount
+
+
+def delete_meetings(meeting_ids: list) -> int:
+    """Removes meetings (participants go with them through ON DELETE CASCADE)."""
+    if not meeting_ids:
+        return 0
+    with db_cursor(commit=True) as cur:
+        cur.execute("DELETE FROM meetings WHERE meeting_id = ANY(%s)", (list(meeting_ids),))
+        return cur.rowcount
+
+
+def list_meetings(organizer_email: str, start, end) -> list:
+    """
+    Meetings organized by `organizer_email` starting in [start, end),
+    earliest first, each with its participants.
+    """
+    with db_cursor() as cur:
+        cur.execute(
+            f"{MEETING_SELECT}"
+            " WHERE m.organizer_email = %s AND m.start_time >= %s AND m.start_time < %s"
+            " ORDER BY m.start_time",
+            (organizer_email.lower(), _naive_utc(start), _naive_utc(end)),
+        )
+        return [dict(row) for row in cur.fetchall()]
+
+
+def list_invited_meetings(participant_email: str, start, end) -> list:
+    """Meetings `participant_email` is invited to, starting in [start, end)."""
+    with db_cursor() as cur:
+        cur.execute(
+            f"{MEETING_SELECT}"
+            " WHERE m.id IN (SELECT meeting_id FROM meeting_participants WHERE participant_email = %s)"
+            " AND m.start_time >= %s AND m.start_time < %s"
+            " ORDER BY m.start_time",
+            (participant_email.lower(), _naive_utc(start), _naive_utc(end)),
+        )
+        return [dict(row) for row in cur.fetchall()]
+
+
+def get_meeting(meeting_id: str):
+    """The meeting with its participants, or None if it is not mirrored."""
+    with db_cursor() as cur:
+        cur.execute(f"{MEETING_SELECT} WHERE m.meeting_id = %s", (meeting_id,))
+        row = cur.fetchone()
+    return dict(row) if row else None
+
+
+
+# asyncio variants (utils/async_db.py, asyncpg): same queries and row
+# shapes, $n placeholders, for callers running on an event loop
+
+# unnest() of three arrays stands in for execute_values' VALUES list
+ASYNC_RESCHEDULE_SQL = RESCHEDULE_SQL.replace(
+    "(VALUES %s)", "unnest($1::text[], $2::timestamp[], $3::timestamp[])")
+
+
+async def reschedule_meetings_async(changes: list) -> int:
+    """reschedule_meetings on the event loop."""
+    if not changes:
+        return 0
+    ids, starts, ends = zip(*((meeting_id, _naive_utc(start), _naive_utc(end))
+                              for meeting_id, start, end in changes))
+    return await async_db.execute(ASYNC_RESCHEDULE_SQL, list(ids), list(starts), list(ends))
+
+
+async def delete_meetings_async(meeting_ids: list) -> int:
+    """delete_meetings on the event loop."""
+    if not meeting_ids:
+        return 0
+    return await async_db.execute("DELETE FROM meetings WHERE meeting_id = ANY($1)", list(meeting_ids))
+
+
+async def list_meetings_async(organizer_email: str, start, end) -> list:
+    """list_meetings on the event loop."""
+    return await async_db.fetch(
+        f"{MEETING_SELECT}"
+        " WHERE m.organizer_email = $1 AND m.start_time >= $2 AND m.start_time < $3"
+        " ORDER BY m.start_time",
+        organizer_email.lower(), _naive_utc(start), _naive_utc(end),
+    )
+
+
+async def list_invited_meetings_async(participant_email: str, start, end) -> list:
+    """list_invited_meetings on the event loop."""
+    return await async_db.fetch(
+        f"{MEETING_SELECT}"
+        " WHERE m.id IN (SELECT meeting_id FROM meeting_participants WHERE participant_email = $1)"
+        " AND m.start_time >= $2 AND m.start_time < $3"
+        " ORDER BY m.start_time",
+        participant_email.lower(), _naive_utc(start), _naive_utc(end),
+    )
+
+
+async def get_meeting_async(meeting_id: str):
+    """get_meeting on the event loop."""
+    return await async_db.fetchrow(f"{MEETING_SELECT} WHERE m.meeting_id = $1", meeting_id)
+
+'''
+how to use this?
+
+from utils.meeting_store import list_meetings, get_meeting
+
+# agle 7 din (sam list --days 7)
+now = datetime.datetime.utcnow()
+for meeting in list_meetings("hod@college.edu", now, now + datetime.timedelta(days=7)):
+    print(meeting["start_time"], meeting["title"], [p["email"] for p in meeting["participants"]])
+
+get_meeting("evt123")   # sam show evt123
+
+# event loop pe (HTTP API): same cheez, await ke saath
+meeting = await get_meeting_async("evt123")
+
+# likhna meeting_modifier karta hai (save_meetings / reschedule_meetings /
+# delete_meetings), khud se call karne kee zarurat nahi
+'''
@@ -0,0 +1,158 @@
+"""
+Render-once, personalize-many email builder.
+ek meeting ke saare attendees ko almost same mail jata hai. isliye HTML,
+base64 wala .ics part aur headers ek hee baar banate hai, aur har recipient
+ke liye sirf To, greeting naam aur RSVP token stamp karte hai. RSVP link
+start / end markers ke beech hota hai; jis recipient ka token nahi, uske
+mail se poora link hata dete hai (khaali ?token= wala link nahi jata).
+"""
+
+import html
+import re
+import secrets
+from email.message import EmailMessage, MIMEPart
+from urllib.parse import quote
+
+# Rendered into the HTML skeleton in place of per-recipient values
+RECIPIENT_NAME_MARKER = "__SAM_RECIPIENT_NAME__"
+RSVP_TOKEN_MARKER = "__SAM_RSVP_TOKEN__"
+# Around the RSVP link; the block is dropped for recipients without a token
+RSVP_START_MARKER = "<!--SAM_RSVP-->"
+RSVP_END_MARKER = "<!--/SAM_RSVP-->"
+_RSVP_BLOCK = re.compile(re.escape(RSVP_START_MARKER) + ".*?" + re.escape(RSVP_END_MARKER), re.DOTALL)
+
+
+def personalization_markers() -> dict:
+    """
+    Template context that renders the per-recipient fields as markers,
+    so one render can be stamped for every recipient.
+    """
+    return {
+        "recipient_name": RECIPIENT_NAME_MARKER,
+        "rsvp_token": RSVP_TOKEN_MARKER,
+        "rsvp_start": RSVP_START_MARKER,
+        "rsvp_end": RSVP_END_MARKER,
+    }
+
+
+def _new_boundary() -> str:
+    return f"==============={secrets.token_hex(8)}=="
+
+
+def _clone_container(container, payload):
+    part = MIMEPart()
+    for name, value in container.raw_items():
+        part.set_raw(name, value)
+    part.set_payload(payload)
+    return part
+
+
+class PersonalizedMessageBuilder:
+    """
+    Builds the shared MIME tree once and stamps recipients into copies of it.
+
+    Shared parts (plain text, .ics attachment, and the HTML when it has no
+    markers) are the same objects in every message, so their transfer
+    encoding is done once. Multipart boundaries are fixed up front so
+    serializing a message never mutates the shared parts.
+    """
+
+    def __init__(self, sender_email, subject, text_body,
+                 html_skeleton=None, ics_data=None, ics_filename="invite.ics",
+                 ics_method=None):
+        template = EmailMessage()
+        template["From"] = sender_email
+        template["Subject"] = subject
+        template.set_content(text_body)
+
+        self._html_skeleton = html_skeleton
+        self._personalized = False
+        self._html_part = None
+        self._alternative = None
+
+        if html_skeleton is not None:
+            self._personalized = (RECIPIENT_NAME_MARKER in html_skeleton
+                                  or RSVP_TOKEN_MARKER in html_skeleton
+                                  or RSVP_START_MARKER in html_skeleton)
+            template.add_alternative(self._stamp(None, None), subtype="html")
+
+        if ics_data is not None:
+            template.add_attachment(
+                ics_data,
+                maintype="text",
+                subtype="calendar",
+                filename=ics_filename,
+                # text/calendar; method=REQUEST / CANCEL lets mail clients
+                # apply it to the existing event (RFC 6047)
+                params={"method": ics_method} if ics_method else None
+            )
+
+        if template.is_multipart():
+            template.set_boundary(_new_boundary())
+            for part in template.walk():
+                if part is not template and part.is_multipart():
+                    part.set_boundary(_new_boundary())
+
+        if html_skeleton is not None:
+            for part in template.walk():
+                if part.get_content_type() == "multipart/alternative":
+                    self._alternative = part
+                elif part.get_content_type() == "text/html":
+                    self._html_part = part
+
+        self._template = template
+        self._root_headers = list(template.raw_items())
+
+    def _stamp(self, recipient_name, rsvp_token) -> str:
+        name = f" {html.escape(recipient_name)}" if recipient_name else ""
+        if rsvp_token:
+            skeleton = self._html_skeleton.replace(RSVP_START_MARKER, "").replace(RSVP_END_MARKER, "")
+            token = quote(rsvp_token, safe="")
+        else:
+            skeleton = _RSVP_BLOCK.sub("", self._html_skeleton)
+            token = ""
+        return (skeleton
+                .replace(f" {RECIPIENT_NAME_MARKER}", name)
+                .replace(RECIPIENT_NAME_MARKER, name.strip())
+                .replace(RSVP_TOKEN_MARKER, token))
+
+    def _payload_for(self, recipient_name, rsvp_token):
+        payload = self._template.get_payload()
+        if not self._personalized or not (recipient_name or rsvp_token):
+            return list(payload) if isinstance(payload, list) else payload
+
+        html_part = MIMEPart()
+        html_part.set_content(self._stamp(recipient_name, rsvp_token), subtype="html")
+
+        alternative = _clone_container(self._alternative, [
+            html_part if part is self._html_part else part
+            for part in self._alternative.get_payload()
+        ])
+        if self._alternative is self._template:
+            return alternative.get_payload()
+
+        return [alternative if part is self._alternative else part for part in payload]
+
+    def build(self, recipient_email, recipient_name=None, rsvp_token=None) -> EmailMessage:
+        """
+        Returns a ready-to-send EmailMessage for one recipient.
+        """
+        msg = EmailMessage()
+        for name, value in self._root_headers:
+            msg.set_raw(name, value)
+        msg.set_raw(*msg.policy.header_store_parse("To", recipient_email))
+        msg.set_payload(self._payload_for(recipient_name, rsvp_token))
+        return msg
+
+
+'''
+how to use this?
+
+from utils.mime_builder import PersonalizedMessageBuilder, personalization_markers
+
+html_skeleton = template.render(title="Sync", **personalization_markers()) # ek hee baar render
+builder = PersonalizedMessageBuilder(sender, "Meeting Invitation: Sync", "plain text", html_skeleton, ics_bytes)
+
+for person in attendees:
+    msg = builder.build(person["email"], person["name"], rsvp_token=person.get("token"))
+'''
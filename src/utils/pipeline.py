@@ -0,0 +1,176 @@
+"""
+Chhota DAG executor: kaam ko stages me todo, har stage batao ki usse kin
+stages ka result chahiye, aur jo stages ek doosre pe depend nahi karte woh
+threads pe ek saath chalte hai.
+
+har stage ka start / duration record hota hai (run ke start se, ms me),
+toh pata chalta hai time kaha ja raha hai aur kya overlap hua.
+
+koi stage fail ho toh naye stages start nahi hote, jo chal rahe hai unka
+wait hota hai, phir jo stages ho chuke hai unka `undo` ulte order me
+chalta hai (jaise bana hua Calendar event delete karna) - aadha kaam
+peeche nahi chhootta.
+
+stages ke functions ko dependencies keyword arguments me milti hai, naam
+wahi jo stage / input ka naam hai. inputs run(**inputs) se aate hai.
+"""
+
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class Stage:
+    """
+    One step of a Pipeline.
+
+    Args:
+        name (str): Stage name; dependent stages get its result under it.
+        run (callable): Called with the results of `requires` as keyword
+            arguments; its return value is the stage result. Raising fails
+            the pipeline.
+        requires (tuple): Names of stages or run() inputs it needs.
+        undo (callable): Optional, called with the stage result when a
+            later stage fails.
+    """
+
+    def __init__(self, name: str, run, requires=(), undo=None):
+        self.name = name
+        self.run = run
+        self.requires = tuple(requires)
+        self.undo = undo
+
+
+class Pipeline:
+    """
+    Runs Stages as a dependency graph on a thread pool, each stage as soon
+    as everything it requires is done. With max_workers=1 the stages run
+    one after another, in declaration order.
+    """
+
+    def __init__(self, stages: list, max_workers: int = None):
+        self.stages = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage: {stage.name}")
+            self.stages[stage.name] = stage
+        self.max_workers = max_workers or max(1, len(self.stages))
+        self._check_acyclic()
+
+    def _check_acyclic(self):
+        state = {}
+
+        def visit(name, path):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Stage dependency cycle: {' -> '.join(path + [name])}")
+            state[name] = "visiting"
+            for dep in self.stages[name].requires:
+                if dep in self.stages:
+                    visit(dep, path + [name])
+            state[name] = "done"
+
+        for name in self.stages:
+            visit(name, [])
+
+    @staticmethod
+    def _timed(stage, kwargs, origin):
+        started = time.perf_counter()
+        try:
+            value, error = stage.run(**kwargs), None
+        except Exception as e:
+            value, error = None, e
+        return value, error, started - origin, time.perf_counter() - started
+
+    def run(self, **inputs) -> dict:
+        """
+        Runs every stage.
+
+        Returns:
+            dict: {"success", "results": {stage: result},
+                   "timings": {stage: {"start_ms", "duration_ms"}}, "elapsed_ms"}
+            On failure also "error", "failed_stage", "rolled_back" (stages
+            whose undo ran, in that order) and "skipped" (never started).
+        """
+        missing = sorted({dep for stage in self.stages.values() for dep in stage.requires
+                          if dep not in self.stages and dep not in inputs})
+        if missing:
+            raise ValueError(f"Missing pipeline inputs: {', '.join(missing)}")
+
+        origin = time.perf_counter()
+        values = dict(inputs)
+        waiting = dict(self.stages)
+        running = {}
+        completed = []
+        timings = {}
+        failure = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                if failure is None:
+                    for name, stage in list(waiting.items()):
+                        if all(dep in values for dep in stage.requires):
+                            del waiting[name]
+                            kwargs = {dep: values[dep] for dep in stage.requires}
+                            # stages see the caller's context vars (e.g. the
+                            # daemon's per-request output capture)
+                            context = contextvars.copy_context()
+                            running[executor.submit(context.run, self._timed, stage, kwargs, origin)] = stage
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage = running.pop(future)
+                    value, error, start, duration = future.result()
+                    timings[stage.name] = {"start_ms": round(start * 1000, 1),
+                                           "duration_ms": round(duration * 1000, 1)}
+                    if error is None:
+                        values[stage.name] = value
+                        completed.append(stage)
+                    elif failure is None:
+                        failure = (stage.name, error)
+
+        results = {stage.name: values[stage.name] for stage in completed}
+        outcome = {
+            "success": failure is None,
+            "results": results,
+            "timings": timings,
+            "elapsed_ms": round((time.perf_counter() - origin) * 1000, 1),
+        }
+        if failure is not None:
+            outcome.update(error=str(failure[1]), failed_stage=failure[0],
+                           rolled_back=self._rollback(completed, results), skipped=list(waiting))
+        return outcome
+
+    @staticmethod
+    def _rollback(completed, results):
+        rolled_back = []
+        for stage in reversed(completed):
+            if stage.undo is None:
+                continue
+            try:
+                stage.undo(results[stage.name])
+                rolled_back.append(stage.name)
+            except Exception as e:
+                print(f"Rollback of stage '{stage.name}' failed: {e}")
+        return rolled_back
+
+
+'''
+how to use this?
+
+from utils.pipeline import Pipeline, Stage
+
+pipeline = Pipeline([
+    Stage("a", lambda request: fetch_a(request), requires=["request"]),
+    Stage("b", lambda request: fetch_b(request), requires=["request"]),      # a ke saath chalega
+    Stage("c", lambda a, b: write(a, b), requires=["a", "b"], undo=lambda c: delete(c)),
+    Stage("d", lambda c: notify(c), requires=["c"]),                          # fail hua toh c undo
+])
+run = pipeline.run(request={...})
+# {"success": True, "results": {"a": ..., ...}, "timings": {"a": {"start_ms": 0.1, "duration_ms": 80.2}, ...},
+#  "elapsed_ms": 190.4}
+
+# sab ek ke baad ek (comparison ke liye): Pipeline(stages, max_workers=1)
+'''
@@ -0,0 +1,409 @@
+"""
+Fuzzy name matching ka index.
+pehele har resolve pe faculty_map + names_list banta tha aur thefuzz poore
+roster pe ek ek naam score karta tha. 5 log ke liye theek hai, 50k ke liye
+nahi. yea index roster ke har version ke liye ek hee baar banta hai:
+normalized naam, token/trigram postings aur soundex keys. query aane pe
+pehele blocking se chhote candidates nikalte hai, unhe rapidfuzz se score
+karte hai, aur phir us score ko cutoff bana ke ek verify pass chalate hai
+taaki result bilkul thefuzz.process.extractOne jaisa hee aaye.
+"""
+
+import copy
+from collections import Counter, defaultdict
+
+import numpy as np
+from rapidfuzz import fuzz, process
+from thefuzz.utils import full_process
+
+# How many trigram-overlap candidates are scored per query
+TRIGRAM_CANDIDATES = 256
+# Batch resolution: best-ranked candidates per query that become matrix columns
+BATCH_CANDIDATES = 64
+# Rosters up to this size are scored in full by the batch matrix (exact)
+FULL_MATRIX_ROSTER = 2000
+# apply_changes() gives up (forcing a rebuild) past this share of empty slots
+MAX_DEAD_SHARE = 0.1
+# Trigrams present in more than this share of the roster are too common to block on
+MAX_TRIGRAM_SHARE = 0.05
+# The exact pass cutoff sits this far below the blocked best score
+TIE_MARGIN = 0.5
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+def normalize_choice(name: str) -> str:
+    """Same preprocessing thefuzz applies to every choice for WRatio."""
+    return full_process(name, force_ascii=True)
+
+
+def normalize_query(query: str) -> str:
+    """Same preprocessing thefuzz applies to the query for WRatio (it runs twice)."""
+    return full_process(full_process(query), force_ascii=True)
+
+
+def soundex(token: str) -> str:
+    """
+    Classic 4-character Soundex, used as a phonetic blocking key
+    ("Sharma" and "Sherma" both become S650).
+    """
+    letters = [c for c in token.lower() if c.isalpha()]
+    if not letters:
+        return ""
+
+    first = letters[0]
+    code = first.upper()
+    previous = _SOUNDEX_CODES.get(first, "")
+    for c in letters[1:]:
+        digit = _SOUNDEX_CODES.get(c, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if c not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def trigrams(token: str) -> set:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _posting_keys(norm: str) -> tuple:
+    """(tokens, soundex keys, trigrams) a normalized name is posted under."""
+    tokens = set(norm.split())
+    grams = set()
+    for token in tokens:
+        grams |= trigrams(token)
+    return tokens, [soundex(token) for token in tokens], grams
+
+
+class ResolverIndex:
+    """
+    Immutable search structure over one roster snapshot.
+
+    Attributes:
+        version: Roster version the index was built from.
+        names: Unique names in roster order (first occurrence wins the slot,
+               the last record with that name wins the data, like the old
+               faculty_map dict did).
+    """
+
+    def __init__(self, faculty: list, version=None):
+        faculty_map = {person['name']: person for person in faculty}
+        self.version = version
+        self.names = list(faculty_map.keys())
+        self.people = [faculty_map[name] for name in self.names]
+        self.normalized = [normalize_choice(name) for name in self.names]
+        self._positions = {name: i for i, name in enumerate(self.names)}
+        # Slots emptied by apply_changes(); they score 0 and are in no postings
+        self._dead = set()
+
+        self._tokens = defaultdict(list)
+        self._phonetic = defaultdict(list)
+        self._trigrams = defaultdict(list)
+
+        for i, norm in enumerate(self.normalized):
+            for table, keys in zip(self._tables(), _posting_keys(norm)):
+                for key in keys:
+                    table[key].append(i)
+
+        self._max_trigram_df = max(int(len(self.names) * MAX_TRIGRAM_SHARE), 50)
+
+    def __len__(self):
+        return len(self.names) - len(self._dead)
+
+    def _tables(self):
+        return self._tokens, self._phonetic, self._trigrams
+
+    def apply_changes(self, changes: dict, version=None):
+        """
+        Returns a new index with a roster change set applied (see
+        utils.faculty_import.sync_faculty_csv), sharing every posting list
+        the change set does not touch. This index is left as it is.
+
+        Updated people keep their slot when the name is unchanged; renamed,
+        inserted and reactivated people get new slots at the end, removed
+        ones leave an empty slot behind.
+
+        Returns:
+            ResolverIndex or None: None when the change set cannot be
+            patched in exactly (duplicate names, rows without an id, too
+            many empty slots); the caller should rebuild instead.
+        """
+        index = copy.copy(self)
+        index.version = version
+        index.names = list(self.names)
+        index.people = list(self.people)
+        index.normalized = list(self.normalized)
+        index._positions = dict(self._positions)
+        index._dead = set(self._dead)
+
+        updated = changes.get('updated', [])
+        if any(person.get('id') is None
+               for rows in changes.values() for person in rows):
+            return None
+
+        updated_ids = {person['id'] for person in updated}
+        by_id = {person['id']: i for i, person in enumerate(self.people)
+                 if i not in self._dead}
+        removed, added = [], []
+
+        for person in changes.get('deactivated', []) + updated:
+            position = by_id.pop(person['id'], None)
+            if position is None:
+                continue
+            if person['id'] in updated_ids and person['name'] == index.names[position]:
+                index.people[position] = person
+                continue
+            removed.append(position)
+            del index._positions[index.names[position]]
+
+        for person in updated + changes.get('inserted', []):
+            if person['name'] in index._positions:
+                if index.people[index._positions[person['name']]] is person:
+                    continue
+                return None
+            position = len(index.names)
+            index.names.append(person['name'])
+            index.people.append(person)
+            index.normalized.append(normalize_choice(person['name']))
+            index._positions[person['name']] = position
+            added.append(position)
+
+        if len(index._dead) + len(removed) > max(50, len(index.names) * MAX_DEAD_SHARE):
+            return None
+
+        # Touched posting lists are rebuilt once each (copy-on-write)
+        dropped = set(removed)
+        appended = [{}, {}, {}]
+        touched = [set(), set(), set()]
+        for position in removed:
+            for keys, seen in zip(_posting_keys(index.normalized[position]), touched):
+                seen.update(keys)
+            index.normalized[position] = ""
+            index.people[position] = None
+            index._dead.add(position)
+        for position in added:
+            for keys, extra, seen in zip(_posting_keys(index.normalized[position]), appended, touched):
+                for key in keys:
+                    extra.setdefault(key, []).append(position)
+                seen.update(keys)
+
+        tables = []
+        for table, extra, seen in zip(self._tables(), appended, touched):
+            table = defaultdict(list, table)
+            for key in seen:
+                postings = [i for i in table.get(key, ()) if i not in dropped]
+                postings.extend(extra.get(key, ()))
+                if postings:
+                    table[key] = postings
+                else:
+                    table.pop(key, None)
+            tables.append(table)
+        index._tokens, index._phonetic, index._trigrams = tables
+        return index
+
+    def candidates(self, query_norm: str) -> list:
+        """
+        Blocking step: roster positions sharing a token, a Soundex key or the
+        most trigrams with the query. Returned in roster order.
+        """
+        hits = set()
+        overlap = Counter()
+
+        for token in set(query_norm.split()):
+            hits.update(self._tokens.get(token, ()))
+            hits.update(self._phonetic.get(soundex(token), ()))
+            for gram in trigrams(token):
+                postings = self._trigrams.get(gram, ())
+                if len(postings) <= self._max_trigram_df:
+                    overlap.update(postings)
+
+        hits.update(i for i, _ in overlap.most_common(TRIGRAM_CANDIDATES))
+        return sorted(hits)
+
+    def ranked_candidates(self, query_norm: str, limit: int = BATCH_CANDIDATES) -> list:
+        """
+        Top `limit` blocked candidates, ranked by shared tokens (3 points),
+        shared Soundex keys (2) and shared trigrams (1 each).
+        """
+        rank = Counter()
+        for token in set(query_norm.split()):
+            rank.update(dict.fromkeys(self._tokens.get(token, ()), 3))
+            rank.update(dict.fromkeys(self._phonetic.get(soundex(token), ()), 2))
+            for gram in trigrams(token):
+                postings = self._trigrams.get(gram, ())
+                if len(postings) <= self._max_trigram_df:
+                    rank.update(postings)
+        return [i for i, _ in rank.most_common(limit)]
+
+    def best_matches(self, name_queries: list, threshold: int = 75,
+                     ambiguity_margin: int = 5, exact: bool = True) -> list:
+        """
+        Resolves many names in one query x roster similarity matrix
+        (rapidfuzz cdist).
+
+        Small rosters (<= FULL_MATRIX_ROSTER) use every roster name as a
+        column. Bigger ones score the union of each query's best-ranked
+        blocked candidates; with exact=True (default) each query is then
+        rescored against the whole roster with its blocked best as cutoff,
+        so the best match is the same as best_match(). exact=False skips
+        that: faster, but a query can come back with a lower score or
+        another name on a tie.
+
+        Returns:
+            list: One dict per query, in order:
+                {"query", "match" (person or None), "name", "score",
+                 "runner_up", "runner_up_score", "ambiguous"}
+                "ambiguous" is True when a different person scored within
+                `ambiguity_margin` points of an accepted match.
+        """
+        queries = [normalize_query(q) for q in name_queries]
+        if not self.names or not queries:
+            return [self._batch_result(q, None, 0.0, None, 0.0, threshold, ambiguity_margin)
+                    for q in name_queries]
+
+        if len(self.names) <= FULL_MATRIX_ROSTER:
+            columns = None
+            choices = self.normalized
+        else:
+            columns = sorted({i for q in queries if q for i in self.ranked_candidates(q)})
+            if not columns:
+                columns = [0]
+            choices = [self.normalized[i] for i in columns]
+
+        scores = process.cdist(queries, choices, scorer=fuzz.WRatio, processor=None,
+                               dtype=np.float64, workers=-1)
+
+        # argmax keeps the first column on ties, i.e. roster order like extractOne
+        rows = np.arange(len(queries))
+        best = scores.argmax(axis=1)
+        best_scores = scores[rows, best]
+        if scores.shape[1] > 1:
+            scores[rows, best] = -1.0
+            second = scores.argmax(axis=1)
+            second_scores = scores[rows, second]
+        else:
+            second = second_scores = None
+
+        results = []
+        for row, query in enumerate(name_queries):
+            best_pos = best[row] if columns is None else columns[best[row]]
+            second_pos = second_score = None
+            if second is not None:
+                second_pos = second[row] if columns is None else columns[second[row]]
+                second_score = second_scores[row]
+            best_pos, best_score = int(best_pos), float(best_scores[row])
+            if exact and columns is not None and queries[row]:
+                best_pos, best_score, second_pos, second_score = self._rescore(
+                    queries[row], best_pos, best_score, second_pos, second_score, ambiguity_margin)
+            results.append(self._batch_result(query, best_pos, best_score,
+                                              second_pos, second_score, threshold,
+                                              ambiguity_margin))
+        return results
+
+    def _rescore(self, query_norm, best_pos, best_score, second_pos, second_score, ambiguity_margin):
+        """
+        Exact best and runner-up for one query over the whole roster, given
+        its blocked best. Only names that could beat the blocked best or be
+        within `ambiguity_margin` of it are scored in full; if no runner-up
+        is that close, the blocked one is kept (it cannot make the match
+        ambiguous).
+        """
+        # one point more than the margin covers rounding of both scores
+        cutoff = max(best_score - TIE_MARGIN - ambiguity_margin - 1, 0)
+        scores = process.cdist([query_norm], self.normalized, scorer=fuzz.WRatio,
+                               processor=None, dtype=np.float64, score_cutoff=cutoff)[0]
+        top = int(np.argmax(scores))
+        if scores[top] < best_score - TIE_MARGIN:
+            return best_pos, best_score, second_pos, second_score
+        top_score = float(scores[top])
+        scores[top] = -1.0
+        runner_up = int(np.argmax(scores))
+        if len(scores) > 1 and scores[runner_up] >= cutoff:
+            return top, top_score, runner_up, float(scores[runner_up])
+        if second_pos == top:
+            second_pos, second_score = None, None
+        return top, top_score, second_pos, second_score
+
+    def _batch_result(self, query, best_pos, best_score, second_pos, second_score,
+                      threshold, ambiguity_margin) -> dict:
+        score = int(round(best_score))
+        matched = best_pos is not None and score >= threshold
+        runner_up_score = int(round(second_score)) if second_pos is not None else None
+        return {
+            "query": query,
+            "match": self.people[best_pos] if matched else None,
+            "name": self.names[best_pos] if best_pos is not None else None,
+            "score": score,
+            "runner_up": self.names[second_pos] if second_pos is not None else None,
+            "runner_up_score": runner_up_score,
+            "ambiguous": bool(matched and runner_up_score is not None
+                              and score - runner_up_score <= ambiguity_margin),
+        }
+
+    def best_match(self, name_query: str, threshold: int = 75, exact: bool = True):
+        """
+        Finds the best roster match for `name_query`.
+
+        The blocked candidates are scored first. With exact=True (default)
+        their best score becomes the cutoff for a pass over the whole
+        roster, so the answer is identical to
+        thefuzz.process.extractOne(name_query, names); exact=False returns
+        the best blocked candidate.
+
+        Returns:
+            tuple: (person or None, best_name, score). person is None when
+            score < threshold; best_name/score are then the best candidate
+            found (it may not be the roster's best), which is only used for
+            the "no strong match" message.
+        """
+        if not self.names:
+            return None, None, 0
+
+        query_norm = normalize_query(name_query)
+        if not query_norm:
+            # thefuzz scores everything 0 for an empty query
+            return None, self.names[0], 0
+
+        positions = self.candidates(query_norm)
+        best_position, best_score = None, 0.0
+        if positions:
+            result = process.extractOne(
+                query_norm,
+                [self.normalized[i] for i in positions],
+                scorer=fuzz.WRatio,
+                processor=None,
+            )
+            if result:
+                best_position, best_score = positions[result[2]], result[1]
+
+        if exact:
+            # round() in thefuzz: anything >= threshold - 0.5 may still pass.
+            # Only names scoring at least the blocked best can beat it, so
+            # that is the cutoff for the full-roster pass (which lets
+            # rapidfuzz skip most names early). rapidfuzz may drop a score
+            # sitting right on the cutoff, so the cutoff is kept TIE_MARGIN
+            # below it; the first of the top scores wins, like in thefuzz.
+            cutoff = max(best_score - TIE_MARGIN, threshold - 0.5)
+            scores = process.cdist([query_norm], self.normalized, scorer=fuzz.WRatio,
+                                   processor=None, dtype=np.float64, score_cutoff=cutoff)[0]
+            top = int(np.argmax(scores))
+            if scores[top] >= cutoff:
+                best_position, best_score = top, float(scores[top])
+
+        if best_position is None:
+            return None, None, 0
+
+        score = int(round(best_score))
+        person = self.people[best_position] if score >= threshold else None
+        return person, self.names[best_position], score
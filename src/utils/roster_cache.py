@@ -0,0 +1,227 @@
+"""
+Faculty roster ka TTL cache.
+pehele get_cached_faculty lru_cache(maxsize=1) tha, matlab roster process
+restart tak kabhi refresh hee nahi hota tha. ab:
+  - TTL ke baad roster stale maana jata hai
+  - db_handler ke write functions (add/update/clear) cache ko invalidate karte hai
+  - stale hone par purana roster hee turant serve hota hai aur refresh
+    background thread me hota hai (stale-while-revalidate), toh request
+    kabhi bhi SELECT ka wait nahi karti (sirf sabse pehli baar ko chhod ke)
+  - roster sync (utils/faculty_import.py) ka change set aaye toh poora
+    reload nahi, sirf badle hue log patch hote hai
+"""
+
+import threading
+import time
+
+from utils.config_loader import Config
+from utils.db_handler import fetch_all_faculty, on_faculty_change
+
+
+class RosterCache:
+    """
+    Stale-while-revalidate cache around a loader function.
+
+    `version` goes up by one on every successful load, so dependents (like
+    the resolver index) can tell when they need to rebuild.
+    """
+
+    def __init__(self, loader, ttl=300):
+        self._loader = loader
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._cold_load_lock = threading.Lock()
+        self._data = None
+        self._loaded_at = 0.0
+        self.version = 0
+
+        # bumped by invalidate(); a load only clears staleness for the
+        # generation it started in
+        self._generation = 0
+        self._loaded_generation = -1
+
+        self._refresh_thread = None
+        self._listeners = []
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "patches": 0,
+            "refresh_failures": 0,
+            "refresh_ms_total": 0.0,
+            "last_refresh_ms": None,
+        }
+
+    def _bump(self, key, amount=1):
+        with self._lock:
+            self._stats[key] += amount
+
+    def add_listener(self, callback, on_patch=None):
+        """
+        callback(data, version) runs after every successful load, on the
+        thread that loaded it (usually the background refresher).
+
+        on_patch(data, version, changes) runs after apply_changes() instead;
+        without it, callback(data, version) is called for patches too.
+        """
+        self._listeners.append((callback, on_patch))
+
+    def is_stale(self):
+        return (self._loaded_generation != self._generation
+                or time.monotonic() - self._loaded_at > self.ttl)
+
+    def snapshot(self):
+        """
+        Returns (data, version). Only the very first call (or a call after a
+        failed first load) waits for the loader; stale data is returned
+        immediately while a background refresh runs.
+        """
+        data, version = self._data, self.version
+        if data is None:
+            self._bump("misses")
+            with self._cold_load_lock:
+                if self._data is None:
+                    self.refresh()
+            return self._data if self._data is not None else [], self.version
+
+        if self.is_stale():
+            self._bump("stale_hits")
+            self.refresh_async()
+        else:
+            self._bump("hits")
+        return data, version
+
+    def get(self):
+        return self.snapshot()[0]
+
+    def invalidate(self):
+        """Marks the data stale and starts reloading it in the background."""
+        with self._lock:
+            self._generation += 1
+        self.refresh_async()
+
+    def refresh_async(self):
+        """Starts a background refresh unless one is already running."""
+        with self._lock:
+            if self._refresh_thread and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_until_current, name="roster-cache-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def _refresh_until_current(self):
+        # An invalidate() that lands mid-load needs one more load
+        while self.refresh() and self._loaded_generation != self._generation:
+            pass
+
+    def refresh(self):
+        """
+        Loads the data inline. On failure the previous data is kept.
+
+        Returns:
+            bool: True if the load succeeded.
+        """
+        generation = self._generation
+        started = time.perf_counter()
+        try:
+            data = self._loader()
+        except Exception as e:
+            self._bump("refresh_failures")
+            print(f"Error refreshing roster cache: {e}")
+            return False
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._data = data
+            self._loaded_at = time.monotonic()
+            self._loaded_generation = generation
+            self.version += 1
+            version = self.version
+            self._stats["refreshes"] += 1
+            self._stats["refresh_ms_total"] += elapsed_ms
+            self._stats["last_refresh_ms"] = elapsed_ms
+
+        self._notify(data, version)
+        return True
+
+    def apply_changes(self, changes=None):
+        """
+        Patches the cached roster with a change set
+        {"inserted": [...], "updated": [...], "deactivated": [...]}
+        (rows keyed by "id"). Without a change set, before the first load
+        or while a reload is running (it may have read the table before the
+        change) this falls back to invalidate().
+        """
+        with self._lock:
+            reloading = self._refresh_thread is not None and self._refresh_thread.is_alive()
+            if changes is None or self._data is None or reloading:
+                patched = False
+            else:
+                updated = {row['id']: row for row in changes.get('updated', [])}
+                gone = {row['id'] for row in changes.get('deactivated', [])}
+                data = []
+                for person in self._data:
+                    if person.get('id') in gone:
+                        continue
+                    data.append(updated.pop(person.get('id'), person))
+                # whatever is left in `updated` was reactivated
+                data.extend(updated.values())
+                data.extend(changes.get('inserted', []))
+
+                self._data = data
+                self.version += 1
+                version = self.version
+                self._stats["patches"] += 1
+                patched = True
+
+        if not patched:
+            self.invalidate()
+            return
+        self._notify(data, version, changes)
+
+    def _notify(self, data, version, changes=None):
+        for callback, on_patch in self._listeners:
+            try:
+                if changes is not None and on_patch is not None:
+                    on_patch(data, version, changes)
+                else:
+                    callback(data, version)
+            except Exception as e:
+                print(f"Error in roster cache listener: {e}")
+
+    def wait(self, timeout=None):
+        """Blocks until the current background refresh (if any) is done."""
+        thread = self._refresh_thread
+        if thread:
+            thread.join(timeout)
+
+    def stats(self):
+        """
+        Returns:
+            dict: hit/stale-hit/miss/refresh counters, refresh timings (ms),
+            current version and age of the data in seconds.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["version"] = self.version
+        stats["age_seconds"] = (time.monotonic() - self._loaded_at) if self._data is not None else None
+        return stats
+
+
+faculty_cache = RosterCache(fetch_all_faculty, ttl=Config.ROSTER_CACHE_TTL)
+on_faculty_change(faculty_cache.apply_changes)
+
+
+'''
+how to use this?
+
+from utils.roster_cache import faculty_cache
+
+faculty = faculty_cache.get()      # kabhi DB ka wait nahi (pehli call ko chhod ke)
+faculty_cache.invalidate()         # db_handler khud call karta hai writes ke baad
+faculty_cache.apply_changes(changes)   # sync ke baad, reload ke bina patch
+print(faculty_cache.stats())       # hits / stale_hits / misses / refresh timings
+'''
@@ -0,0 +1,153 @@
+"""
+Free slot finder.
+conflict mil jaye toh sirf "busy" bolna kaafi nahi, alternative time bhi
+chahiye. yea file sab participants ke busy intervals leti hai, unhe ek
+sorted list me merge karti hai (heapq.merge), aur phir working hours /
+holidays ke andar jo gaps bachte hai unme se sabse pehele wale K slots
+nikalti hai. ek mahine ke 30 logon ka search milliseconds me ho jata hai.
+"""
+
+import bisect
+import datetime
+import heapq
+import math
+from zoneinfo import ZoneInfo
+
+from .busy_cache import to_timestamp
+from .config_loader import Config
+
+WEEKDAYS = (0, 1, 2, 3, 4)
+
+
+def merge_busy(busy_by_participant: dict) -> list:
+    """
+    Union of everyone's busy intervals as sorted, non-overlapping
+    (start, end) POSIX-second pairs. Each participant's list is sorted once
+    and the lists are k-way merged, so this is O(n log k) after that.
+    """
+    per_person = [
+        sorted((to_timestamp(start), to_timestamp(end)) for start, end in intervals)
+        for intervals in busy_by_participant.values()
+    ]
+    merged = []
+    for start, end in heapq.merge(*per_person):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def _parse_clock(value) -> datetime.time:
+    if isinstance(value, datetime.time):
+        return value
+    return datetime.time.fromisoformat(value)
+
+
+def _working_windows(window_start, window_end, tz, day_start, day_end, working_days, holidays):
+    """Yields (start, end, local midnight) POSIX seconds for each working day."""
+    day = datetime.datetime.fromtimestamp(window_start, tz).date()
+    last_day = datetime.datetime.fromtimestamp(window_end, tz).date()
+    while day <= last_day:
+        if day.weekday() in working_days and day not in holidays:
+            midnight = datetime.datetime.combine(day, datetime.time.min, tzinfo=tz).timestamp()
+            start = datetime.datetime.combine(day, day_start, tzinfo=tz).timestamp()
+            end = datetime.datetime.combine(day, day_end, tzinfo=tz).timestamp()
+            start, end = max(start, window_start), min(end, window_end)
+            if start < end:
+                yield start, end, midnight
+        day += datetime.timedelta(days=1)
+
+
+def find_free_slots(busy_by_participant: dict,
+                    window_start,
+                    window_end,
+                    duration_minutes: int,
+                    top_k: int = 5,
+                    timezone: str = None,
+                    day_start=None,
+                    day_end=None,
+                    working_days=WEEKDAYS,
+                    holidays=(),
+                    align_minutes: int = 15,
+                    step_minutes: int = None) -> list:
+    """
+    Earliest slots of `duration_minutes` when nobody is busy.
+
+    Args:
+        busy_by_participant (dict): {email: [(start, end), ...]} with ISO
+            strings, datetimes or POSIX seconds (naive means UTC).
+        window_start, window_end: Search range.
+        duration_minutes (int): Meeting length.
+        top_k (int): How many slots to return.
+        timezone (str): Zone for working hours, days and holidays
+            (default Config.SCHEDULING_TIMEZONE).
+        day_start, day_end: Working hours as "09:00" / datetime.time
+            (default Config.WORKDAY_START / WORKDAY_END).
+        working_days: Allowed weekdays, Monday = 0.
+        holidays: datetime.date values to skip.
+        align_minutes (int): Slots start on multiples of this past midnight.
+        step_minutes (int): Gap between suggestions inside one free gap
+            (default: the duration, so suggestions do not overlap).
+
+    Returns:
+        list: Up to top_k (start, end) timezone-aware datetimes, earliest first.
+    """
+    tz = ZoneInfo(timezone or Config.SCHEDULING_TIMEZONE)
+    day_start = _parse_clock(day_start or Config.WORKDAY_START)
+    day_end = _parse_clock(day_end or Config.WORKDAY_END)
+    working_days = set(working_days)
+    holidays = set(holidays)
+
+    duration = duration_minutes * 60
+    align = max(align_minutes, 1) * 60
+    step = (step_minutes or duration_minutes) * 60
+    busy = merge_busy(busy_by_participant)
+    busy_ends = [end for _, end in busy]
+
+    slots = []
+    for day_from, day_to, midnight in _working_windows(
+            to_timestamp(window_start), to_timestamp(window_end), tz,
+            day_start, day_end, working_days, holidays):
+        # first busy interval that is still running at day_from
+        i = bisect.bisect_right(busy_ends, day_from)
+        cursor = day_from
+        while cursor < day_to and len(slots) < top_k:
+            gap_end = day_to
+            if i < len(busy) and busy[i][0] < day_to:
+                gap_end = max(min(busy[i][0], day_to), cursor)
+
+            start = midnight + math.ceil((cursor - midnight) / align) * align
+            while start + duration <= gap_end and len(slots) < top_k:
+                slots.append((start, start + duration))
+                start += step
+
+            if i >= len(busy) or busy[i][0] >= day_to:
+                break
+            cursor = max(cursor, busy[i][1])
+            i += 1
+        if len(slots) >= top_k:
+            break
+
+    return [(datetime.datetime.fromtimestamp(start, tz), datetime.datetime.fromtimestamp(end, tz))
+            for start, end in slots]
+
+
+'''
+how to use this?
+
+from utils.slot_finder import find_free_slots
+
+busy = {
+    "a@college.edu": [("2025-01-27T09:00:00Z", "2025-01-27T10:30:00Z")],
+    "b@college.edu": [("2025-01-27T11:00:00Z", "2025-01-27T12:00:00Z")],
+}
+slots = find_free_slots(busy, "2025-01-27T00:00:00Z", "2025-02-03T00:00:00Z",
+                        duration_minutes=60, top_k=3, timezone="UTC")
+# [(12:00-13:00), (13:00-14:00), (14:00-15:00)]  (Monday 27 Jan 2025; 10:30-11:00 is too short)
+
+# seedha participants ke naam se: conflict_detector.suggest_alternative_slots
+'''
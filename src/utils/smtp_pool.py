@@ -0,0 +1,214 @@
+"""
+SMTP connection pool.
+pehele har ek recipient ke liye naya SMTP_SSL connection banta tha,
+TLS handshake hota tha aur login hota tha. 40 logo ko invite = 40 handshakes.
+yea pool kuch authenticated sessions ko zinda rakhta hai, idle session ko
+NOOP se check karta hai aur drop hone par khud reconnect kar leta hai.
+"""
+
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from queue import LifoQueue, Empty
+
+from utils.config_loader import Config
+
+
+class SMTPPoolError(Exception):
+    """Raised when the pool cannot hand out a connection."""
+
+
+class SMTPConnectionPool:
+    """
+    Thread-safe pool of logged-in SMTP sessions.
+
+    Connections are created lazily up to `max_connections`. A connection that
+    sat idle longer than `keepalive_interval` seconds is probed with NOOP before
+    being reused, and one idle longer than `max_idle` is thrown away (Gmail
+    drops idle sessions after a few minutes anyway).
+    """
+
+    def __init__(self, host, port, username=None, password=None,
+                 use_ssl=True, starttls=False, max_connections=4,
+                 keepalive_interval=30, max_idle=240, timeout=30):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_ssl = use_ssl
+        self.starttls = starttls
+        self.max_connections = max_connections
+        self.keepalive_interval = keepalive_interval
+        self.max_idle = max_idle
+        self.timeout = timeout
+
+        self._idle = LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {"connects": 0, "reuses": 0, "dropped": 0, "sent": 0}
+
+    def _bump(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _connect(self):
+        if self.use_ssl:
+            server = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.starttls:
+                server.starttls()
+
+        try:
+            if self.username and self.password:
+                server.login(self.username, self.password)
+        except Exception:
+            self._discard(server)
+            raise
+
+        self._bump("connects")
+        return server
+
+    @staticmethod
+    def _is_alive(server):
+        try:
+            return server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def _discard(server):
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    def _acquire(self, timeout=None):
+        if self._closed:
+            raise SMTPPoolError("SMTP pool is closed")
+        if not self._slots.acquire(timeout=timeout):
+            raise SMTPPoolError("Timed out waiting for a free SMTP connection")
+
+        try:
+            while True:
+                try:
+                    server, last_used = self._idle.get_nowait()
+                except Empty:
+                    return self._connect()
+
+                idle_for = time.monotonic() - last_used
+                stale = idle_for > self.max_idle
+                if not stale and idle_for > self.keepalive_interval:
+                    stale = not self._is_alive(server)
+
+                if stale:
+                    self._bump("dropped")
+                    self._discard(server)
+                    continue
+
+                self._bump("reuses")
+                return server
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, server, healthy=True):
+        try:
+            if healthy and not self._closed:
+                self._idle.put((server, time.monotonic()))
+            else:
+                self._bump("dropped")
+                self._discard(server)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """
+        Borrows a logged-in session from the pool.
+
+        If the block raises a disconnect/socket error the session is not
+        returned to the pool, so the next borrower gets a fresh one.
+        """
+        server = self._acquire(timeout)
+        healthy = True
+        try:
+            yield server
+        except (smtplib.SMTPServerDisconnected, OSError):
+            healthy = False
+            raise
+        finally:
+            self._release(server, healthy)
+
+    def send_message(self, msg, retries=1):
+        """
+        Sends an EmailMessage over a pooled session.
+
+        A session that was dropped by the server between the keepalive check
+        and the send is replaced and the message retried `retries` times.
+
+        Returns:
+            dict: Refused recipients as returned by smtplib (empty on success).
+        """
+        attempt = 0
+        while True:
+            try:
+                with self.connection() as server:
+                    refused = server.send_message(msg)
+                self._bump("sent")
+                return refused
+            except smtplib.SMTPServerDisconnected:
+                if attempt >= retries:
+                    raise
+                attempt += 1
+
+    def close(self):
+        """Closes every idle session. Borrowed sessions are closed on release."""
+        self._closed = True
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except Empty:
+                break
+            self._discard(server)
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_smtp_pool():
+    """
+    Returns the process-wide pool for the configured sender account.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            Config.require("email")
+            _default_pool = SMTPConnectionPool(
+                Config.SMTP_HOST,
+                Config.SMTP_PORT,
+                username=Config.SENDER_EMAIL,
+                password=Config.SENDER_PASSWORD,
+                use_ssl=Config.SMTP_PORT == 465,
+                starttls=Config.SMTP_PORT == 587,
+                max_connections=Config.SMTP_POOL_SIZE,
+            )
+        return _default_pool
+
+
+'''
+how to use this?
+
+from utils.smtp_pool import get_smtp_pool
+
+pool = get_smtp_pool()
+pool.send_message(msg) # msg ek EmailMessage hai, connection reuse ho jayega
+
+# ya agar ek hee session pe bahut saare mails bhejne hai
+with pool.connection() as server:
+    for msg in messages:
+        server.send_message(msg)
+'''
@@ -0,0 +1,106 @@
+"""
+Email templates ka registry.
+pehele har ek recipient ke liye templates/email_*.html disk se padha jata tha
+aur naya jinja2.Template compile hota tha. ab ek hee jinja2.Environment hai jo
+compiled templates memory me rakhta hai (bytecode cache bhi), aur file ka
+mtime badle toh khud reload kar leta hai.
+
+registry pehli get_template / render_template pe banta hai (aur tabhi
+templates compile hote hai), import karne pe nahi.
+"""
+
+import threading
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateNotFound
+
+from utils.config_loader import Config
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+NOTIFICATION_TEMPLATES = {
+    "invite": "email_invite.html",
+    "update": "email_update.html",
+    "cancel": "email_cancel.html",
+}
+
+
+class TemplateRegistry:
+    """
+    Holds one jinja2.Environment for a templates directory.
+
+    Compiled templates stay in the environment cache; with auto_reload the
+    loader only stats the file to compare mtimes, it does not re-parse it.
+    """
+
+    def __init__(self, directory=TEMPLATES_DIR, bytecode_cache_dir=None):
+        self.directory = Path(directory)
+        bytecode_cache = None
+        if bytecode_cache_dir is not False:
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
+        self.environment = Environment(
+            loader=FileSystemLoader(str(self.directory)),
+            bytecode_cache=bytecode_cache,
+            auto_reload=True,
+            cache_size=-1,
+        )
+
+    def get_template(self, name):
+        """
+        Returns the compiled template `name` (a file name or a notification type).
+        Raises jinja2.TemplateNotFound if it does not exist.
+        """
+        return self.environment.get_template(NOTIFICATION_TEMPLATES.get(name, name))
+
+    def render(self, name, **context):
+        return self.get_template(name).render(**context)
+
+    def warm_up(self, names=None):
+        """
+        Compiles templates ahead of time so the first send does not pay for it.
+        Missing files are skipped.
+
+        Returns:
+            list: Names of the templates that were compiled.
+        """
+        compiled = []
+        for name in names or NOTIFICATION_TEMPLATES.values():
+            try:
+                self.get_template(name)
+                compiled.append(name)
+            except TemplateNotFound:
+                continue
+        return compiled
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    """The shared registry for templates/, compiled on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            registry = TemplateRegistry(bytecode_cache_dir=Config.TEMPLATE_CACHE_DIR)
+            registry.warm_up()
+            _registry = registry
+        return _registry
+
+
+def get_template(name):
+    return get_registry().get_template(name)
+
+
+def render_template(name, **context):
+    return get_registry().render(name, **context)
+
+
+'''
+how to use this?
+
+from utils.template_registry import render_template
+
+html = render_template("invite", title="Sync", time_str="3 PM", location="Meet", agenda="N/A")
+'''
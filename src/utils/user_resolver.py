@@ -4,56 +4,113 @@ user names extract krne me. tests/test_resolver.py
 me iska demo hai
 """
 
-from functools import lru_cache
-from thefuzz import process
-from utils.db_handler import get_all_faculty
+import threading
+from utils.roster_cache import faculty_cache
+
+_index = None
+_index_lock = threading.Lock()
 
-@lru_cache(maxsize=1)
 def get_cached_faculty():
     """
-    Fetches faculty data once and stores it in memory.
-    Useful for batch processing (e.g., resolving 5 participants at once).
-    
-    NOTE: In a long-running web server (FastAPI), you would use a 
-    Time-To-Live (TTL) cache instead so it refreshes periodically.
+    Returns the faculty roster from the TTL cache (utils/roster_cache.py).
+    Only the first call hits the database inline; after that a stale roster
+    is served while it refreshes in the background.
+    """
+    return faculty_cache.get()
+
+def _build_index(all_faculty, version):
+    global _index
+    # rapidfuzz / numpy / thefuzz load with the first index, not at import
+    from utils.resolver_index import ResolverIndex
+
+    index = ResolverIndex(all_faculty, version=version)
+    with _index_lock:
+        if _index is None or _index.version < version:
+            _index = index
+    return index
+
+def _patch_index(all_faculty, version, changes):
+    """
+    Applies a roster sync change set to the current index; falls back to a
+    full rebuild if the index is not exactly one version behind.
+    """
+    global _index
+    with _index_lock:
+        current = _index
+    index = None
+    if current is not None and current.version == version - 1:
+        index = current.apply_changes(changes, version)
+    if index is None:
+        return _build_index(all_faculty, version)
+    with _index_lock:
+        if _index is None or _index.version < version:
+            _index = index
+    return index
+
+# Rebuild (or patch) the index on the refresher thread, not inside a resolve call
+faculty_cache.add_listener(_build_index, on_patch=_patch_index)
+
+def get_faculty_index():
+    """
+    Returns the fuzzy-match index for the current cached roster version.
     """
-    return get_all_faculty()
+    all_faculty, version = faculty_cache.snapshot()
+
+    index = _index
+    if index is None or index.version != version:
+        index = _build_index(all_faculty, version)
+    return index
 
 def resolve_faculty_member(name_query, threshold=75):
     """
     Takes a name (e.g., "Sharma" or "Aniket") and finds the best match
-    using the cached faculty list.
+    using the cached faculty index.
     """
-    all_faculty = get_cached_faculty()
+    index = get_faculty_index()
     
-    if not all_faculty:
+    if not len(index):
         print("Warning: Database is empty.")
         return None
 
-    faculty_map = {person['name']: person for person in all_faculty}
-    names_list = list(faculty_map.keys())
-    match_result = process.extractOne(name_query, names_list)
-    
-    if match_result:
-        best_match_name, score = match_result
-        
-        if score >= threshold:
-            return faculty_map[best_match_name]
-        else:
-            print(f"❌ No strong match for '{name_query}' (Best: {best_match_name}, Score: {score})")
-            return None
-            
-    return None
+    person, best_match_name, score = index.best_match(name_query, threshold)
+
+    if person is None:
+        print(f"❌ No strong match for '{name_query}' (Best: {best_match_name}, Score: {score})")
+
+    return person
+
+def resolve_participants_batch(names_list, threshold=75, ambiguity_margin=5, exact=True):
+    """
+    Scores all names against the roster in one vectorized pass. exact=False
+    only scores blocked candidates on big rosters (see
+    ResolverIndex.best_matches); callers that invite people keep it exact.
+
+    Returns:
+        list: One dict per name (same order) with "match", "score",
+        "runner_up", "runner_up_score" and an "ambiguous" flag when someone
+        else scored within `ambiguity_margin` points. See
+        ResolverIndex.best_matches.
+    """
+    return get_faculty_index().best_matches(names_list, threshold, ambiguity_margin, exact=exact)
 
 def resolve_participants(names_list):
     """
     Wrapper to handle a list of names.
     """
+    if not len(get_faculty_index()):
+        print("Warning: Database is empty.")
+        return []
+
     resolved_users = []
-    for name in names_list:
-        user = resolve_faculty_member(name)
-        if user:
-            resolved_users.append(user)      
+    for result in resolve_participants_batch(names_list, exact=True):
+        if result["match"] is None:
+            print(f"❌ No strong match for '{result['query']}' (Best: {result['name']}, Score: {result['score']})")
+            continue
+
+        if result["ambiguous"]:
+            print(f"⚠️ '{result['query']}' is ambiguous: {result['name']} ({result['score']}) "
+                  f"vs {result['runner_up']} ({result['runner_up_score']})")
+        resolved_users.append(result["match"])
     return resolved_users
 
 '''
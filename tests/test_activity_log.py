@@ -0,0 +1,126 @@
+import sys
+import os
+import datetime
+import threading
+import unittest
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils import activity_log
+from utils.activity_log import ActivityLogWriter
+
+
+@contextmanager
+def fake_cursor(cursor):
+    yield cursor
+
+
+class RecordingWriter(ActivityLogWriter):
+    """Writer whose batches land in self.batches instead of Postgres."""
+
+    def __init__(self, fail_times=0, gate=None, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+        self.fail_times = fail_times
+        self.gate = gate
+
+    def _write(self, batch):
+        if self.gate is not None:
+            self.gate.wait()
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("database is down")
+        self.batches.append(list(batch))
+
+
+class TestActivityLogWriter(unittest.TestCase):
+
+    def test_events_are_written_in_batches(self):
+        writer = RecordingWriter(max_queue=1000, batch_size=100, flush_interval=5)
+        for i in range(250):
+            writer.log("meeting_created", f"evt{i}", "hod@college.edu", {"n": i})
+
+        self.assertTrue(writer.flush(timeout=5))
+        writer.close()
+
+        # exact split depends on how fast the writer keeps up; order and cap do not
+        self.assertTrue(all(len(b) <= 100 for b in writer.batches))
+        self.assertEqual([event[1] for b in writer.batches for event in b], [f"evt{i}" for i in range(250)])
+        first = writer.batches[0][0]
+        self.assertEqual(first[:4], ("meeting_created", "evt0", "hod@college.edu", '{"n": 0}'))
+        self.assertIsInstance(first[4], datetime.datetime)
+        self.assertEqual(writer.stats()["written"], 250)
+
+    def test_full_queue_drops_and_counts(self):
+        """
+        Scenario: The writer is stuck on a slow database and the queue
+        (capacity 5) fills up.
+        Expected: log() returns False right away instead of blocking the
+        caller, and the drops show up in stats().
+        """
+        gate = threading.Event()
+        writer = RecordingWriter(gate=gate, max_queue=5, batch_size=1, flush_interval=0.01)
+        results = [writer.log("meeting_cancelled", f"evt{i}") for i in range(20)]
+        gate.set()
+        writer.close()
+
+        stats = writer.stats()
+        self.assertIn(False, results)
+        self.assertEqual(stats["dropped"], results.count(False))
+        self.assertEqual(stats["enqueued"] + stats["dropped"], 20)
+        self.assertEqual(stats["max_queue_depth"], 5)
+        self.assertEqual(sum(len(b) for b in writer.batches), stats["enqueued"])
+
+    def test_failed_flush_is_retried(self):
+        writer = RecordingWriter(fail_times=2, max_queue=10, batch_size=10, flush_interval=0.01)
+        writer.log("meeting_rescheduled", "evt1")
+
+        self.assertTrue(writer.flush(timeout=5))
+        writer.close()
+
+        self.assertEqual([[event[1] for event in batch] for batch in writer.batches], [["evt1"]])
+        self.assertEqual(writer.stats()["flush_errors"], 2)
+        self.assertEqual(writer.stats()["dropped"], 0)
+
+    def test_close_flushes_what_is_buffered(self):
+        writer = RecordingWriter(max_queue=100, batch_size=50, flush_interval=60)
+        for i in range(3):
+            writer.log("meeting_created", f"evt{i}")
+        writer.close(timeout=5)
+
+        self.assertEqual(sum(len(b) for b in writer.batches), 3)
+
+
+class TestPartitions(unittest.TestCase):
+
+    def test_monthly_partition_bounds(self):
+        cursor = MagicMock()
+        activity_log.ensure_partitions(cursor, [datetime.datetime(2025, 12, 31, 23, 59),
+                                                datetime.date(2025, 12, 1)])
+
+        cursor.execute.assert_called_once()
+        sql, bounds = cursor.execute.call_args[0]
+        self.assertIn("activity_log_2025_12 PARTITION OF activity_log", sql)
+        self.assertEqual(bounds, (datetime.date(2025, 12, 1), datetime.date(2026, 1, 1)))
+
+    @patch('utils.activity_log.db_cursor')
+    def test_writer_copies_and_creates_missing_partition_once(self, mock_db_cursor):
+        cursor = MagicMock()
+        mock_db_cursor.side_effect = lambda commit=False: fake_cursor(cursor)
+        writer = ActivityLogWriter(max_queue=10, batch_size=10, flush_interval=60)
+        batch = [("meeting_created", "evt1", None, None, datetime.datetime(2025, 1, 27, 10))]
+
+        writer._write(batch)
+        writer._write(batch)
+
+        partition_calls = [c for c in cursor.execute.call_args_list if "PARTITION OF" in c[0][0]]
+        self.assertEqual(len(partition_calls), 1)
+        self.assertEqual(cursor.copy_expert.call_count, 2)
+        copied = cursor.copy_expert.call_args[0][1].getvalue()
+        self.assertEqual(copied.strip(), "meeting_created,evt1,,,2025-01-27 10:00:00")
+
+
+if __name__ == '__main__':
+    unittest.main()
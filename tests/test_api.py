@@ -0,0 +1,138 @@
+import sys
+import os
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from api import routes
+from utils.config_loader import Config
+
+
+class TestMeetingRoutes(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(routes.app)
+        self.client.__enter__()
+        self.addCleanup(self.client.__exit__, None, None, None)
+
+    @patch('api.routes.meeting_modifier.create_meetings')
+    def test_create_builds_the_calendar_event(self, mock_create):
+        mock_create.return_value = {"success": True, "created": 1, "failed": 0, "results": [
+            {"index": 0, "success": True, "meeting_id": "evt1", "html_link": "https://cal/evt1"}]}
+
+        response = self.client.post("/meetings", json={
+            "title": "Review", "start": "2025-01-28T10:00:00", "end": "2025-01-28T11:00:00",
+            "participants": ["sharma@college.edu"]})
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["meeting_id"], "evt1")
+        (events, scheduler), kwargs = mock_create.call_args
+        self.assertEqual(events[0]["start"], {"dateTime": "2025-01-28T10:00:00", "timeZone": "UTC"})
+        self.assertEqual(events[0]["attendees"], [{"email": "sharma@college.edu"}])
+        self.assertEqual(scheduler, Config.SENDER_EMAIL)
+        self.assertTrue(kwargs["check_conflicts"])
+
+    @patch('api.routes.meeting_modifier.reschedule_meeting_async', new_callable=AsyncMock)
+    @patch('api.routes.meeting_modifier.cancel_meeting_async', new_callable=AsyncMock)
+    def test_service_errors_become_status_codes(self, mock_cancel, mock_reschedule):
+        mock_cancel.return_value = {"success": False, "error": "Meeting not found or already deleted"}
+        mock_reschedule.return_value = {"success": False, "error": "New time conflicts with an existing meeting"}
+
+        self.assertEqual(self.client.delete("/meetings/evt1?notify=true").status_code, 404)
+        mock_cancel.assert_awaited_once_with("evt1", Config.SENDER_EMAIL, notify=True)
+
+        response = self.client.patch("/meetings/evt1", json={"start": "2025-01-29T10:00:00",
+                                                             "end": "2025-01-29T11:00:00"})
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["detail"], "New time conflicts with an existing meeting")
+
+        response = self.client.patch("/meetings/evt1", json={"start": "tomorrow", "end": "2025-01-29T11:00:00"})
+        self.assertEqual(response.status_code, 422)
+
+    @patch('api.routes.meeting_store.get_meeting_async')
+    def test_slow_call_times_out_per_request(self, mock_get):
+        """
+        Scenario: The client allows 0.1s (X-Request-Timeout) for a lookup
+        that takes 0.5s.
+        Expected: 504 for that request only, and its query is cancelled;
+        the next one without the header gets its result.
+        """
+        cancelled = []
+
+        async def slow_lookup(meeting_id):
+            try:
+                await asyncio.sleep(0.5)
+            except asyncio.CancelledError:
+                cancelled.append(meeting_id)
+                raise
+            return {"meeting_id": meeting_id}
+
+        mock_get.side_effect = slow_lookup
+
+        started = time.monotonic()
+        response = self.client.get("/meetings/evt1", headers={"X-Request-Timeout": "0.1"})
+        self.assertEqual(response.status_code, 504)
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.assertEqual(cancelled, ["evt1"])
+
+        response = self.client.get("/meetings/evt2")
+        self.assertEqual(response.json()["meeting"], {"meeting_id": "evt2"})
+        self.assertEqual(self.client.get("/health").json()["executor"]["timeouts"], 1)
+
+    @patch('api.routes.user_resolver.resolve_participants_batch')
+    def test_blocking_calls_run_concurrently(self, mock_resolve):
+        """
+        Scenario: Eight resolve requests each block their thread for 0.3s.
+        Expected: They overlap on the worker pool instead of running one
+        after another on the event loop.
+        """
+        mock_resolve.side_effect = lambda names, threshold, exact: time.sleep(0.3) or [{"query": names[0]}]
+        statuses = []
+
+        def call(i):
+            response = self.client.post("/resolve", json={"names": [f"name{i}"]})
+            statuses.append((response.status_code, response.json()["results"][0]["query"]))
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(sorted(statuses), [(200, f"name{i}") for i in range(8)])
+        self.assertTrue(mock_resolve.call_args.kwargs["exact"])
+        self.assertLess(time.monotonic() - started, 1.5)  # one after another would take 2.4s
+
+
+class TestAdmission(unittest.TestCase):
+
+    @patch.object(Config, "API_MAX_PENDING", 1)
+    @patch('api.routes.user_resolver.resolve_participants_batch')
+    def test_full_pool_refuses_with_503(self, mock_resolve):
+        release = threading.Event()
+        mock_resolve.side_effect = lambda names, threshold, exact: release.wait(5) and []
+
+        with TestClient(routes.app) as client:
+            first = threading.Thread(target=client.post, args=("/resolve",), kwargs={"json": {"names": ["a"]}})
+            first.start()
+            executor = routes.app.state.executor
+            while executor.stats()["pending"] == 0:
+                time.sleep(0.01)
+
+            response = client.post("/resolve", json={"names": ["b"]})
+            release.set()
+            first.join(5)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], "1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import sys
+import os
+import datetime
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiosmtplib
+import httpx
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from services import meeting_modifier, notification_dispatcher
+from utils import async_calendar
+from utils.async_calendar import AsyncCalendarClient, CalendarAPIError
+from utils.config_loader import Config
+
+
+def calendar_client(handler):
+    creds = MagicMock(valid=True, expiry=None, token="tok")
+    return AsyncCalendarClient(http=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                               credentials_factory=lambda: creds)
+
+
+@patch.object(async_calendar, "RETRY_DELAY", 0)
+class TestAsyncCalendarClient(unittest.IsolatedAsyncioTestCase):
+
+    async def test_retries_server_errors_then_returns_the_resource(self):
+        """
+        Scenario: The first patch answers 503, the second succeeds.
+        Expected: One retry, the event JSON comes back, and every call
+        carries the bearer token.
+        """
+        seen = []
+
+        def handler(request):
+            seen.append((request.method, request.url.path, request.headers["Authorization"]))
+            if len(seen) == 1:
+                return httpx.Response(503, json={"error": {"message": "Backend Error"}})
+            return httpx.Response(200, json={"id": "evt1", "status": "confirmed"})
+
+        calendar = calendar_client(handler)
+        event = await calendar.patch_event("primary", "evt1", {"summary": "x"})
+
+        self.assertEqual(event["id"], "evt1")
+        self.assertEqual(seen, [("PATCH", "/calendar/v3/calendars/primary/events/evt1", "Bearer tok")] * 2)
+        self.assertEqual(calendar.stats["retries"], 1)
+        await calendar.aclose()
+
+    async def test_client_errors_raise_with_status(self):
+        calendar = calendar_client(lambda request: httpx.Response(404, json={
+            "error": {"message": "Not Found", "errors": [{"reason": "notFound"}]}}))
+
+        with self.assertRaises(CalendarAPIError) as raised:
+            await calendar.delete_event("primary", "evt1")
+
+        self.assertEqual(raised.exception.status, 404)
+        self.assertEqual(raised.exception.reason, "notFound")
+        self.assertEqual(calendar.stats["calls"], 1)  # 404 is not retried
+        await calendar.aclose()
+
+
+@patch('services.meeting_modifier.log_activity')
+@patch('services.meeting_modifier.get_synced_store', return_value=None)
+class TestMeetingModifierAsync(unittest.IsolatedAsyncioTestCase):
+
+    @patch('services.meeting_modifier.enqueue_meeting_notification_async', new_callable=AsyncMock)
+    @patch('services.meeting_modifier.meeting_store')
+    @patch('services.meeting_modifier._new_time_conflicts', return_value=False)
+    @patch('services.meeting_modifier.get_async_calendar')
+    async def test_reschedule_patches_mirrors_and_notifies(self, mock_calendar, mock_conflicts, mock_store,
+                                                           mock_enqueue, mock_synced, mock_log):
+        calendar = mock_calendar.return_value = AsyncMock()
+        calendar.patch_event.return_value = {
+            "id": "evt1",
+            "start": {"dateTime": "2025-01-29T10:00:00Z"},
+            "end": {"dateTime": "2025-01-29T11:00:00Z"},
+        }
+        mock_store.reschedule_meetings_async = AsyncMock()
+        mock_store.get_meeting_async = AsyncMock(return_value={
+            "meeting_id": "evt1", "title": "Budget review",
+            "start_time": datetime.datetime(2025, 1, 29, 10), "end_time": datetime.datetime(2025, 1, 29, 11),
+            "organizer_email": "hod@college.edu", "meet_link": None, "sequence": 3,
+            "participants": [{"name": "Dr. Sharma", "email": "sharma@college.edu"}]})
+        mock_enqueue.return_value = 7
+
+        result = await meeting_modifier.reschedule_meeting_async(
+            "evt1", "2025-01-29T10:00:00", "2025-01-29T11:00:00", "hod@college.edu", notify=True)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["notification_job"], 7)
+        calendar.patch_event.assert_awaited_once_with("primary", "evt1", {
+            "start": {"dateTime": "2025-01-29T10:00:00", "timeZone": "UTC"},
+            "end": {"dateTime": "2025-01-29T11:00:00", "timeZone": "UTC"},
+        })
+        mock_store.reschedule_meetings_async.assert_awaited_once_with(
+            [("evt1", "2025-01-29T10:00:00Z", "2025-01-29T11:00:00Z")])
+        recipients, notification_type, _, ics = mock_enqueue.call_args.args
+        self.assertEqual((recipients, notification_type), ([{"email": "sharma@college.edu", "name": "Dr. Sharma"}], "update"))
+        self.assertIn(b"SEQUENCE:3", ics)
+
+    @patch('services.meeting_modifier.meeting_store')
+    @patch('services.meeting_modifier.get_async_calendar')
+    async def test_cancel_of_a_deleted_event_drops_the_mirror_row(self, mock_calendar, mock_store,
+                                                                   mock_synced, mock_log):
+        calendar = mock_calendar.return_value = AsyncMock()
+        calendar.delete_event.side_effect = CalendarAPIError(410, "Resource has been deleted")
+        mock_store.delete_meetings_async = AsyncMock()
+
+        result = await meeting_modifier.cancel_meeting_async("evt1", "hod@college.edu")
+
+        self.assertEqual(result, {"success": False, "error": "Meeting not found or already deleted"})
+        mock_store.delete_meetings_async.assert_awaited_once_with(["evt1"])
+
+
+class FakeSMTPPool:
+    def __init__(self, refuse=(), reject=()):
+        self.refuse = refuse
+        # accepted by the server, but the recipient comes back as refused
+        self.reject = reject
+        self.sent = []
+
+    async def send_message(self, msg):
+        if msg["To"] in self.refuse:
+            raise aiosmtplib.SMTPRecipientsRefused([])
+        if msg["To"] in self.reject:
+            return {msg["To"]: aiosmtplib.SMTPResponse(550, "No such user")}
+        self.sent.append(msg["To"])
+        return {}
+
+
+@patch.object(Config, "SENDER_EMAIL", "sam@college.edu")
+@patch.object(Config, "SENDER_PASSWORD", "secret")
+class TestBulkNotificationsAsync(unittest.IsolatedAsyncioTestCase):
+
+    @patch('utils.async_smtp.get_async_smtp_pool')
+    async def test_sends_everyone_and_reports_refusals(self, mock_pool):
+        pool = mock_pool.return_value = FakeSMTPPool(refuse={"bad@college.edu"})
+        recipients = ["a@college.edu", "bad@college.edu", "b@college.edu"]
+
+        result = await notification_dispatcher.send_meeting_notifications_bulk_async(
+            recipients, "invite", {"title": "Review", "time_str": "10:00", "location": "Room 1",
+                                   "agenda": "", "organizer": "HOD", "link": ""})
+
+        self.assertEqual((result["sent"], result["failed"]), (2, 1))
+        self.assertEqual(sorted(pool.sent), ["a@college.edu", "b@college.edu"])
+        self.assertEqual([r["success"] for r in result["results"]], [True, False, True])
+
+    @patch('utils.async_smtp.get_async_smtp_pool')
+    async def test_recipient_refused_after_accept_is_a_failure(self, mock_pool):
+        mock_pool.return_value = FakeSMTPPool(reject={"bad@college.edu"})
+
+        result = await notification_dispatcher.send_meeting_notifications_bulk_async(
+            ["a@college.edu", "bad@college.edu"], "invite", {"title": "Review"})
+
+        self.assertEqual((result["sent"], result["failed"]), (1, 1))
+        self.assertEqual(result["results"][1]["error"], "Recipient refused: 550 No such user")
+
+
+if __name__ == '__main__':
+    unittest.main()
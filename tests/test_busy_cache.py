@@ -0,0 +1,193 @@
+import sys
+import os
+import random
+import unittest
+from unittest.mock import MagicMock, patch
+
+from googleapiclient.errors import HttpError
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.busy_cache import BusyStore, IntervalTree, to_timestamp
+from services import meeting_modifier
+
+
+def event(event_id, start, end, **extra):
+    return {"id": event_id, "status": "confirmed",
+            "start": {"dateTime": start}, "end": {"dateTime": end}, **extra}
+
+
+def calendar_service(pages_by_call):
+    """
+    Mock service; each events().list(...).execute() returns the next item
+    of pages_by_call (a dict page, or an exception to raise).
+    """
+    service = MagicMock()
+    calls = []
+    responses = iter(pages_by_call)
+
+    def list_events(**params):
+        calls.append(params)
+        request = MagicMock()
+        response = next(responses)
+        if isinstance(response, Exception):
+            request.execute.side_effect = response
+        else:
+            request.execute.return_value = response
+        return request
+
+    service.events.return_value.list.side_effect = list_events
+    return service, calls
+
+
+class TestIntervalTree(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+        rng = random.Random(4)
+        intervals = []
+        for i in range(500):
+            start = rng.uniform(0, 10000)
+            intervals.append((start, start + rng.choice([5, 30, 60, 600]), i))
+        tree = IntervalTree(intervals)
+
+        for _ in range(300):
+            start = rng.uniform(0, 10000)
+            end = start + rng.choice([1, 30, 120])
+            expected = sorted(i for i in intervals if i[0] < end and i[1] > start)
+            self.assertEqual(tree.overlapping(start, end), expected)
+            self.assertEqual(tree.overlaps(start, end), bool(expected))
+
+    def test_touching_intervals_do_not_overlap(self):
+        tree = IntervalTree([(10, 20, "a")])
+        self.assertFalse(tree.overlaps(20, 30))
+        self.assertFalse(tree.overlaps(0, 10))
+        self.assertTrue(tree.overlaps(19, 21))
+
+
+class TestBusyStore(unittest.TestCase):
+
+    def test_full_then_incremental_sync(self):
+        """
+        Scenario: Initial list returns two pages; a later incremental sync
+        reports one cancelled and one moved event.
+        Expected: The second request uses the sync token (no time range)
+        and queries reflect the changes without another full list.
+        """
+        service, calls = calendar_service([
+            {"items": [event("standup", "2025-01-27T09:00:00Z", "2025-01-27T09:15:00Z")],
+             "nextPageToken": "p2", "timeZone": "Asia/Kolkata"},
+            {"items": [event("review", "2025-01-27T15:00:00Z", "2025-01-27T16:00:00Z")],
+             "nextSyncToken": "sync-1"},
+            {"items": [{"id": "standup", "status": "cancelled"},
+                       event("review", "2025-01-27T17:00:00Z", "2025-01-27T18:00:00Z")],
+             "nextSyncToken": "sync-2"},
+        ])
+        store = BusyStore("primary", max_staleness=3600, service_factory=lambda: service)
+
+        store.sync()
+        self.assertTrue(store.is_busy("2025-01-27T09:00:00", "2025-01-27T09:30:00"))
+        self.assertTrue(store.is_busy("2025-01-27T15:30:00Z", "2025-01-27T15:45:00Z"))
+
+        store.sync()
+        self.assertEqual(calls[2]["syncToken"], "sync-1")
+        self.assertNotIn("timeMin", calls[2])
+        self.assertFalse(store.is_busy("2025-01-27T09:00:00", "2025-01-27T09:30:00"))
+        self.assertFalse(store.is_busy("2025-01-27T15:00:00", "2025-01-27T16:00:00"))
+        self.assertTrue(store.is_busy("2025-01-27T17:30:00", "2025-01-27T19:00:00"))
+
+        stats = store.stats()
+        self.assertEqual((stats["full_syncs"], stats["incremental_syncs"]), (1, 1))
+
+    def test_free_declined_and_all_day_events(self):
+        service, _ = calendar_service([{
+            "items": [
+                event("focus", "2025-01-27T10:00:00Z", "2025-01-27T11:00:00Z", transparency="transparent"),
+                event("skip", "2025-01-27T12:00:00Z", "2025-01-27T13:00:00Z",
+                      attendees=[{"email": "me@college.edu", "self": True, "responseStatus": "declined"}]),
+                {"id": "holiday", "status": "confirmed",
+                 "start": {"date": "2025-01-28"}, "end": {"date": "2025-01-29"}},
+            ],
+            "nextSyncToken": "sync-1",
+            "timeZone": "Asia/Kolkata",
+        }])
+        store = BusyStore("primary", service_factory=lambda: service)
+        store.sync()
+
+        self.assertFalse(store.is_busy("2025-01-27T10:00:00Z", "2025-01-27T13:00:00Z"))
+        # 2025-01-28 00:00 IST is 2025-01-27 18:30 UTC
+        self.assertTrue(store.is_busy("2025-01-27T18:45:00Z", "2025-01-27T19:00:00Z"))
+        self.assertFalse(store.is_busy("2025-01-27T18:00:00Z", "2025-01-27T18:30:00Z"))
+
+    def test_expired_sync_token_triggers_full_resync(self):
+        gone = HttpError(MagicMock(status=410), b"Sync token is no longer valid")
+        service, calls = calendar_service([
+            {"items": [event("a", "2025-01-27T09:00:00Z", "2025-01-27T10:00:00Z")], "nextSyncToken": "s1"},
+            gone,
+            {"items": [event("b", "2025-01-27T11:00:00Z", "2025-01-27T12:00:00Z")], "nextSyncToken": "s2"},
+        ])
+        store = BusyStore("primary", service_factory=lambda: service)
+        store.sync()
+        store.sync()
+
+        self.assertNotIn("syncToken", calls[2])
+        self.assertFalse(store.is_busy("2025-01-27T09:00:00Z", "2025-01-27T10:00:00Z"))
+        self.assertTrue(store.is_busy("2025-01-27T11:00:00Z", "2025-01-27T12:00:00Z"))
+
+    def test_queries_do_not_call_the_api_while_fresh(self):
+        service, calls = calendar_service([
+            {"items": [event("a", "2025-01-27T09:00:00Z", "2025-01-27T10:00:00Z")], "nextSyncToken": "s1"},
+        ])
+        store = BusyStore("primary", max_staleness=3600, service_factory=lambda: service)
+
+        for _ in range(100):
+            store.is_busy("2025-01-27T09:30:00Z", "2025-01-27T09:45:00Z")
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(store.stats()["queries"], 100)
+
+
+class TestRescheduleUsesBusyCache(unittest.TestCase):
+
+    @patch('services.meeting_modifier.get_calendar_service')
+    @patch('services.meeting_modifier.get_busy_store')
+    def test_meeting_does_not_conflict_with_itself(self, mock_get_store, mock_get_service):
+        """
+        Scenario: A meeting at 15:00-16:00 is moved 30 minutes later.
+        Expected: Its own old slot is ignored, the patch goes through and
+        the cache sees the new time immediately.
+        """
+        service, _ = calendar_service([
+            {"items": [event("m1", "2025-01-27T15:00:00Z", "2025-01-27T16:00:00Z")], "nextSyncToken": "s1"},
+        ])
+        store = BusyStore("primary", max_staleness=3600, service_factory=lambda: service)
+        store.sync()
+        mock_get_store.return_value = store
+
+        api = MagicMock()
+        mock_get_service.return_value = api
+        api.events.return_value.get.return_value.execute.return_value = \
+            event("m1", "2025-01-27T15:00:00Z", "2025-01-27T16:00:00Z")
+        api.events.return_value.patch.return_value.execute.side_effect = \
+            lambda: event("m1", "2025-01-27T15:30:00", "2025-01-27T16:30:00")
+
+        with patch('services.meeting_modifier.get_synced_store', return_value=store), \
+                patch('services.meeting_modifier.meeting_store'), \
+                patch('services.meeting_modifier.log_activity'):
+            result = meeting_modifier.reschedule_meeting(
+                "m1", "2025-01-27T15:30:00", "2025-01-27T16:30:00", "me@college.edu"
+            )
+
+        self.assertTrue(result["success"], result)
+        self.assertEqual(store.busy_intervals("2025-01-27T16:15:00", "2025-01-27T16:20:00")[0][2], "m1")
+        self.assertFalse(store.is_busy("2025-01-27T15:00:00", "2025-01-27T15:30:00"))
+
+
+class TestTimestamps(unittest.TestCase):
+
+    def test_naive_means_utc(self):
+        self.assertEqual(to_timestamp("2025-01-27T15:00:00"), to_timestamp("2025-01-27T15:00:00Z"))
+        self.assertEqual(to_timestamp("2025-01-27T20:30:00+05:30"), to_timestamp("2025-01-27T15:00:00Z"))
+
+
+if __name__ == '__main__':
+    unittest.main()
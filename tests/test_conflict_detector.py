@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import patch, MagicMock
-from src.utils.conflict_detector import check_scheduler_conflict
+from src.utils.conflict_detector import check_scheduler_conflict, check_participants_conflicts
 
 class TestConflictDetector(unittest.TestCase):
 
@@ -84,5 +84,101 @@ class TestConflictDetector(unittest.TestCase):
 
         self.assertTrue(result, "Should return True (fail-safe) on API exception")
 
+
+def freebusy_service(busy_by_email, errors_by_email=None, fail_chunk_with=None):
+    """
+    Mock service whose freebusy().query(body=...) answers for exactly the
+    calendars in the request body, the way the real API does.
+    """
+    errors_by_email = errors_by_email or {}
+    service = MagicMock()
+    bodies = []
+
+    def query(body):
+        bodies.append(body)
+        ids = [item["id"] for item in body["items"]]
+        request = MagicMock()
+        if fail_chunk_with and fail_chunk_with in ids:
+            request.execute.side_effect = Exception("Rate Limit Exceeded")
+            return request
+        calendars = {}
+        for email in ids:
+            if email in errors_by_email:
+                calendars[email] = {"errors": [{"domain": "global", "reason": errors_by_email[email]}],
+                                    "busy": []}
+            else:
+                calendars[email] = {"busy": busy_by_email.get(email, [])}
+        request.execute.return_value = {"calendars": calendars}
+        return request
+
+    service.freebusy.return_value.query.side_effect = query
+    return service, bodies
+
+
+class TestParticipantsConflicts(unittest.TestCase):
+
+    @patch('src.utils.conflict_detector.get_calendar_service')
+    def test_per_participant_conflicts_in_one_call(self, mock_get_service):
+        """
+        Scenario: 3 participants; one has two overlapping events in the slot,
+        one has an event that ends exactly when the slot starts.
+        Expected: One freebusy request; only the first person conflicts and
+        their intervals come back merged.
+        """
+        service, bodies = freebusy_service({
+            "a@college.edu": [{"start": "2025-01-27T15:00:00Z", "end": "2025-01-27T15:30:00Z"},
+                              {"start": "2025-01-27T15:15:00Z", "end": "2025-01-27T15:45:00Z"}],
+            "b@college.edu": [{"start": "2025-01-27T14:00:00Z", "end": "2025-01-27T15:00:00Z"}],
+        })
+        mock_get_service.return_value = service
+
+        result = check_participants_conflicts(
+            ["a@college.edu", "b@college.edu", "c@college.edu"],
+            "2025-01-27T15:00:00", "2025-01-27T16:00:00"
+        )
+
+        self.assertEqual(len(bodies), 1)
+        self.assertEqual(bodies[0]["timeMin"], "2025-01-27T15:00:00Z")
+        self.assertTrue(result["success"])
+        self.assertEqual(result["conflicts"], ["a@college.edu"])
+        intervals = result["participants"]["a@college.edu"]["intervals"]
+        self.assertEqual([(s.isoformat(), e.isoformat()) for s, e in intervals],
+                         [("2025-01-27T15:00:00+00:00", "2025-01-27T15:45:00+00:00")])
+        self.assertFalse(result["participants"]["b@college.edu"]["busy"])
+
+    @patch('src.utils.conflict_detector.get_calendar_service')
+    def test_large_meeting_is_split_into_api_sized_requests(self, mock_get_service):
+        emails = [f"user{i}@college.edu" for i in range(120)]
+        service, bodies = freebusy_service({
+            "user99@college.edu": [{"start": "2025-01-27T15:30:00Z", "end": "2025-01-27T16:30:00Z"}],
+        })
+        mock_get_service.return_value = service
+
+        result = check_participants_conflicts(emails, "2025-01-27T15:00:00Z", "2025-01-27T16:00:00Z")
+
+        self.assertEqual(sorted(len(b["items"]) for b in bodies), [20, 50, 50])
+        self.assertEqual(len(result["participants"]), 120)
+        self.assertEqual(result["conflicts"], ["user99@college.edu"])
+
+    @patch('src.utils.conflict_detector.get_calendar_service')
+    def test_unreadable_calendars_count_as_busy(self, mock_get_service):
+        """
+        Scenario: One calendar is not shared with us and one whole request fails.
+        Expected: Fail-safe: those participants are busy with an error, the
+        rest are still checked.
+        """
+        emails = [f"user{i}@college.edu" for i in range(60)]
+        service, _ = freebusy_service({}, errors_by_email={"user3@college.edu": "notFound"},
+                                      fail_chunk_with="user55@college.edu")
+        mock_get_service.return_value = service
+
+        result = check_participants_conflicts(emails, "2025-01-27T15:00:00", "2025-01-27T16:00:00")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["participants"]["user3@college.edu"]["error"], "notFound")
+        self.assertEqual(result["participants"]["user55@college.edu"]["error"], "Rate Limit Exceeded")
+        self.assertEqual(len(result["conflicts"]), 1 + 10)
+        self.assertFalse(result["participants"]["user4@college.edu"]["busy"])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,149 @@
+import sys
+import os
+import io
+import tempfile
+import threading
+import time
+import unittest
+
+import click
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from services import daemon as sam_daemon
+from services.daemon import SamDaemon, forward, ping
+from utils.pipeline import Pipeline, Stage
+
+
+class Stream:
+    """Stand-in for the client's sys.stdout / sys.stderr."""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def flush(self):
+        pass
+
+    def text(self):
+        return self.buffer.getvalue().decode("utf-8")
+
+
+@click.group()
+def app():
+    pass
+
+
+@app.command()
+@click.argument("name")
+def hello(name):
+    click.echo(f"hello {name}")
+    print("from print", file=sys.stderr)
+
+
+@app.command()
+def fail():
+    raise click.ClickException("Meeting evt1 not found")
+
+
+@app.command()
+@click.argument("seconds", type=float)
+@click.argument("tag")
+def slow(seconds, tag):
+    threading.Event().wait(seconds)
+    click.echo(tag)
+
+
+@app.command()
+@click.argument("tag")
+def staged(tag):
+    Pipeline([Stage(name, lambda name=name: print(f"{tag}:{name}")) for name in "ab"]).run()
+
+
+@app.command()
+@click.pass_context
+def where(ctx):
+    click.echo(ctx.obj["cwd"])
+
+
+class TestSamDaemon(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.socket_path = os.path.join(self.tmp.name, "sam.sock")
+        self.daemon = SamDaemon(self.socket_path, workers=4, app=app)
+        self.daemon.start()
+        thread = self.daemon.serve_in_background()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(self.daemon.shutdown)
+
+    def run_command(self, *argv):
+        out, err = Stream(), Stream()
+        exit_code = forward(list(argv), self.socket_path, stdout=out, stderr=err)
+        return exit_code, out.text(), err.text()
+
+    def test_command_output_and_exit_code_come_back(self):
+        self.assertEqual(self.run_command("hello", "sam"), (0, "hello sam\n", "from print\n"))
+
+        exit_code, out, err = self.run_command("fail")
+        self.assertEqual((exit_code, out), (1, ""))
+        self.assertIn("Meeting evt1 not found", err)
+
+        exit_code, _, err = self.run_command("nope")
+        self.assertEqual(exit_code, 2)
+        self.assertIn("No such command", err)
+
+    def test_concurrent_commands_keep_their_own_output(self):
+        """
+        Scenario: Four commands run at once on the daemon's worker threads.
+        Expected: Each client gets exactly its own output, and the commands
+        overlap instead of queueing behind each other.
+        """
+        results = {}
+
+        def run(tag):
+            results[tag] = self.run_command("slow", "0.3", tag)
+
+        threads = [threading.Thread(target=run, args=(f"t{i}",)) for i in range(4)]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(results, {f"t{i}": (0, f"t{i}\n", "") for i in range(4)})
+        self.assertLess(time.monotonic() - started, 1.0)  # one after another would take 1.2s
+        self.assertEqual(ping(self.socket_path)["requests"], 4)
+
+    def test_pipeline_stage_output_goes_to_its_request(self):
+        """
+        Scenario: A command prints from Pipeline stage threads.
+        Expected: The prints reach that command's client, not the daemon's
+        console or another request.
+        """
+        _, out, _ = self.run_command("staged", "r1")
+        self.assertEqual(sorted(out.split()), ["r1:a", "r1:b"])
+        self.assertEqual(self.run_command("staged", "r2")[1].count("r1"), 0)
+
+    def test_caller_directory_is_passed(self):
+        self.assertEqual(self.run_command("where")[1], os.getcwd() + "\n")
+
+    def test_second_daemon_on_the_same_socket_is_refused(self):
+        with self.assertRaises(RuntimeError):
+            SamDaemon(self.socket_path, workers=1, app=app).start()
+
+
+class TestClientFallback(unittest.TestCase):
+
+    def test_no_daemon_means_run_in_process(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(forward(["list"], os.path.join(tmp, "missing.sock")))
+
+    def test_long_running_commands_are_never_forwarded(self):
+        self.assertTrue(sam_daemon.is_local_command(["outbox", "work", "--workers", "2"]))
+        self.assertTrue(sam_daemon.is_local_command(["serve"]))
+        self.assertFalse(sam_daemon.is_local_command(["outbox", "status"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
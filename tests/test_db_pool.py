@@ -0,0 +1,104 @@
+import sys
+import os
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.db_pool import DatabasePool, PoolTimeoutError
+
+
+def fake_connection():
+    conn = MagicMock()
+    conn.closed = 0
+    return conn
+
+
+class TestDatabasePool(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch('psycopg2.pool.ThreadedConnectionPool')
+        self.pool_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.backend = self.pool_cls.return_value
+        self.backend.getconn.side_effect = lambda: fake_connection()
+
+    def test_pool_is_created_once_with_statement_timeout(self):
+        pool = DatabasePool("postgresql://db", minconn=1, maxconn=3, statement_timeout_ms=2500)
+
+        with pool.cursor():
+            pass
+        with pool.cursor():
+            pass
+
+        self.pool_cls.assert_called_once()
+        self.assertEqual(self.pool_cls.call_args.kwargs["options"], "-c statement_timeout=2500")
+        self.assertEqual(pool.stats()["checkouts"], 2)
+        self.assertEqual(pool.stats()["in_use"], 0)
+
+    def test_cursor_commits_on_success_and_rolls_back_on_error(self):
+        pool = DatabasePool("postgresql://db")
+
+        with pool.cursor(commit=True):
+            pass
+        committed = self.backend.putconn.call_args.args[0]
+        committed.commit.assert_called_once()
+
+        with self.assertRaises(ValueError):
+            with pool.cursor(commit=True):
+                raise ValueError("bad row")
+        failed = self.backend.putconn.call_args.args[0]
+        failed.commit.assert_not_called()
+        failed.rollback.assert_called_once()
+
+    def test_full_pool_waits_then_times_out(self):
+        """
+        Scenario: Every connection is checked out.
+        Expected: The next caller waits for the timeout (instead of failing
+        at once) and the wait shows up in the saturation stats.
+        """
+        pool = DatabasePool("postgresql://db", maxconn=1, checkout_timeout=0.05)
+        held = pool.getconn()
+
+        with self.assertRaises(PoolTimeoutError):
+            pool.getconn()
+
+        stats = pool.stats()
+        self.assertEqual((stats["waits"], stats["timeouts"], stats["in_use"]), (1, 1, 1))
+
+        pool.putconn(held)
+        self.assertEqual(pool.stats()["in_use"], 0)
+
+    def test_waiting_caller_gets_released_connection(self):
+        pool = DatabasePool("postgresql://db", maxconn=1, checkout_timeout=5)
+        held = pool.getconn()
+        got = []
+
+        waiter = threading.Thread(target=lambda: got.append(pool.getconn()))
+        waiter.start()
+        pool.putconn(held)
+        waiter.join(5)
+
+        self.assertEqual(len(got), 1)
+        self.assertEqual(pool.stats()["max_in_use"], 1)
+
+    def test_dead_idle_connection_is_replaced(self):
+        pool = DatabasePool("postgresql://db", ping_after=0)
+        first = pool.getconn()
+        pool.putconn(first)
+
+        ping = first.cursor.return_value.__enter__.return_value
+        ping.execute.side_effect = psycopg2.OperationalError("server closed the connection")
+        replacement = fake_connection()
+        self.backend.getconn.side_effect = [first, replacement]
+
+        self.assertIs(pool.getconn(), replacement)
+        self.backend.putconn.assert_called_with(first, close=True)
+        self.assertEqual(pool.stats()["discarded"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
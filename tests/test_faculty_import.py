@@ -0,0 +1,136 @@
+import sys
+import os
+import csv
+import io
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.faculty_import import _CopyStream, bulk_upsert_faculty, clean_row, row_hash, sync_faculty
+
+
+def row(name="Ayush Kumar", email="ayush@college.edu", phone="9301629038",
+        department="CSE", role="teacher"):
+    return {"name": name, "email": email, "phone": phone,
+            "department": department, "role": role}
+
+
+class TestCleanRow(unittest.TestCase):
+
+    def test_valid_row_is_stripped(self):
+        values, reason = clean_row(row(name="  Ayush Kumar ", phone=""))
+        self.assertIsNone(reason)
+        self.assertEqual(values, ("Ayush Kumar", "ayush@college.edu", None, "CSE", "teacher"))
+
+    def test_bad_rows_are_rejected_with_reason(self):
+        self.assertEqual(clean_row(row(name=""))[1], "empty name")
+        self.assertEqual(clean_row(row(email="not-an-email"))[1], "invalid email")
+        self.assertEqual(clean_row(row(phone="9" * 21))[1], "phone longer than 20 characters")
+
+    def test_row_hash_treats_missing_and_empty_alike(self):
+        """
+        faculty.row_hash (generated column) uses COALESCE(col, ''), so a
+        NULL phone and an empty one must hash the same here too.
+        """
+        values, _ = clean_row(row(phone=""))
+        self.assertEqual(row_hash(values), row_hash(values[:2] + ("",) + values[3:]))
+        self.assertNotEqual(row_hash(values), row_hash(clean_row(row(role="hod"))[0]))
+
+
+class TestCopyStream(unittest.TestCase):
+
+    def test_streams_valid_rows_in_small_chunks(self):
+        """
+        Scenario: copy_expert reads the stream in 64 byte chunks.
+        Expected: Reassembled output is every valid row as CSV; the bad
+        row is counted and reported with its line number.
+        """
+        rows = [(i + 2, row(email=f"user{i}@college.edu")) for i in range(20)]
+        rows.insert(5, (99, row(email="broken")))
+        report = {"rejected": 0, "rejected_rows": [], "staged": 0}
+        stream = _CopyStream(iter(rows), report)
+
+        chunks = []
+        while True:
+            chunk = stream.read(64)
+            if not chunk:
+                break
+            self.assertLessEqual(len(chunk), 64)
+            chunks.append(chunk)
+
+        parsed = list(csv.reader(io.StringIO("".join(chunks))))
+        self.assertEqual(len(parsed), 20)
+        self.assertEqual(parsed[0][:3], ["2", "Ayush Kumar", "user0@college.edu"])
+        self.assertEqual(report["staged"], 20)
+        self.assertEqual(report["rejected_rows"], [{"line": 99, "reason": "invalid email"}])
+
+
+class TestBulkUpsert(unittest.TestCase):
+
+    @patch('utils.faculty_import._notify_faculty_change')
+    @patch('utils.faculty_import.db_cursor')
+    def test_report_counts(self, mock_db_cursor, mock_notify):
+        cur = MagicMock()
+        mock_db_cursor.return_value.__enter__.return_value = cur
+        cur.copy_expert.side_effect = lambda sql, stream: stream.read(1 << 20)
+        # 3 unique emails staged; 1 inserted, 1 updated, 1 unchanged
+        cur.fetchone.return_value = {"emails": 3}
+        cur.fetchall.return_value = [{"inserted": True}, {"inserted": False}]
+
+        rows = [(2, row(email="a@x.edu")), (3, row(email="b@x.edu")),
+                (4, row(email="c@x.edu")), (5, row(email="a@x.edu")), (6, row(name=""))]
+        report = bulk_upsert_faculty(rows)
+
+        self.assertTrue(report["success"])
+        self.assertEqual(
+            {k: report[k] for k in ("inserted", "updated", "unchanged", "duplicates", "rejected")},
+            {"inserted": 1, "updated": 1, "unchanged": 1, "duplicates": 1, "rejected": 1},
+        )
+        mock_db_cursor.assert_called_once_with(commit=True)
+        mock_notify.assert_called_once()
+
+
+class TestSyncFaculty(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch('utils.faculty_import.db_cursor')
+        self.mock_db_cursor = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cur = MagicMock()
+        self.mock_db_cursor.return_value.__enter__.return_value = self.cur
+        self.cur.copy_expert.side_effect = lambda sql, stream: stream.read(1 << 20)
+        self.cur.rowcount = 2
+
+    @patch('utils.faculty_import._notify_faculty_change')
+    def test_change_set_is_broadcast(self, mock_notify):
+        self.cur.fetchone.return_value = {"missing": 1, "active": 10}
+        updated = [{"id": 1, "name": "Ayush Kumar"}]
+        deactivated = [{"id": 7, "name": "Old Faculty"}]
+        self.cur.fetchall.side_effect = [updated, [], deactivated]
+
+        report = sync_faculty([(2, row(email="a@x.edu")), (3, row(email="b@x.edu"))])
+
+        self.assertTrue(report["success"])
+        self.assertEqual((report["updated"], report["inserted"], report["deactivated"],
+                          report["unchanged"]), (1, 0, 1, 1))
+        mock_notify.assert_called_once_with(report["changes"])
+        self.assertEqual(report["changes"]["deactivated"], deactivated)
+
+    @patch('utils.faculty_import._notify_faculty_change')
+    def test_refuses_mass_deactivation(self, mock_notify):
+        """
+        Scenario: A truncated export would deactivate most of the roster.
+        Expected: Nothing is written and the report explains why.
+        """
+        self.cur.fetchone.return_value = {"missing": 9, "active": 10}
+
+        report = sync_faculty([(2, row())])
+
+        self.assertFalse(report["success"])
+        self.assertIn("refusing to deactivate 9 of 10", report["error"])
+        mock_notify.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import sys
+import os
+import datetime
+import threading
+import unittest
+from unittest.mock import patch
+
+from google.oauth2.credentials import Credentials
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils import google_auth
+from utils.config_loader import Config
+
+
+def credentials(expires_in_minutes):
+    expiry = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) \
+        + datetime.timedelta(minutes=expires_in_minutes)
+    return Credentials(token="access", refresh_token="refresh", expiry=expiry,
+                       client_id="id", client_secret="secret",
+                       token_uri="https://oauth2.googleapis.com/token")
+
+
+class TestCalendarClientCache(unittest.TestCase):
+
+    def setUp(self):
+        google_auth.reset_calendar_service()
+        self.addCleanup(google_auth.reset_calendar_service)
+        patcher = patch('utils.google_auth._save_credentials')
+        self.save = patcher.start()
+        self.addCleanup(patcher.stop)
+        # token.json is mocked; the OAuth client keys in .env are not needed
+        patcher = patch.object(Config, 'require')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('utils.google_auth.os.path.exists', return_value=True)
+    @patch('utils.google_auth.Credentials.from_authorized_user_file')
+    def test_token_file_is_read_once_and_client_reused(self, mock_load, _):
+        mock_load.return_value = credentials(60)
+
+        first = google_auth.get_calendar_service()
+        second = google_auth.get_calendar_service()
+
+        self.assertIs(first, second)
+        mock_load.assert_called_once()
+        self.assertTrue(hasattr(first, "events"))
+
+    @patch('utils.google_auth.os.path.exists', return_value=True)
+    @patch('utils.google_auth.Credentials.from_authorized_user_file')
+    def test_each_thread_gets_its_own_transport(self, mock_load, _):
+        """
+        Scenario: Two threads ask for the client.
+        Expected: Separate service objects (httplib2 is not thread-safe)
+        sharing one set of credentials.
+        """
+        mock_load.return_value = credentials(60)
+        services = []
+
+        def worker():
+            services.append(google_auth.get_calendar_service())
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertIsNot(services[0], services[1])
+        self.assertIsNot(services[0]._http, services[1]._http)
+        self.assertIs(services[0]._http.credentials, services[1]._http.credentials)
+
+    @patch('utils.google_auth.os.path.exists', return_value=True)
+    @patch('utils.google_auth.Credentials.from_authorized_user_file')
+    def test_token_is_refreshed_before_it_expires(self, mock_load, _):
+        """
+        Scenario: The access token expires in 2 minutes (inside the margin).
+        Expected: It is refreshed and saved before the client is handed out;
+        a fresh token is not refreshed again.
+        """
+        creds = credentials(2)
+        mock_load.return_value = creds
+
+        def refresh(request):
+            creds.expiry = creds.expiry + datetime.timedelta(hours=1)
+
+        with patch.object(Credentials, 'refresh', autospec=True,
+                          side_effect=lambda self, request: refresh(request)) as mock_refresh:
+            google_auth.get_calendar_service()
+            google_auth.get_calendar_service()
+
+        mock_refresh.assert_called_once()
+        self.save.assert_called_once_with(creds)
+
+
+if __name__ == '__main__':
+    unittest.main()
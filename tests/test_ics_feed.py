@@ -0,0 +1,112 @@
+import sys
+import os
+import datetime
+import unittest
+from unittest.mock import patch
+
+from icalendar import Calendar
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils import ics_feed
+from utils.ics_feed import FeedCache, fold_line, get_feed, iter_ics_feed
+
+
+def meeting_row(i, **overrides):
+    row = {
+        "meeting_id": f"evt{i}",
+        "title": f"Review, part {i}; room 2",
+        "start_time": datetime.datetime(2025, 1, 27, 10 + i),
+        "end_time": datetime.datetime(2025, 1, 27, 10 + i, 30),
+        "organizer_email": "hod@college.edu",
+        "meet_link": "https://meet.google.com/abc-defg-hij",
+        "sequence": i,
+        "updated_at": datetime.datetime(2025, 1, 20, 9, 0),
+        "participants": [{"name": "Sharma, R.", "email": "sharma@college.edu"}],
+    }
+    row.update(overrides)
+    return row
+
+
+class TestIcsText(unittest.TestCase):
+
+    def test_long_lines_fold_at_75_octets_without_splitting_characters(self):
+        line = "SUMMARY:" + "बैठक " * 40
+        folded = fold_line(line)
+
+        physical = folded.split(b"\r\n")[:-1]
+        self.assertTrue(all(len(part) <= 75 for part in physical))
+        for part in physical:
+            part.decode("utf-8")  # every physical line is valid UTF-8 on its own
+        self.assertEqual(folded.replace(b"\r\n ", b"").decode("utf-8"), line + "\r\n")
+
+    def test_feed_parses_with_stable_uids_and_sequence(self):
+        with patch.object(ics_feed, "CHUNK_EVENTS", 2):
+            chunks = list(iter_ics_feed([meeting_row(i) for i in range(5)], "Computer Science"))
+
+        self.assertEqual(len(chunks), 3)
+        cal = Calendar.from_ical(b"".join(chunks))
+        events = cal.walk("VEVENT")
+        self.assertEqual(str(cal["X-WR-CALNAME"]), "Computer Science")
+        self.assertEqual([str(e["UID"]) for e in events], [f"evt{i}@sam" for i in range(5)])
+        self.assertEqual([int(e["SEQUENCE"]) for e in events], [0, 1, 2, 3, 4])
+        self.assertEqual(str(events[1]["SUMMARY"]), "Review, part 1; room 2")
+        self.assertEqual(events[1]["DTSTART"].dt,
+                         datetime.datetime(2025, 1, 27, 11, tzinfo=datetime.timezone.utc))
+        self.assertEqual(events[0]["ATTENDEE"].params["CN"], "Sharma, R.")
+
+
+class TestGetFeed(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = FeedCache(max_entries=10, max_body_bytes=1024 * 1024)
+        self.etag = '"v1"'
+        patcher = patch.object(ics_feed, "feed_etag", side_effect=lambda kind, params: self.etag)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(ics_feed, "stream_meetings",
+                               side_effect=lambda kind, params: iter([meeting_row(0)]))
+        self.stream = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fetch(self, **headers):
+        feed = get_feed("faculty", "HOD@college.edu", cache=self.cache, **headers)
+        if feed["body"] is not None:
+            feed["body"] = b"".join(feed["body"])
+        return feed
+
+    def test_unchanged_feed_is_served_from_cache(self):
+        """
+        Scenario: A calendar client polls the same feed while nothing changes.
+        Expected: The first request streams from the database; a request
+        with the ETag gets 304, one without it gets the cached body.
+        """
+        first = self.fetch()
+        self.assertEqual(first["status"], 200)
+        self.assertIn(b"UID:evt0@sam", first["body"])
+
+        self.assertEqual(self.fetch(if_none_match=first["etag"])["status"], 304)
+        self.assertEqual(self.fetch(if_modified_since=first["last_modified"])["status"], 304)
+        again = self.fetch()
+        self.assertEqual(again["body"], first["body"])
+
+        self.assertEqual(self.stream.call_count, 1)
+        self.assertEqual(self.stream.call_args[0][1]["key"], "hod@college.edu")
+        self.assertEqual(self.cache.stats()["not_modified"], 2)
+
+    def test_changed_feed_is_regenerated(self):
+        first = self.fetch()
+        self.etag = '"v2"'
+
+        second = self.fetch(if_none_match=first["etag"])
+
+        self.assertEqual(second["status"], 200)
+        self.assertEqual(second["etag"], '"v2"')
+        self.assertEqual(self.stream.call_count, 2)
+
+    def test_unknown_feed_kind(self):
+        self.assertFalse(get_feed("room", "A-101", cache=self.cache)["success"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,3 +25,132 @@ path = generate_ics(
 )
 
 print("ICS generated at:", path)
+
+
+import tempfile
+import time
+import unittest
+
+from icalendar import Calendar
+
+from src.utils.ics_generator import IcsFileCache, render_ics
+
+ORGANIZER = {"name": "Chairman", "email": "chairman@college.edu"}
+ATTENDEES = [{"name": "Aniket", "email": "aniket@gmail.com"}]
+
+
+class TestRenderIcs(unittest.TestCase):
+
+    def test_invite_is_returned_as_bytes(self):
+        data = render_ics("Test meeting", start, end, ORGANIZER, ATTENDEES)
+
+        self.assertIsInstance(data, bytes)
+        event = Calendar.from_ical(data).walk("VEVENT")[0]
+        self.assertEqual(str(event["summary"]), "Test meeting")
+
+    def test_builder_attaches_bytes_without_a_file(self):
+        from services.notification_dispatcher import _make_builder
+
+        data = render_ics("Test meeting", start, end, ORGANIZER, ATTENDEES)
+        builder = _make_builder("sam@college.edu", "invite", {"title": "Test meeting"}, memoryview(data))
+        msg = builder.build("aniket@gmail.com")
+
+        attachment = next(msg.iter_attachments())
+        self.assertEqual(attachment.get_filename(), "invite.ics")
+        self.assertEqual(attachment.get_content(), data.decode())
+
+    def test_update_and_cancel_keep_the_meeting_uid(self):
+        """
+        Scenario: A meeting is invited, rescheduled, then cancelled.
+        Expected: All three carry the same UID with a rising SEQUENCE, so the
+        attendee's calendar updates one event; the cancel is METHOD:CANCEL
+        and goes out as text/calendar; method=CANCEL.
+        """
+        from services.notification_dispatcher import _make_builder
+
+        invite = render_ics("Test meeting", start, end, ORGANIZER, ATTENDEES, meeting_id="evt123")
+        update = render_ics("Test meeting", start + timedelta(hours=1), end + timedelta(hours=1),
+                            ORGANIZER, ATTENDEES, meeting_id="evt123", sequence=1)
+        cancel = render_ics("Test meeting", start, end, ORGANIZER, ATTENDEES,
+                            meeting_id="evt123", sequence=2, method="CANCEL")
+
+        cals = [Calendar.from_ical(data) for data in (invite, update, cancel)]
+        events = [cal.walk("VEVENT")[0] for cal in cals]
+        self.assertEqual({str(e["uid"]) for e in events}, {"evt123@sam"})
+        self.assertEqual([int(e["sequence"]) for e in events], [0, 1, 2])
+        self.assertEqual([str(cal["method"]) for cal in cals], ["REQUEST", "REQUEST", "CANCEL"])
+        self.assertEqual(str(events[2]["status"]), "CANCELLED")
+
+        builder = _make_builder("sam@college.edu", "cancel", {"title": "Test meeting"}, cancel)
+        attachment = next(builder.build("aniket@gmail.com").iter_attachments())
+        self.assertEqual(attachment.get_param("method"), "CANCEL")
+
+
+class TestIcsFileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_same_content_same_file(self):
+        cache = IcsFileCache(self.tmp.name, max_bytes=10_000, max_age=3600)
+
+        first = cache.put(b"BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n")
+        second = cache.put(memoryview(b"BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n"))
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(os.listdir(self.tmp.name)), 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+        digest = os.path.basename(first)[:-4]
+        self.assertEqual(cache.get(digest), b"BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n")
+
+    def test_render_time_does_not_change_the_file(self):
+        cache = IcsFileCache(self.tmp.name, max_bytes=10_000, max_age=3600)
+        invite = b"BEGIN:VEVENT\r\nDTSTAMP:%s\r\nUID:evt123@sam\r\nEND:VEVENT\r\n"
+
+        first = cache.put(invite % b"20260223T110000Z")
+        second = cache.put(invite % b"20260223T110005Z")
+
+        self.assertEqual(first, second)
+        self.assertEqual(cache.stats(), {"puts": 2, "hits": 1, "evicted": 0})
+
+    def test_generate_ics_twice_writes_one_file(self):
+        """
+        Scenario: The same invite (same meeting_id) is generated twice.
+        Expected: Both calls return the same path and one file is written.
+        """
+        cache = IcsFileCache(self.tmp.name, max_bytes=10_000, max_age=3600)
+
+        paths = [generate_ics("Test meeting", start, end, ORGANIZER, ATTENDEES,
+                              cache=cache, meeting_id="evt123") for _ in range(2)]
+
+        self.assertEqual(paths[0], paths[1])
+        self.assertEqual(os.listdir(self.tmp.name), [os.path.basename(paths[0])])
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_old_and_oversized_entries_are_evicted(self):
+        """
+        Scenario: One file is past max_age, then the cache goes over
+        max_bytes (100 bytes, files of 40).
+        Expected: The stale file goes first, then the least recently stored
+        ones; the file just stored always stays.
+        """
+        cache = IcsFileCache(self.tmp.name, max_bytes=100, max_age=3600)
+        stale = cache.put(b"s" * 40)
+        os.utime(stale, (time.time() - 7200, time.time() - 7200))
+        paths = []
+        for i, letter in enumerate(b"abc"):
+            path = cache.put(bytes([letter]) * 40)
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+            paths.append(path)
+        newest = cache.put(b"d" * 40)
+
+        left = sorted(os.listdir(self.tmp.name))
+        self.assertNotIn(os.path.basename(stale), left)
+        self.assertNotIn(os.path.basename(paths[0]), left)
+        self.assertIn(os.path.basename(newest), left)
+        self.assertLessEqual(len(left) * 40, 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
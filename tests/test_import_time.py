@@ -0,0 +1,94 @@
+"""
+CLI cold start budget.
+
+`python -X importtime` se har entry point ka import time naapta hai (best
+of 3, taaki .pyc compile / disk cache ka noise na aaye) aur budget cross hua
+ya koi heavy library (Google client, icalendar, jinja2, numpy...) bina
+zaroorat import hui toh fail hota hai. slow machine pe budgets ko
+SAM_IMPORT_BUDGET_SCALE=2 jaise scale kar sakte hai.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.config_loader import REQUIRED_KEYS, Config, ConfigError
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Cumulative import time of the module itself, in milliseconds
+BUDGETS_MS = {
+    "main": 100,                       # sam --help
+    "utils.meeting_store": 150,        # sam list / sam show
+    "utils.ics_feed": 200,             # sam feed
+    "services.meeting_modifier": 250,  # reschedule / cancel
+}
+
+# Only imported by the code that needs them (first Calendar call, first
+# invite rendered, first email, first fuzzy match, first database query)
+HEAVY = ("googleapiclient.discovery", "google_auth_oauthlib", "google.oauth2",
+         "icalendar", "jinja2", "numpy", "rapidfuzz", "thefuzz", "psycopg2")
+
+SCALE = float(os.getenv("SAM_IMPORT_BUDGET_SCALE", "1"))
+
+
+def import_profile(module):
+    """
+    Imports `module` in a fresh interpreter without any of the .env keys
+    (importing must not validate config) and returns
+    ({module name: cumulative microseconds}, the module's own cumulative time).
+    """
+    env = {key: value for key, value in os.environ.items() if key not in REQUIRED_KEYS}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR, env=env, capture_output=True, text=True, timeout=60,
+    )
+    if result.returncode != 0:
+        raise AssertionError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules, modules[module]
+
+
+class TestImportBudget(unittest.TestCase):
+
+    def test_entry_points_stay_within_budget(self):
+        for module, budget in BUDGETS_MS.items():
+            with self.subTest(module=module):
+                runs = [import_profile(module) for _ in range(3)]
+                modules, _ = runs[0]
+                best_ms = min(cumulative for _, cumulative in runs) / 1000
+
+                heavy = sorted(name for name in modules if name.startswith(HEAVY))
+                self.assertEqual(heavy, [], f"{module} imports heavy modules at import time")
+                self.assertLessEqual(best_ms, budget * SCALE,
+                                     f"import {module} took {best_ms:.1f} ms (budget {budget * SCALE:.0f} ms)")
+
+
+class TestDeferredConfig(unittest.TestCase):
+
+    def test_only_the_subsystem_in_use_is_checked(self):
+        """
+        Scenario: SENDER_PASSWORD is missing but DATABASE_URL is set.
+        Expected: The database subsystem starts; email raises ConfigError
+        naming the missing key instead of exiting the process.
+        """
+        env = {"DATABASE_URL": "postgresql://db", "SENDER_EMAIL": "sam@college.edu"}
+        with patch.dict(os.environ, env, clear=True), patch.object(Config, "_checked", set()):
+            Config.require("database")
+            with self.assertRaisesRegex(ConfigError, "SENDER_PASSWORD"):
+                Config.require("email")
+
+
+if __name__ == '__main__':
+    unittest.main()
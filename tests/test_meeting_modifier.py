@@ -0,0 +1,333 @@
+import sys
+import os
+import datetime
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httplib2
+from googleapiclient.errors import HttpError
+from icalendar import Calendar
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.busy_cache import BusyStore
+from services import meeting_modifier
+
+
+def http_error(status, reason=""):
+    return HttpError(httplib2.Response({"status": status}), reason.encode())
+
+
+class FakeBatchService:
+    """
+    Calendar service whose requests are plain dicts and whose batch
+    requests answer every item through `respond(request)`, which returns
+    the response or raises.
+    """
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.batches = []
+        events = MagicMock()
+        events.delete.side_effect = lambda **kw: {"op": "delete", "headers": {}, **kw}
+        events.patch.side_effect = lambda **kw: FakeRequest(op="patch", **kw)
+        events.insert.side_effect = lambda **kw: {"op": "insert", "headers": {}, **kw}
+        self._events = events
+
+    def events(self):
+        return self._events
+
+    def new_batch_http_request(self, callback):
+        service = self
+
+        class Batch:
+            def __init__(self):
+                self.items = []
+
+            def add(self, request, request_id):
+                self.items.append((request_id, request))
+
+            def execute(self):
+                service.batches.append(len(self.items))
+                for request_id, request in self.items:
+                    try:
+                        callback(request_id, service.respond(request), None)
+                    except HttpError as error:
+                        callback(request_id, None, error)
+
+        return Batch()
+
+
+class FakeRequest(dict):
+    def __init__(self, **kw):
+        super().__init__(headers={}, **kw)
+
+    @property
+    def headers(self):
+        return self["headers"]
+
+
+class MirrorPatched(unittest.TestCase):
+    """
+    Keeps the Postgres meetings mirror and the activity log out of these
+    tests; self.mirror and self.log_activity record the calls.
+    """
+
+    def setUp(self):
+        patcher = patch('services.meeting_modifier.meeting_store')
+        self.mirror = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('services.meeting_modifier.log_activity')
+        self.log_activity = patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestBulkCancel(MirrorPatched):
+
+    @patch('services.meeting_modifier.get_synced_store', return_value=None)
+    @patch('services.meeting_modifier.get_calendar_service')
+    def test_120_deletes_go_in_three_batches_without_gets(self, mock_service, _):
+        """
+        Scenario: A holiday cancels 120 meetings; one is already gone.
+        Expected: 3 batch requests (50 + 50 + 20), no events().get, and a
+        per-meeting result in input order.
+        """
+        def respond(request):
+            if request["eventId"] == "m7":
+                raise http_error(410)
+            return ""
+
+        service = FakeBatchService(respond)
+        mock_service.return_value = service
+        ids = [f"m{i}" for i in range(120)]
+
+        result = meeting_modifier.cancel_meetings(ids, "hod@college.edu")
+
+        self.assertEqual(service.batches, [50, 50, 20])
+        service.events().get.assert_not_called()
+        self.assertEqual(result["cancelled"], 119)
+        self.assertEqual(result["failed"], 1)
+        self.assertFalse(result["success"])
+        self.assertEqual([item["meeting_id"] for item in result["results"]], ids)
+        self.assertEqual(result["results"][7]["error"], "Meeting not found or already deleted")
+        # the one Google no longer has goes from the mirror too
+        self.mirror.delete_meetings.assert_called_once_with(ids)
+        self.assertEqual(self.log_activity.call_count, 119)
+
+    @patch('services.meeting_modifier.time.sleep')
+    @patch('services.meeting_modifier.get_synced_store', return_value=None)
+    @patch('services.meeting_modifier.get_calendar_service')
+    def test_rate_limited_items_are_retried(self, mock_service, _, mock_sleep):
+        attempts = {}
+
+        def respond(request):
+            attempts[request["eventId"]] = attempts.get(request["eventId"], 0) + 1
+            if request["eventId"] == "m1" and attempts["m1"] == 1:
+                raise http_error(429)
+            return ""
+
+        service = FakeBatchService(respond)
+        mock_service.return_value = service
+
+        result = meeting_modifier.cancel_meetings(["m0", "m1", "m2"], "hod@college.edu")
+
+        self.assertTrue(result["success"], result)
+        self.assertEqual(service.batches, [3, 1])
+        self.assertEqual(attempts, {"m0": 1, "m1": 2, "m2": 1})
+        mock_sleep.assert_called_once()
+
+
+class TestBulkReschedule(MirrorPatched):
+
+    @patch('services.meeting_modifier.get_calendar_service')
+    def test_conflicts_are_refused_and_etag_is_sent(self, mock_service):
+        """
+        Scenario: Three meetings are moved; the second lands on an other
+        meeting, the third on the first one's new slot.
+        Expected: Only the first is patched, with the cached ETag as
+        If-Match, and the cache sees its new time.
+        """
+        sync_service = MagicMock()
+        sync_service.events.return_value.list.return_value.execute.return_value = {
+            "items": [
+                {"id": "m1", "etag": '"e1"', "start": {"dateTime": "2025-01-27T09:00:00Z"},
+                 "end": {"dateTime": "2025-01-27T10:00:00Z"}},
+                {"id": "other", "etag": '"e9"', "start": {"dateTime": "2025-01-27T12:00:00Z"},
+                 "end": {"dateTime": "2025-01-27T13:00:00Z"}},
+            ],
+            "nextSyncToken": "s1",
+        }
+        store = BusyStore("primary", max_staleness=3600, service_factory=lambda: sync_service)
+        store.sync()
+
+        patched = []
+
+        def respond(request):
+            patched.append(request)
+            return {"id": request["eventId"], **request["body"]}
+
+        mock_service.return_value = FakeBatchService(respond)
+
+        with patch('services.meeting_modifier.get_busy_store', return_value=store), \
+                patch('services.meeting_modifier.get_synced_store', return_value=store):
+            result = meeting_modifier.reschedule_meetings([
+                {"meeting_id": "m1", "new_start": "2025-01-27T10:00:00", "new_end": "2025-01-27T11:00:00"},
+                {"meeting_id": "m2", "new_start": "2025-01-27T12:30:00", "new_end": "2025-01-27T13:30:00"},
+                {"meeting_id": "m3", "new_start": "2025-01-27T10:30:00", "new_end": "2025-01-27T11:30:00"},
+            ], "hod@college.edu", if_unchanged=True)
+
+        self.assertEqual([item["success"] for item in result["results"]], [True, False, False])
+        self.assertEqual(len(patched), 1)
+        self.assertEqual(patched[0].headers["If-Match"], '"e1"')
+        self.assertEqual(set(patched[0]["body"]), {"start", "end"})
+        self.assertTrue(store.is_busy("2025-01-27T10:15:00", "2025-01-27T10:20:00"))
+        self.assertFalse(store.is_busy("2025-01-27T09:00:00", "2025-01-27T10:00:00"))
+        self.mirror.reschedule_meetings.assert_called_once_with(
+            [("m1", "2025-01-27T10:00:00", "2025-01-27T11:00:00")])
+
+    @patch('services.meeting_modifier.get_synced_store', return_value=None)
+    @patch('services.meeting_modifier.get_busy_store')
+    @patch('services.meeting_modifier.get_calendar_service')
+    def test_changed_meeting_reports_precondition_failure(self, mock_service, mock_store, _):
+        mock_store.return_value.busy_intervals.return_value = []
+
+        def respond(request):
+            raise http_error(412)
+
+        mock_service.return_value = FakeBatchService(respond)
+
+        result = meeting_modifier.reschedule_meetings([
+            {"meeting_id": "m1", "new_start": "2025-01-27T10:00:00", "new_end": "2025-01-27T11:00:00"},
+            {"meeting_id": "m2", "new_start": "not a date", "new_end": "2025-01-27T11:00:00"},
+        ], "hod@college.edu")
+
+        self.assertEqual(result["failed"], 2)
+        self.assertEqual(result["results"][0]["error"], "Meeting was changed since it was last synced")
+        self.assertEqual(result["results"][1]["meeting_id"], "m2")
+
+
+class TestBulkCreate(MirrorPatched):
+
+    @patch('services.meeting_modifier.get_synced_store', return_value=None)
+    @patch('services.meeting_modifier.get_busy_store')
+    @patch('services.meeting_modifier.get_calendar_service')
+    def test_creates_in_one_batch(self, mock_service, mock_store, _):
+        mock_store.return_value.busy_intervals.return_value = []
+        created = iter(range(100))
+        service = FakeBatchService(lambda request: {"id": f"new{next(created)}"})
+        mock_service.return_value = service
+        events = [{"summary": f"Viva {i}",
+                   "start": {"dateTime": f"2025-01-27T{10 + i}:00:00Z"},
+                   "end": {"dateTime": f"2025-01-27T{10 + i}:30:00Z"}} for i in range(3)]
+
+        result = meeting_modifier.create_meetings(events, "hod@college.edu")
+
+        self.assertTrue(result["success"], result)
+        self.assertEqual(service.batches, [3])
+        self.assertEqual([item["meeting_id"] for item in result["results"]], ["new0", "new1", "new2"])
+        saved, organizer = self.mirror.save_meetings.call_args[0]
+        self.assertEqual([event["id"] for event in saved], ["new0", "new1", "new2"])
+        self.assertEqual(organizer, "hod@college.edu")
+
+    @patch('services.meeting_modifier.get_synced_store', return_value=None)
+    @patch('services.meeting_modifier.get_busy_store')
+    @patch('services.meeting_modifier.get_calendar_service')
+    def test_mirror_failure_does_not_fail_the_create(self, mock_service, mock_store, _):
+        mock_store.return_value.busy_intervals.return_value = []
+        mock_service.return_value = FakeBatchService(lambda request: {"id": "new0"})
+        self.mirror.save_meetings.side_effect = RuntimeError("database is down")
+
+        result = meeting_modifier.create_meetings([{
+            "start": {"dateTime": "2025-01-27T10:00:00Z"}, "end": {"dateTime": "2025-01-27T11:00:00Z"},
+        }], "hod@college.edu")
+
+        self.assertTrue(result["success"], result)
+
+    @patch('services.meeting_modifier.get_synced_store', return_value=None)
+    @patch('services.meeting_modifier.get_calendar_service')
+    def test_single_create_keeps_the_given_id(self, mock_service, _):
+        insert = mock_service.return_value.events.return_value.insert
+        insert.return_value.execute.return_value = {"id": "a1b2c3d4e5", "htmlLink": "https://cal/a1"}
+        event = {"id": "a1b2c3d4e5", "summary": "Viva",
+                 "start": {"dateTime": "2025-01-27T10:00:00Z"}, "end": {"dateTime": "2025-01-27T11:00:00Z"}}
+
+        result = meeting_modifier.create_meeting(event, "hod@college.edu", check_conflicts=False)
+
+        self.assertEqual(result["meeting_id"], "a1b2c3d4e5")
+        insert.assert_called_once_with(calendarId='primary', body=event)
+        self.mirror.save_meetings.assert_called_once_with([{"id": "a1b2c3d4e5", "htmlLink": "https://cal/a1"}],
+                                                          "hod@college.edu")
+
+        insert.return_value.execute.side_effect = http_error(409, "duplicate")
+        self.assertEqual(meeting_modifier.create_meeting(event, "hod@college.edu", check_conflicts=False),
+                         {"success": False, "error": "Meeting already exists"})
+
+
+class TestAttendeeUpdates(MirrorPatched):
+    """
+    reschedule_meeting / cancel_meeting with notify=True queue an update
+    keyed by the meeting's UID instead of a fresh invite.
+    """
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch('services.meeting_modifier.enqueue_meeting_notification', return_value=7)
+        self.enqueue = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.meeting = {
+            "meeting_id": "evt1", "title": "Budget review",
+            "start_time": datetime.datetime(2025, 1, 28, 10), "end_time": datetime.datetime(2025, 1, 28, 11),
+            "organizer_email": "hod@college.edu", "meet_link": None, "sequence": 3,
+            "participants": [{"name": "Dr. Sharma", "email": "sharma@college.edu"}],
+        }
+        self.mirror.get_meeting.return_value = self.meeting
+
+    def sent_event(self):
+        recipients, notification_type, _, ics = self.enqueue.call_args[0]
+        cal = Calendar.from_ical(ics)
+        return recipients, notification_type, str(cal["method"]), cal.walk("VEVENT")[0]
+
+    @patch('services.meeting_modifier.get_synced_store', return_value=None)
+    @patch('services.meeting_modifier._new_time_conflicts', return_value=False)
+    @patch('services.meeting_modifier.get_calendar_service')
+    def test_reschedule_sends_request_with_stored_sequence(self, mock_service, *_):
+        mock_service.return_value.events.return_value.patch.return_value.execute.return_value = {
+            "id": "evt1",
+            "start": {"dateTime": "2025-01-28T10:00:00Z"}, "end": {"dateTime": "2025-01-28T11:00:00Z"},
+        }
+
+        result = meeting_modifier.reschedule_meeting(
+            "evt1", "2025-01-28T10:00:00Z", "2025-01-28T11:00:00Z", "hod@college.edu", notify=True)
+
+        self.assertEqual(result["notification_job"], 7)
+        recipients, notification_type, method, event = self.sent_event()
+        self.assertEqual(recipients, [{"email": "sharma@college.edu", "name": "Dr. Sharma"}])
+        self.assertEqual((notification_type, method), ("update", "REQUEST"))
+        self.assertEqual((str(event["uid"]), int(event["sequence"])), ("evt1@sam", 3))
+
+    @patch('services.meeting_modifier.get_synced_store', return_value=None)
+    @patch('services.meeting_modifier.get_calendar_service')
+    def test_cancel_reads_the_mirror_before_deleting(self, mock_service, _):
+        calls = []
+        self.mirror.get_meeting.side_effect = lambda meeting_id: calls.append("get") or self.meeting
+        self.mirror.delete_meetings.side_effect = lambda ids: calls.append("delete")
+
+        result = meeting_modifier.cancel_meeting("evt1", "hod@college.edu", notify=True)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(calls, ["get", "delete"])
+        _, notification_type, method, event = self.sent_event()
+        self.assertEqual((notification_type, method), ("cancel", "CANCEL"))
+        self.assertEqual((str(event["uid"]), int(event["sequence"])), ("evt1@sam", 4))
+
+    @patch('services.meeting_modifier.get_synced_store', return_value=None)
+    @patch('services.meeting_modifier.get_calendar_service')
+    def test_no_notification_by_default(self, mock_service, _):
+        meeting_modifier.cancel_meeting("evt1", "hod@college.edu")
+
+        self.enqueue.assert_not_called()
+        self.mirror.get_meeting.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
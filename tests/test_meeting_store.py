@@ -0,0 +1,102 @@
+import sys
+import os
+import datetime
+import unittest
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils import meeting_store
+
+
+def calendar_event(event_id="evt1", **extra):
+    return {
+        "id": event_id,
+        "summary": "Budget review",
+        "start": {"dateTime": "2025-01-27T15:00:00+05:30"},
+        "end": {"dateTime": "2025-01-27T16:00:00+05:30"},
+        "hangoutLink": "https://meet.google.com/abc-defg-hij",
+        "attendees": [
+            {"email": "Sharma@College.edu", "displayName": "Dr. Sharma"},
+            {"email": "room-101@resource.calendar.google.com", "resource": True},
+        ],
+        **extra,
+    }
+
+
+@contextmanager
+def fake_cursor(cursor):
+    yield cursor
+
+
+class TestEventRows(unittest.TestCase):
+
+    def test_times_become_naive_utc_and_rooms_are_dropped(self):
+        meeting, participants = meeting_store.event_rows(calendar_event(), "HOD@college.edu")
+
+        self.assertEqual(meeting, ("evt1", "Budget review",
+                                   datetime.datetime(2025, 1, 27, 9, 30),
+                                   datetime.datetime(2025, 1, 27, 10, 30),
+                                   "hod@college.edu", "https://meet.google.com/abc-defg-hij"))
+        self.assertEqual(participants, [("Dr. Sharma", "sharma@college.edu")])
+
+    def test_all_day_event_and_missing_title(self):
+        meeting, _ = meeting_store.event_rows(
+            calendar_event(summary=None, start={"date": "2025-01-27"}, end={"date": "2025-01-28"}),
+            "hod@college.edu")
+
+        self.assertEqual(meeting[1], "Untitled meeting")
+        self.assertEqual(meeting[2], datetime.datetime(2025, 1, 27))
+
+
+class TestSaveMeetings(unittest.TestCase):
+
+    @patch('psycopg2.extras.execute_values')
+    @patch('utils.meeting_store.db_cursor')
+    def test_one_transaction_for_meetings_and_participants(self, mock_db_cursor, mock_execute_values):
+        """
+        Scenario: Two events are saved, one of them listed twice.
+        Expected: One upsert with 2 rows, one participant delete and one
+        participant insert, all on the same committed cursor.
+        """
+        cursor = MagicMock()
+        mock_db_cursor.side_effect = lambda commit=False: fake_cursor(cursor)
+        mock_execute_values.side_effect = [
+            [{"id": 10, "meeting_id": "evt1"}, {"id": 11, "meeting_id": "evt2"}],
+            None,
+        ]
+
+        saved = meeting_store.save_meetings(
+            [calendar_event("evt1"), calendar_event("evt2"), calendar_event("evt1")], "hod@college.edu")
+
+        self.assertEqual(saved, 2)
+        mock_db_cursor.assert_called_once_with(commit=True)
+        upsert, participants = mock_execute_values.call_args_list
+        self.assertEqual(len(upsert[0][2]), 2)
+        cursor.execute.assert_called_once()
+        self.assertEqual(cursor.execute.call_args[0][1], ([10, 11],))
+        self.assertEqual(participants[0][2], [(10, "Dr. Sharma", "sharma@college.edu"),
+                                              (11, "Dr. Sharma", "sharma@college.edu")])
+
+    @patch('utils.meeting_store.db_cursor')
+    def test_listing_is_a_single_query(self, mock_db_cursor):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [{"meeting_id": "evt1", "participants": []}]
+        mock_db_cursor.side_effect = lambda commit=False: fake_cursor(cursor)
+
+        meetings = meeting_store.list_meetings(
+            "HOD@college.edu",
+            datetime.datetime(2025, 1, 27, tzinfo=datetime.timezone.utc),
+            "2025-02-03T05:30:00+05:30",
+        )
+
+        self.assertEqual(meetings, [{"meeting_id": "evt1", "participants": []}])
+        cursor.execute.assert_called_once()
+        self.assertEqual(cursor.execute.call_args[0][1], ("hod@college.edu",
+                                                          datetime.datetime(2025, 1, 27),
+                                                          datetime.datetime(2025, 2, 3)))
+
+
+if __name__ == '__main__':
+    unittest.main()
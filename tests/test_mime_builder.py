@@ -0,0 +1,91 @@
+import sys
+import os
+import unittest
+from email import message_from_bytes
+from email.policy import default
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.mime_builder import PersonalizedMessageBuilder, personalization_markers
+
+SKELETON = "<p>Hello {name},</p><a href='https://sam.test/rsvp?token={token}'>RSVP</a>".format(
+    name=personalization_markers()["recipient_name"],
+    token=personalization_markers()["rsvp_token"],
+)
+ICS = b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nEND:VCALENDAR\r\n"
+
+
+def roundtrip(msg):
+    return message_from_bytes(msg.as_bytes(), policy=default)
+
+
+class TestPersonalizedMessageBuilder(unittest.TestCase):
+
+    def setUp(self):
+        self.builder = PersonalizedMessageBuilder(
+            "sam@test", "Meeting Invitation: Sync", "plain body",
+            html_skeleton=SKELETON, ics_data=ICS, ics_filename="sync.ics"
+        )
+
+    def test_recipient_fields_are_stamped(self):
+        """
+        Scenario: A message is built for a named recipient with an RSVP token.
+        Expected: To, greeting and token are personalized, shared parts intact.
+        """
+        parsed = roundtrip(self.builder.build("ayush@test", "Ayush <Kumar>", "tok/1"))
+
+        self.assertEqual(parsed["To"], "ayush@test")
+        self.assertEqual(parsed["From"], "sam@test")
+        html = parsed.get_body(("html",)).get_content()
+        self.assertIn("Hello Ayush &lt;Kumar&gt;,", html)
+        self.assertIn("token=tok%2F1", html)
+
+        attachment = next(parsed.iter_attachments())
+        self.assertEqual(attachment.get_filename(), "sync.ics")
+        self.assertEqual(attachment.get_content_type(), "text/calendar")
+        self.assertEqual(attachment.get_payload(decode=True), ICS)
+
+    def test_shared_parts_are_not_copied(self):
+        """
+        Scenario: Two recipients get messages from the same builder.
+        Expected: The encoded .ics part object is shared, the To headers differ.
+        """
+        first = self.builder.build("a@test", "A")
+        second = self.builder.build("b@test", "B")
+
+        self.assertIs(first.get_payload()[1], second.get_payload()[1])
+        self.assertEqual(first["To"], "a@test")
+        self.assertEqual(second["To"], "b@test")
+
+    def test_without_name_greeting_stays_generic(self):
+        html = roundtrip(self.builder.build("a@test")).get_body(("html",)).get_content()
+        self.assertIn("<p>Hello,</p>", html)
+
+    def test_rsvp_link_only_for_recipients_with_a_token(self):
+        """
+        Scenario: The invite template is rendered with an rsvp_url; one
+        recipient has an RSVP token, the other does not.
+        Expected: Only the first gets the link; the second gets no empty
+        ?token= link.
+        """
+        from services.notification_dispatcher import _make_builder
+
+        builder = _make_builder("sam@test", "invite",
+                                {"title": "Sync", "rsvp_url": "https://sam.test/rsvp"}, None)
+        with_token = roundtrip(builder.build("a@test", "A", "tok1")).get_body(("html",)).get_content()
+        without = roundtrip(builder.build("b@test", "B")).get_body(("html",)).get_content()
+
+        self.assertIn('href="https://sam.test/rsvp?token=tok1"', with_token)
+        self.assertNotIn("rsvp", without)
+        self.assertNotIn("SAM_RSVP", with_token)
+
+    def test_text_only_message(self):
+        builder = PersonalizedMessageBuilder("sam@test", "Hi", "just text")
+        parsed = roundtrip(builder.build("a@test"))
+
+        self.assertEqual(parsed["Subject"], "Hi")
+        self.assertEqual(parsed.get_content().strip(), "just text")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import sys
+import os
+import time
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from services.notification_queue import (
+    NotificationWorkerPool,
+    SenderRateLimiter,
+    backoff_seconds,
+    deliver_job,
+)
+
+
+def meeting_job(recipients, attempts=1, max_attempts=5):
+    return {
+        "id": 7,
+        "kind": "meeting",
+        "sender_email": "sam@test",
+        "attempts": attempts,
+        "max_attempts": max_attempts,
+        "payload": {
+            "recipients": recipients,
+            "notification_type": "invite",
+            "meeting_details": {"title": "Sync"},
+            "ics_attachment": None,
+        },
+    }
+
+
+def bulk_result(outcomes):
+    results = [{"success": ok, "recipient": email, **({} if ok else {"error": "SMTP error: 451"})}
+               for email, ok in outcomes]
+    sent = sum(1 for _, ok in outcomes if ok)
+    return {"success": sent == len(outcomes), "sent": sent, "failed": len(outcomes) - sent,
+            "results": results}
+
+
+class TestBackoff(unittest.TestCase):
+
+    def test_backoff_grows_and_is_capped(self):
+        self.assertLessEqual(backoff_seconds(1), 30)
+        self.assertGreaterEqual(backoff_seconds(3), 60)
+        self.assertLessEqual(backoff_seconds(50), 3600)
+
+
+class TestSenderRateLimiter(unittest.TestCase):
+
+    def test_burst_then_throttle(self):
+        """
+        Scenario: 5 msg/s limit with a burst of 5, then 2 more messages.
+        Expected: The burst is immediate, the extra messages wait ~0.4s.
+        """
+        limiter = SenderRateLimiter(5, burst=5)
+        started = time.monotonic()
+        limiter.acquire("sam@test", 5)
+        self.assertLess(time.monotonic() - started, 0.05)
+
+        limiter.acquire("sam@test", 2)
+        self.assertGreaterEqual(time.monotonic() - started, 0.35)
+
+    def test_senders_have_separate_buckets(self):
+        limiter = SenderRateLimiter(1, burst=1)
+        started = time.monotonic()
+        limiter.acquire("a@test")
+        limiter.acquire("b@test")
+        self.assertLess(time.monotonic() - started, 0.05)
+
+
+class TestDeliverJob(unittest.TestCase):
+
+    @patch('services.notification_queue.send_meeting_notifications_bulk')
+    def test_partial_failure_retries_only_failed_recipients(self, mock_bulk):
+        mock_bulk.return_value = bulk_result([("a@test", True), ("b@test", False)])
+
+        outcome = deliver_job(meeting_job(["a@test", "b@test"]))
+
+        self.assertFalse(outcome["success"])
+        self.assertFalse(outcome["permanent"])
+        self.assertEqual(outcome["retry_payload"]["recipients"], ["b@test"])
+
+    @patch('services.notification_queue.send_meeting_notifications_bulk')
+    def test_bad_notification_type_is_permanent(self, mock_bulk):
+        mock_bulk.return_value = {"success": False, "error": "Invalid notification_type"}
+
+        outcome = deliver_job(meeting_job(["a@test"]))
+
+        self.assertTrue(outcome["permanent"])
+
+
+class TestWorkerPool(unittest.TestCase):
+
+    @patch('services.notification_queue.mark_failed')
+    @patch('services.notification_queue.mark_sent')
+    @patch('services.notification_queue.send_meeting_notifications_bulk')
+    def test_success_marks_job_sent(self, mock_bulk, mock_sent, mock_failed):
+        mock_bulk.return_value = bulk_result([("a@test", True)])
+        pool = NotificationWorkerPool(workers=1, send_rate=0)
+
+        pool.process_job(meeting_job(["a@test"]))
+
+        mock_sent.assert_called_once_with(7)
+        mock_failed.assert_not_called()
+        self.assertEqual(pool.stats["messages_sent"], 1)
+
+    @patch('services.notification_queue._update_job')
+    @patch('services.notification_queue.send_meeting_notifications_bulk')
+    def test_last_attempt_is_dead_lettered(self, mock_bulk, mock_update):
+        """
+        Scenario: A send fails on attempt 4 of 5, then on attempt 5 of 5.
+        Expected: The first is rescheduled as 'pending' with a backoff; the
+        last is written as 'dead' with no retry delay.
+        """
+        mock_bulk.return_value = bulk_result([("a@test", False)])
+        pool = NotificationWorkerPool(workers=1, send_rate=0)
+
+        pool.process_job(meeting_job(["a@test"], attempts=4, max_attempts=5))
+        pool.process_job(meeting_job(["a@test"], attempts=5, max_attempts=5))
+
+        (_, retry), (_, last) = [c.args for c in mock_update.call_args_list]
+        self.assertEqual(retry[0], "pending")
+        self.assertGreater(retry[3], 0)
+        self.assertEqual((last[0], last[3], last[4]), ("dead", 0, 7))
+        self.assertEqual(pool.stats["jobs_dead"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+import sys
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from services import meeting_pipeline
+from utils.pipeline import Pipeline, Stage
+
+
+def sleeper(seconds, value=None):
+    def run(**deps):
+        time.sleep(seconds)
+        return value
+    return run
+
+
+class TestPipeline(unittest.TestCase):
+
+    def test_independent_stages_overlap(self):
+        """
+        Scenario: a and b (0.2s each) only need the input; c needs both.
+        Expected: c gets both results, the run takes ~0.2s not 0.4s, and
+        each stage has a timing.
+        """
+        pipeline = Pipeline([
+            Stage("a", sleeper(0.2, 1), requires=["x"]),
+            Stage("b", sleeper(0.2, 2), requires=["x"]),
+            Stage("c", lambda a, b: a + b, requires=["a", "b"]),
+        ])
+
+        run = pipeline.run(x=None)
+
+        self.assertTrue(run["success"])
+        self.assertEqual(run["results"]["c"], 3)
+        self.assertLess(run["elapsed_ms"], 350)
+        self.assertGreaterEqual(run["timings"]["c"]["start_ms"], run["timings"]["a"]["duration_ms"])
+
+    def test_one_worker_runs_in_sequence(self):
+        order = []
+        stages = [Stage(name, lambda name=name: order.append(name)) for name in "abc"]
+
+        Pipeline(stages, max_workers=1).run()
+
+        self.assertEqual(order, ["a", "b", "c"])
+
+    def test_failure_rolls_back_finished_stages(self):
+        """
+        Scenario: "create" succeeds, "send" fails while "slow" is still
+        running; "after" depends on send.
+        Expected: slow is waited for, both undos run newest first, after
+        never starts, and the error names the stage.
+        """
+        undone = []
+
+        def fail(create):
+            raise RuntimeError("SMTP down")
+
+        pipeline = Pipeline([
+            Stage("create", lambda: "evt1", undo=lambda value: undone.append(("create", value))),
+            Stage("slow", sleeper(0.1, "s"), undo=lambda value: undone.append(("slow", value))),
+            Stage("send", fail, requires=["create"]),
+            Stage("after", lambda send: None, requires=["send"]),
+        ])
+
+        run = pipeline.run()
+
+        self.assertFalse(run["success"])
+        self.assertEqual((run["failed_stage"], run["error"]), ("send", "SMTP down"))
+        self.assertEqual(undone, [("slow", "s"), ("create", "evt1")])
+        self.assertEqual(run["rolled_back"], ["slow", "create"])
+        self.assertEqual(run["skipped"], ["after"])
+
+    def test_rejects_cycles_and_missing_inputs(self):
+        with self.assertRaisesRegex(ValueError, "cycle"):
+            Pipeline([Stage("a", None, requires=["b"]), Stage("b", None, requires=["a"])])
+        with self.assertRaisesRegex(ValueError, "request"):
+            Pipeline([Stage("a", None, requires=["request"])]).run()
+
+
+@patch('services.meeting_pipeline.log_activity')
+@patch('services.meeting_pipeline.check_participants_conflicts',
+       return_value={"success": True, "has_conflict": False, "conflicts": [], "participants": {}})
+@patch('services.meeting_pipeline.check_scheduler_conflict', return_value=False)
+@patch('services.meeting_pipeline.user_resolver.resolve_participants_batch')
+@patch('services.meeting_pipeline.meeting_modifier')
+@patch('services.meeting_pipeline.notification_dispatcher')
+class TestSchedulePipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.sharma = {"query": "Sharma", "match": {"name": "Dr. Sharma", "email": "Sharma@college.edu"},
+                       "name": "Dr. Sharma", "score": 95, "runner_up": None, "runner_up_score": 0,
+                       "ambiguous": False}
+
+    def test_invite_is_built_while_the_event_is_created(self, dispatcher, modifier, resolve,
+                                                         scheduler_busy, participants, log):
+        """
+        Scenario: The Calendar insert takes 0.2s.
+        Expected: The invite messages are built before it returns, with the
+        meeting id in the .ics UID, and sent once it has.
+        """
+        resolve.return_value = [self.sharma]
+        inserted = threading.Event()
+        built = []
+
+        def create(event, scheduler_email, check_conflicts):
+            time.sleep(0.2)
+            inserted.set()
+            return {"success": True, "meeting_id": event["id"], "html_link": "https://cal/x"}
+
+        modifier.create_meeting.side_effect = create
+        dispatcher.build_notification_messages.side_effect = \
+            lambda recipients, kind, details, ics: built.append((inserted.is_set(), ics)) or ([None], ["job"])
+        dispatcher.deliver_notification_messages.return_value = {"sent": 1, "failed": 0, "results": [{}]}
+
+        result = meeting_pipeline.schedule_meeting(
+            "Review", "2025-01-28T10:00:00", "2025-01-28T11:00:00", ["Sharma", "guest@college.edu"],
+            "hod@college.edu")
+
+        self.assertTrue(result["success"])
+        resolve.assert_called_once_with(["Sharma"], exact=True)
+        event = modifier.create_meeting.call_args.args[0]
+        self.assertEqual(result["meeting_id"], event["id"])
+        self.assertEqual(event["attendees"], [{"email": "guest@college.edu"},
+                                              {"email": "sharma@college.edu", "displayName": "Dr. Sharma"}])
+        (inserted_first, ics), = built
+        self.assertFalse(inserted_first)
+        self.assertIn(f"UID:{event['id']}@sam".encode(), ics)
+        dispatcher.deliver_notification_messages.assert_called_once_with(([None], ["job"]), "invite")
+        self.assertEqual(set(result["timings"]),
+                         {"parse", "resolve", "scheduler_busy", "participant_conflicts",
+                          "create_event", "ics", "emails", "send"})
+
+    def test_failed_send_deletes_the_event(self, dispatcher, modifier, resolve,
+                                           scheduler_busy, participants, log):
+        resolve.return_value = [self.sharma]
+        modifier.create_meeting.side_effect = lambda event, *args, **kwargs: {
+            "success": True, "meeting_id": event["id"], "html_link": None}
+        modifier.cancel_meeting.return_value = {"success": True}
+        dispatcher.build_notification_messages.return_value = ([None], ["job"])
+        dispatcher.deliver_notification_messages.return_value = {
+            "sent": 0, "failed": 1, "results": [{"success": False, "error": "SMTP authentication failed"}]}
+
+        result = meeting_pipeline.schedule_meeting(
+            "Review", "2025-01-28T10:00:00", "2025-01-28T11:00:00", ["Sharma"], "hod@college.edu")
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["failed_stage"], "send")
+        self.assertIn("SMTP authentication failed", result["error"])
+        self.assertEqual(result["rolled_back"], ["create_event"])
+        event_id = modifier.create_meeting.call_args.args[0]["id"]
+        modifier.cancel_meeting.assert_called_once_with(event_id, "hod@college.edu")
+        log.assert_not_called()
+
+    def test_conflict_stops_before_the_insert(self, dispatcher, modifier, resolve,
+                                              scheduler_busy, participants, log):
+        resolve.return_value = [self.sharma]
+        scheduler_busy.return_value = True
+        dispatcher.build_notification_messages.return_value = ([None], ["job"])
+
+        result = meeting_pipeline.schedule_meeting(
+            "Review", "2025-01-28T10:00:00", "2025-01-28T11:00:00", ["Sharma"], "hod@college.edu")
+
+        self.assertEqual((result["failed_stage"], result["error"]),
+                         ("scheduler_busy", "Time conflicts with an existing meeting"))
+        modifier.create_meeting.assert_not_called()
+        dispatcher.deliver_notification_messages.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
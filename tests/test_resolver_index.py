@@ -0,0 +1,161 @@
+import sys
+import os
+import unittest
+
+from thefuzz import process
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.resolver_index import FULL_MATRIX_ROSTER, ResolverIndex, soundex
+
+ROSTER = [
+    {"id": 1, "name": "Ayush Kumar", "email": "ayush@college.edu"},
+    {"id": 2, "name": "Krishna H Zalavadiya", "email": "krishna@college.edu"},
+    {"id": 3, "name": "Kishan Bhardwaj", "email": "kishan@college.edu"},
+    {"id": 4, "name": "Bismun Singh Makkarh", "email": "bismun@college.edu"},
+    {"id": 5, "name": "Aniket Barun", "email": "aniket@college.edu"},
+    {"id": 6, "name": "Dr. Rahul Sharma", "email": "sharma@college.edu"},
+    {"id": 7, "name": "Prof. Rohit Sharma", "email": "rohit@college.edu"},
+    {"id": 8, "name": "Ayush Kumar", "email": "ayush.k2@college.edu"},
+]
+
+QUERIES = ["Ani", "ayuss", "Bismun", "Kishan", "mayank KD", "NonExistentPerson",
+           "Sharma", "Dr Sharma", "krisna zalavadia", "kumar ayush", "!!", "Prof. Kumar"]
+
+
+class TestResolverIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = ResolverIndex(ROSTER)
+        self.faculty_map = {person['name']: person for person in ROSTER}
+        self.names = list(self.faculty_map.keys())
+
+    def test_matches_thefuzz_extract_one(self):
+        """
+        Scenario: The same queries go through the old full scan and the index.
+        Expected: Same accept/reject decision; accepted matches have the same
+        name and score (rejected ones only report the best blocked candidate).
+        """
+        for query in QUERIES:
+            with self.subTest(query=query):
+                expected_name, expected_score = process.extractOne(query, self.names)
+                person, name, score = self.index.best_match(query, threshold=75)
+
+                if expected_score >= 75:
+                    self.assertEqual((name, score), (expected_name, expected_score))
+                    self.assertIs(person, self.faculty_map[expected_name])
+                else:
+                    self.assertIsNone(person)
+
+    def test_tie_picks_earlier_roster_name(self):
+        """
+        Scenario: "Kishan Sneha" and the later "Kishan Nehaa" both score
+        85.71 for "ishan nea", and blocking only finds the later one.
+        Expected: The verify pass still returns the earlier name, like
+        thefuzz does on a tie.
+        """
+        roster = ROSTER + [{"id": 9, "name": "Kishan Sneha", "email": "sneha@college.edu"},
+                           {"id": 10, "name": "Kishan Nehaa", "email": "nehaa@college.edu"}]
+        index = ResolverIndex(roster)
+        index.candidates = lambda query: [len(index.names) - 1]
+
+        _, name, score = index.best_match("ishan nea")
+
+        self.assertEqual((name, score), process.extractOne("ishan nea", index.names))
+        self.assertEqual(name, "Kishan Sneha")
+
+    def test_duplicate_names_keep_last_record(self):
+        person, _, _ = self.index.best_match("Ayush Kumar")
+        self.assertEqual(person["email"], "ayush.k2@college.edu")
+
+    def test_phonetic_blocking_finds_misspelling(self):
+        self.assertEqual(soundex("Sharma"), soundex("Sherma"))
+        self.assertIn(self.names.index("Dr. Rahul Sharma"), self.index.candidates("sherma"))
+
+    def test_empty_roster(self):
+        self.assertEqual(ResolverIndex([]).best_match("Ayush"), (None, None, 0))
+        self.assertIsNone(ResolverIndex([]).best_matches(["Ayush"])[0]["match"])
+
+    def test_batch_agrees_with_single_lookups(self):
+        """
+        Scenario: All queries are resolved in one cdist matrix.
+        Expected: Same decision and best name as one-by-one best_match.
+        """
+        results = self.index.best_matches(QUERIES, threshold=75)
+
+        self.assertEqual([r["query"] for r in results], QUERIES)
+        for result in results:
+            with self.subTest(query=result["query"]):
+                person, name, score = self.index.best_match(result["query"], threshold=75)
+                self.assertIs(result["match"], person)
+                if person is not None:
+                    self.assertEqual((result["name"], result["score"]), (name, score))
+
+    def test_batch_on_big_roster_agrees_with_single_lookups(self):
+        """
+        Scenario: A roster over FULL_MATRIX_ROSTER names, where the batch
+        path used to score only blocked candidates.
+        Expected: Same best name and score as best_match for every query.
+        """
+        first = ["Aniket", "Ayush", "Kishan", "Krishna", "Priya", "Rahul", "Sneha", "Rohit"]
+        last = ["Sharma", "Kumar", "Singh", "Barun", "Bhardwaj", "Gupta", "Verma", "Nair"]
+        roster = [{"id": i, "name": f"{first[i % 8]} {last[i // 8 % 8]}{i // 64 or ''}",
+                   "email": f"user{i}@college.edu"} for i in range(FULL_MATRIX_ROSTER + 100)]
+        index = ResolverIndex(roster)
+        queries = ["KishanS", "yush", "Sharma2m", "Krishan", "Rohi", "nSeha", "rahul sharm"]
+
+        results = index.best_matches(queries)
+
+        self.assertEqual([(r["match"], r["name"], r["score"]) for r in results],
+                         [index.best_match(query) for query in queries])
+
+    def test_batch_flags_ambiguous_surname(self):
+        """
+        Scenario: "Sharma" matches two faculty members almost equally well.
+        Expected: A match is returned but flagged as ambiguous.
+        """
+        result = self.index.best_matches(["Sharma", "Kishan Bhardwaj"], ambiguity_margin=5)
+
+        self.assertIsNotNone(result[0]["match"])
+        self.assertTrue(result[0]["ambiguous"])
+        self.assertIn(result[0]["runner_up"], {"Dr. Rahul Sharma", "Prof. Rohit Sharma"})
+        self.assertFalse(result[1]["ambiguous"])
+
+    def test_patched_index_matches_rebuilt_index(self):
+        """
+        Scenario: A roster sync renames one person, updates another's email,
+        removes one and adds one.
+        Expected: The patched index answers like an index rebuilt from the
+        new roster, and the original index is untouched.
+        """
+        changes = {
+            "updated": [{"id": 3, "name": "Kishan Bhardwaj", "email": "kb@college.edu"},
+                        {"id": 5, "name": "Aniket Barun Singh", "email": "aniket@college.edu"}],
+            "deactivated": [{"id": 6, "name": "Dr. Rahul Sharma", "email": "sharma@college.edu"}],
+            "inserted": [{"id": 9, "name": "Mayank Kedia", "email": "mayank@college.edu"}],
+        }
+        patched = self.index.apply_changes(changes, version=2)
+
+        new_roster = [p for p in ROSTER if p["id"] not in (3, 5, 6)] + \
+            changes["updated"] + changes["inserted"]
+        rebuilt = ResolverIndex(new_roster)
+
+        self.assertEqual(len(patched), len(rebuilt))
+        for query in QUERIES + ["Aniket Singh", "Rahul Sharma", "mayank kedia", "Kishan"]:
+            with self.subTest(query=query):
+                person, _, score = patched.best_match(query)
+                expected, _, expected_score = rebuilt.best_match(query)
+                self.assertEqual(score, expected_score)
+                self.assertEqual(person and person["id"], expected and expected["id"])
+
+        self.assertEqual(patched.best_match("Kishan")[0]["email"], "kb@college.edu")
+        self.assertEqual(self.index.best_match("Kishan")[0]["email"], "kishan@college.edu")
+        self.assertIsNotNone(self.index.best_match("Dr. Rahul Sharma")[0])
+
+    def test_patch_with_duplicate_name_asks_for_rebuild(self):
+        changes = {"inserted": [{"id": 9, "name": "Kishan Bhardwaj", "email": "k2@college.edu"}]}
+        self.assertIsNone(self.index.apply_changes(changes))
+
+
+if __name__ == '__main__':
+    unittest.main()
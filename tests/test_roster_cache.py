@@ -0,0 +1,128 @@
+import sys
+import os
+import threading
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.roster_cache import RosterCache
+
+
+class FakeLoader:
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+        self.gate = None
+
+    def __call__(self):
+        self.calls += 1
+        if self.gate:
+            self.gate.wait(5)
+        if self.fail:
+            raise RuntimeError("database down")
+        return [{"id": self.calls, "name": f"Roster v{self.calls}"}]
+
+
+class TestRosterCache(unittest.TestCase):
+
+    def test_first_call_loads_then_hits(self):
+        loader = FakeLoader()
+        cache = RosterCache(loader, ttl=60)
+
+        self.assertEqual(cache.get()[0]["id"], 1)
+        self.assertEqual(cache.get()[0]["id"], 1)
+
+        self.assertEqual(loader.calls, 1)
+        stats = cache.stats()
+        self.assertEqual((stats["misses"], stats["hits"]), (1, 1))
+        self.assertIsNotNone(stats["last_refresh_ms"])
+
+    def test_expired_roster_is_served_while_refreshing(self):
+        """
+        Scenario: The TTL expired and the database is slow.
+        Expected: The caller gets the stale roster immediately; the new one
+        shows up after the background refresh.
+        """
+        loader = FakeLoader()
+        cache = RosterCache(loader, ttl=0)
+        cache.get()
+
+        loader.gate = threading.Event()
+        self.assertEqual(cache.get()[0]["id"], 1)
+        self.assertEqual(cache.stats()["stale_hits"], 1)
+
+        loader.gate.set()
+        cache.wait(5)
+        self.assertEqual(cache.snapshot(), ([{"id": 2, "name": "Roster v2"}], 2))
+
+    def test_invalidate_refreshes_in_background(self):
+        loader = FakeLoader()
+        cache = RosterCache(loader, ttl=3600)
+        cache.get()
+
+        cache.invalidate()
+        cache.wait(5)
+
+        self.assertEqual(loader.calls, 2)
+        self.assertFalse(cache.is_stale())
+
+    def test_failed_refresh_keeps_old_roster(self):
+        loader = FakeLoader()
+        cache = RosterCache(loader, ttl=3600)
+        cache.get()
+
+        loader.fail = True
+        self.assertFalse(cache.refresh())
+
+        self.assertEqual(cache.get()[0]["id"], 1)
+        self.assertEqual(cache.stats()["refresh_failures"], 1)
+
+    def test_listeners_get_each_new_version(self):
+        seen = []
+        cache = RosterCache(FakeLoader(), ttl=3600)
+        cache.add_listener(lambda data, version: seen.append(version))
+
+        cache.get()
+        cache.refresh()
+
+        self.assertEqual(seen, [1, 2])
+
+    def test_change_set_patches_without_reload(self):
+        """
+        Scenario: A roster sync reports one update, one deactivation and one
+        insert.
+        Expected: The cached roster is patched in place (no loader call),
+        the version goes up and patch listeners get the change set.
+        """
+        loader = lambda: [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]  # noqa: E731
+        cache = RosterCache(loader, ttl=3600)
+        loader_calls = []
+        cache._loader = lambda: loader_calls.append(1) or loader()
+        cache.get()
+
+        patches = []
+        cache.add_listener(lambda data, version: self.fail("full reload listener called"),
+                           on_patch=lambda data, version, changes: patches.append(version))
+        cache.apply_changes({"updated": [{"id": 2, "name": "B2"}],
+                             "deactivated": [{"id": 1, "name": "A"}],
+                             "inserted": [{"id": 3, "name": "C"}]})
+
+        self.assertEqual(cache.snapshot(), ([{"id": 2, "name": "B2"}, {"id": 3, "name": "C"}], 2))
+        self.assertEqual(patches, [2])
+        self.assertEqual(len(loader_calls), 1)
+        self.assertEqual(cache.stats()["patches"], 1)
+
+    def test_change_without_change_set_reloads(self):
+        loader = FakeLoader()
+        cache = RosterCache(loader, ttl=3600)
+        cache.get()
+
+        cache.apply_changes(None)
+        cache.wait(5)
+
+        self.assertEqual(loader.calls, 2)
+        self.assertEqual(cache.get()[0]["id"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import sys
+import os
+import datetime
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.slot_finder import find_free_slots, merge_busy
+from utils import conflict_detector
+
+UTC = datetime.timezone.utc
+
+
+def hhmm(slots):
+    return [(s.strftime("%a %H:%M"), e.strftime("%H:%M")) for s, e in slots]
+
+
+class TestFindFreeSlots(unittest.TestCase):
+
+    def test_merge_busy_unions_everyone(self):
+        merged = merge_busy({
+            "a": [("2025-01-27T10:00:00Z", "2025-01-27T11:00:00Z"),
+                  ("2025-01-27T09:00:00Z", "2025-01-27T09:30:00Z")],
+            "b": [("2025-01-27T10:30:00Z", "2025-01-27T12:00:00Z")],
+        })
+        self.assertEqual(len(merged), 2)
+        self.assertEqual(merged[1][1] - merged[1][0], 2 * 3600)
+
+    def test_earliest_common_gaps_in_working_hours(self):
+        """
+        Scenario: Monday 27 Jan 2025, A busy 09:00-10:30, B busy 11:00-12:00.
+        Expected: 10:30 is too short for an hour; first slots are 12:00 and
+        13:00, and nothing starts before 09:00.
+        """
+        busy = {
+            "a@college.edu": [("2025-01-27T09:00:00Z", "2025-01-27T10:30:00Z")],
+            "b@college.edu": [("2025-01-27T11:00:00Z", "2025-01-27T12:00:00Z")],
+        }
+        slots = find_free_slots(busy, "2025-01-27T00:00:00Z", "2025-02-03T00:00:00Z", 60,
+                                top_k=3, timezone="UTC", day_start="09:00", day_end="17:00")
+
+        self.assertEqual(hhmm(slots), [("Mon 12:00", "13:00"), ("Mon 13:00", "14:00"),
+                                       ("Mon 14:00", "15:00")])
+
+    def test_skips_weekends_holidays_and_aligns(self):
+        """
+        Scenario: Search starts Friday 16:20 for a 60 minute meeting; Monday
+        is a holiday.
+        Expected: Friday has no aligned hour left, the weekend and Monday
+        are skipped, Tuesday 09:00 is first.
+        """
+        slots = find_free_slots({}, "2025-01-31T16:20:00Z", "2025-02-10T00:00:00Z", 60,
+                                top_k=1, timezone="UTC", day_start="09:00", day_end="17:00",
+                                holidays={datetime.date(2025, 2, 3)})
+
+        self.assertEqual(slots[0][0], datetime.datetime(2025, 2, 4, 9, 0, tzinfo=UTC))
+
+    def test_working_hours_follow_the_timezone(self):
+        slots = find_free_slots({}, "2025-01-27T00:00:00Z", "2025-01-28T00:00:00Z", 30,
+                                top_k=1, timezone="Asia/Kolkata", day_start="09:00", day_end="17:00")
+
+        # 09:00 IST
+        self.assertEqual(slots[0][0].astimezone(UTC), datetime.datetime(2025, 1, 27, 3, 30, tzinfo=UTC))
+
+    def test_busy_interval_spanning_days(self):
+        busy = {"a@college.edu": [("2025-01-27T15:00:00Z", "2025-01-28T10:15:00Z")]}
+        slots = find_free_slots(busy, "2025-01-27T15:00:00Z", "2025-01-30T00:00:00Z", 30,
+                                top_k=2, timezone="UTC", day_start="09:00", day_end="17:00")
+
+        self.assertEqual(hhmm(slots), [("Tue 10:15", "10:45"), ("Tue 10:45", "11:15")])
+
+
+class TestSuggestAlternativeSlots(unittest.TestCase):
+
+    @patch('utils.conflict_detector.check_participants_conflicts')
+    def test_unreadable_calendars_are_reported(self, mock_check):
+        mock_check.return_value = {
+            "success": True,
+            "participants": {
+                "a@college.edu": {"busy": True, "error": None, "intervals": [
+                    (datetime.datetime(2025, 1, 27, 9, tzinfo=UTC), datetime.datetime(2025, 1, 27, 12, tzinfo=UTC))
+                ]},
+                "b@college.edu": {"busy": True, "error": "notFound", "intervals": []},
+            },
+        }
+
+        result = conflict_detector.suggest_alternative_slots(
+            ["a@college.edu", "b@college.edu"], "2025-01-27T09:00:00", "2025-01-27T10:00:00",
+            top_k=1, timezone="UTC", day_start="09:00", day_end="17:00"
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["unchecked"], ["b@college.edu"])
+        self.assertEqual(result["slots"][0][0], datetime.datetime(2025, 1, 27, 12, tzinfo=UTC))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import sys
+import os
+import smtplib
+import unittest
+from unittest.mock import patch, MagicMock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.smtp_pool import SMTPConnectionPool
+from services.notification_dispatcher import send_meeting_notifications_bulk
+from utils.config_loader import Config
+
+
+def make_server():
+    server = MagicMock()
+    server.noop.return_value = (250, b"OK")
+    server.send_message.return_value = {}
+    return server
+
+
+class TestSMTPConnectionPool(unittest.TestCase):
+
+    @patch('utils.smtp_pool.smtplib.SMTP_SSL')
+    def test_session_is_reused(self, mock_smtp_ssl):
+        """
+        Scenario: Three messages are sent one after another.
+        Expected: Only one TLS connection + login happens.
+        """
+        server = make_server()
+        mock_smtp_ssl.return_value = server
+        pool = SMTPConnectionPool("smtp.test", 465, "me@test", "secret")
+
+        for _ in range(3):
+            pool.send_message(MagicMock())
+
+        mock_smtp_ssl.assert_called_once()
+        server.login.assert_called_once_with("me@test", "secret")
+        self.assertEqual(server.send_message.call_count, 3)
+        self.assertEqual(pool.stats["reuses"], 2)
+
+    @patch('utils.smtp_pool.smtplib.SMTP_SSL')
+    def test_dead_idle_session_is_replaced(self, mock_smtp_ssl):
+        """
+        Scenario: An idle session fails the NOOP keepalive probe.
+        Expected: It is discarded and a new session is opened.
+        """
+        dead, fresh = make_server(), make_server()
+        dead.noop.side_effect = smtplib.SMTPServerDisconnected()
+        mock_smtp_ssl.side_effect = [dead, fresh]
+        pool = SMTPConnectionPool("smtp.test", 465, "me@test", "secret", keepalive_interval=0)
+
+        pool.send_message(MagicMock())
+        pool.send_message(MagicMock())
+
+        self.assertEqual(mock_smtp_ssl.call_count, 2)
+        fresh.send_message.assert_called_once()
+        self.assertEqual(pool.stats["dropped"], 1)
+
+    @patch('utils.smtp_pool.smtplib.SMTP_SSL')
+    def test_reconnects_when_server_drops_mid_send(self, mock_smtp_ssl):
+        """
+        Scenario: The server closes the session while a message is being sent.
+        Expected: The message is retried once on a new session.
+        """
+        dropped, fresh = make_server(), make_server()
+        dropped.send_message.side_effect = smtplib.SMTPServerDisconnected()
+        mock_smtp_ssl.side_effect = [dropped, fresh]
+        pool = SMTPConnectionPool("smtp.test", 465, "me@test", "secret")
+
+        pool.send_message(MagicMock())
+
+        fresh.send_message.assert_called_once()
+        self.assertEqual(pool.stats["sent"], 1)
+
+
+class TestBulkNotifications(unittest.TestCase):
+
+    @patch.object(Config, "SENDER_EMAIL", "sam@college.edu")
+    @patch.object(Config, "SENDER_PASSWORD", "secret")
+    @patch('services.notification_dispatcher._make_builder')
+    @patch('services.notification_dispatcher.get_smtp_pool')
+    def test_results_are_reported_per_recipient(self, mock_get_pool, mock_make_builder):
+        """
+        Scenario: One of three recipients is refused by the SMTP server.
+        Expected: Overall success is False and each recipient gets its own result.
+        """
+        pool = MagicMock()
+        pool.max_connections = 2
+
+        def send(msg):
+            if msg == "bad@test":
+                raise smtplib.SMTPRecipientsRefused({"bad@test": (550, b"No such user")})
+            return {}
+
+        pool.send_message.side_effect = send
+        mock_get_pool.return_value = pool
+        mock_make_builder.return_value.build.side_effect = lambda recipient, *args: recipient
+
+        recipients = ["a@test", "bad@test", "c@test"]
+        result = send_meeting_notifications_bulk(recipients, "invite", {"title": "Sync"})
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["sent"], 2)
+        self.assertEqual(result["failed"], 1)
+        self.assertEqual([r["recipient"] for r in result["results"]], recipients)
+        self.assertFalse(result["results"][1]["success"])
+
+    @patch.object(Config, "SENDER_EMAIL", "sam@college.edu")
+    @patch.object(Config, "SENDER_PASSWORD", "secret")
+    @patch('services.notification_dispatcher._make_builder')
+    @patch('services.notification_dispatcher.get_smtp_pool')
+    def test_recipient_refused_after_accept_is_a_failure(self, mock_get_pool, mock_make_builder):
+        """
+        Scenario: The server accepts the message but returns the recipient
+        in its refused dict.
+        Expected: That recipient is reported as failed, not sent.
+        """
+        pool = MagicMock()
+        pool.max_connections = 2
+        pool.send_message.side_effect = lambda msg: {"Bad@test": (550, b"No such user")} if msg == "bad@test" else {}
+        mock_get_pool.return_value = pool
+        mock_make_builder.return_value.build.side_effect = lambda recipient, *args: recipient
+
+        result = send_meeting_notifications_bulk(["a@test", "bad@test"], "invite", {"title": "Sync"})
+
+        self.assertEqual((result["sent"], result["failed"]), (1, 1))
+        self.assertEqual(result["results"][1]["error"], "Recipient refused: 550 No such user")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import sys
+import os
+import tempfile
+import time
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from utils.template_registry import TemplateRegistry
+
+
+class TestTemplateRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "email_invite.html")
+        self.write("Hello {{ title }}")
+        self.registry = TemplateRegistry(self.tmp.name, bytecode_cache_dir=False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, content, bump_mtime=0):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(content)
+        if bump_mtime:
+            stamp = time.time() + bump_mtime
+            os.utime(self.path, (stamp, stamp))
+
+    def test_template_is_compiled_once(self):
+        """
+        Scenario: The same notification template is requested twice.
+        Expected: The same compiled Template object comes back.
+        """
+        first = self.registry.get_template("invite")
+        second = self.registry.get_template("invite")
+
+        self.assertIs(first, second)
+        self.assertEqual(first.render(title="Sync"), "Hello Sync")
+
+    def test_template_reloads_when_file_changes(self):
+        """
+        Scenario: The template file is edited after it was compiled.
+        Expected: The next render picks up the new content.
+        """
+        self.assertEqual(self.registry.render("invite", title="Sync"), "Hello Sync")
+
+        self.write("Updated {{ title }}", bump_mtime=5)
+
+        self.assertEqual(self.registry.render("invite", title="Sync"), "Updated Sync")
+
+    def test_warm_up_skips_missing_templates(self):
+        self.assertEqual(self.registry.warm_up(), ["email_invite.html"])
+
+
+if __name__ == '__main__':
+    unittest.main()